@@ -29,6 +29,7 @@ pyinstaller --noconfirm --windowed --name "${APP_NAME}" \
 --add-data="jobcard.jpeg:." \
 --add-data="tabs:tabs" \
 --collect-data fpdf \
+--collect-submodules tabs \
 main_app.py
 
 # --- Step 2: Create the DMG ---
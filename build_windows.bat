@@ -28,6 +28,7 @@ pyinstaller --noconfirm --windowed --onefile ^
 --add-data="jobcard.jpeg;." ^
 --add-data="tabs;tabs" ^
 --collect-data fpdf ^
+--collect-submodules tabs ^
 main_app.py
 
 REM Check if PyInstaller failed
@@ -170,7 +170,8 @@ REJECTED_WL_CONFIG = {
 
 # --- MR Tracking Configuration  ---
 MR_TRACKING_CONFIG = {
-    "url": "https://nregastrep.nic.in/netnrega/dynamic_muster_track.aspx?lflag=eng&state_code=34&fin_year=2025-2026&state_name=JHARKHAND&Digest=FjAL4jfLQiHS1NU1KnbRZg"
+    "url": "https://nregastrep.nic.in/netnrega/dynamic_muster_track.aspx?lflag=eng&state_code=34&fin_year=2025-2026&state_name=JHARKHAND&Digest=FjAL4jfLQiHS1NU1KnbRZg",
+    "http_engine": True # Report ko bina browser ke (requests + lxml) fetch karein; fail hone par browser fallback
 }
 
 # --- MIS Reports Configuration ---
@@ -193,6 +194,121 @@ WORK_ALLOCATION_CONFIG = {
     "url": "https://nregade4.nic.in/Netnrega/workalloc.aspx"
 }
 
+# --- Parallel Workers Configuration ---
+# Extra Chrome profiles used to split batch work codes across several browsers.
+# Edge already listens on 9223, so the extra worker profiles start at 9224.
+PARALLEL_WORKERS_CONFIG = {
+    "max_workers": 4,
+    "main_port": 9222,
+    "extra_worker_base_port": 9224
+}
+
+# Shared headless Chrome pool for read-only report tabs (MR Tracking, Issued MR, Dashboard, MIS).
+# A browser is recycled after `max_uses` runs or once its process tree uses more than `memory_ceiling_mb`.
+HEADLESS_POOL_CONFIG = {
+    "pool_size": 2,
+    "max_uses": 20,
+    "memory_ceiling_mb": 1024,
+    "acquire_timeout": 120
+}
+
+# Tab modules are imported on first open; a few seconds after startup the user's most used
+# tabs are imported in the background so opening them feels instant.
+TAB_PREWARM_CONFIG = {
+    "enabled": True,
+    "count": 3,
+    "delay_ms": 3000
+}
+
+# Result tables: worker rows are added to the model in chunks every `flush_ms`; only the visible rows are drawn.
+RESULTS_MODEL_CONFIG = {
+    "flush_ms": 50,
+    "chunk_rows": 500
+}
+
+# Per-row status/progress updates from workers reach the UI at most this often (latest value only).
+PROGRESS_REPORTER_CONFIG = {
+    "max_updates_per_second": 5
+}
+
+# Tab log textboxes: workers queue lines, the UI draws them in batches every `drain_ms`.
+# Only the last `visible_lines` stay in the textbox ("Show Older" brings back up to `older_lines`);
+# the full log goes to logs/<tab>.log in the app data dir, rotated at `file_max_mb`.
+LOG_SINK_CONFIG = {
+    "visible_lines": 2000,
+    "older_lines": 20000,
+    "batch_lines": 500,
+    "drain_ms": 100,
+    "file_max_mb": 5,
+    "file_backups": 3
+}
+
+# Long sessions: at most `max_loaded_tabs` tabs keep their widgets. The least recently used idle tab
+# (no automation running) is snapshotted to tab_snapshots/ and destroyed; opening it again restores the snapshot.
+TAB_UNLOAD_CONFIG = {
+    "enabled": True,
+    "max_loaded_tabs": 6,
+    "keep_loaded": ["About"]
+}
+
+# Autocomplete history / usage counts live in history.db; changes are written in one transaction
+# `flush_delay_s` after the first unsaved change (and on exit).
+HISTORY_STORE_CONFIG = {
+    "flush_delay_s": 2.0
+}
+
+# Saved inputs / mappings / profiles of all tabs live in state.db (one row per tab namespace). Rows are read once in
+# the background at startup; changes are written together `flush_delay_s` after the first unsaved change (and on exit).
+# Old `*_inputs.json`, `*_map.json` and `*_profiles.json` files are imported on first run.
+STATE_STORE_CONFIG = {
+    "flush_delay_s": 1.0
+}
+
+# Every result row (`_log_result`) is also written to results.db (automation key, panchayat, work code, MSR no, status).
+# Tabs that opt in (Zero MR: work key + MSR no) skip items that already finished with one of `done_statuses` since the 1st/16th
+# of the month when `skip_done_this_fortnight` is on. Rows older than `keep_days` are deleted.
+RESULTS_DB_CONFIG = {
+    "flush_delay_s": 2.0,
+    "keep_days": 400,
+    "done_statuses": ["success", "verified"],
+    "skip_done_this_fortnight": True
+}
+
+# Last seen dropdown lists (panchayats -> work codes -> MSR numbers) per page, kept in work_index.db. Within
+# `ttl_minutes` tabs plan the batch from it instead of reading the dropdowns again; MSR lists change most often.
+WORK_INDEX_CONFIG = {
+    "enabled": True,
+    "ttl_minutes": {"panchayats": 7 * 24 * 60, "work_codes": 6 * 60, "msrs": 30}
+}
+
+# CPU-heavy steps (PDF merge, MIS table parsing, PNG report rendering) run in `pool_size` spawned worker
+# processes so the UI thread keeps the GIL. A worker that ignores Stop for `stop_grace_s` is terminated.
+# "enabled": False runs them inline in the automation thread as before.
+PROCESS_WORKERS_CONFIG = {
+    "enabled": True,
+    "pool_size": 1,
+    "stop_grace_s": 5
+}
+
+# Icons: each PNG is decoded once, at up to `scale`x its largest display size (HiDPI). Non-critical icons are
+# decoded `warm_delay_ms` after startup; decoded images are kept in a raw RGBA atlas for faster warm starts.
+ASSET_CACHE_CONFIG = {
+    "atlas": True,
+    "scale": 2,
+    "warm_delay_ms": 2000
+}
+
+# "Lean mode": while an automation runs, Chrome/Edge skip images, fonts and third-party
+# trackers via CDP. Tabs that need assets set `lean_mode_allow` (e.g. ("images",)).
+LEAN_MODE_CONFIG = {
+    "enabled": True,
+    "blocked": {
+        "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.bmp", "*.webp", "*.svg", "*.ico"],
+        "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+        "third_party": ["*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*facebook.net*", "*facebook.com/tr*", "*addthis.com*", "*sharethis.com*"]
+    }
+}
+
 import os
 import json
 from utils import get_data_path
@@ -1,10 +1,12 @@
 # main_app.py
+from tabs import startup_profiler # Sabse pehle, taaki --benchmark-startup mein saare imports time ho sakein
+startup_profiler.install()
+
 import tkinter
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
-import threading, time, subprocess, os, webbrowser, sys, requests, json, uuid, logging, socket, shutil
+import threading, time, subprocess, os, webbrowser, sys, requests, json, uuid, logging, socket, shutil, importlib, contextlib, collections, multiprocessing
 from urllib.parse import urlencode
-from PIL import Image
 from packaging.version import parse as parse_version
 from getmac import get_mac_address
 from datetime import datetime
@@ -15,6 +17,14 @@ from dotenv import load_dotenv
 
 from location_data import STATE_DISTRICT_MAP
 from tabs.history_manager import HistoryManager
+from tabs.job_store import JobStore
+from tabs.state_store import StateStore
+from tabs.results_store import ResultsStore
+from tabs.work_index import WorkIndex
+from tabs.log_sink import LogSink
+from tabs import tab_snapshot
+from tabs.asset_cache import AssetCache
+from tabs.process_worker import ProcessWorkerPool
 import config
 
 from utils import resource_path, get_data_path, get_user_downloads_path, get_config, save_config
@@ -32,6 +42,7 @@ _original_showerror = messagebox.showerror
 
 ctk.set_default_color_theme(resource_path("theme.json"))
 ctk.set_appearance_mode("System")
+startup_profiler.mark("imports_done")
 
 
 class CollapsibleFrame(ctk.CTkFrame):
@@ -381,10 +392,338 @@ class ComingSoonTab(ctk.CTkFrame):
         except: pass
 
         ctk.CTkLabel(container, text="Coming Soon", font=ctk.CTkFont(size=28, weight="bold")).pack()
-        ctk.CTkLabel(container, text="Sarkar Aapke Dwar Automation is under development.", 
+        ctk.CTkLabel(container, text="Sarkar Aapke Dwar Automation is under development.",
                      font=ctk.CTkFont(size=14), text_color="gray60").pack(pady=(10, 0))
 
 
+# Declarative tab registry: category -> tab name -> module/class (imported lazily), icon key and nav key.
+# "automation_key" is only given where it differs from "key" (used to map usage stats back to tabs).
+TAB_REGISTRY = {
+    "Core NREGA Tasks": {
+        "MR Gen": {"module": "tabs.musterroll_gen_tab", "class": "MusterrollGenTab", "icon": "emoji_mr_gen", "key": "muster"},
+        "MR Fill": {"module": "tabs.mr_fill_tab", "class": "MrFillTab", "icon": "emoji_mr_fill", "key": "mr_fill"},
+        "MR Payment": {"module": "tabs.msr_tab", "class": "MsrTab", "icon": "emoji_mr_payment", "key": "msr"},
+        "Gen Wagelist": {"module": "tabs.wagelist_gen_tab", "class": "WagelistGenTab", "icon": "emoji_gen_wagelist", "key": "gen"},
+        "Send Wagelist": {"module": "tabs.wagelist_send_tab", "class": "WagelistSendTab", "icon": "emoji_send_wagelist", "key": "send"},
+        "FTO Generation": {"module": "tabs.fto_generation_tab", "class": "FtoGenerationTab", "icon": "emoji_fto_gen", "key": "fto_gen"},
+        "Scheme Closing": {"module": "tabs.scheme_closing_tab", "class": "SchemeClosingTab", "icon": "emoji_scheme_closing", "key": "scheme_close", "automation_key": "scheme_closing"},
+        "Del Work Alloc": {"module": "tabs.del_work_alloc_tab", "class": "DelWorkAllocTab", "icon": "emoji_del_work_alloc", "key": "del_work_alloc"},
+        "Duplicate MR Print": {"module": "tabs.duplicate_mr_tab", "class": "DuplicateMrTab", "icon": "emoji_duplicate_mr", "key": "dup_mr", "automation_key": "duplicate_mr"},
+        "Demand": {"module": "tabs.demand_tab", "class": "DemandTab", "icon": "emoji_demand", "key": "demand"},
+        "Allocation": {"module": "tabs.work_allocation_tab", "class": "WorkAllocationTab", "icon": "emoji_work_alloc", "key": "allocation", "automation_key": "work_allocation"},
+    },
+    "JE & AE Automation": {
+        "eMB Entry": {"module": "tabs.mb_entry_tab", "class": "MbEntryTab", "icon": "emoji_emb_entry", "key": "mb_entry"},
+        "eMB Verify": {"module": "tabs.emb_verify_tab", "class": "EmbVerifyTab", "icon": "emoji_emb_verify", "key": "emb_verify"},
+    },
+    "Records & Workcode": {
+        "WC Gen": {"module": "tabs.wc_gen_tab", "class": "WcGenTab", "icon": "emoji_wc_gen", "key": "wc_gen"},
+        "IF Editor": {"module": "tabs.if_edit_tab", "class": "IfEditTab", "icon": "emoji_if_editor", "key": "if_edit"},
+        "Add Activity": {"module": "tabs.add_activity_tab", "class": "AddActivityTab", "icon": "emoji_add_activity", "key": "add_activity"},
+        "Update Estimate": {"module": "tabs.update_estimate_tab", "class": "UpdateEstimateTab", "icon": "emoji_update_outcome", "key": "update_outcome", "automation_key": "update_estimate"},
+    },
+    "Utilities & Verification": {
+        "Verify Jobcard": {"module": "tabs.jobcard_verify_tab", "class": "JobcardVerifyTab", "icon": "emoji_verify_jobcard", "key": "jc_verify"},
+        "Verify ABPS": {"module": "tabs.abps_verify_tab", "class": "AbpsVerifyTab", "icon": "emoji_verify_abps", "key": "abps_verify"},
+        "Workcode Extractor": {"module": "tabs.workcode_extractor_tab", "class": "WorkcodeExtractorTab", "icon": "emoji_wc_extractor", "key": "wc_extract"},
+        "Resend Rejected WG": {"module": "tabs.resend_rejected_wg_tab", "class": "ResendRejectedWgTab", "icon": "emoji_resend_wg", "key": "resend_wg"},
+        "PDF Merger": {"module": "tabs.pdf_merger_tab", "class": "PdfMergerTab", "icon": "emoji_pdf_merger", "key": "pdf_merger"},
+        "Zero Mr": {"module": "tabs.zero_mr_tab", "class": "ZeroMrTab", "icon": "emoji_zero_mr", "key": "zero_mr"},
+        "File Manager": {"module": "tabs.file_management_tab", "class": "FileManagementTab", "icon": "emoji_file_manager", "key": "file_manager"},
+    },
+    "AYASAD": {
+        "Sarkar Aapke Dwar": {"module": "tabs.sarkar_aapke_dwar_tab", "class": "SarkarAapkeDwarTab", "icon": "emoji_sad_auto", "key": "sad_auto"},
+        "SAD Update Status": {"module": "tabs.sad_update_tab", "class": "SADUpdateStatusTab", "icon": "emoji_sad_status", "key": "sad_status", "automation_key": "sad_update_status"},
+    },
+    "Reporting": {
+        "Social Audit Report": {"module": "tabs.SA_report_tab", "class": "SAReportTab", "icon": "emoji_social_audit", "key": "social_audit_respond"},
+        "MIS Reports": {"module": "tabs.mis_reports_tab", "class": "MisReportsTab", "icon": "emoji_mis_reports", "key": "mis_reports"},
+        "MR Tracking": {"module": "tabs.mr_tracking_tab", "class": "MrTrackingTab", "icon": "emoji_mr_tracking", "key": "mr_tracking"},
+        "Issued MR Details": {"module": "tabs.issued_mr_report_tab", "class": "IssuedMrReportTab", "icon": "emoji_issued_mr_report", "key": "issued_mr_report"},
+        "Dashboard Report": {"module": "tabs.dashboard_report_tab", "class": "DashboardReportTab", "icon": "emoji_dashboard_report", "key": "dashboard_report"},
+    },
+    "Application": {
+        "Feedback": {"module": "tabs.feedback_tab", "class": "FeedbackTab", "icon": "emoji_feedback"},
+        "About": {"module": "tabs.about_tab", "class": "AboutTab", "icon": "emoji_about"},
+    },
+}
+
+
+class DriverSessionPool:
+    """
+    Keeps one attached WebDriver session per debugger port (Chrome 9222, Edge 9223).
+    A cached session is health-checked with a single cheap call before it is handed
+    out, and is transparently re-attached if the browser was closed or restarted.
+    """
+    DEBUGGER_PORTS = {"chrome": 9222, "edge": 9223}
+
+    def __init__(self):
+        self._sessions = {}  # port -> {"driver", "browser", "attached_at", "uses"}
+        self._lock = threading.Lock()
+        self.stats = {"acquires": 0, "reused": 0, "attached": 0, "reattached": 0, "last_acquire_ms": 0.0, "total_acquire_ms": 0.0}
+
+    def is_port_open(self, port):
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2): return True
+        except OSError: return False
+
+    def has_live_session(self, port):
+        with self._lock:
+            entry = self._sessions.get(port)
+            return bool(entry) and self._is_healthy(entry["driver"])
+
+    def acquire(self, browser, port=None):
+        """Returns a healthy driver attached to the given debugger port, attaching only when needed."""
+        port = port or self.DEBUGGER_PORTS[browser]
+        started = time.perf_counter()
+        with self._lock:
+            entry = self._sessions.get(port)
+            if entry and self._is_healthy(entry["driver"]):
+                entry["uses"] += 1; outcome = "reused"
+            else:
+                if entry: self._release(entry["driver"])
+                outcome = "reattached" if entry else "attached"
+                try:
+                    entry = {"driver": self._attach(browser, port), "browser": browser, "attached_at": time.time(), "uses": 1}
+                except Exception:
+                    self._sessions.pop(port, None)
+                    raise
+                self._sessions[port] = entry
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats["acquires"] += 1; self.stats[outcome] += 1
+            self.stats["last_acquire_ms"] = elapsed_ms; self.stats["total_acquire_ms"] += elapsed_ms
+        logging.info(f"Driver pool: {outcome} {browser} session on port {port} in {elapsed_ms:.0f} ms")
+        return entry["driver"]
+
+    def invalidate(self, port):
+        with self._lock:
+            entry = self._sessions.pop(port, None)
+            if entry: self._release(entry["driver"])
+
+    def close_all(self):
+        with self._lock:
+            for entry in self._sessions.values(): self._release(entry["driver"])
+            self._sessions.clear()
+
+    def _is_healthy(self, driver):
+        # One HTTP round trip; also recovers from a closed tab by switching to a live one.
+        try:
+            handles = driver.window_handles
+            if not handles: return False
+            if driver.current_window_handle not in handles: driver.switch_to.window(handles[0])
+            return True
+        except Exception:
+            try:
+                handles = driver.window_handles
+                if handles: driver.switch_to.window(handles[0]); return True
+            except Exception: pass
+            return False
+
+    def _attach(self, browser, port):
+        from selenium import webdriver
+        if browser == "edge":
+            from selenium.webdriver.edge.options import Options as EdgeOptions
+            opts = EdgeOptions(); opts.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+            return webdriver.Edge(options=opts)
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        opts = ChromeOptions(); opts.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+        return webdriver.Chrome(options=opts)
+
+    def _release(self, driver):
+        # Only stop the driver service; quit() would also close the user's browser windows.
+        try: driver.service.stop()
+        except Exception: pass
+
+
+class LeanModeController:
+    """
+    CDP resource blocking ("lean mode") for automation sessions.
+    While automations run, Network.setBlockedURLs drops the categories in LEAN_MODE_CONFIG
+    except the ones every running tab allows; blocking is lifted when the last one finishes.
+    Firefox has no CDP, so it is simply left alone.
+    """
+    def __init__(self):
+        self._profiles = {}  # automation key -> frozenset of allowed categories, None = lean mode off for that tab
+        self._applied = {}   # id(driver) -> (driver, tuple of blocked patterns)
+        self._lock = threading.Lock()
+
+    def register(self, key, tab):
+        if not config.LEAN_MODE_CONFIG.get("enabled", True) or not getattr(tab, "lean_mode", True): profile = None
+        else: profile = frozenset(getattr(tab, "lean_mode_allow", ()))
+        with self._lock: self._profiles[key] = profile
+
+    def unregister(self, key):
+        """Drops the automation's profile; lifts all blocking once no automation is left."""
+        with self._lock:
+            self._profiles.pop(key, None)
+            if self._profiles: return
+            applied, self._applied = list(self._applied.values()), {}
+        for driver, _ in applied: self._send(driver, [])
+
+    def blocked_patterns(self):
+        with self._lock:
+            profiles = list(self._profiles.values())
+        if not profiles or any(p is None for p in profiles): return []
+        allowed = set().union(*profiles)
+        return [pattern for category, patterns in config.LEAN_MODE_CONFIG["blocked"].items() if category not in allowed for pattern in patterns]
+
+    def apply(self, driver):
+        """Brings the driver's blocked-URL list in line with the running automations (no-op if unchanged)."""
+        patterns = tuple(self.blocked_patterns())
+        with self._lock: previous = self._applied.get(id(driver))
+        if (previous[1] if previous else ()) == patterns: return
+        if self._send(driver, list(patterns)):
+            with self._lock:
+                if patterns: self._applied[id(driver)] = (driver, patterns)
+                else: self._applied.pop(id(driver), None)
+
+    def _send(self, driver, patterns):
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+            logging.info(f"Lean mode: {len(patterns)} URL patterns blocked")
+            return True
+        except Exception as e: # Firefox / closed browser
+            logging.debug(f"Lean mode not applied: {e}")
+            return False
+
+
+class HeadlessReportPool:
+    """
+    Warm headless Chrome instances shared by the read-only report tabs (MR Tracking, Issued MR,
+    Dashboard, MIS). Har run par naya Chrome start karne ki jagah browser pool se milta hai aur
+    run ke baad wapas aata hai. An instance is recycled after `max_uses` runs, when its process
+    tree crosses `memory_ceiling_mb`, or when the caller reports it as broken.
+    """
+    def __init__(self, lean_mode=None):
+        self._idle = []      # entries ready to hand out (LIFO, so the warmest one is reused)
+        self._in_use = {}    # id(driver) -> entry
+        self._starting = 0   # slots reserved by threads that are still launching Chrome
+        self._cond = threading.Condition()
+        self._closed = False
+        self.lean_mode = lean_mode
+        self.stats = {"acquires": 0, "reused": 0, "created": 0, "recycled": 0, "last_acquire_ms": 0.0}
+
+    @property
+    def size(self): return max(1, int(config.HEADLESS_POOL_CONFIG.get("pool_size", 2)))
+
+    def acquire(self, timeout=None):
+        """Returns a healthy headless driver, starting one only if no warm instance is idle. Blocks while the pool is full."""
+        timeout = config.HEADLESS_POOL_CONFIG.get("acquire_timeout", 120) if timeout is None else timeout
+        started = time.perf_counter(); deadline = time.monotonic() + timeout
+        entry = None
+        with self._cond:
+            while not entry:
+                if self._closed: raise RuntimeError("Headless report pool is closed.")
+                if self._idle:
+                    candidate = self._idle.pop()
+                    if self._is_healthy(candidate["driver"]): entry = candidate; outcome = "reused"
+                    else: self._quit(candidate["driver"])
+                    continue
+                if len(self._in_use) + self._starting < self.size: self._starting += 1; break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0: raise TimeoutError("All headless report browsers are busy.")
+                self._cond.wait(remaining)
+            if entry: self._in_use[id(entry["driver"])] = entry
+        if not entry:
+            outcome = "created"
+            try: entry = {"driver": self._create(), "uses": 0, "created_at": time.time()}
+            finally:
+                with self._cond:
+                    self._starting -= 1
+                    if entry: self._in_use[id(entry["driver"])] = entry
+                    self._cond.notify()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._cond:
+            self.stats["acquires"] += 1; self.stats[outcome] += 1; self.stats["last_acquire_ms"] = elapsed_ms
+        logging.info(f"Report pool: {outcome} headless browser in {elapsed_ms:.0f} ms")
+        if self.lean_mode: self.lean_mode.apply(entry["driver"])
+        return entry["driver"]
+
+    def release(self, driver, broken=False):
+        """Gives a driver back. Recycles it if broken, used up, or over the memory ceiling; otherwise resets it for the next run."""
+        if driver is None: return
+        with self._cond: entry = self._in_use.pop(id(driver), None)
+        if entry is None: self._quit(driver); return
+        entry["uses"] += 1
+        reason = "broken" if broken else self._recycle_reason(entry)
+        if not reason and not self._reset(driver): reason = "reset failed"
+        if reason:
+            logging.info(f"Report pool: recycling headless browser after {entry['uses']} uses ({reason})")
+            self._quit(driver)
+        with self._cond:
+            if reason: self.stats["recycled"] += 1
+            elif self._closed or len(self._idle) >= self.size: self._quit(driver)
+            else: self._idle.append(entry)
+            self._cond.notify()
+
+    def close_all(self):
+        with self._cond:
+            self._closed = True
+            entries = self._idle + [e for e in self._in_use.values() if e]
+            self._idle, self._in_use = [], {}
+            self._cond.notify_all()
+        for entry in entries: self._quit(entry["driver"])
+
+    def _recycle_reason(self, entry):
+        max_uses = config.HEADLESS_POOL_CONFIG.get("max_uses", 20)
+        if max_uses and entry["uses"] >= max_uses: return f"max uses {max_uses}"
+        ceiling_mb = config.HEADLESS_POOL_CONFIG.get("memory_ceiling_mb", 0)
+        if ceiling_mb:
+            used_mb = self._memory_mb(entry["driver"])
+            if used_mb and used_mb > ceiling_mb: return f"{used_mb:.0f} MB > {ceiling_mb} MB"
+        return None
+
+    @staticmethod
+    def _memory_mb(driver):
+        # psutil ho to chromedriver ke poore process tree ka RSS; warna CDP se JS heap size.
+        try:
+            import psutil
+            root = psutil.Process(driver.service.process.pid)
+            return sum(p.memory_info().rss for p in [root] + root.children(recursive=True)) / (1024 * 1024)
+        except ImportError: pass
+        except Exception: return None
+        try:
+            metrics = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+            return next((m["value"] for m in metrics if m["name"] == "JSHeapTotalSize"), 0) / (1024 * 1024)
+        except Exception: return None
+
+    @staticmethod
+    def _reset(driver):
+        """Closes extra windows, clears cookies and parks the tab on about:blank so the next run starts clean."""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]: driver.switch_to.window(handle); driver.close()
+            driver.switch_to.window(handles[0])
+            try: driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception: driver.delete_all_cookies()
+            driver.get("about:blank")
+            return True
+        except Exception: return False
+
+    @staticmethod
+    def _is_healthy(driver):
+        try: return bool(driver.window_handles)
+        except Exception: return False
+
+    @staticmethod
+    def _create():
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from tabs.driver_cache import chrome_service
+        opts = ChromeOptions()
+        opts.add_argument("--headless")
+        opts.add_argument("--window-size=1920,1080") # Headless browser ko ek size dena zaroori hai
+        opts.add_argument("--disable-gpu")
+        opts.add_experimental_option("excludeSwitches", ["enable-automation"])
+        return webdriver.Chrome(service=chrome_service(), options=opts)
+
+    @staticmethod
+    def _quit(driver):
+        try: driver.quit()
+        except Exception: pass
+
+
 class NregaBotApp(ctk.CTk):
     def __init__(self):
         super().__init__()
@@ -397,13 +736,27 @@ class NregaBotApp(ctk.CTk):
         self.minsize(1000, 700)
 
         # Initialize basics
-        self.history_manager = HistoryManager(self.get_data_path)
+        self.history_manager = HistoryManager(self.get_data_path, config.HISTORY_STORE_CONFIG.get("flush_delay_s", 2.0))
+        self.state_store = StateStore(self.get_data_path('state.db'), self.get_data_path(''), config.STATE_STORE_CONFIG.get("flush_delay_s", 1.0))
+        self.state_store.preload_async() # Tabs khulne se pehle saved inputs memory mein
         self.is_licensed = False; self.license_info = {}; self.machine_id = self._get_machine_id()
         self.update_info = {"status": "Checking...", "version": None, "url": None}
         self.driver = None; self.active_browser = None; self.open_on_about_tab = False
+        self.driver_pool = DriverSessionPool(); self.lean_mode = LeanModeController()
+        self.report_pool = HeadlessReportPool(self.lean_mode)
+        self.process_workers = ProcessWorkerPool(config.PROCESS_WORKERS_CONFIG) # Heavy steps alag process mein
+        self.job_store = JobStore(self.get_data_path('jobs.db'))
+        results_cfg = config.RESULTS_DB_CONFIG
+        self.results_store = ResultsStore(self.get_data_path('results.db'), results_cfg.get("flush_delay_s", 2.0),
+                                          results_cfg.get("keep_days", 400), results_cfg.get("done_statuses", ("success",)))
+        self.work_index = WorkIndex(self.get_data_path('work_index.db'), config.WORK_INDEX_CONFIG)
+        self._log_sinks = {}; self._log_sinks_lock = threading.Lock()
         self.sleep_prevention_process = None; self.is_validating_license = False
-        self.active_automations = set(); self.icon_images = {}; self.automation_threads = {}
+        self.active_automations = set(); self.automation_threads = {}
+        self.icon_images = AssetCache(resource_path, get_data_path("asset_atlas") if config.ASSET_CACHE_CONFIG.get("atlas", True) else None,
+                                      config.ASSET_CACHE_CONFIG.get("scale", 2), config.APP_VERSION)
         self.stop_events = {}; self.nav_buttons = {}; self.content_frames = {}; self.tab_instances = {}
+        self._tab_lru = collections.OrderedDict(); self.tab_memory = {}; self.current_page = None # LRU tab unloading
         self.button_to_category_frame = {}
         self.category_frames = {}
         self.last_selected_category = get_config('last_selected_category', 'All Automations')
@@ -420,8 +773,9 @@ class NregaBotApp(ctk.CTk):
         self.splash = None
 
         # --- STEP 1: SHOW SPLASH IMMEDIATELY ---
-        self.splash = self._create_splash_screen()
-        self.splash.update() # Force render
+        with startup_profiler.phase("splash"):
+            self.splash = self._create_splash_screen()
+            self.splash.update() # Force render
 
         # --- STEP 2: START HEAVY LOADING IN BACKGROUND ---
         threading.Thread(target=self._background_initialization, daemon=True).start()
@@ -431,8 +785,9 @@ class NregaBotApp(ctk.CTk):
         
         # 1. Initialize Pygame (Audio)
         try:
-            import pygame
-            pygame.mixer.init()
+            with startup_profiler.phase("pygame"):
+                import pygame
+                pygame.mixer.init()
         except Exception as e:
             print(f"Warning: Could not initialize audio mixer: {e}")
 
@@ -440,19 +795,20 @@ class NregaBotApp(ctk.CTk):
         try:
             SENTRY_DSN = os.getenv("SENTRY_DSN")
             if SENTRY_DSN:
-                import sentry_sdk
-                sentry_sdk.init(
-                    dsn=SENTRY_DSN,
-                    release=f"{config.APP_NAME}@{config.APP_VERSION}",
-                    traces_sample_rate=1.0,
-                )
-                sentry_sdk.set_user({"id": self.machine_id})
-                sentry_sdk.set_tag("os.name", config.OS_SYSTEM)
+                with startup_profiler.phase("sentry"):
+                    import sentry_sdk
+                    sentry_sdk.init(
+                        dsn=SENTRY_DSN,
+                        release=f"{config.APP_NAME}@{config.APP_VERSION}",
+                        traces_sample_rate=1.0,
+                    )
+                    sentry_sdk.set_user({"id": self.machine_id})
+                    sentry_sdk.set_tag("os.name", config.OS_SYSTEM)
         except Exception: 
             pass
 
         # 3. Load Icons (Disk I/O)
-        self._load_all_icons()
+        with startup_profiler.phase("load_icons"): self._load_all_icons()
 
         # 4. Apply patches
         messagebox.showinfo = self._custom_showinfo
@@ -469,16 +825,19 @@ class NregaBotApp(ctk.CTk):
         
         # Build UI
         self.grid_rowconfigure(1, weight=1); self.grid_columnconfigure(0, weight=1)
-        self._create_header(); self._create_footer()
-        self.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self._create_main_layout(for_activation=True)
+        with startup_profiler.phase("create_main_layout"):
+            self._create_header(); self._create_footer()
+            self.protocol("WM_DELETE_WINDOW", self.on_closing)
+            self._create_main_layout(for_activation=True)
         self.set_status("Initializing...")
 
         # License check
-        self.perform_license_check_flow()
+        with startup_profiler.phase("license_check"): self.perform_license_check_flow()
 
         # Transition Splash
         self.after(500, self._transition_from_splash)
+        # Baaki (lazy) icons background mein decode karo aur atlas refresh karo
+        self.after(config.ASSET_CACHE_CONFIG.get("warm_delay_ms", 2000), self.icon_images.warm_async)
 
     def _transition_from_splash(self):
         if self.splash: self._fade_out_splash(self.splash, step=0)
@@ -528,7 +887,7 @@ class NregaBotApp(ctk.CTk):
         self._load_icon("firefox", "assets/icons/firefox.png")
         
         # App Branding & Tools
-        self._load_icon("nrega", "assets/icons/nrega.png")
+        self._load_icon("nrega", "assets/icons/nrega.png", lazy=True)
         self._load_icon("whatsapp", "assets/icons/whatsapp.png")
         self._load_icon("feedback", "assets/icons/feedback.png")
         
@@ -545,19 +904,20 @@ class NregaBotApp(ctk.CTk):
         self._load_icon("theme_light", "assets/icons/theme_sun.png", size=(18, 18))
         self._load_icon("theme_dark", "assets/icons/theme_moon.png", size=(18, 18))
 
-        # Other Icons (Keep existing ones...)
+        # Other Icons (Keep existing ones...) -- same file + size as extractor_icon, so the same image is shared
         self._load_icon("wc_extractor", "assets/icons/extractor.png") # Keep old key just in case
-        self._load_icon("disclaimer_warning", "assets/icons/emojis/warning.png", size=(16,16))
-        self._load_icon("disclaimer_thunder", "assets/icons/emojis/thunder.png", size=(16,16))
-        self._load_icon("disclaimer_tools", "assets/icons/emojis/tools.png", size=(16,16))
-        self._load_icon("onboarding_launch", "assets/icons/emojis/thunder.png", size=(48, 48))
-        self._load_icon("onboarding_login", "assets/icons/emojis/verify_jobcard.png", size=(48, 48))
-        self._load_icon("onboarding_select", "assets/icons/emojis/wc_gen.png", size=(48, 48))
-        self._load_icon("onboarding_start", "assets/icons/emojis/fto_gen.png", size=(48, 48))
+        self._load_icon("logo_splash", "logo.png", size=(80, 80), lazy=True); self._load_icon("logo_header", "logo.png", size=(38, 38))
+        self._load_icon("disclaimer_warning", "assets/icons/emojis/warning.png", size=(16,16), lazy=True)
+        self._load_icon("disclaimer_thunder", "assets/icons/emojis/thunder.png", size=(16,16), lazy=True)
+        self._load_icon("disclaimer_tools", "assets/icons/emojis/tools.png", size=(16,16), lazy=True)
+        self._load_icon("onboarding_launch", "assets/icons/emojis/thunder.png", size=(48, 48), lazy=True)
+        self._load_icon("onboarding_login", "assets/icons/emojis/verify_jobcard.png", size=(48, 48), lazy=True)
+        self._load_icon("onboarding_select", "assets/icons/emojis/wc_gen.png", size=(48, 48), lazy=True)
+        self._load_icon("onboarding_start", "assets/icons/emojis/fto_gen.png", size=(48, 48), lazy=True)
 
         # --- NEW: Device Management Icons ---
-        self._load_icon("device_edit", "assets/icons/edit.png", size=(20, 20))
-        self._load_icon("device_reset", "assets/icons/reset.png", size=(20, 20))
+        self._load_icon("device_edit", "assets/icons/edit.png", size=(20, 20), lazy=True)
+        self._load_icon("device_reset", "assets/icons/reset.png", size=(20, 20), lazy=True)
         
         # Menu Icons
         self._load_icon("emoji_mr_gen", "assets/icons/emojis/mr_gen.png", size=(16,16))
@@ -609,7 +969,7 @@ class NregaBotApp(ctk.CTk):
         x, y = (sw/2) - (w/2), (sh/2) - (h/2)
         splash.geometry(f'{w}x{h}+{int(x)}+{int(y)}')
         try:
-            logo = ctk.CTkImage(Image.open(resource_path("logo.png")), size=(80, 80))
+            logo = self.icon_images.image("logo.png", (80, 80))
             ctk.CTkLabel(splash, image=logo, text="").pack(pady=(20, 10))
         except Exception: pass
         ctk.CTkLabel(splash, text=f"{config.APP_NAME}\nLoading...", font=("SF Pro Display", 14)).pack()
@@ -634,12 +994,13 @@ class NregaBotApp(ctk.CTk):
         self._ping_server_in_background()
         
         # Default tab par le jayein
-        first_tab = list(list(self.get_tabs_definition().values())[0].keys())[0]
+        first_tab = next(iter(next(iter(TAB_REGISTRY.values()))))
         self.show_frame("About" if is_expiring else first_tab)
         
         self.check_for_updates_background()
         self.set_status("Ready")
         self.after(500, self.run_onboarding_if_needed)
+        self.after(config.TAB_PREWARM_CONFIG.get("delay_ms", 3000), self._prewarm_tab_modules)
 
     def _setup_unlicensed_ui(self):
         self._preload_and_update_about_tab()
@@ -863,27 +1224,60 @@ class NregaBotApp(ctk.CTk):
             self.play_sound("error")
             messagebox.showerror("Error", f"Could not open folder: {e}")
 
-    def _load_icon(self, name, path, size=(20, 20)):
-        try: self.icon_images[name] = ctk.CTkImage(Image.open(resource_path(path)), size=size)
-        except Exception as e: print(f"Warning: Could not load icon '{name}': {e}")
+    def _load_icon(self, name, path, size=(20, 20), lazy=False):
+        """Registers an icon; critical ones (header, nav, footer) are decoded now, `lazy` ones on first use / warm-up."""
+        self.icon_images.register(name, path, size)
+        if not lazy: self.icon_images.decode(path)
+
+    def get_worker_port(self, worker_no):
+        cfg = config.PARALLEL_WORKERS_CONFIG
+        return cfg["main_port"] if worker_no == 0 else cfg["extra_worker_base_port"] + worker_no - 1
 
-    def launch_chrome_detached(self):
-        port, p_dir = "9222", os.path.join(os.path.expanduser("~"), "ChromeProfileForNREGABot")
+    def launch_chrome_detached(self, worker_no=0, notify=True):
+        port = str(self.get_worker_port(worker_no))
+        p_dir = os.path.join(os.path.expanduser("~"), "ChromeProfileForNREGABot" if worker_no == 0 else f"ChromeProfileForNREGABot_Worker{worker_no}")
         os.makedirs(p_dir, exist_ok=True)
         paths = {"Darwin": ["/Applications/Google Chrome.app/Contents/MacOS/Google Chrome"], "Windows": [r"C:\Program Files\Google\Chrome\Application\chrome.exe", r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe"]}
         b_path = next((p for p in paths.get(config.OS_SYSTEM, []) if os.path.exists(p)), None)
         if not b_path: 
-            self.play_sound("error")
-            messagebox.showerror("Error", "Google Chrome not found."); return
+            if notify:
+                self.play_sound("error")
+                messagebox.showerror("Error", "Google Chrome not found.")
+            return False
         try:
             cmd = [b_path, f"--remote-debugging-port={port}", f"--user-data-dir={p_dir}", config.MAIN_WEBSITE_URL, "https://bookmark.nregabot.com/"]
             flags = 0x00000008 if config.OS_SYSTEM == "Windows" else 0
             subprocess.Popen(cmd, creationflags=flags, start_new_session=(config.OS_SYSTEM != "Windows"))
-            self.play_sound("success")
-            messagebox.showinfo("Chrome Launched", "Chrome is starting. Please log in to the NREGA website.")
+            if notify:
+                self.play_sound("success")
+                messagebox.showinfo("Chrome Launched", "Chrome is starting. Please log in to the NREGA website.")
+            return True
         except Exception as e: 
-            self.play_sound("error")
-            messagebox.showerror("Error", f"Failed to launch Chrome:\n{e}")
+            if notify:
+                self.play_sound("error")
+                messagebox.showerror("Error", f"Failed to launch Chrome:\n{e}")
+            return False
+
+    def get_parallel_worker_drivers(self, count):
+        """
+        Attaches to up to `count` extra Chrome worker profiles for parallel batch runs.
+        Worker browsers that are not running yet are launched for the user to log in; they join from the next run.
+        """
+        if self.active_browser != "chrome":
+            logging.info("Parallel workers are only supported with Chrome; continuing with a single browser.")
+            return []
+        drivers, missing = [], []
+        for worker_no in range(1, count + 1):
+            port = self.get_worker_port(worker_no)
+            if not self.driver_pool.is_port_open(port):
+                missing.append(worker_no); continue
+            try: drivers.append(self.driver_pool.acquire("chrome", port)); self.lean_mode.apply(drivers[-1])
+            except Exception as e: logging.warning(f"Could not attach to worker browser on port {port}: {e}")
+        if missing:
+            launched = [n for n in missing if self.launch_chrome_detached(worker_no=n, notify=False)]
+            if launched:
+                self.after(0, lambda: messagebox.showinfo("Parallel Workers", f"Started {len(launched)} worker browser(s).\n\nPlease log in to the NREGA website in each new Chrome window. They will join from the next run."))
+        return drivers
 
     def launch_edge_detached(self):
         port, p_dir = "9223", os.path.join(os.path.expanduser("~"), "EdgeProfileForNREGABot")
@@ -907,15 +1301,14 @@ class NregaBotApp(ctk.CTk):
         # Lazy load selenium
         from selenium import webdriver
         from selenium.webdriver.firefox.options import Options as FirefoxOptions
-        from selenium.webdriver.firefox.service import Service as FirefoxService
-        from webdriver_manager.firefox import GeckoDriverManager
+        from tabs.driver_cache import firefox_service
 
         if self.driver and messagebox.askyesno("Browser Running", "Close existing Firefox and start new?"): self.driver.quit(); self.driver = None
         elif self.driver: return
         try:
             p_dir = os.path.join(os.path.expanduser("~"), "FirefoxProfileForNREGABot"); os.makedirs(p_dir, exist_ok=True)
             opts = FirefoxOptions(); opts.add_argument("-profile"); opts.add_argument(p_dir)
-            self.driver = webdriver.Firefox(service=FirefoxService(GeckoDriverManager().install()), options=opts)
+            self.driver = webdriver.Firefox(service=firefox_service(), options=opts)
             self.active_browser = "firefox"; self.play_sound("success")
             self.driver.get(config.MAIN_WEBSITE_URL); self.driver.execute_script("window.open(arguments[0], '_blank');", "https://bookmark.nregabot.com/")
             self.driver.switch_to.window(self.driver.window_handles[0])
@@ -924,9 +1317,6 @@ class NregaBotApp(ctk.CTk):
             messagebox.showerror("Error", f"Failed to launch Firefox:\n{e}"); self.driver = None; self.active_browser = None
 
     def get_driver(self):
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options as ChromeOptions
-        from selenium.webdriver.edge.options import Options as EdgeOptions
         from selenium.common.exceptions import WebDriverException
 
         available_browsers = []
@@ -938,19 +1328,21 @@ class NregaBotApp(ctk.CTk):
                 available_browsers.append("firefox")
             except Exception: self.driver = None
 
-        try:
-            with socket.create_connection(("127.0.0.1", 9222), timeout=0.2): available_browsers.append("chrome")
-        except (socket.timeout, ConnectionRefusedError): pass
-        try:
-            with socket.create_connection(("127.0.0.1", 9223), timeout=0.2): available_browsers.append("edge")
-        except (socket.timeout, ConnectionRefusedError): pass
+        for browser, port in DriverSessionPool.DEBUGGER_PORTS.items():
+            if self.driver_pool.is_port_open(port): available_browsers.append(browser)
 
         if not available_browsers:
             self.play_sound("error")
             messagebox.showerror("Connection Failed", "No browser is running. Please launch one first.")
             return None
 
-        selected_browser = available_browsers[0] if len(available_browsers) == 1 else self._ask_browser_selection(available_browsers)
+        # Reuse the browser picked on the previous run while its pooled session is still alive,
+        # so the selection dialog only appears when the choice is actually ambiguous.
+        if len(available_browsers) == 1: selected_browser = available_browsers[0]
+        elif self.active_browser in DriverSessionPool.DEBUGGER_PORTS and self.active_browser in available_browsers \
+                and self.driver_pool.has_live_session(DriverSessionPool.DEBUGGER_PORTS[self.active_browser]):
+            selected_browser = self.active_browser
+        else: selected_browser = self._ask_browser_selection(available_browsers)
         if not selected_browser: return None
 
         if selected_browser == "firefox":
@@ -960,19 +1352,23 @@ class NregaBotApp(ctk.CTk):
                 return None
             self.active_browser = "firefox"
             return self.driver
-        elif selected_browser == "chrome":
-            try:
-                opts = ChromeOptions(); opts.add_experimental_option("debuggerAddress", "127.0.0.1:9222")
-                driver = webdriver.Chrome(options=opts); self.active_browser = 'chrome'; return driver
-            except Exception as e:
-                self.play_sound("error"); messagebox.showerror("Connection Failed", f"Could not connect to Chrome.\nError: {e}"); return None
-        elif selected_browser == "edge":
-            try:
-                opts = EdgeOptions(); opts.add_experimental_option("debuggerAddress", "127.0.0.1:9223")
-                driver = webdriver.Edge(options=opts); self.active_browser = 'edge'; return driver
-            except Exception as e:
-                self.play_sound("error"); messagebox.showerror("Connection Failed", f"Could not connect to Edge.\nError: {e}"); return None
-        return None
+
+        try:
+            driver = self.driver_pool.acquire(selected_browser)
+            self.active_browser = selected_browser
+            self.lean_mode.apply(driver)
+            return driver
+        except Exception as e:
+            name = "Edge" if selected_browser == "edge" else "Chrome"
+            self.play_sound("error"); messagebox.showerror("Connection Failed", f"Could not connect to {name}.\nError: {e}"); return None
+
+    def get_report_driver(self):
+        """Headless driver from the shared report pool (give it back with report_pool.release). None on failure."""
+        try: return self.report_pool.acquire()
+        except Exception as e:
+            self.play_sound("error")
+            messagebox.showerror("Browser Error", f"Headless Chrome browser shuru nahi ho saka.\n\nError: {e}\n\nKya Chrome installed hai?")
+            return None
 
     def _ask_browser_selection(self, options):
         selection_var = tkinter.StringVar(value="")
@@ -1016,7 +1412,7 @@ class NregaBotApp(ctk.CTk):
         branding_frame.grid(row=0, column=0, sticky="w", padx=15, pady=8)
         
         try:
-            logo = ctk.CTkImage(Image.open(resource_path("logo.png")), size=(38, 38))
+            logo = self.icon_images.image("logo.png", (38, 38))
             ctk.CTkLabel(branding_frame, image=logo, text="").pack(side="left", padx=(0, 12))
         except Exception: pass
 
@@ -1276,7 +1672,7 @@ class NregaBotApp(ctk.CTk):
         
         ctk.CTkLabel(parent, text="Category Filter:", font=ctk.CTkFont(size=12, weight="bold")).pack(fill="x", padx=10, pady=(10, 2))
         
-        categories = ["All Automations"] + list(self.get_tabs_definition().keys())
+        categories = ["All Automations"] + list(TAB_REGISTRY.keys())
         self.category_filter_menu = ctk.CTkOptionMenu(
             parent, 
             values=categories, 
@@ -1349,100 +1745,49 @@ class NregaBotApp(ctk.CTk):
                 self.category_frames[selected_category].pack(fill="x", pady=5, padx=5)
 
     def _create_content_frames(self):
-        self.content_frames.clear(); self.tab_instances.clear(); self.show_frame("About", raise_frame=False)
+        self.content_frames.clear(); self.tab_instances.clear(); self._tab_lru.clear()
+        shutil.rmtree(self.get_data_path("tab_snapshots"), ignore_errors=True) # Pichle session ke snapshots purane hain
+        self.show_frame("About", raise_frame=False)
 
     def get_tabs_definition(self):
-        # --- LAZY LOAD IMPORTS ---
-        from tabs.msr_tab import MsrTab
-        from tabs.wagelist_gen_tab import WagelistGenTab
-        from tabs.wagelist_send_tab import WagelistSendTab
-        from tabs.wc_gen_tab import WcGenTab
-        from tabs.mb_entry_tab import MbEntryTab
-        from tabs.if_edit_tab import IfEditTab
-        from tabs.musterroll_gen_tab import MusterrollGenTab
-        from tabs.about_tab import AboutTab
-        from tabs.jobcard_verify_tab import JobcardVerifyTab
-        from tabs.fto_generation_tab import FtoGenerationTab
-        from tabs.workcode_extractor_tab import WorkcodeExtractorTab
-        from tabs.add_activity_tab import AddActivityTab
-        from tabs.abps_verify_tab import AbpsVerifyTab
-        from tabs.del_work_alloc_tab import DelWorkAllocTab
-        from tabs.update_estimate_tab import UpdateEstimateTab
-        from tabs.duplicate_mr_tab import DuplicateMrTab
-        from tabs.feedback_tab import FeedbackTab
-        from tabs.file_management_tab import FileManagementTab
-        from tabs.scheme_closing_tab import SchemeClosingTab
-        from tabs.emb_verify_tab import EmbVerifyTab
-        from tabs.resend_rejected_wg_tab import ResendRejectedWgTab
-        from tabs.SA_report_tab import SAReportTab
-        from tabs.mis_reports_tab import MisReportsTab
-        from tabs.demand_tab import DemandTab
-        from tabs.mr_tracking_tab import MrTrackingTab
-        from tabs.dashboard_report_tab import DashboardReportTab
-        from tabs.mr_fill_tab import MrFillTab
-        from tabs.pdf_merger_tab import PdfMergerTab
-        from tabs.issued_mr_report_tab import IssuedMrReportTab
-        from tabs.zero_mr_tab import ZeroMrTab
-        from tabs.work_allocation_tab import WorkAllocationTab
-        from tabs.sarkar_aapke_dwar_tab import SarkarAapkeDwarTab
-        from tabs.sad_update_tab import SADUpdateStatusTab
-
-        return {
-            "Core NREGA Tasks": {
-                "MR Gen": {"creation_func": MusterrollGenTab, "icon": self.icon_images.get("emoji_mr_gen"), "key": "muster"},
-                "MR Fill": {"creation_func": MrFillTab, "icon": self.icon_images.get("emoji_mr_fill"), "key": "mr_fill"},
-                "MR Payment": {"creation_func": MsrTab, "icon": self.icon_images.get("emoji_mr_payment"), "key": "msr"},
-                "Gen Wagelist": {"creation_func": WagelistGenTab, "icon": self.icon_images.get("emoji_gen_wagelist"), "key": "gen"},
-                "Send Wagelist": {"creation_func": WagelistSendTab, "icon": self.icon_images.get("emoji_send_wagelist"), "key": "send"},
-                "FTO Generation": {"creation_func": FtoGenerationTab, "icon": self.icon_images.get("emoji_fto_gen"), "key": "fto_gen"},
-                "Scheme Closing": {"creation_func": SchemeClosingTab, "icon": self.icon_images.get("emoji_scheme_closing"), "key": "scheme_close"},
-                "Del Work Alloc": {"creation_func": DelWorkAllocTab, "icon": self.icon_images.get("emoji_del_work_alloc"), "key": "del_work_alloc"},
-                "Duplicate MR Print": {"creation_func": DuplicateMrTab, "icon": self.icon_images.get("emoji_duplicate_mr"), "key": "dup_mr"},
-                "Demand": {"creation_func": DemandTab, "icon": self.icon_images.get("emoji_demand"), "key": "demand"},
-                "Allocation": {"creation_func": WorkAllocationTab, "icon": self.icon_images.get("emoji_work_alloc"), "key": "allocation"},
-            },
-            "JE & AE Automation": {
-                "eMB Entry": {"creation_func": MbEntryTab, "icon": self.icon_images.get("emoji_emb_entry"), "key": "mb_entry"},
-                "eMB Verify": {"creation_func": EmbVerifyTab, "icon": self.icon_images.get("emoji_emb_verify"), "key": "emb_verify"},
-            },
-            "Records & Workcode": {
-                "WC Gen": {"creation_func": WcGenTab, "icon": self.icon_images.get("emoji_wc_gen"), "key": "wc_gen"},
-                "IF Editor": {"creation_func": IfEditTab, "icon": self.icon_images.get("emoji_if_editor"), "key": "if_edit"},
-                "Add Activity": {"creation_func": AddActivityTab, "icon": self.icon_images.get("emoji_add_activity"), "key": "add_activity"},
-                "Update Estimate": {"creation_func": UpdateEstimateTab, "icon": self.icon_images.get("emoji_update_outcome"), "key": "update_outcome"},
-            },
-            "Utilities & Verification": {
-                "Verify Jobcard": {"creation_func": JobcardVerifyTab, "icon": self.icon_images.get("emoji_verify_jobcard"), "key": "jc_verify"},
-                "Verify ABPS": {"creation_func": AbpsVerifyTab, "icon": self.icon_images.get("emoji_verify_abps"), "key": "abps_verify"},
-                "Workcode Extractor": {"creation_func": WorkcodeExtractorTab, "icon": self.icon_images.get("emoji_wc_extractor"), "key": "wc_extract"},
-                "Resend Rejected WG": {"creation_func": ResendRejectedWgTab, "icon": self.icon_images.get("emoji_resend_wg"), "key": "resend_wg"},
-                "PDF Merger": {"creation_func": PdfMergerTab, "icon": self.icon_images.get("emoji_pdf_merger"), "key": "pdf_merger"},
-                "Zero Mr": {"creation_func": ZeroMrTab, "icon": self.icon_images.get("emoji_zero_mr"), "key": "zero_mr"},
-                "File Manager": {"creation_func": FileManagementTab, "icon": self.icon_images.get("emoji_file_manager"), "key": "file_manager"},
-            },
-            "AYASAD": {
-                "Sarkar Aapke Dwar": {"creation_func": SarkarAapkeDwarTab, "icon": self.icon_images.get("emoji_sad_auto"), "key": "sad_auto"},
-                "SAD Update Status": {"creation_func": SADUpdateStatusTab, "icon": self.icon_images.get("emoji_sad_status"), "key": "sad_status"},
-            },
-            "Reporting": {
-                "Social Audit Report": {"creation_func": SAReportTab, "icon": self.icon_images.get("emoji_social_audit"), "key": "social_audit_respond"},
-                "MIS Reports": {"creation_func": MisReportsTab, "icon": self.icon_images.get("emoji_mis_reports"), "key": "mis_reports"},
-                "MR Tracking": {"creation_func": MrTrackingTab, "icon": self.icon_images.get("emoji_mr_tracking"), "key": "mr_tracking"},
-                "Issued MR Details": {"creation_func": IssuedMrReportTab, "icon": self.icon_images.get("emoji_issued_mr_report"), "key": "issued_mr_report"},
-                "Dashboard Report": {"creation_func": DashboardReportTab, "icon": self.icon_images.get("emoji_dashboard_report"), "key": "dashboard_report"},
-            },
-            "Application": {
-                 "Feedback": {"creation_func": FeedbackTab, "icon": self.icon_images.get("emoji_feedback")},
-                 "About": {"creation_func": AboutTab, "icon": self.icon_images.get("emoji_about")},
-            }
-        }
-
-    def show_frame(self, page_name, raise_frame=True):
+        """
+        Nav structure from TAB_REGISTRY. Sirf naam, icon aur category; tab ka module (selenium, pandas...)
+        tabhi import hota hai jab "creation_func" pehli baar call hota hai.
+        """
+        return {cat: {name: {"creation_func": (lambda parent, app, n=name: self.get_tab_class(n)(parent, app)),
+                             "icon": self.icon_images.get(entry["icon"]), "key": entry.get("key")}
+                      for name, entry in tabs.items()}
+                for cat, tabs in TAB_REGISTRY.items()}
+
+    def get_tab_class(self, page_name):
+        """Imports the tab's module on first use and returns its class."""
+        entry = next(tabs[page_name] for tabs in TAB_REGISTRY.values() if page_name in tabs)
+        return getattr(importlib.import_module(entry["module"]), entry["class"])
+
+    def _prewarm_tab_modules(self):
+        """Background-imports the modules of the most used tabs so their first open is instant (no widgets are built)."""
+        prewarm = config.TAB_PREWARM_CONFIG
+        if not prewarm.get("enabled", True): return
+        by_key = {entry.get("automation_key", entry.get("key")): name for tabs in TAB_REGISTRY.values() for name, entry in tabs.items()}
+        names = [by_key[k] for k in self.history_manager.get_most_used_keys(prewarm.get("count", 3)) if k in by_key]
+        def _worker():
+            for name in names:
+                if name in self.tab_instances: continue
+                started = time.perf_counter()
+                try: self.get_tab_class(name)
+                except Exception as e: logging.warning(f"Pre-warm of '{name}' failed: {e}"); continue
+                logging.info(f"Pre-warmed '{name}' in {(time.perf_counter() - started) * 1000:.0f} ms")
+        if names: threading.Thread(target=_worker, daemon=True).start()
+
+    def show_frame(self, page_name, raise_frame=True, on_ready=None):
+        """Shows a tab, building it first if needed. `on_ready(instance)` runs once the tab exists (use it for data handoffs)."""
         # Step 1: Agar tab pehle se loaded hai, turant dikha do
         if page_name in self.tab_instances:
+            self._tab_lru.move_to_end(page_name)
             if raise_frame:
                 self.content_frames[page_name].tkraise()
-                self._update_nav_button_color(page_name)
+                self._update_nav_button_color(page_name); self.current_page = page_name
+            if on_ready: on_ready(self.tab_instances[page_name])
             return
 
         # Step 2: Agar tab loaded nahi hai, toh pehle SKELETON dikhao
@@ -1456,6 +1801,7 @@ class NregaBotApp(ctk.CTk):
         self.update_idletasks() # Screen par skeleton force karo draw hone ke liye
         
         # Step 3: Thoda sa delay dekar asli data load karo (taaki UI freeze na ho)
+        shown = startup_profiler.phase(f"show_frame:{page_name}") if raise_frame else contextlib.nullcontext()
         def load_actual_tab():
             try:
                 tabs = self.get_tabs_definition()
@@ -1467,9 +1813,13 @@ class NregaBotApp(ctk.CTk):
                         self.content_frames[page_name] = frame
                         
                         # Asli content initialize karo (Yeh time leta hai)
-                        instance = tab_items[page_name]["creation_func"](frame, self)
-                        instance.pack(expand=True, fill="both")
+                        rss_before = self._process_rss_mb()
+                        with shown:
+                            instance = tab_items[page_name]["creation_func"](frame, self)
+                            instance.pack(expand=True, fill="both")
                         self.tab_instances[page_name] = instance
+                        self._restore_tab_snapshot(page_name, instance)
+                        self._record_tab_opened(page_name, rss_before)
                         
                         # Skeleton hatao aur asli frame dikhao
                         skeleton.stop()
@@ -1477,7 +1827,10 @@ class NregaBotApp(ctk.CTk):
                         
                         if raise_frame:
                             frame.tkraise()
-                            self._update_nav_button_color(page_name)
+                            self._update_nav_button_color(page_name); self.current_page = page_name
+                            if startup_profiler.ENABLED: self.after_idle(self._finish_startup_benchmark)
+                        if on_ready: self.after_idle(on_ready, instance) # Snapshot restore ke baad, taaki handoff data na mite
+                        self.after_idle(self._unload_idle_tabs)
                         break
             except Exception as e:
                 print(f"Error loading tab {page_name}: {e}")
@@ -1487,6 +1840,89 @@ class NregaBotApp(ctk.CTk):
         # 50ms baad load function chalao (UI ko saans lene do)
         self.after(50, load_actual_tab)
 
+    # --- LRU tab unloading ---
+    def _tab_snapshot_path(self, page_name):
+        slug = "".join(c if c.isalnum() else "_" for c in page_name)
+        return self.get_data_path(os.path.join("tab_snapshots", f"{slug}.json"))
+
+    @staticmethod
+    def _process_rss_mb():
+        try:
+            import psutil
+            return psutil.Process().memory_info().rss / (1024 * 1024)
+        except Exception: return None # psutil optional hai
+
+    def _record_tab_opened(self, page_name, rss_before):
+        self._tab_lru[page_name] = True; self._tab_lru.move_to_end(page_name)
+        stats = self.tab_memory.setdefault(page_name, {"opens": 0, "opened_mb": None, "snapshot_kb": None})
+        rss_after = self._process_rss_mb()
+        stats["opens"] += 1; stats["snapshot_kb"] = None
+        if rss_before is not None and rss_after is not None: stats["opened_mb"] = max(0.0, rss_after - rss_before)
+
+    def _restore_tab_snapshot(self, page_name, instance):
+        path = self._tab_snapshot_path(page_name)
+        if not os.path.exists(path): return
+        try: tab_snapshot.restore(instance, tab_snapshot.load(path))
+        except Exception as e: logging.warning(f"Could not restore '{page_name}' from its snapshot: {e}")
+        finally:
+            try: os.remove(path)
+            except OSError: pass
+
+    def _is_tab_busy(self, page_name):
+        key = getattr(self.tab_instances.get(page_name), "automation_key", None)
+        thread = self.automation_threads.get(key)
+        return key in self.active_automations or bool(thread and thread.is_alive())
+
+    def _unload_idle_tabs(self):
+        """Loaded tabs `max_loaded_tabs` se zyada hon to sabse purane idle tabs unload karo."""
+        cfg = config.TAB_UNLOAD_CONFIG
+        if not cfg.get("enabled", True): return
+        excess = len(self._tab_lru) - cfg["max_loaded_tabs"]
+        if excess <= 0: return
+        keep = set(cfg.get("keep_loaded", ()))
+        idle = [name for name in self._tab_lru if name not in keep and name != self.current_page and not self._is_tab_busy(name)]
+        for name in idle[:excess]: self.unload_tab(name)
+
+    def unload_tab(self, page_name):
+        """Writes the tab's inputs/results to a snapshot and destroys its widgets; show_frame rebuilds it later."""
+        instance = self.tab_instances.get(page_name)
+        if instance is None: return False
+        path = self._tab_snapshot_path(page_name)
+        try: tab_snapshot.save(path, tab_snapshot.capture(instance))
+        except Exception as e:
+            logging.warning(f"Not unloading '{page_name}', snapshot failed: {e}"); return False
+        frame = self.content_frames.pop(page_name); del self.tab_instances[page_name]; self._tab_lru.pop(page_name, None)
+        prefix = str(frame) + "."
+        with self._log_sinks_lock:
+            for log in [log for log in self._log_sinks if str(log).startswith(prefix)]: self._log_sinks.pop(log).close()
+        frame.destroy()
+        stats = self.tab_memory.get(page_name)
+        if stats is not None: stats["snapshot_kb"] = os.path.getsize(path) / 1024
+        logging.info(f"Unloaded idle tab '{page_name}' (snapshot {path})")
+        return True
+
+    def get_tab_memory_report(self):
+        """One row per visited tab for the About tab: loaded state, widgets, result rows and memory taken on open."""
+        rows = []
+        for name, stats in self.tab_memory.items():
+            instance = self.tab_instances.get(name)
+            rows.append({"name": name, "loaded": instance is not None, "opens": stats["opens"], "opened_mb": stats["opened_mb"],
+                         "snapshot_kb": stats["snapshot_kb"],
+                         "widgets": tab_snapshot.widget_count(self.content_frames[name]) if instance is not None else 0,
+                         "rows": tab_snapshot.result_row_count(instance) if instance is not None else 0})
+        return {"process_mb": self._process_rss_mb(), "tabs": rows}
+
+    def _finish_startup_benchmark(self):
+        """Benchmark mode: pehla tab screen par aate hi report likho aur app band karo."""
+        try:
+            startup_profiler.mark("first_frame_shown")
+            data = startup_profiler.finish(config.APP_NAME, config.APP_VERSION, self.get_data_path)
+        except Exception as e:
+            logging.error(f"Startup benchmark report failed: {e}"); data = None
+        if not data: return
+        logging.info(f"Startup benchmark written to {data['path']}\n{startup_profiler.format_summary(data)}")
+        self.after(500, lambda: self.on_closing(force=True))
+
     def _update_nav_button_color(self, page_name):
         for name, btn in self.nav_buttons.items(): 
             btn.configure(fg_color=("gray90", "gray28") if name == page_name else "transparent")
@@ -1495,54 +1931,37 @@ class NregaBotApp(ctk.CTk):
         if self.license_info.get('key'): webbrowser.open_new_tab(f"{config.LICENSE_SERVER_URL}/authenticate-from-app/{self.license_info['key']}?next=files")
         else: self.play_sound("error"); messagebox.showerror("Error", "License key not found.")
 
+    def _handoff(self, page_name, deliver, message=None, title="Data Transferred"):
+        """Opens `page_name` and calls `deliver(tab)` once it is loaded (it may have been unloaded or never opened)."""
+        def _on_ready(tab):
+            deliver(tab)
+            if message: self.play_sound("success"); messagebox.showinfo(title, message)
+        self.show_frame(page_name, on_ready=_on_ready)
+
     def switch_to_if_edit_with_data(self, data):
-        self.show_frame("IF Editor")
-        if self.tab_instances.get("IF Editor"):
-            self.tab_instances["IF Editor"].load_data_from_wc_gen(data)
-            self.play_sound("success"); messagebox.showinfo("Data Transferred", f"{len(data)} items transferred.")
+        self._handoff("IF Editor", lambda tab: tab.load_data_from_wc_gen(data), f"{len(data)} items transferred.")
     
     def run_work_allocation_from_demand(self, panchayat_name: str, work_key: str):
-        self.show_frame("Allocation")
-        alloc = self.tab_instances.get("Allocation")
-        if alloc:
-            self.after(200, alloc.run_automation_from_demand, panchayat_name, work_key)
-            self.play_sound("success"); messagebox.showinfo("Handoff", "Starting Work Allocation...")
+        self._handoff("Allocation", lambda tab: self.after(200, tab.run_automation_from_demand, panchayat_name, work_key),
+                      "Starting Work Allocation...", title="Handoff")
 
     def switch_to_msr_tab_with_data(self, workcodes: str, panchayat_name: str):
-        self.show_frame("MR Payment")
-        if self.tab_instances.get("MR Payment"):
-            self.tab_instances["MR Payment"].load_data_from_mr_tracking(workcodes, panchayat_name)
-            self.play_sound("success"); messagebox.showinfo("Data Transferred", "Data sent to MR Payment.")
+        self._handoff("MR Payment", lambda tab: tab.load_data_from_mr_tracking(workcodes, panchayat_name), "Data sent to MR Payment.")
 
     def switch_to_emb_entry_with_data(self, workcodes: str, panchayat_name: str):
-        self.show_frame("eMB Entry")
-        if self.tab_instances.get("eMB Entry"):
-            self.tab_instances["eMB Entry"].load_data_from_mr_tracking(workcodes, panchayat_name)
-            self.play_sound("success"); messagebox.showinfo("Data Transferred", "Data sent to eMB Entry.")
+        self._handoff("eMB Entry", lambda tab: tab.load_data_from_mr_tracking(workcodes, panchayat_name), "Data sent to eMB Entry.")
 
     def switch_to_mr_fill_with_data(self, workcodes: str, panchayat_name: str):
-        self.show_frame("MR Fill")
-        if self.tab_instances.get("MR Fill"):
-            self.tab_instances["MR Fill"].load_data_from_dashboard(workcodes, panchayat_name)
-            self.play_sound("success"); messagebox.showinfo("Data Transferred", "Data sent to MR Fill.")
+        self._handoff("MR Fill", lambda tab: tab.load_data_from_dashboard(workcodes, panchayat_name), "Data sent to MR Fill.")
 
     def switch_to_mr_tracking_for_abps(self):
-        self.show_frame("MR Tracking")
-        if self.tab_instances.get("MR Tracking"):
-            self.tab_instances["MR Tracking"].set_for_abps_check()
-            self.play_sound("success"); messagebox.showinfo("Action Required", "Fill details to check ABPS Labour")
+        self._handoff("MR Tracking", lambda tab: tab.set_for_abps_check(), "Fill details to check ABPS Labour", title="Action Required")
 
     def switch_to_duplicate_mr_with_data(self, workcodes: str, panchayat_name: str):
-        self.show_frame("Duplicate MR Print")
-        if self.tab_instances.get("Duplicate MR Print"):
-            self.tab_instances["Duplicate MR Print"].load_data_from_report(workcodes, panchayat_name)
-            self.play_sound("success"); messagebox.showinfo("Data Transferred", "Data sent to Duplicate MR.")
+        self._handoff("Duplicate MR Print", lambda tab: tab.load_data_from_report(workcodes, panchayat_name), "Data sent to Duplicate MR.")
 
     def switch_to_zero_mr_tab_with_data(self, data_list: list):
-        self.show_frame("Zero Mr")
-        if self.tab_instances.get("Zero Mr"):
-            self.tab_instances["Zero Mr"].load_data_from_mr_tracking(data_list)
-            self.play_sound("success"); messagebox.showinfo("Data Transferred", "Data sent to Zero MR.")
+        self._handoff("Zero Mr", lambda tab: tab.load_data_from_mr_tracking(data_list), "Data sent to Zero MR.")
     
     def _create_footer(self):
         footer = ctk.CTkFrame(self, height=40, corner_radius=0)
@@ -1614,9 +2033,7 @@ class NregaBotApp(ctk.CTk):
             return True
 
     def send_wagelist_data_and_switch_tab(self, start, end):
-        self.show_frame("Send Wagelist")
-        send_tab = self.tab_instances.get("Send Wagelist")
-        if send_tab: self.after(100, lambda: send_tab.populate_wagelist_data(start, end))
+        self._handoff("Send Wagelist", lambda send_tab: self.after(100, lambda: send_tab.populate_wagelist_data(start, end)))
 
     def show_activation_window(self):
         win = ctk.CTkToplevel(self); win.title("Activate Product")
@@ -1722,17 +2139,38 @@ class NregaBotApp(ctk.CTk):
         except Exception: pass
         return False
 
-    def start_automation_thread(self, key, target, args=()):
+    def start_automation_thread(self, key, target, args=(), job_params=None):
+        """
+        Runs `target` on a worker thread. With `job_params` (the run's inputs) the run is checkpointed
+        in the job store per item; an unfinished run with the same inputs can be resumed.
+        """
         if self.automation_threads.get(key) and self.automation_threads[key].is_alive():
             self.play_sound("error")
             messagebox.showwarning("Busy", "Task running")
             return
         
+        if job_params is not None:
+            resume_id = None
+            try:
+                previous = self.job_store.find_unfinished(key, job_params)
+                if previous and previous["done"] and messagebox.askyesno(
+                        "Resume Previous Run?",
+                        f"Pichla run ({datetime.fromtimestamp(previous['created_at']).strftime('%d-%m-%Y %H:%M')}) beech mein ruk gaya tha.\n"
+                        f"{previous['done']} of {previous['total']} items ho chuke hain.\n\n"
+                        "Yes = wahin se resume karein (done items skip honge)\nNo = shuru se chalayein"):
+                    resume_id = previous["run_id"]
+                self.job_store.begin(key, job_params, resume_run_id=resume_id)
+            except Exception as e: # Job store kharab ho to bhi automation chalni chahiye
+                logging.error(f"Job store unavailable: {e}")
+
         self.play_sound("start")
         self.history_manager.increment_usage(key)
         self.prevent_sleep()
         self.active_automations.add(key)
         self.stop_events[key] = threading.Event()
+        self.lean_mode.register(key, getattr(target, "__self__", None))
+        tab = getattr(target, "__self__", None)
+        if hasattr(tab, "begin_result_run"): tab.begin_result_run(job_params) # Results DB ke liye panchayat
 
         # --- AUTO MINIMIZE LOGIC (Mac Chrome Fix Added) ---
         if self.minimize_var.get() and self.driver:
@@ -1761,16 +2199,30 @@ class NregaBotApp(ctk.CTk):
             try:
                 target(*args)
             finally:
+                self.lean_mode.unregister(key)
+                try: self.job_store.end(key, stopped=self.stop_events[key].is_set())
+                except Exception as e: logging.error(f"Job store: could not close run: {e}")
                 self.after(0, self.on_automation_finished, key)
         
         t = threading.Thread(target=wrapper, daemon=True)
         self.automation_threads[key] = t
         t.start()
 
-    def log_message(self, log, msg, level="info"): 
-        log.configure(state="normal"); log.insert(tkinter.END, f"[{time.strftime('%H:%M:%S')}] {msg}\n"); log.configure(state="disabled"); log.see(tkinter.END)
-    
-    def clear_log(self, log): log.configure(state="normal"); log.delete("1.0", tkinter.END); log.configure(state="disabled")
+    def get_log_sink(self, log):
+        """Batched sink of a log textbox, created on first use. Safe to call from worker threads."""
+        with self._log_sinks_lock:
+            sink = self._log_sinks.get(log)
+            if sink is None:
+                owner = log
+                while owner is not None and not getattr(owner, "automation_key", None): owner = getattr(owner, "master", None)
+                name = owner.automation_key if owner is not None else "app"
+                sink = self._log_sinks[log] = LogSink(log, name, self.get_data_path(os.path.join("logs", f"{name}.log")), config.LOG_SINK_CONFIG)
+            return sink
+
+    # Kisi bhi thread se call ho sakte hain; textbox update Tk thread par batch mein hota hai
+    def log_message(self, log, msg, level="info"): self.get_log_sink(log).write(msg, level)
+    def clear_log(self, log): self.get_log_sink(log).clear()
+    def get_log_text(self, log): return self.get_log_sink(log).text()
 
     def on_closing(self, force=False):
         if force or messagebox.askokcancel("Quit", "Quit application?"):
@@ -1779,6 +2231,10 @@ class NregaBotApp(ctk.CTk):
             if self.driver: 
                 try: self.driver.quit()
                 except: pass
+            self.driver_pool.close_all(); self.report_pool.close_all(); self.process_workers.close_all()
+            for sink in list(self._log_sinks.values()): sink.close()
+            self.history_manager.close() # Bachi hui history writes disk par
+            self.state_store.close(); self.results_store.close(); self.work_index.close()
             for e in self.stop_events.values(): e.set()
             try: 
                 import pygame
@@ -1817,7 +2273,7 @@ class NregaBotApp(ctk.CTk):
     def show_update_prompt(self, version):
         self.play_sound("update")
         if messagebox.askyesno("Update", f"Version {version} available. View?"):
-            self.show_frame("About"); self.tab_instances.get("About").tab_view.set("Updates")
+            self.show_frame("About", on_ready=lambda about: about.tab_view.set("Updates"))
 
     def update_history(self, key, val): self.history_manager.save_entry(key, val)
     def remove_history(self, key, val): self.history_manager.remove_entry(key, val)
@@ -1839,37 +2295,37 @@ class NregaBotApp(ctk.CTk):
         threading.Thread(target=_worker, daemon=True).start()
 
 def initialize_webdriver_manager():
+    # Driver paths are cached per browser version, so this only touches the network after a browser update.
     try:
-        from webdriver_manager.chrome import ChromeDriverManager
-        from selenium.webdriver.chrome.service import Service as ChromeService
-        ChromeService(ChromeDriverManager().install())
-    except: pass
-    try:
-        from webdriver_manager.firefox import GeckoDriverManager
-        from selenium.webdriver.firefox.service import Service as FirefoxService
-        FirefoxService(GeckoDriverManager().install())
-    except: pass
+        from tabs.driver_cache import warm_up
+        warm_up()
+    except Exception: pass
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support() # Packaged exe mein worker process yahin se apna kaam shuru karta hai
     logging.basicConfig(level=logging.INFO)
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    bound = True
     try: s.bind(("127.0.0.1", 60123))
     except:
-        try: s.connect(("127.0.0.1", 60123)); s.sendall(b'focus')
-        except: pass
-        sys.exit(0)
+        bound = False
+        # Benchmark run ko already-open instance se nahi rokna
+        if not startup_profiler.ENABLED:
+            try: s.connect(("127.0.0.1", 60123)); s.sendall(b'focus')
+            except: pass
+            sys.exit(0)
     
     threading.Thread(target=initialize_webdriver_manager, daemon=True).start()
     
     try:
-        app = NregaBotApp()
+        with startup_profiler.phase("app_init"): app = NregaBotApp()
         def listen():
             s.listen(1)
             while True:
                 c, a = s.accept(); d = c.recv(1024)
                 if d == b'focus': app.after(0, app.bring_to_front)
                 c.close()
-        threading.Thread(target=listen, daemon=True).start()
+        if bound: threading.Thread(target=listen, daemon=True).start()
         app.mainloop()
     except Exception as e:
         messagebox.showerror("Fatal Error", str(e))
@@ -13,6 +13,7 @@ from fpdf import FPDF
 from utils import resource_path
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .table_extractor import extract_table
 
 class SAReportTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -108,20 +109,17 @@ class SAReportTab(BaseAutomationTab):
                 try: wait.until(EC.staleness_of(old_first_row))
                 except TimeoutException: self.app.log_message(self.log_display, "Staleness check timed out, proceeding...", "warning")
 
-            table = wait.until(EC.presence_of_element_located((By.ID, RESULTS_TABLE_ID))); total_rows = len(table.find_elements(By.XPATH, ".//tr[position()>1]")); self.app.log_message(self.log_display, f"Found {total_rows} records.")
+            table = wait.until(EC.presence_of_element_located((By.ID, RESULTS_TABLE_ID))); table_rows = extract_table(driver, table); total_rows = len(table_rows); self.app.log_message(self.log_display, f"Found {total_rows} records.")
             for i in range(total_rows):
                 if self.app.stop_events[self.automation_key].is_set(): self.app.log_message(self.log_display, "Stop signal received.", "warning"); break
                 
                 # --- UPDATE: Better Status ---
-                status_msg = f"Processing row {i+1}/{total_rows}"
-                self.app.after(0, self.app.set_status, status_msg)
-                self.app.after(0, self.update_status, status_msg, (i+1)/total_rows)
+                self.progress.update(f"Processing row {i+1}/{total_rows}", (i+1)/total_rows)
                 # --- END UPDATE ---
                 
-                row = wait.until(EC.presence_of_element_located((By.XPATH, f"//table[@id='{RESULTS_TABLE_ID}']//tr[{i+2}]"))); cells = row.find_elements(By.TAG_NAME, "td")
-                
-                sr_no, district, block, panchayat, issue_no, issue_type, forwarded_to, status = (cells[0].text.strip(), cells[1].text.strip(), cells[2].text.strip(), cells[3].text.strip(), cells[4].text.strip(), cells[5].text.strip(), cells[6].text.strip(), cells[7].text.strip())
-                self.app.log_message(self.log_display, f"({sr_no}/{total_rows}) Clicking 'View' for Issue: {issue_no}"); view_button = cells[9].find_element(By.TAG_NAME, "input"); driver.execute_script("arguments[0].click();", view_button)
+                sr_no, district, block, panchayat, issue_no, issue_type, forwarded_to, status = table_rows[i][:8]
+                view_button = wait.until(EC.presence_of_element_located((By.XPATH, f"//table[@id='{RESULTS_TABLE_ID}']//tr[{i+2}]/td[10]//input")))
+                self.app.log_message(self.log_display, f"({sr_no}/{total_rows}) Clicking 'View' for Issue: {issue_no}"); driver.execute_script("arguments[0].click();", view_button)
                 modal_wait = WebDriverWait(driver, 10); issue_description = modal_wait.until(EC.presence_of_element_located((By.ID, "ContentPlaceHolder1_lblIssueDesc"))).text.strip()
                 modal_wait.until(EC.element_to_be_clickable((By.ID, "btnCloseModel"))).click(); modal_wait.until(EC.invisibility_of_element_located((By.ID, "successModal")))
                 try: modal_wait.until(EC.invisibility_of_element_located((By.CLASS_NAME, "modal-backdrop")))
@@ -132,7 +130,7 @@ class SAReportTab(BaseAutomationTab):
         except (TimeoutException, NoSuchElementException, StaleElementReferenceException) as e: error_msg = f"A browser error occurred: {str(e).splitlines()[0]}"; self.app.log_message(self.log_display, error_msg, "error"); messagebox.showerror("Automation Error", error_msg)
         except Exception as e: self.app.log_message(self.log_display, f"An unexpected error occurred: {e}", "error"); messagebox.showerror("Critical Error", f"An unexpected error occurred: {e}")
         finally:
-            self.app.after(0, self.set_ui_state, False); self.app.after(0, self.update_status, "Automation Finished", 1.0); self.app.after(0, self.app.set_status, "Automation Finished")
+            self.app.after(0, self.set_ui_state, False); self.progress.update("Automation Finished", 1.0, immediate=True)
             if not self.app.stop_events[self.automation_key].is_set():
                 self.app.after(100, lambda: messagebox.showinfo("Complete", "Social Audit Report generation has finished."))
             
@@ -188,9 +186,8 @@ class SAReportTab(BaseAutomationTab):
             if not file_path: return
             
             # Use the base class method to generate the PNG
-            success = self.generate_report_image(data, headers, title, date_str, file_path)
-            if success:
-                messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}")
+            self.generate_report_image(data, headers, title, date_str, file_path,
+                                       on_done=lambda: messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}"))
 
         elif "PDF" in export_format:
             default_filename = f"Social_Audit_Report_{safe_panchayat}-{current_date_str}.pdf"
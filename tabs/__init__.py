@@ -0,0 +1 @@
+# tabs/__init__.py
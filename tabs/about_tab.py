@@ -60,6 +60,8 @@ class AboutTab(ctk.CTkFrame):
         self.tab_view.add("Subscription")
         self.tab_view.add("Changelog")
         self.tab_view.add("Updates")
+        self.tab_view.add("Memory")
+        self.tab_view.configure(command=lambda: self.tab_view.get() == "Memory" and self.refresh_memory_usage())
 
         # --- Subscription Tab ---
         sub_tab = self.tab_view.tab("Subscription")
@@ -194,6 +196,30 @@ class AboutTab(ctk.CTkFrame):
         versions_link.grid(row=6, column=0, sticky='s', pady=(10, 5))
         versions_link.bind("<Button-1>", lambda e: webbrowser.open(versions_url))
 
+        # --- Memory Tab ---
+        memory_tab = self.tab_view.tab("Memory")
+        memory_tab.grid_rowconfigure(1, weight=1); memory_tab.grid_columnconfigure(0, weight=1)
+        self.memory_summary_label = ctk.CTkLabel(memory_tab, text="", anchor="w")
+        self.memory_summary_label.grid(row=0, column=0, sticky="w", padx=5, pady=(5, 0))
+        ctk.CTkButton(memory_tab, text="Refresh", width=90, command=self.refresh_memory_usage).grid(row=0, column=1, padx=5, pady=(5, 0))
+        self.memory_text = ctk.CTkTextbox(memory_tab, wrap="none", state="disabled", font=ctk.CTkFont(family="Courier New", size=12))
+        self.memory_text.grid(row=1, column=0, columnspan=2, sticky="nsew", padx=5, pady=5)
+
+    def refresh_memory_usage(self):
+        """Fills the Memory tab with per-tab usage from the app (idle tabs are unloaded, see TAB_UNLOAD_CONFIG)."""
+        report = self.app.get_tab_memory_report()
+        process_mb = report["process_mb"]
+        loaded = sum(1 for t in report["tabs"] if t["loaded"])
+        limit = config.TAB_UNLOAD_CONFIG["max_loaded_tabs"]
+        self.memory_summary_label.configure(text=(f"App memory: {process_mb:.0f} MB  |  " if process_mb is not None else "") + f"Loaded tabs: {loaded} (limit {limit})")
+        lines = [f"{'Tab':<24}{'State':<10}{'Opened':>8}{'+MB on open':>13}{'Widgets':>9}{'Rows':>8}{'Snapshot':>11}"]
+        for t in sorted(report["tabs"], key=lambda t: (not t["loaded"], t["name"])):
+            opened_mb = f"{t['opened_mb']:.1f}" if t["opened_mb"] is not None else "-"
+            snapshot = f"{t['snapshot_kb']:.0f} KB" if t["snapshot_kb"] is not None else "-"
+            lines.append(f"{t['name'][:23]:<24}{'loaded' if t['loaded'] else 'unloaded':<10}{t['opens']:>8}{opened_mb:>13}{t['widgets']:>9}{t['rows']:>8}{snapshot:>11}")
+        self.memory_text.configure(state="normal"); self.memory_text.delete("1.0", tkinter.END)
+        self.memory_text.insert("1.0", "\n".join(lines)); self.memory_text.configure(state="disabled")
+
     def update_subscription_details(self, license_info):
         self.license_info = license_info
         
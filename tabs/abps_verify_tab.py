@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -12,6 +11,7 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException,
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback
 
 class AbpsVerifyTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -116,9 +116,10 @@ class AbpsVerifyTab(BaseAutomationTab):
 
             # 1. Select Panchayat and determine villages
             self.app.log_message(self.log_display, f"Selecting Panchayat: {panchayat}")
-            Select(wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_DDL_panchayat")))).select_by_visible_text(panchayat)
+            panchayat_element = wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_DDL_panchayat")))
+            Select(panchayat_element).select_by_visible_text(panchayat)
             self.app.update_history("panchayat_name", panchayat)
-            time.sleep(1)
+            wait_for_postback(driver, panchayat_element)
 
             village_dd_id = "ctl00_ContentPlaceHolder1_DDL_Village"
             wait.until(lambda d: len(Select(d.find_element(By.ID, village_dd_id)).options) > 1)
@@ -244,5 +245,6 @@ class AbpsVerifyTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Automation Finished")
 
     def _log_result(self, job_card, app_name, status):
+        self._record_result(status, details=f"{job_card} {app_name}")
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=(job_card, app_name, status, timestamp)))
\ No newline at end of file
@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -12,6 +11,7 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException,
 
 import config
 from .base_tab import BaseAutomationTab
+from .page_wait import wait_for_postback
 
 class AddActivityTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -171,6 +171,7 @@ class AddActivityTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Automation Finished")
 
     def _log_result(self, work_key, status, details):
+        self._record_result(status, work_key, details=details)
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=(work_key, status, details, timestamp)))
 
@@ -229,7 +230,7 @@ class AddActivityTab(BaseAutomationTab):
             quantity_input.send_keys(quantity)
             quantity_input.send_keys(Keys.TAB)
 
-            time.sleep(2)
+            wait_for_postback(driver, quantity_input)
 
             # 6. Click Save
             self.app.log_message(self.log_display, "Saving activity...")
@@ -0,0 +1,217 @@
+# tabs/applicant_list.py
+"""
+Demand tab ka applicant panel.
+ApplicantModel CSV ke saare applicants rakhta hai: search ke liye trigram index (job card + naam),
+village code index, original_index -> position map aur selected positions ka set, taaki search,
+selection toggle aur "agle N job cards" sab bina poori list scan kiye ho sakein.
+ApplicantListView sirf dikhne wali rows ke liye checkboxes banata hai aur scroll par unhi ko reuse karta hai.
+"""
+import collections
+import customtkinter as ctk
+
+GRAM = 3
+
+
+def _grams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class ApplicantModel:
+    """Applicant dicts ('original_index', 'Name of Applicant', 'Job card number', '_selected') plus indexes."""
+
+    def __init__(self, records=(), village_code=None):
+        self.village_code = village_code # (job_card, village_code_logic) -> code, e.g. DemandTab._get_village_code
+        self.load(list(records))
+
+    def load(self, records):
+        self.records = records
+        self._position = {r['original_index']: i for i, r in enumerate(records)}
+        self._text = [f"{r['Job card number']}\n{r['Name of Applicant']}".lower() for r in records]
+        self._postings = collections.defaultdict(list) # trigram -> positions (ascending)
+        self._villages = {} # village_code_logic -> {code: positions}, pehli "v:" search par banta hai
+        for i, text in enumerate(self._text):
+            for gram in _grams(text): self._postings[gram].append(i)
+        self._selected = set()
+        self._jc_counts = collections.Counter()
+        for i, record in enumerate(records):
+            if record.get('_selected'): record['_selected'] = False; self.set_selected(i, True)
+
+    def __len__(self):
+        return len(self.records)
+
+    # --- Search ---
+    def search(self, query, village_logic=None):
+        """Positions whose job card or name contains `query` ("v:<code>" filters by village code, needs `village_logic`)."""
+        query = (query or "").lower().strip()
+        if not query: return range(len(self.records))
+        if query.startswith("v:"): return self._village_index(village_logic).get(query[2:].strip(), [])
+        if len(query) < GRAM: return [i for i, text in enumerate(self._text) if query in text]
+        postings = [self._postings.get(gram) for gram in _grams(query)]
+        if not all(postings): return []
+        return [i for i in min(postings, key=len) if query in self._text[i]]
+
+    def _village_index(self, logic):
+        if not logic or not self.village_code: return {}
+        if logic not in self._villages:
+            index = self._villages[logic] = collections.defaultdict(list)
+            for i, record in enumerate(self.records):
+                code = self.village_code(record['Job card number'], logic)
+                if code: index[code.lower()].append(i)
+        return self._villages[logic]
+
+    # --- Selection ---
+    @staticmethod
+    def is_selectable(record):
+        return "*" not in record.get('Name of Applicant', '') # '*' wale applicants ineligible hain
+
+    def position_of(self, record):
+        return self._position.get(record['original_index'], -1)
+
+    def is_selected(self, position):
+        return position in self._selected
+
+    def set_selected(self, position, selected=True):
+        record = self.records[position]
+        if bool(record['_selected']) == bool(selected): return
+        record['_selected'] = bool(selected)
+        jc = record['Job card number']
+        if selected:
+            self._selected.add(position); self._jc_counts[jc] += 1
+        else:
+            self._selected.discard(position); self._jc_counts[jc] -= 1
+            if not self._jc_counts[jc]: del self._jc_counts[jc]
+
+    def clear_selection(self):
+        for position in list(self._selected): self.set_selected(position, False)
+
+    def select_first(self, count):
+        """Selects the first `count` selectable applicants; returns how many were selected."""
+        selected = 0
+        for position, record in enumerate(self.records):
+            if selected >= count: break
+            if self.is_selectable(record): self.set_selected(position); selected += 1
+        return selected
+
+    def selected_records(self):
+        return [self.records[i] for i in sorted(self._selected)]
+
+    def selection_summary(self):
+        """(selected applicants, unique job cards)"""
+        return len(self._selected), len(self._jc_counts)
+
+    def find(self, job_card, name):
+        """Position of the applicant with this job card and name, or -1."""
+        query = f"{job_card}\n{name}".lower()
+        for i in self.search(job_card):
+            if self._text[i] == query: return i
+        return -1
+
+    def next_jobcard_positions(self, position, max_jobcards=5):
+        """Applicants after `position` that belong to the next `max_jobcards` job cards (its own card skipped)."""
+        own_jc = self.records[position]['Job card number']; next_jcs = set(); found = []
+        for i in range(position + 1, len(self.records)):
+            jc = self.records[i]['Job card number']
+            if jc == own_jc: continue
+            if jc not in next_jcs:
+                if len(next_jcs) >= max_jobcards: break
+                next_jcs.add(jc)
+            found.append(i)
+        return found
+
+
+class ApplicantListView(ctk.CTkFrame):
+    """
+    Virtualized checkbox list. Rows are ("applicant", position, is_next) or ("separator", text);
+    only the rows that fit are drawn, using a pool of checkbox/label slots that is reused on every scroll.
+    """
+    ROW_HEIGHT = 30
+
+    def __init__(self, parent, model, on_toggle, label_text=""):
+        super().__init__(parent)
+        self.model, self.on_toggle = model, on_toggle
+        self.grid_columnconfigure(0, weight=1); self.grid_rowconfigure(1, weight=1)
+        if label_text: ctk.CTkLabel(self, text=label_text).grid(row=0, column=0, columnspan=2, pady=(5, 0))
+        self.body = ctk.CTkFrame(self, fg_color="transparent")
+        self.body.grid(row=1, column=0, sticky="nsew", padx=(5, 0), pady=5)
+        self.body.grid_columnconfigure(0, weight=1)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.grid(row=1, column=1, sticky="ns", pady=5)
+        self._rows, self._slots, self._offset, self._state = [], [], 0, "normal"
+        self._default_text_color = ctk.ThemeManager.theme["CTkCheckBox"]["text_color"]
+        self.body.bind("<Configure>", lambda e: self._render())
+        for widget in (self, self.body): self._bind_wheel(widget)
+
+    def _bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", lambda e: self._scroll(-3 if e.delta > 0 else 3), add="+")
+        widget.bind("<Button-4>", lambda e: self._scroll(-3), add="+") # Linux
+        widget.bind("<Button-5>", lambda e: self._scroll(3), add="+")
+
+    # --- Public API ---
+    def set_rows(self, rows, keep_offset=False):
+        self._rows = rows
+        if not keep_offset: self._offset = 0
+        self._render()
+
+    def rows(self):
+        return self._rows
+
+    def refresh(self):
+        """Redraws the visible rows (e.g. after the selection changed)."""
+        self._render()
+
+    def set_state(self, state):
+        self._state = state; self._render()
+
+    # --- Rendering ---
+    def _page_size(self):
+        height = self.body.winfo_height()
+        if height <= 1: return 15 # Abhi map nahi hua
+        return max(1, int(height // (self.ROW_HEIGHT * ctk.ScalingTracker.get_widget_scaling(self))))
+
+    def _slot(self, index):
+        while len(self._slots) <= index:
+            n = len(self._slots); var = ctk.StringVar(value="off")
+            checkbox = ctk.CTkCheckBox(self.body, text="", variable=var, onvalue="on", offvalue="off", command=lambda slot=n: self._on_click(slot))
+            label = ctk.CTkLabel(self.body, text="", text_color="gray", anchor="w")
+            self._bind_wheel(checkbox); self._bind_wheel(label)
+            self._slots.append((checkbox, var, label))
+        return self._slots[index]
+
+    def _render(self):
+        page = self._page_size()
+        self._offset = max(0, min(self._offset, len(self._rows) - page))
+        window = self._rows[self._offset:self._offset + page]
+        for n, row in enumerate(window):
+            checkbox, var, label = self._slot(n)
+            if row[0] == "separator":
+                checkbox.grid_remove()
+                label.configure(text=row[1]); label.grid(row=n, column=0, sticky="ew", padx=10, pady=2)
+                continue
+            _, position, is_next = row
+            record = self.model.records[position]
+            label.grid_remove()
+            var.set("on" if self.model.is_selected(position) else "off")
+            if not self.model.is_selectable(record): color, state = "gray50", "disabled"
+            else: color, state = ("#a0a0ff" if is_next else self._default_text_color), self._state
+            checkbox.configure(text=f"{record['Job card number']}  -  {record['Name of Applicant']}", text_color=color, state=state)
+            checkbox.grid(row=n, column=0, sticky="ew", padx=10, pady=2)
+        for checkbox, var, label in self._slots[len(window):]:
+            checkbox.grid_remove(); label.grid_remove()
+        total = max(1, len(self._rows))
+        self.scrollbar.set(self._offset / total, min(1.0, (self._offset + page) / total))
+
+    def _on_click(self, slot):
+        index = self._offset + slot
+        if index >= len(self._rows) or self._rows[index][0] != "applicant": return
+        self.on_toggle(self._rows[index][1], self._slots[slot][1].get() == "on")
+
+    # --- Scrolling ---
+    def yview(self, *args):
+        if args and args[0] == "moveto": self._offset = int(float(args[1]) * len(self._rows))
+        elif args and args[0] == "scroll":
+            self._offset += int(args[1]) * (self._page_size() if len(args) > 2 and args[2] == "pages" else 1)
+        self._render()
+
+    def _scroll(self, units):
+        self.yview("scroll", units, "units")
+        return "break"
@@ -0,0 +1,132 @@
+# tabs/asset_cache.py
+"""
+Icon / image cache shared by the whole app (`app.icon_images`).
+Har PNG sirf ek baar decode hota hai (utne hi size tak chhota karke jitna kisi key ko chahiye), aur
+ek hi file + size wali keys ek hi CTkImage share karti hain. Non-critical icons pehli `get` par ya
+background warm-up mein bante hain. Decode hui images ek raw RGBA atlas file mein bhi likhi jaati hain,
+taaki agli baar startup par PNG decode kiye bina seedha bytes se image ban jaaye.
+"""
+import os, json, logging, threading
+from PIL import Image
+import customtkinter as ctk
+
+
+class AssetCache:
+    """Dict-like (`get`, `in`, `[]`) registry of CTkImages keyed by icon name."""
+
+    def __init__(self, resolve, atlas_path=None, scale=2, version=""):
+        self._resolve = resolve # relative asset path -> absolute path (resource_path)
+        self._atlas_path, self._scale, self._version = atlas_path, scale, version
+        self._specs = {} # key -> (path, size)
+        self._needed = {} # path -> largest pixel size any key needs
+        self._sources = {} # path -> decoded PIL image (downscaled to `_needed`)
+        self._images = {} # (path, size) -> CTkImage
+        self._failed = set()
+        self._atlas = None # path -> [offset, w, h, file_size] (valid for one app version)
+        self._atlas_bytes = b""
+        self._atlas_dirty = False
+        self._lock = threading.RLock()
+
+    # --- Registry ---
+    def register(self, key, path, size=(20, 20)):
+        """Records `key` -> `path` at `size`; nothing is read from disk yet."""
+        with self._lock:
+            self._specs[key] = (path, tuple(size))
+            self._needed[path] = max(self._needed.get(path, 0), max(size) * self._scale)
+
+    def __contains__(self, key):
+        return key in self._specs
+
+    def __getitem__(self, key):
+        image = self.get(key)
+        if image is None: raise KeyError(key)
+        return image
+
+    def get(self, key, default=None):
+        spec = self._specs.get(key)
+        if spec is None: return default
+        return self.image(*spec) or default
+
+    def image(self, path, size):
+        """Shared CTkImage of `path` at `size` (also usable for files that have no key, e.g. the logo)."""
+        size = tuple(size)
+        with self._lock:
+            cached = self._images.get((path, size))
+            if cached is not None: return cached
+            self._needed[path] = max(self._needed.get(path, 0), max(size) * self._scale)
+            source = self.decode(path)
+            if source is None: return None
+            image = self._images[(path, size)] = ctk.CTkImage(light_image=source, size=size)
+            return image
+
+    # --- Decoding ---
+    def decode(self, path):
+        """Decoded (and downscaled) PIL image of `path`, from the atlas when it is current. Thread-safe."""
+        with self._lock:
+            source = self._sources.get(path)
+            needed = self._needed.get(path, 0)
+            if source is not None and max(source.size) >= needed: return source
+            if path in self._failed: return None
+            full_path = self._resolve(path)
+            source = self._from_atlas(path, full_path, needed)
+            if source is None:
+                try:
+                    with Image.open(full_path) as original: source = original.convert("RGBA")
+                except Exception as e:
+                    print(f"Warning: Could not load icon '{path}': {e}"); self._failed.add(path); return None
+                if needed and max(source.size) > needed: source.thumbnail((needed, needed), Image.LANCZOS)
+                self._atlas_dirty = True
+            self._sources[path] = source
+            return source
+
+    def warm(self, paths=None):
+        """Decodes every registered file (or just `paths`) and refreshes the atlas if anything changed."""
+        for path in list(paths if paths is not None else self._needed): self.decode(path)
+        if paths is None and self._atlas_dirty: self.save_atlas()
+
+    def warm_async(self):
+        threading.Thread(target=self.warm, daemon=True, name="AssetCacheWarm").start()
+
+    # --- Atlas ---
+    def _load_atlas(self):
+        self._atlas = {}
+        if not self._atlas_path or not os.path.exists(self._atlas_path + ".json"): return
+        try:
+            with open(self._atlas_path + ".json", "r", encoding="utf-8") as f: index = json.load(f)
+            if index.get("version") != self._version: return
+            with open(self._atlas_path + ".bin", "rb") as f: self._atlas_bytes = f.read()
+            if len(self._atlas_bytes) != index.get("bin_size"): return # .bin aur .json alag runs ke hain
+            self._atlas = index.get("entries", {})
+        except Exception as e: logging.warning(f"Icon atlas unreadable, decoding PNGs: {e}")
+
+    def _from_atlas(self, path, full_path, needed):
+        if self._atlas is None: self._load_atlas()
+        entry = self._atlas.get(path)
+        if not entry or len(entry) != 4: return None
+        offset, width, height, file_size = entry
+        # mtime nahi: --onefile build har launch par assets naye temp folder mein nikaalta hai
+        try: size_on_disk = os.path.getsize(full_path)
+        except OSError: return None
+        if size_on_disk != file_size or max(width, height) < needed: return None
+        data = self._atlas_bytes[offset:offset + width * height * 4]
+        if len(data) != width * height * 4: return None
+        return Image.frombytes("RGBA", (width, height), data)
+
+    def save_atlas(self):
+        """Writes every decoded image into `<atlas_path>.bin` (raw RGBA) + `.json` (offsets, source file sizes)."""
+        if not self._atlas_path: return
+        with self._lock:
+            sources = dict(self._sources); self._atlas_dirty = False
+        entries, chunks, offset = {}, [], 0
+        for path, source in sources.items():
+            try: file_size = os.path.getsize(self._resolve(path))
+            except OSError: continue
+            data = source.tobytes()
+            entries[path] = [offset, source.width, source.height, file_size]
+            chunks.append(data); offset += len(data)
+        try:
+            os.makedirs(os.path.dirname(self._atlas_path), exist_ok=True)
+            for suffix, payload, mode in ((".bin", b"".join(chunks), "wb"), (".json", json.dumps({"version": self._version, "bin_size": offset, "entries": entries}), "w")):
+                with open(self._atlas_path + suffix + ".tmp", mode) as f: f.write(payload)
+                os.replace(self._atlas_path + suffix + ".tmp", self._atlas_path + suffix)
+        except Exception as e: logging.warning(f"Could not write icon atlas: {e}")
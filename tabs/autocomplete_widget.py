@@ -1,5 +1,9 @@
 # tabs/autocomplete_widget.py
 import customtkinter as ctk
+from .suggestion_index import SuggestionIndex
+
+MAX_SUGGESTIONS = 5
+ROW_HEIGHT = 28
 
 class AutocompleteEntry(ctk.CTkEntry):
     def __init__(self, parent, suggestions_list=None, app_instance=None, history_key=None, **kwargs):
@@ -10,11 +14,14 @@ class AutocompleteEntry(ctk.CTkEntry):
         self.history_key = history_key
         
         self._suggestion_toplevel = None
+        self._index = None; self._indexed_list = None; self._indexed_len = 0 # Private index jab suggestions history se nahi aate
         
         # --- For keyboard navigation ---
         self._active_suggestion_index = -1
         self._suggestion_labels = []
         self._suggestion_frames = []
+        self._row_pool = [] # (frame, label) - popup rows ek baar bante hain, har keystroke par sirf text badalta hai
+        self._row_values = []
         
         # --- NEW: Debounce Timer variable ---
         self._typing_timer = None
@@ -50,50 +57,33 @@ class AutocompleteEntry(ctk.CTkEntry):
             self._hide_suggestions()
             return
 
-        # Filter suggestions
-        matching_suggestions = [s for s in self.suggestions if current_text in s.lower()]
+        # Filter suggestions (index se, poori list scan kiye bina)
+        matching_suggestions = self._search_index().search(current_text, MAX_SUGGESTIONS)
         
         if matching_suggestions:
             self._show_suggestions(matching_suggestions)
         else:
             self._hide_suggestions()
 
-    def _show_suggestions(self, suggestions):
-        # Agar window pehle se hai, toh use REUSE karein (Destroy mat karein)
-        if not self._suggestion_toplevel or not self._suggestion_toplevel.winfo_exists():
-            self._suggestion_toplevel = ctk.CTkToplevel(self)
-            self._suggestion_toplevel.wm_overrideredirect(True)
-            self._suggestion_toplevel.attributes("-topmost", True)
-            
-            # Initial Listbox Frame
-            self._suggestion_listbox = ctk.CTkFrame(self._suggestion_toplevel, fg_color=("gray90", "gray20"))
-            self._suggestion_listbox.pack(expand=True, fill="both")
-        else:
-            # Agar window hai, to bas purane widgets hatayein
-            for widget in self._suggestion_listbox.winfo_children():
-                widget.destroy()
-
-        # Position calculation
-        try:
-            x = self.winfo_rootx()
-            y = self.winfo_rooty() + self.winfo_height()
-            w = self.winfo_width()
-            self._suggestion_toplevel.wm_geometry(f"{w}x{y}+{x}+{y}")
-            self._suggestion_toplevel.lift()
-        except Exception:
-            return # Agar widget destroy ho gaya ho calculation ke dauran
-
-        self._suggestion_labels.clear()
-        self._suggestion_frames.clear()
-        self._active_suggestion_index = -1
-
-        # Sirf top 5 suggestions dikhayein
-        for i, item in enumerate(suggestions[:5]):
+    def _search_index(self):
+        """History lists carry their own index (kept in sync by HistoryManager); other lists get a private one."""
+        if hasattr(self.suggestions, "search_index"): return self.suggestions.search_index()
+        if self._index is None or self._indexed_list is not self.suggestions or self._indexed_len != len(self.suggestions):
+            self._index, self._indexed_list, self._indexed_len = SuggestionIndex(self.suggestions), self.suggestions, len(self.suggestions)
+        return self._index
+
+    def _build_popup(self):
+        self._suggestion_toplevel = ctk.CTkToplevel(self)
+        self._suggestion_toplevel.wm_overrideredirect(True)
+        self._suggestion_toplevel.attributes("-topmost", True)
+        self._suggestion_listbox = ctk.CTkFrame(self._suggestion_toplevel, fg_color=("gray90", "gray20"))
+        self._suggestion_listbox.pack(expand=True, fill="both")
+
+        self._row_pool = []
+        for i in range(MAX_SUGGESTIONS):
             item_frame = ctk.CTkFrame(self._suggestion_listbox, fg_color="transparent")
-            item_frame.pack(fill="x")
             item_frame.grid_columnconfigure(0, weight=1)
-
-            label = ctk.CTkLabel(item_frame, text=item, anchor="w", padx=5)
+            label = ctk.CTkLabel(item_frame, text="", anchor="w", padx=5)
             label.grid(row=0, column=0, sticky="ew")
             
             # Delete button
@@ -101,19 +91,49 @@ class AutocompleteEntry(ctk.CTkEntry):
                 del_button = ctk.CTkButton(
                     item_frame, text="✕", width=25, height=25,
                     fg_color="transparent", text_color=("gray40", "gray60"), hover_color="gray70",
-                    command=lambda val=item: self._delete_suggestion(val)
+                    command=lambda index=i: self._delete_suggestion(self._row_values[index])
                 )
                 del_button.grid(row=0, column=1, padx=(0, 5))
             
-            # Bindings
-            item_frame.bind("<Button-1>", lambda e, val=item: self._select_suggestion(val))
-            label.bind("<Button-1>", lambda e, val=item: self._select_suggestion(val))
-            
+            # Bindings (row index par, value _row_values se aati hai)
+            item_frame.bind("<Button-1>", lambda e, index=i: self._select_suggestion(self._row_values[index]))
+            label.bind("<Button-1>", lambda e, index=i: self._select_suggestion(self._row_values[index]))
             item_frame.bind("<Enter>", lambda e, index=i: self._on_mouse_enter(index))
             item_frame.bind("<Leave>", lambda e, index=i: self._on_mouse_leave(index))
-            
-            self._suggestion_labels.append(label)
-            self._suggestion_frames.append(item_frame)
+            self._row_pool.append((item_frame, label))
+
+    def _show_suggestions(self, suggestions):
+        # Popup aur uski rows REUSE hoti hain; sirf text aur visibility badalti hai
+        if not self._suggestion_toplevel or not self._suggestion_toplevel.winfo_exists():
+            self._build_popup()
+
+        suggestions = suggestions[:MAX_SUGGESTIONS]
+        self._row_values = list(suggestions)
+        self._suggestion_labels.clear()
+        self._suggestion_frames.clear()
+        self._active_suggestion_index = -1
+
+        for i, (item_frame, label) in enumerate(self._row_pool):
+            if i < len(suggestions):
+                label.configure(text=suggestions[i])
+                item_frame.configure(fg_color="transparent")
+                if not item_frame.winfo_manager(): item_frame.pack(fill="x")
+                self._suggestion_labels.append(label)
+                self._suggestion_frames.append(item_frame)
+            else:
+                item_frame.pack_forget()
+
+        # Position calculation
+        try:
+            x = self.winfo_rootx()
+            y = self.winfo_rooty() + self.winfo_height()
+            w = self.winfo_width()
+            h = int(len(suggestions) * ROW_HEIGHT * ctk.ScalingTracker.get_widget_scaling(self))
+            self._suggestion_toplevel.wm_geometry(f"{w}x{h}+{x}+{y}")
+            self._suggestion_toplevel.deiconify()
+            self._suggestion_toplevel.lift()
+        except Exception:
+            return # Agar widget destroy ho gaya ho calculation ke dauran
 
     def _hide_suggestions(self):
         # Timer cancel karein taaki focus out ke baad popup wapas na aa jaye
@@ -121,8 +141,11 @@ class AutocompleteEntry(ctk.CTkEntry):
             self.after_cancel(self._typing_timer)
             self._typing_timer = None
 
-        if self._suggestion_toplevel:
-            self._suggestion_toplevel.destroy()
+        # Destroy nahi, sirf chhupao - agli baar wahi popup kaam aayega
+        try:
+            if self._suggestion_toplevel and self._suggestion_toplevel.winfo_exists():
+                self._suggestion_toplevel.withdraw()
+        except Exception:
             self._suggestion_toplevel = None
             
         self._suggestion_labels.clear()
@@ -150,6 +173,8 @@ class AutocompleteEntry(ctk.CTkEntry):
             
             if value in self.suggestions:
                 self.suggestions.remove(value)
+                if self._index is not None and self._indexed_list is self.suggestions:
+                    self._index.remove(value); self._indexed_len = len(self.suggestions)
             
             # Turant refresh karein bina delay ke
             self.focus()
@@ -2,19 +2,295 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import os, sys, subprocess, csv, platform, re
+import os, sys, subprocess, csv, platform, re, threading, queue, bisect
+from contextlib import nullcontext
 from datetime import datetime
 from fpdf import FPDF
 from PIL import Image, ImageDraw, ImageFont # <-- Added PIL
 
 # --- ADD THIS IMPORT ---
-from utils import resource_path
+from utils import resource_path, get_config, save_config, CONFIG
+import config
+from .tracing import RunTrace
+from .progress_reporter import ProgressReporter
+from .results_model import ResultsModel
+
+def wrap_text(text, font, max_width):
+    """Helper to wrap text for Pillow."""
+    if not text:
+        return [""]
+
+    # Handle newlines in the original text
+    text_lines = text.split('\n')
+    final_lines = []
+
+    for text_line in text_lines:
+        if not text_line.strip():
+            final_lines.append("") # Preserve empty lines
+            continue
+
+        words = text_line.split(' ')
+        lines = []
+        current_line = []
+        for word in words:
+            # Check if the word itself is too long
+            word_too_long = False
+            while font.getlength(word) > max_width:
+                word_too_long = True
+                # Word is too long, break it
+                if current_line: # Push the line before breaking the word
+                    lines.append(' '.join(current_line))
+                    current_line = []
+
+                # Find break point
+                break_found = False
+                for i in range(len(word) - 1, 0, -1):
+                    if font.getlength(word[:i]) <= max_width:
+                        lines.append(word[:i])
+                        word = word[i:]
+                        break_found = True
+                        break
+                if not break_found: # Cannot break, just push the long word
+                    lines.append(word)
+                    word = ""
+                    break
+
+            if not word:
+                continue
+
+            # Standard word wrapping
+            if not word_too_long and font.getlength(' '.join(current_line + [word])) <= max_width:
+                current_line.append(word)
+            else:
+                if current_line: 
+                    lines.append(' '.join(current_line))
+                current_line = [word]
+
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        final_lines.extend(lines)
+
+    return final_lines if final_lines else [""]
+
+
+def render_report_image(channel, data, headers, title, date_str, output_path, col_ratios=None):
+    """
+    Draws a report table as a PNG (used by generate_report_image). Module-level so it can run in a
+    worker process; raises on failure. `col_ratios` (one per header) fixes the column proportions.
+    """
+    # --- Font setup ---
+    try:
+        # --- FIX: Changed self.app.resource_path to resource_path ---
+        font_path_regular = resource_path("assets/fonts/NotoSansDevanagari-Regular.ttf")
+        font_path_bold = resource_path("assets/fonts/NotoSansDevanagari-Bold.ttf")
+        font_title = ImageFont.truetype(font_path_bold, 28)
+        font_date = ImageFont.truetype(font_path_regular, 18)
+        font_header = ImageFont.truetype(font_path_bold, 16)
+        font_body = ImageFont.truetype(font_path_regular, 14)
+    except IOError:
+        channel.log("Warning: NotoSansDevanagari fonts not found. Using default PIL fonts.", "warning")
+        font_title = ImageFont.load_default(size=28)
+        font_date = ImageFont.load_default(size=18)
+        font_header = ImageFont.load_default(size=16)
+        font_body = ImageFont.load_default(size=14)
+
+    # --- Image dimensions and colors ---
+    img_width = 2400  # High resolution for readability
+    margin_x = 80
+    margin_y = 60
+
+    header_bg_color = (220, 235, 255) # Light blue
+    row_even_bg_color = (255, 255, 255) # White
+    row_odd_bg_color = (245, 245, 245)  # Light grey
+    text_color = (0, 0, 0) # Black
+    border_color = (180, 180, 180) # Grey
+
+    # --- Calculate column widths (heuristic approach) ---
+    # Give first and last columns less space, distribute rest
+    num_cols = len(headers)
+    col_widths_pixels = []
+    if col_ratios and len(col_ratios) == num_cols: # Report ke apne column proportions
+        col_widths_pixels = [r / sum(col_ratios) * (img_width - 2 * margin_x) for r in col_ratios]
+    elif num_cols > 0:
+        available_width = img_width - (2 * margin_x)
+        # Default equal width
+        default_width = available_width / num_cols
+        col_widths_pixels = [default_width] * num_cols
+
+        # Adjust for common patterns (e.g., "S No." column)
+        sno_index = -1
+        if any(str(h).lower() in ["s no.", "sno.", "s.no"] for h in headers):
+            sno_index = next((i for i, h in enumerate(headers) if str(h).lower() in ["s no.", "sno.", "s.no"]), -1)
+            if sno_index != -1:
+                col_widths_pixels[sno_index] = max(80, default_width * 0.4) # 40% of average, min 80
+
+        # Re-distribute remaining width
+        non_sno_width = sum(col_widths_pixels[i] for i in range(num_cols) if i != sno_index)
+        remaining_width = available_width - (col_widths_pixels[sno_index] if sno_index != -1 else 0)
+
+        # Calculate the total width of non-sno columns *before* adjustment
+        original_non_sno_total = sum(default_width for i in range(num_cols) if i != sno_index)
+
+        if original_non_sno_total > 0:
+            scale_factor = remaining_width / original_non_sno_total
+            for i in range(num_cols):
+                if i != sno_index:
+                    col_widths_pixels[i] *= scale_factor
+
+    # --- Auto-adjust column widths based on headers (min width) ---
+    for i, header in enumerate(headers):
+        header_width = font_header.getlength(str(header)) + 40 # Add padding
+        if col_widths_pixels[i] < header_width:
+            col_widths_pixels[i] = header_width
+
+    # Re-normalize to fit available width exactly
+    current_total_width = sum(col_widths_pixels)
+    if current_total_width == 0: # Avoid division by zero if headers are empty
+        return False
+
+    scale_factor = (img_width - 2 * margin_x) / current_total_width
+    col_widths_pixels = [w * scale_factor for w in col_widths_pixels]
+
+    # Start with a base image, will expand if needed
+    initial_height = 1600 # Start with a reasonable height
+    img = Image.new("RGB", (img_width, initial_height), (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+
+    current_y = margin_y
+
+    # --- Draw Title ---
+    title_bbox = font_title.getbbox(title)
+    title_height = title_bbox[3] - title_bbox[1]
+    title_text_width = font_title.getlength(title)
+    title_x = (img_width - title_text_width) / 2
+    draw.text((title_x, current_y), title, font=font_title, fill=text_color)
+    current_y += title_height + 5
+
+    # --- Draw Date ---
+    date_bbox = font_date.getbbox(date_str)
+    date_height = date_bbox[3] - date_bbox[1]
+    date_text_width = font_date.getlength(date_str)
+    date_x = img_width - margin_x - date_text_width
+    draw.text((date_x, current_y), date_str, font=font_date, fill=text_color)
+    current_y += date_height + 20 # Space after date and before table
+
+    # --- Draw Headers ---
+    header_y_start = current_y
+    header_height = 0
+    # Calculate max header height considering wrapping
+    for i, header in enumerate(headers):
+        wrapped_header = wrap_text(str(header), font_header, col_widths_pixels[i] - 10)
+        line_height = (font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]) * 1.2 # Add line spacing
+        header_height = max(header_height, len(wrapped_header) * line_height + 10) # Add padding
+
+    # Draw header cells
+    current_x = margin_x
+    for i, header in enumerate(headers):
+        draw.rectangle([current_x, header_y_start, current_x + col_widths_pixels[i], header_y_start + header_height], fill=header_bg_color, outline=border_color, width=1)
+
+        wrapped_header = wrap_text(str(header), font_header, col_widths_pixels[i] - 20)
+        line_height = (font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]) * 1.2
+        total_text_height = len(wrapped_header) * line_height
+        text_y = header_y_start + (header_height - total_text_height) / 2 # Center vertically
+
+        for line in wrapped_header:
+            line_width = font_header.getlength(line)
+            draw.text((current_x + (col_widths_pixels[i] - line_width) / 2, text_y), line, font=font_header, fill=text_color)
+            text_y += line_height # Move to next line
+        current_x += col_widths_pixels[i]
+    current_y += header_height
+
+    # --- Draw Data Rows ---
+    line_height = (font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1]) * 1.2
+    for row_idx, row_data in enumerate(data):
+        row_bg_color = row_even_bg_color if row_idx % 2 == 0 else row_odd_bg_color
+
+        # Calculate row height dynamically based on content wrapping
+        max_row_text_height = 0
+        temp_wrapped_cells = []
+        for i, cell_text in enumerate(row_data):
+            wrapped_lines = wrap_text(str(cell_text), font_body, col_widths_pixels[i] - 20) # 20 for internal padding
+            temp_wrapped_cells.append(wrapped_lines)
+            max_row_text_height = max(max_row_text_height, len(wrapped_lines) * line_height)
+
+        row_data_height = max_row_text_height + 10 # Add vertical padding
+
+        # If current_y plus next row height exceeds image height, expand image
+        if current_y + row_data_height + margin_y > img.height:
+            new_height = int(img.height + (row_data_height + margin_y) * 20) # Expand by 20 rows
+            new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
+            new_img.paste(img, (0, 0))
+            img = new_img
+            draw = ImageDraw.Draw(img) # Update draw object for new image
+
+        current_x = margin_x
+        for i, cell_text in enumerate(row_data):
+            # Draw cell background
+            draw.rectangle([current_x, current_y, current_x + col_widths_pixels[i], current_y + row_data_height], fill=row_bg_color, outline=border_color, width=1)
+
+            # Draw wrapped text
+            wrapped_lines = temp_wrapped_cells[i]
+            text_y = current_y + 5 # Small top padding
+            for line in wrapped_lines:
+                draw.text((current_x + 10, text_y), line, font=font_body, fill=text_color) # 10 for left padding
+                text_y += line_height # Move to next line
+            current_x += col_widths_pixels[i]
+        current_y += row_data_height
+
+    # --- Draw Footer ---
+    current_y += 15 # Space after table
+    footer_text = "Report Generated by NregaBot.com"
+    footer_font = font_body
+    footer_bbox = footer_font.getbbox(footer_text)
+    footer_height = footer_bbox[3] - footer_bbox[1]
+    footer_y_pos = current_y + 10
+
+    # Check if image needs expansion for footer + bottom margin
+    if footer_y_pos + footer_height + margin_y > img.height:
+        new_height = int(footer_y_pos + footer_height + margin_y)
+        new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
+        new_img.paste(img, (0, 0))
+        img = new_img
+        draw = ImageDraw.Draw(img)
+
+    # Draw footer text
+    draw.text((margin_x, footer_y_pos), footer_text, font=footer_font, fill=text_color)
+    current_y = footer_y_pos + footer_height # Update final Y position
+    # --- End Footer ---
+
+    # Crop image to actual content
+    final_img = img.crop((0, 0, img_width, current_y + margin_y))
+    final_img.save(output_path, "PNG", dpi=(300, 300)) # Save at 300 DPI for quality
+    return True
+
 
 class BaseAutomationTab(ctk.CTkFrame):
+    # Lean mode (see LeanModeController): categories this tab needs while it runs, or lean_mode = False to disable it.
+    lean_mode = True
+    lean_mode_allow = ()
+    # run_work_items skips items that already succeeded this fortnight (results DB); only for tabs where a repeat is pointless
+    skip_done_results = False
+
     def __init__(self, parent, app_instance, automation_key):
         super().__init__(parent, fg_color="transparent")
         self.app = app_instance
         self.automation_key = automation_key
+        self.parallel_workers_menu = None
+        # Keeps rows in input order when several worker browsers report results at once
+        self._result_order = threading.local()
+        self._result_positions = []
+        self.trace = None # RunTrace of the current run (trace_begin / trace_finish)
+        self.result_panchayat = "" # Panchayat of the current run, recorded with every result
+        # Workers call self.progress.update(...) per row instead of scheduling set_status/update_status themselves
+        self.progress = ProgressReporter(self.app, self, config.PROGRESS_REPORTER_CONFIG["max_updates_per_second"])
+
+    def snapshot_state(self):
+        """Extra JSON-safe data (not held in widgets) to keep when the app unloads this idle tab; see tabs/tab_snapshot.py."""
+        return {}
+
+    def restore_state(self, state):
+        """Counterpart of snapshot_state, called after the tab is rebuilt from its snapshot."""
 
     def _get_wkhtml_path(self):
         """Gets the correct path to the wkhtmltoimage executable based on the OS."""
@@ -35,255 +311,32 @@ class BaseAutomationTab(ctk.CTkFrame):
                 
         return 'wkhtmltoimage'
         
-    def generate_report_image(self, data, headers, title, date_str, output_path):
+    def generate_report_image(self, data, headers, title, date_str, output_path, col_ratios=None, on_done=None):
         """
         Generates a professional-looking report as a PNG image.
-        (Replaced the 'Coming Soon' stub)
+        Drawing runs in a worker process (see tabs/process_worker.py) so big reports do not freeze the UI.
+        From an automation thread it blocks and returns True/False. From the Tk thread pass `on_done`: the call
+        returns at once and on_done() runs on the Tk thread once the PNG is saved.
         """
+        show_error = lambda e: messagebox.showerror("PNG Export Error", f"Could not generate PNG report.\nError: {e}", parent=self.app)
+        if on_done is not None:
+            def finished(result, error=None):
+                self.app.set_status("Ready")
+                if error is not None: show_error(error)
+                elif result: on_done()
+            self.app.set_status("Generating PNG report...")
+            self.app.process_workers.submit(self, render_report_image, data, headers, title, date_str, output_path, col_ratios,
+                                            on_done=finished, on_error=lambda e: finished(False, e))
+            return None
         try:
-            # --- Font setup ---
-            try:
-                # --- FIX: Changed self.app.resource_path to resource_path ---
-                font_path_regular = resource_path("assets/fonts/NotoSansDevanagari-Regular.ttf")
-                font_path_bold = resource_path("assets/fonts/NotoSansDevanagari-Bold.ttf")
-                font_title = ImageFont.truetype(font_path_bold, 28)
-                font_date = ImageFont.truetype(font_path_regular, 18)
-                font_header = ImageFont.truetype(font_path_bold, 16)
-                font_body = ImageFont.truetype(font_path_regular, 14)
-            except IOError:
-                print("Warning: NotoSansDevanagari fonts not found. Using default PIL fonts.")
-                font_title = ImageFont.load_default(size=28)
-                font_date = ImageFont.load_default(size=18)
-                font_header = ImageFont.load_default(size=16)
-                font_body = ImageFont.load_default(size=14)
-
-            # --- Image dimensions and colors ---
-            img_width = 2400  # High resolution for readability
-            margin_x = 80
-            margin_y = 60
-            
-            header_bg_color = (220, 235, 255) # Light blue
-            row_even_bg_color = (255, 255, 255) # White
-            row_odd_bg_color = (245, 245, 245)  # Light grey
-            text_color = (0, 0, 0) # Black
-            border_color = (180, 180, 180) # Grey
-
-            # --- Calculate column widths (heuristic approach) ---
-            # Give first and last columns less space, distribute rest
-            num_cols = len(headers)
-            col_widths_pixels = []
-            if num_cols > 0:
-                available_width = img_width - (2 * margin_x)
-                # Default equal width
-                default_width = available_width / num_cols
-                col_widths_pixels = [default_width] * num_cols
-                
-                # Adjust for common patterns (e.g., "S No." column)
-                sno_index = -1
-                if any(str(h).lower() in ["s no.", "sno.", "s.no"] for h in headers):
-                    sno_index = next((i for i, h in enumerate(headers) if str(h).lower() in ["s no.", "sno.", "s.no"]), -1)
-                    if sno_index != -1:
-                        col_widths_pixels[sno_index] = max(80, default_width * 0.4) # 40% of average, min 80
-                        
-                # Re-distribute remaining width
-                non_sno_width = sum(col_widths_pixels[i] for i in range(num_cols) if i != sno_index)
-                remaining_width = available_width - (col_widths_pixels[sno_index] if sno_index != -1 else 0)
-                
-                # Calculate the total width of non-sno columns *before* adjustment
-                original_non_sno_total = sum(default_width for i in range(num_cols) if i != sno_index)
-                
-                if original_non_sno_total > 0:
-                    scale_factor = remaining_width / original_non_sno_total
-                    for i in range(num_cols):
-                        if i != sno_index:
-                            col_widths_pixels[i] *= scale_factor
-            
-            # --- Auto-adjust column widths based on headers (min width) ---
-            for i, header in enumerate(headers):
-                header_width = font_header.getlength(str(header)) + 40 # Add padding
-                if col_widths_pixels[i] < header_width:
-                    col_widths_pixels[i] = header_width
-
-            # Re-normalize to fit available width exactly
-            current_total_width = sum(col_widths_pixels)
-            if current_total_width == 0: # Avoid division by zero if headers are empty
-                return False
-                
-            scale_factor = (img_width - 2 * margin_x) / current_total_width
-            col_widths_pixels = [w * scale_factor for w in col_widths_pixels]
-
-            # Start with a base image, will expand if needed
-            initial_height = 1600 # Start with a reasonable height
-            img = Image.new("RGB", (img_width, initial_height), (255, 255, 255))
-            draw = ImageDraw.Draw(img)
-
-            current_y = margin_y
-            
-            # --- Draw Title ---
-            title_bbox = font_title.getbbox(title)
-            title_height = title_bbox[3] - title_bbox[1]
-            title_text_width = font_title.getlength(title)
-            title_x = (img_width - title_text_width) / 2
-            draw.text((title_x, current_y), title, font=font_title, fill=text_color)
-            current_y += title_height + 5
-
-            # --- Draw Date ---
-            date_bbox = font_date.getbbox(date_str)
-            date_height = date_bbox[3] - date_bbox[1]
-            date_text_width = font_date.getlength(date_str)
-            date_x = img_width - margin_x - date_text_width
-            draw.text((date_x, current_y), date_str, font=font_date, fill=text_color)
-            current_y += date_height + 20 # Space after date and before table
-
-            # --- Draw Headers ---
-            header_y_start = current_y
-            header_height = 0
-            # Calculate max header height considering wrapping
-            for i, header in enumerate(headers):
-                wrapped_header = self._wrap_text(str(header), font_header, col_widths_pixels[i] - 10)
-                line_height = (font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]) * 1.2 # Add line spacing
-                header_height = max(header_height, len(wrapped_header) * line_height + 10) # Add padding
-            
-            # Draw header cells
-            current_x = margin_x
-            for i, header in enumerate(headers):
-                draw.rectangle([current_x, header_y_start, current_x + col_widths_pixels[i], header_y_start + header_height], fill=header_bg_color, outline=border_color, width=1)
-                
-                wrapped_header = self._wrap_text(str(header), font_header, col_widths_pixels[i] - 20)
-                line_height = (font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]) * 1.2
-                total_text_height = len(wrapped_header) * line_height
-                text_y = header_y_start + (header_height - total_text_height) / 2 # Center vertically
-                
-                for line in wrapped_header:
-                    line_width = font_header.getlength(line)
-                    draw.text((current_x + (col_widths_pixels[i] - line_width) / 2, text_y), line, font=font_header, fill=text_color)
-                    text_y += line_height # Move to next line
-                current_x += col_widths_pixels[i]
-            current_y += header_height
-
-            # --- Draw Data Rows ---
-            line_height = (font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1]) * 1.2
-            for row_idx, row_data in enumerate(data):
-                row_bg_color = row_even_bg_color if row_idx % 2 == 0 else row_odd_bg_color
-
-                # Calculate row height dynamically based on content wrapping
-                max_row_text_height = 0
-                temp_wrapped_cells = []
-                for i, cell_text in enumerate(row_data):
-                    wrapped_lines = self._wrap_text(str(cell_text), font_body, col_widths_pixels[i] - 20) # 20 for internal padding
-                    temp_wrapped_cells.append(wrapped_lines)
-                    max_row_text_height = max(max_row_text_height, len(wrapped_lines) * line_height)
-
-                row_data_height = max_row_text_height + 10 # Add vertical padding
-
-                # If current_y plus next row height exceeds image height, expand image
-                if current_y + row_data_height + margin_y > img.height:
-                    new_height = int(img.height + (row_data_height + margin_y) * 20) # Expand by 20 rows
-                    new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-                    new_img.paste(img, (0, 0))
-                    img = new_img
-                    draw = ImageDraw.Draw(img) # Update draw object for new image
-
-                current_x = margin_x
-                for i, cell_text in enumerate(row_data):
-                    # Draw cell background
-                    draw.rectangle([current_x, current_y, current_x + col_widths_pixels[i], current_y + row_data_height], fill=row_bg_color, outline=border_color, width=1)
-                    
-                    # Draw wrapped text
-                    wrapped_lines = temp_wrapped_cells[i]
-                    text_y = current_y + 5 # Small top padding
-                    for line in wrapped_lines:
-                        draw.text((current_x + 10, text_y), line, font=font_body, fill=text_color) # 10 for left padding
-                        text_y += line_height # Move to next line
-                    current_x += col_widths_pixels[i]
-                current_y += row_data_height
-
-            # --- Draw Footer ---
-            current_y += 15 # Space after table
-            footer_text = "Report Generated by NregaBot.com"
-            footer_font = font_body
-            footer_bbox = footer_font.getbbox(footer_text)
-            footer_height = footer_bbox[3] - footer_bbox[1]
-            footer_y_pos = current_y + 10
-
-            # Check if image needs expansion for footer + bottom margin
-            if footer_y_pos + footer_height + margin_y > img.height:
-                new_height = int(footer_y_pos + footer_height + margin_y)
-                new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-                new_img.paste(img, (0, 0))
-                img = new_img
-                draw = ImageDraw.Draw(img)
-            
-            # Draw footer text
-            draw.text((margin_x, footer_y_pos), footer_text, font=footer_font, fill=text_color)
-            current_y = footer_y_pos + footer_height # Update final Y position
-            # --- End Footer ---
-
-            # Crop image to actual content
-            final_img = img.crop((0, 0, img_width, current_y + margin_y))
-            final_img.save(output_path, "PNG", dpi=(300, 300)) # Save at 300 DPI for quality
-            return True
+            return self.app.process_workers.run(self, render_report_image, data, headers, title, date_str, output_path, col_ratios)
         except Exception as e:
-            messagebox.showerror("PNG Export Error", f"Could not generate PNG report.\nError: {e}", parent=self.app)
+            show_error(e)
             return False
 
     def _wrap_text(self, text, font, max_width):
         """Helper to wrap text for Pillow."""
-        if not text:
-            return [""]
-        
-        # Handle newlines in the original text
-        text_lines = text.split('\n')
-        final_lines = []
-        
-        for text_line in text_lines:
-            if not text_line.strip():
-                final_lines.append("") # Preserve empty lines
-                continue
-
-            words = text_line.split(' ')
-            lines = []
-            current_line = []
-            for word in words:
-                # Check if the word itself is too long
-                word_too_long = False
-                while font.getlength(word) > max_width:
-                    word_too_long = True
-                    # Word is too long, break it
-                    if current_line: # Push the line before breaking the word
-                        lines.append(' '.join(current_line))
-                        current_line = []
-                    
-                    # Find break point
-                    break_found = False
-                    for i in range(len(word) - 1, 0, -1):
-                        if font.getlength(word[:i]) <= max_width:
-                            lines.append(word[:i])
-                            word = word[i:]
-                            break_found = True
-                            break
-                    if not break_found: # Cannot break, just push the long word
-                        lines.append(word)
-                        word = ""
-                        break
-                
-                if not word:
-                    continue
-                    
-                # Standard word wrapping
-                if not word_too_long and font.getlength(' '.join(current_line + [word])) <= max_width:
-                    current_line.append(word)
-                else:
-                    if current_line: 
-                        lines.append(' '.join(current_line))
-                    current_line = [word]
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-            
-            final_lines.extend(lines)
-
-        return final_lines if final_lines else [""]
+        return wrap_text(text, font, max_width)
 
     def generate_report_pdf(self, data, headers, col_widths, title, date_str, file_path):
         try:
@@ -360,7 +413,7 @@ class BaseAutomationTab(ctk.CTkFrame):
             return False
 
 
-    def _create_action_buttons(self, parent_frame):
+    def _create_action_buttons(self, parent_frame, parallel_workers=False):
         action_frame = ctk.CTkFrame(parent_frame, fg_color="transparent")
         
         self.start_button = ctk.CTkButton(action_frame, text="Start Automation", command=self.start_automation, width=150)
@@ -372,6 +425,19 @@ class BaseAutomationTab(ctk.CTkFrame):
         self.reset_button = ctk.CTkButton(action_frame, text="Reset Form", command=self.reset_ui, fg_color="gray", hover_color="gray50")
         self.reset_button.pack(side="left", padx=5)
 
+        if parallel_workers:
+            max_workers = config.PARALLEL_WORKERS_CONFIG["max_workers"]
+            self.parallel_workers_menu = ctk.CTkOptionMenu(action_frame, width=70, values=[str(n) for n in range(1, max_workers + 1)],
+                                                           command=lambda value: save_config('parallel_workers', int(value)))
+            self.parallel_workers_menu.set(str(min(int(get_config('parallel_workers', 1)), max_workers)))
+            # Doosre tab mein badla gaya worker count yahan bhi dikhe
+            def _on_config_change(key, value, menu=self.parallel_workers_menu):
+                if key == 'parallel_workers': menu.after(0, menu.set, str(min(int(value), max_workers)))
+            unsubscribe = CONFIG.subscribe(_on_config_change)
+            self.parallel_workers_menu.bind("<Destroy>", lambda e: unsubscribe(), add="+")
+            self.parallel_workers_menu.pack(side="right", padx=5)
+            ctk.CTkLabel(action_frame, text="Parallel Workers:").pack(side="right")
+
         return action_frame
 
     def _create_log_and_status_area(self, parent_notebook):
@@ -383,15 +449,21 @@ class BaseAutomationTab(ctk.CTkFrame):
         log_actions_frame.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
 
         def copy_logs_to_clipboard():
-            logs = self.log_display.get("1.0", tkinter.END)
+            logs = self.app.get_log_text(self.log_display)
             if logs.strip():
                 self.app.clipboard_clear(); self.app.clipboard_append(logs)
                 messagebox.showinfo("Copied", "Logs copied to clipboard.", parent=self.app)
             else:
                 messagebox.showwarning("Empty", "There are no logs to copy.", parent=self.app)
 
+        def show_older_logs():
+            sink = self.app.get_log_sink(self.log_display)
+            if not sink.show_older():
+                messagebox.showinfo("Older Logs", f"No older lines in memory.\nFull log file:\n{sink.log_path}", parent=self.app)
+
         copy_button = ctk.CTkButton(log_actions_frame, text="Copy Logs", width=100, command=copy_logs_to_clipboard)
         copy_button.pack(side="right")
+        ctk.CTkButton(log_actions_frame, text="Show Older", width=100, command=show_older_logs).pack(side="right", padx=(0, 5))
 
         self.log_display = ctk.CTkTextbox(log_frame, state="disabled")
         self.log_display.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
@@ -410,10 +482,195 @@ class BaseAutomationTab(ctk.CTkFrame):
         self.start_button.configure(state="disabled" if running else "normal")
         self.stop_button.configure(state="normal" if running else "disabled")
         self.reset_button.configure(state="disabled" if running else "normal")
+        if self.parallel_workers_menu: self.parallel_workers_menu.configure(state="disabled" if running else "normal")
 
     def start_automation(self):
         raise NotImplementedError
 
+    def _get_parallel_worker_count(self):
+        if not self.parallel_workers_menu: return 1
+        try: return max(1, int(self.parallel_workers_menu.get()))
+        except ValueError: return 1
+
+    def run_work_items(self, driver, items, process_item, setup_worker=None, describe=str, result_key=None):
+        """
+        Runs process_item(driver, context, item) over all items. With 'Parallel Workers' above 1,
+        the items are split across the extra Chrome worker profiles and results stay in input order.
+        setup_worker(driver) prepares each browser once (e.g. selects the Panchayat) and returns the context.
+        result_key(item) gives the work code (or (work_code, msr_no)) used to skip done items; see skip_done_results.
+        """
+        job = self.app.job_store.active(self.automation_key)
+        if job:
+            items = self._resume_job_items(job, items)
+            if not items: return
+        if self.skip_done_results and config.RESULTS_DB_CONFIG.get("skip_done_this_fortnight", True):
+            items = self._skip_done_items(items, result_key)
+            if not items: return
+        checkpointed = set() # Duplicate items ka checkpoint sirf pehli baar
+
+        drivers = [driver]
+        worker_count = self._get_parallel_worker_count()
+        if worker_count > 1:
+            drivers += self.app.get_parallel_worker_drivers(worker_count - 1)
+
+        pending = queue.Queue()
+        for index, item in enumerate(items): pending.put((index, item))
+        total = len(items)
+        stop_event = self.app.stop_events[self.automation_key]
+        abort_event = threading.Event()
+        errors, counter_lock, started = [], threading.Lock(), [0]
+        setups = [0, 0] # [tried, ready]
+
+        def setup_done(ok):
+            with counter_lock:
+                setups[0] += 1; setups[1] += ok
+                if setups[0] < len(drivers) or len(drivers) == 1: return
+            self.app.log_message(self.log_display, f"Running with {setups[1]} browser worker(s).", "info")
+
+        def worker(worker_driver, worker_no):
+            try:
+                context = setup_worker(worker_driver) if setup_worker else None
+            except Exception as e:
+                if worker_no == 0: errors.append(e); abort_event.set()
+                else: self.app.log_message(self.log_display, f"Worker {worker_no + 1} could not start and was skipped: {e}", "warning")
+                setup_done(False); return
+            setup_done(True)
+            while not stop_event.is_set() and not abort_event.is_set():
+                try: index, item = pending.get_nowait()
+                except queue.Empty: return
+                with counter_lock: started[0] += 1; position = started[0]
+                status_msg = f"Processing {position}/{total}: {describe(item)}"
+                self.progress.update(status_msg, position / total)
+                self._result_order.index = index
+                with counter_lock: track = job is not None and str(item) not in checkpointed; checkpointed.add(str(item))
+                self._result_order.job_item = (job, str(item)) if track else None
+                if track: job.start_item(item)
+                try:
+                    with self.trace_item(describe(item)): process_item(worker_driver, context, item)
+                    if track: job.finish_item(item)
+                except Exception as e:
+                    if track: job.finish_item(item, ok=False)
+                    errors.append(e); abort_event.set()
+                finally: self._result_order.index = self._result_order.job_item = None
+
+        if len(drivers) == 1:
+            worker(driver, 0)
+        else:
+            threads = [threading.Thread(target=worker, args=(d, n), daemon=True) for n, d in enumerate(drivers)]
+            for t in threads: t.start()
+            for t in threads: t.join()
+
+        if stop_event.is_set(): self.app.log_message(self.log_display, "Automation stopped by user.", "warning")
+        if errors: raise errors[0]
+
+    # --- Step tracing ---
+    def trace_begin(self):
+        """Starts timing a run; steps wrapped in trace_step() are recorded until trace_finish()."""
+        self.trace = RunTrace(self.automation_key)
+        return self.trace
+
+    def trace_step(self, name, **args):
+        """Context manager timing one step (navigate, postback, save...). No-op when no trace is running."""
+        return self.trace.step(name, **args) if self.trace else nullcontext()
+
+    def trace_mark(self, name, **args):
+        """Starts timing `name` and returns a function that ends it (for steps spread over long branches)."""
+        return self.trace.mark(name, **args) if self.trace else (lambda: None)
+
+    def trace_item(self, item, **args):
+        return self.trace.item(item, **args) if self.trace else nullcontext()
+
+    def trace_finish(self, output_dir=None):
+        """Logs p50/p95 per step and writes a Chrome-trace JSON next to the output (or in the data dir). Returns its path."""
+        trace, self.trace = self.trace, None
+        if not trace or not trace.summary(): return None
+        self.app.log_message(self.log_display, "Step timings:\n" + trace.format_summary(), "info")
+        try:
+            if not output_dir or not os.path.isdir(output_dir):
+                output_dir = self.app.get_data_path("traces"); os.makedirs(output_dir, exist_ok=True)
+            path = trace.export(os.path.join(output_dir, f"trace_{self.automation_key}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"))
+            self.app.log_message(self.log_display, f"Timing trace saved: {path}", "info")
+            return path
+        except OSError as e:
+            self.app.log_message(self.log_display, f"Could not save timing trace: {e}", "warning")
+            return None
+
+    def _resume_job_items(self, job, items):
+        """Skips items finished in an earlier attempt of a resumed job and shows their saved result rows again."""
+        done = job.bind(items)
+        if not done: return items
+        for record in done.values():
+            for values, tags in record["results"]: self._add_result_row(values, tags, order_key=float("-inf"))
+        remaining = [item for item in items if str(item) not in done]
+        self.app.log_message(self.log_display, f"Resuming previous run: {len(items) - len(remaining)} item(s) already done, {len(remaining)} left.", "info")
+        return remaining
+
+    # --- Results ---
+    def begin_result_run(self, job_params=None):
+        """Remembers the run's panchayat for the results DB (called on the Tk thread when an automation starts)."""
+        params = job_params or {}
+        panchayat = params.get("panchayat") or params.get("panchayat_name")
+        for attr in ("panchayat_entry", "panchayat_var"):
+            if panchayat or getattr(self, attr, None) is None: continue
+            try: panchayat = getattr(self, attr).get()
+            except (tkinter.TclError, AttributeError): pass
+        self.result_panchayat = str(panchayat or "").strip()
+
+    def _record_result(self, status, work_code="", msr_no="", details="", panchayat=None):
+        """Adds one outcome to the cross-run results DB (see tabs/results_store.py). Call it from _log_result."""
+        try:
+            self.app.results_store.record(self.automation_key, status, work_code, msr_no,
+                                          self.result_panchayat if panchayat is None else panchayat, details)
+        except Exception as e: print(f"Could not record result: {e}") # Results DB ki wajah se automation nahi rukni chahiye
+
+    def _skip_done_items(self, items, result_key=None):
+        """Drops items that already succeeded this fortnight, before any browser work."""
+        result_key = result_key or (lambda item: str(item).strip())
+        try: pairs = self.app.results_store.done_items(self.automation_key, panchayat=self.result_panchayat, with_msr=True)
+        except Exception as e:
+            self.app.log_message(self.log_display, f"Results DB unavailable, nothing skipped: {e}", "warning"); return items
+        done = pairs | {code for code, _ in pairs}
+        remaining = [item for item in items if result_key(item) not in done]
+        skipped = len(items) - len(remaining)
+        if skipped:
+            self.app.log_message(self.log_display, f"Skipping {skipped} item(s) already done this fortnight: "
+                                 + ", ".join(str(result_key(item)) for item in items if result_key(item) in done)[:500], "info")
+        return remaining
+
+    def attach_results_model(self, tree, scrollbar=None):
+        """Puts `tree` on a ResultsModel: batched inserts, sort/filter on the model and only visible rows drawn."""
+        return ResultsModel(tree, scrollbar, **config.RESULTS_MODEL_CONFIG)
+
+    def get_result_rows(self, tree):
+        """Row values of a results table in display order (from its model if it has one)."""
+        model = ResultsModel.of(tree)
+        if model is not None: return model.rows()
+        return [tree.item(item_id)['values'] for item_id in tree.get_children()]
+
+    def _add_result_row(self, values, tags=(), order_key=None):
+        """Inserts a result row on the Tk thread, ordered by input position during run_work_items."""
+        if order_key is None: order_key = getattr(self._result_order, "index", None)
+        if order_key is None: order_key = float("inf")
+        job_item = getattr(self._result_order, "job_item", None)
+        if job_item is not None: job_item[0].add_result(job_item[1], values, tags) # Resume par yeh row dobara dikhegi
+        model = ResultsModel.of(self.results_tree)
+        if model is not None: model.add(values, tags, order_key); return
+        def _insert():
+            row_count = len(self.results_tree.get_children())
+            if len(self._result_positions) != row_count:
+                # Rows were added or cleared directly on the tree; keep them ahead of this run's rows
+                self._result_positions = [float("-inf")] * row_count
+            position = bisect.bisect_right(self._result_positions, order_key)
+            self._result_positions.insert(position, order_key)
+            self.results_tree.insert("", position, values=values, tags=tags)
+        self.app.after(0, _insert)
+
+    def _clear_results(self):
+        model = ResultsModel.of(self.results_tree)
+        if model is not None: model.clear(); return
+        self._result_positions = []
+        for item in self.results_tree.get_children(): self.results_tree.delete(item)
+
     def stop_automation(self):
         self.app.stop_events[self.automation_key].set()
         self.app.log_message(self.log_display, "Stop signal sent. Finishing current task...", "warning")
@@ -445,6 +702,11 @@ class BaseAutomationTab(ctk.CTkFrame):
             tree.heading(col, text=col, command=lambda _col=col: self._treeview_sort_column(tree, _col, False))
 
     def _treeview_sort_column(self, tv, col, reverse):
+        model = ResultsModel.of(tv)
+        if model is not None:
+            model.sort(col, reverse)
+            tv.heading(col, command=lambda: self._treeview_sort_column(tv, col, not reverse))
+            return
         l = [(tv.set(k, col), k) for k in tv.get_children('')]
         try:
             l.sort(key=lambda t: float(t[0]), reverse=reverse)
@@ -469,8 +731,7 @@ class BaseAutomationTab(ctk.CTkFrame):
             with open(file_path, "w", newline="", encoding="utf-8-sig") as f:
                 writer = csv.writer(f)
                 writer.writerow(tree["columns"])
-                for item_id in tree.get_children():
-                    writer.writerow(tree.item(item_id)['values'])
+                writer.writerows(self.get_result_rows(tree))
             messagebox.showinfo("Success", f"Report successfully exported to\n{file_path}", parent=self)
         except Exception as e:
             messagebox.showerror("Export Failed", f"An error occurred while saving the CSV file:\n{e}", parent=self)
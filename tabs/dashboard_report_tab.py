@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, os, re, json
+import os, re
 from datetime import datetime
 import pandas as pd
 from openpyxl.styles import Font, Alignment, PatternFill
@@ -14,10 +14,10 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 from fpdf import FPDF
-from PIL import Image, ImageDraw, ImageFont # <-- Added PIL imports
 from utils import resource_path
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback
 import config
 
 class DashboardReportTab(BaseAutomationTab):
@@ -204,9 +204,10 @@ class DashboardReportTab(BaseAutomationTab):
             elif operator == '*': result = num1 * num2
             self.app.log_message(self.log_display, f"Solved: {captcha_text.strip()} = {result}")
             driver.find_element(By.ID, captcha_textbox_id).send_keys(str(result))
-            driver.find_element(By.ID, verify_button_id).click()
+            verify_button = driver.find_element(By.ID, verify_button_id)
+            verify_button.click()
             # Wait briefly to see if an error message appears
-            time.sleep(1)
+            wait_for_postback(driver, verify_button, timeout=10)
             if "Invalid Captcha Code" in driver.page_source:
                 raise ValueError("CAPTCHA verification failed.")
             return True
@@ -226,8 +227,9 @@ class DashboardReportTab(BaseAutomationTab):
         self.app.clear_log(self.log_display)
         self.app.log_message(self.log_display, "Starting Dashboard Report automation...")
 
+        driver = None
         try:
-            driver = self.app.get_driver()
+            driver = self.app.get_report_driver() # Shared headless report pool se
             if not driver:
                 self.app.after(0, self.app.set_status, "Browser not found")
                 return # Exit early
@@ -259,7 +261,7 @@ class DashboardReportTab(BaseAutomationTab):
             self.app.log_message(self.log_display, "Clicking 'Dashboard for Delay Monitoring System'...")
             report_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Dashboard for Delay Monitoring System")))
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", report_link)
-            time.sleep(1); report_link.click()
+            report_link.click()
 
             # Optional state re-selection
             # self.app.log_message(self.log_display, "Selecting State again (if required)...")
@@ -320,7 +322,6 @@ class DashboardReportTab(BaseAutomationTab):
                 # We don't care about the text, just click it.
                 self.app.log_message(self.log_display, f"Found link (text: '{target_link.text.strip()}'). Clicking...")
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", target_link)
-                time.sleep(0.5)
                 target_link.click()
 
             except NoSuchElementException:
@@ -408,6 +409,7 @@ class DashboardReportTab(BaseAutomationTab):
                 # --- Status Update ---
                 self.app.after(0, self.app.set_status, "Session expired, retrying...")
                 self.app.after(0, self.update_status, "Retrying...", 0.0)
+                self.app.report_pool.release(driver, broken=True); driver = None # Retry ko fresh browser milega
                 self.run_automation_logic(inputs, retries - 1)
                 return # Stop current execution after scheduling retry
             error_msg = f"A browser error occurred: {str(e).splitlines()[0]}"
@@ -430,6 +432,7 @@ class DashboardReportTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Unexpected Error")
             self.success_message = None
         finally:
+            self.app.report_pool.release(driver) # Browser agle run ke liye warm rehta hai
             # --- Final Status Updates ---
             # Ensure UI is re-enabled even if an error occurred
             self.app.after(0, self.set_ui_state, False)
@@ -565,9 +568,7 @@ class DashboardReportTab(BaseAutomationTab):
 
         elif "PNG" in export_format: # <-- NEW
             # Pass the PDF title and date string to the PNG function
-            success = self._save_to_png(data, headers, pdf_title, date_str_header, file_path)
-            if success:
-                messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}")
+            self._save_to_png(data, headers, pdf_title, date_str_header, file_path)
         # --- END UPDATE ---
 
 
@@ -708,236 +709,24 @@ class DashboardReportTab(BaseAutomationTab):
             messagebox.showerror("PDF Export Error", f"Could not generate PDF report.\nError: {e}", parent=self)
             return False
 
-    # --- NEW METHOD: _save_to_png ---
     def _save_to_png(self, data, headers, title, date_str, file_path):
-        """Generates a professional-looking report as a PNG image."""
-        try:
-            # --- Font setup ---
-            try:
-                font_path_regular = resource_path("assets/fonts/NotoSansDevanagari-Regular.ttf")
-                font_path_bold = resource_path("assets/fonts/NotoSansDevanagari-Bold.ttf")
-                font_title = ImageFont.truetype(font_path_bold, 28)
-                font_date = ImageFont.truetype(font_path_regular, 18)
-                font_header = ImageFont.truetype(font_path_bold, 16)
-                font_body = ImageFont.truetype(font_path_regular, 14)
-            except IOError:
-                self.app.log_message(self.log_display, "Warning: NotoSansDevanagari fonts not found. Using default PIL fonts. Ensure 'assets/fonts' exist.", "warning")
-                font_title = ImageFont.load_default(size=28)
-                font_date = ImageFont.load_default(size=18)
-                font_header = ImageFont.load_default(size=16)
-                font_body = ImageFont.load_default(size=14)
-
-            # --- Image dimensions and colors ---
-            img_width = 2400  # High resolution for readability
-            margin_x = 80
-            margin_y = 60
-            
-            header_bg_color = (220, 235, 255) # Light blue
-            row_even_bg_color = (255, 255, 255) # White
-            row_odd_bg_color = (245, 245, 245)  # Light grey
-            text_color = (0, 0, 0) # Black
-            border_color = (180, 180, 180) # Grey
-
-            draw_start_y = margin_y # Y position to start drawing content
-
-            # --- Calculate column widths (heuristic approach) ---
-            # Based on the 8 headers for this report
-            # "S No.", "District", "Block", "GP", "Implementing Agency", "Project Name with code", "E-MR No.", "DateFrom-DateTo"
-            # Give "Project Name" the most space.
-            base_col_widths = [0.05, 0.10, 0.10, 0.10, 0.15, 0.35, 0.07, 0.08]
-            
-            available_width = img_width - (2 * margin_x)
-            col_widths_pixels = [w * available_width for w in base_col_widths]
-            
-            # --- Auto-adjust column widths based on content ---
-            # This is a simplified version; a full auto-fit is complex.
-            # We'll stick to ratio but ensure headers fit.
-            for i, header in enumerate(headers):
-                header_width = font_header.getlength(header) + 40 # Add padding
-                if col_widths_pixels[i] < header_width:
-                    # If header is wider, steal space from the widest column (Project Name)
-                    diff = header_width - col_widths_pixels[i]
-                    col_widths_pixels[i] = header_width
-                    col_widths_pixels[5] -= diff # Index 5 is "Project Name"
-            
-            # Ensure no column is negative
-            if col_widths_pixels[5] < 100: col_widths_pixels[5] = 100
-            
-            # Re-normalize to fit available width exactly
-            current_total_width = sum(col_widths_pixels)
-            scale_factor = available_width / current_total_width
-            col_widths_pixels = [w * scale_factor for w in col_widths_pixels]
-
-            # Estimate total height required
-            title_bbox = font_title.getbbox(title)
-            date_bbox = font_date.getbbox(date_str)
-            title_height = title_bbox[3] - title_bbox[1]
-            date_height = date_bbox[3] - date_bbox[1]
-
-            # Start with a base image, will expand if needed
-            initial_height = 1600 # Start with a reasonable height
-            img = Image.new("RGB", (img_width, initial_height), (255, 255, 255))
-            draw = ImageDraw.Draw(img)
-
-            current_y = margin_y
-            
-            # --- Draw Title ---
-            title_text_width = font_title.getlength(title)
-            title_x = (img_width - title_text_width) / 2
-            draw.text((title_x, current_y), title, font=font_title, fill=text_color)
-            current_y += title_height + 5
-
-            # --- Draw Date ---
-            date_text_width = font_date.getlength(date_str)
-            date_x = img_width - margin_x - date_text_width
-            draw.text((date_x, current_y), date_str, font=font_date, fill=text_color)
-            current_y += date_height + 20 # Space after date and before table
-
-            # --- Draw Headers ---
-            header_y_start = current_y
-            header_height = 0
-            # Calculate max header height considering wrapping
-            for i, header in enumerate(headers):
-                wrapped_header = self._wrap_text(header, font_header, col_widths_pixels[i] - 10)
-                line_height = font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1] # Basic line height
-                header_height = max(header_height, len(wrapped_header) * line_height + 10) # Add padding
-            
-            # Draw header cells
-            current_x = margin_x
-            for i, header in enumerate(headers):
-                draw.rectangle([current_x, header_y_start, current_x + col_widths_pixels[i], header_y_start + header_height], fill=header_bg_color, outline=border_color, width=1)
-                
-                wrapped_header = self._wrap_text(header, font_header, col_widths_pixels[i] - 20)
-                line_height = font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]
-                total_text_height = len(wrapped_header) * line_height
-                text_y = header_y_start + (header_height - total_text_height) / 2 # Center vertically
-                
-                for line in wrapped_header:
-                    line_width = font_header.getlength(line)
-                    draw.text((current_x + (col_widths_pixels[i] - line_width) / 2, text_y), line, font=font_header, fill=text_color)
-                    text_y += line_height # Move to next line
-                current_x += col_widths_pixels[i]
-            current_y += header_height
-
-            # --- Draw Data Rows ---
-            for row_idx, row_data in enumerate(data):
-                row_bg_color = row_even_bg_color if row_idx % 2 == 0 else row_odd_bg_color
-
-                # Calculate row height dynamically based on content wrapping
-                max_row_text_height = 0
-                temp_wrapped_cells = []
-                for i, cell_text in enumerate(row_data):
-                    wrapped_lines = self._wrap_text(str(cell_text), font_body, col_widths_pixels[i] - 20) # 20 for internal padding
-                    temp_wrapped_cells.append(wrapped_lines)
-                    line_height = font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1] # Basic line height
-                    max_row_text_height = max(max_row_text_height, len(wrapped_lines) * line_height)
-
-                row_data_height = max_row_text_height + 10 # Add vertical padding
-                line_height = font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1]
-
-                # If current_y plus next row height exceeds image height, expand image
-                if current_y + row_data_height + margin_y > img.height:
-                    new_height = int(img.height + (row_data_height + margin_y) * 10) # Expand by 10 rows
-                    new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-                    new_img.paste(img, (0, 0))
-                    img = new_img
-                    draw = ImageDraw.Draw(img) # Update draw object for new image
-
-                current_x = margin_x
-                for i, cell_text in enumerate(row_data):
-                    # Draw cell background
-                    draw.rectangle([current_x, current_y, current_x + col_widths_pixels[i], current_y + row_data_height], fill=row_bg_color, outline=border_color, width=1)
-                    
-                    # Draw wrapped text
-                    wrapped_lines = temp_wrapped_cells[i]
-                    text_y = current_y + 5 # Small top padding
-                    for line in wrapped_lines:
-                        draw.text((current_x + 10, text_y), line, font=font_body, fill=text_color) # 10 for left padding
-                        text_y += line_height # Move to next line
-                    current_x += col_widths_pixels[i]
-                current_y += row_data_height
-
-            # --- Draw Footer ---
-            current_y += 15 # Space after table
-            footer_text = "Report Generated by NregaBot.com"
-            footer_font = font_body
-            footer_bbox = footer_font.getbbox(footer_text)
-            footer_height = footer_bbox[3] - footer_bbox[1]
-            footer_y_pos = current_y + 10
-
-            # Check if image needs expansion for footer + bottom margin
-            if footer_y_pos + footer_height + margin_y > img.height:
-                new_height = int(footer_y_pos + footer_height + margin_y)
-                new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-                new_img.paste(img, (0, 0))
-                img = new_img
-                draw = ImageDraw.Draw(img)
-            
-            # Draw footer text
-            draw.text((margin_x, footer_y_pos), footer_text, font=footer_font, fill=text_color)
-            current_y = footer_y_pos + footer_height # Update final Y position
-            # --- End Footer ---
-
-            # Crop image to actual content
-            final_img = img.crop((0, 0, img_width, current_y + margin_y))
-            final_img.save(file_path, "PNG", dpi=(300, 300)) # Save at 300 DPI for quality
-            return True
-        except Exception as e:
-            messagebox.showerror("PNG Export Error", f"Could not generate PNG report.\nError: {e}", parent=self)
-            return False
+        """Saves the report as a PNG in a worker process (base_tab.render_report_image) without blocking the UI."""
+        self.generate_report_image(data, headers, title, date_str, file_path, col_ratios=[0.05, 0.10, 0.10, 0.10, 0.15, 0.35, 0.07, 0.08],
+                                   on_done=lambda: messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}"))
 
-    # --- NEW METHOD: _wrap_text ---
-    def _wrap_text(self, text, font, max_width):
-        """Helper to wrap text for Pillow."""
-        if not text:
-            return [""]
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        for word in words:
-            if font.getlength(' '.join(current_line + [word])) <= max_width:
-                current_line.append(word)
-            else:
-                if current_line: # Handle case where a single word is too long
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-                # Handle single word longer than max_width
-                while font.getlength(' '.join(current_line)) > max_width:
-                    # This is a simple character-based break, not ideal but works
-                    part = ""
-                    for i, char in enumerate(current_line[0]):
-                        if font.getlength(part + char) > max_width:
-                            lines.append(part)
-                            current_line[0] = current_line[0][i:]
-                            part = ""
-                            break
-                        part += char
-                    else:
-                        break # Word fits now
-        
-        if current_line:
-            lines.append(' '.join(current_line))
-            
-        return lines if lines else [""]
-
-        
     def save_inputs(self, inputs):
         """Saves non-sensitive inputs for this tab."""
         save_data = {k: inputs.get(k) for k in ('state', 'district', 'block', 'panchayat')}
         try:
-            config_file = self.app.get_data_path("dashboard_report_inputs.json")
-            with open(config_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
+            self.app.state_store.set("dashboard_report_inputs", save_data)
         except Exception as e:
             print(f"Error saving Dashboard Report inputs: {e}")
 
     def load_inputs(self):
         """Loads saved inputs for this tab."""
         try:
-            config_file = self.app.get_data_path("dashboard_report_inputs.json")
-            if not os.path.exists(config_file): return
-            
-            with open(config_file, 'r') as f: data = json.load(f)
+            data = self.app.state_store.get("dashboard_report_inputs")
+            if data is None: return
             
             self.state_entry.delete(0, 'end') # Clear before insert
             self.state_entry.insert(0, data.get('state', ''))
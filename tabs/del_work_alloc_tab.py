@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -13,6 +12,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback, wait_for_page_ready
 
 class DelWorkAllocTab(BaseAutomationTab):
     """
@@ -155,11 +155,10 @@ class DelWorkAllocTab(BaseAutomationTab):
             wait = WebDriverWait(driver, 20)
             
             self.app.log_message(self.log_display, "Selecting Panchayat...")
-            panchayat_dropdown = Select(wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddlpanchayat_code"))))
-            panchayat_dropdown.select_by_visible_text(panchayat)
-            
+            panchayat_element = wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddlpanchayat_code")))
+            Select(panchayat_element).select_by_visible_text(panchayat)
+            wait_for_postback(driver, panchayat_element)
             wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_ddlRegistration")))
-            time.sleep(1) 
             self.app.log_message(self.log_display, "Panchayat selected successfully.", "success")
 
             if auto_mode:
@@ -204,7 +203,7 @@ class DelWorkAllocTab(BaseAutomationTab):
                 search_box.send_keys(item_id)
                 search_box.send_keys(Keys.TAB)
                 wait.until(lambda d: len(Select(d.find_element(By.ID, "ctl00_ContentPlaceHolder1_ddlRegistration")).options) > 1)
-                time.sleep(1)
+                wait_for_page_ready(driver)
 
             reg_id_dropdown_element = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_ddlRegistration")))
             reg_id_dropdown = Select(reg_id_dropdown_element)
@@ -227,7 +226,7 @@ class DelWorkAllocTab(BaseAutomationTab):
                 return
 
             select_all_checkbox.click()
-            time.sleep(0.5)
+            wait_for_postback(driver)
             
             proceed_button = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_cmdUpdate")
             proceed_button.click()
@@ -256,6 +255,7 @@ class DelWorkAllocTab(BaseAutomationTab):
 
     def _log_result(self, panchayat, item_id, status, details):
         """Logs the outcome of an operation to the results Treeview."""
+        self._record_result(status, item_id, details=details, panchayat=panchayat)
         timestamp = datetime.now().strftime("%H:%M:%S")
         values = (timestamp, panchayat, item_id, status, details)
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=values))
\ No newline at end of file
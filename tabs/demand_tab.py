@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog, Toplevel
 import customtkinter as ctk
-import os, csv, time, threading, json, re, requests
+import os, csv, time, threading, re, requests
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -14,6 +14,8 @@ import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
 from .date_entry_widget import DateEntry
+from .page_wait import wait_for_postback, wait_for_page_ready
+from .applicant_list import ApplicantModel, ApplicantListView
 
 # --- Cloud File Picker Toplevel Window ---
 class CloudFilePicker(ctk.CTkToplevel):
@@ -201,12 +203,10 @@ class DemandTab(BaseAutomationTab):
         super().__init__(parent, app_instance, automation_key="demand")
         # self.worker_thread = None <-- This is now managed by main_app
         self.csv_path = None # Stores the path to the *processed* file (local or temp)
-        self.config_file = self.app.get_data_path("demand_inputs.json")
 
-        self.all_applicants_data = [] # Holds all data from CSV
-        self.displayed_checkboxes = [] # Holds currently visible widgets (checkboxes, labels)
+        self.applicants = ApplicantModel(village_code=self._get_village_code) # Holds all data from CSV (with search/selection indexes)
+        self.displayed_positions = range(0) # Positions currently in the list (search results + next JCs)
         self.next_jc_separator_shown = False # Flag for sequential display
-        self.next_jc_separator = None # Placeholder for separator label
         
         self.work_key_list = [] # Store work keys for autocomplete
 
@@ -334,12 +334,12 @@ class DemandTab(BaseAutomationTab):
         self.file_label.grid(row=1, column=0, pady=(5,0), sticky="w")
         self.selection_summary_label = ctk.CTkLabel(applicant_header, text="0 applicants selected", text_color="gray", anchor="w")
         self.selection_summary_label.grid(row=2, column=0, columnspan=2, pady=(0, 5), sticky="w")
-        self.search_entry = ctk.CTkEntry(applicant_header, placeholder_text="Load a CSV, then type here to search...")
+        self.search_entry = ctk.CTkEntry(applicant_header, placeholder_text="Load a CSV, then type here to search (v:<village code> for a village)...")
         self.search_entry.grid(row=3, column=0, columnspan=2, pady=5, sticky="ew")
         self.search_entry.bind("<KeyRelease>", self._update_applicant_display)
 
-        self.applicant_scroll_frame = ctk.CTkScrollableFrame(applicant_frame, label_text="Select Applicants to Process")
-        self.applicant_scroll_frame.grid(row=4, column=0, sticky="nsew", padx=10, pady=(0,10)) 
+        self.applicant_list = ApplicantListView(applicant_frame, self.applicants, self._on_applicant_select, label_text="Select Applicants to Process")
+        self.applicant_list.grid(row=4, column=0, sticky="nsew", padx=10, pady=(0,10)) 
 
         # --- Results Tab Widgets ---
         # Configure row weights
@@ -369,26 +369,28 @@ class DemandTab(BaseAutomationTab):
 
         self._setup_results_treeview()
 
+    def snapshot_state(self):
+        """Loaded CSV applicants (with selection) so an unloaded tab comes back with the same list."""
+        return {"csv_path": self.csv_path, "applicants": self.applicants.records}
+
+    def restore_state(self, state):
+        if not state.get("applicants"): return
+        self.csv_path = state.get("csv_path")
+        self.file_label.configure(text=os.path.basename(self.csv_path) if self.csv_path else "Restored list")
+        self.applicants.load(state["applicants"])
+        self._update_applicant_display(); self._update_selection_summary()
+
     def _select_all_applicants(self):
         """
         Selects all valid (not disabled) applicants in the list,
         up to a hardcoded limit of 400.
         """
-        if not self.all_applicants_data: return
-        if len(self.all_applicants_data) > 400: # Limit changed to 400
-             messagebox.showinfo("Limit Exceeded", f"Cannot Select All (>400 applicants loaded: {len(self.all_applicants_data)}).")
+        if not len(self.applicants): return
+        if len(self.applicants) > 400: # Limit changed to 400
+             messagebox.showinfo("Limit Exceeded", f"Cannot Select All (>400 applicants loaded: {len(self.applicants)}).")
              return
-        selected_count = 0
-        # Update the master data list
-        for applicant_data in self.all_applicants_data:
-            if "*" not in applicant_data.get('Name of Applicant', ''):
-                applicant_data['_selected'] = True; selected_count += 1
-        # Update the currently visible checkboxes
-        for checkbox in self.displayed_checkboxes:
-             if isinstance(checkbox, ctk.CTkCheckBox):
-                applicant_data = checkbox.applicant_data
-                if "*" not in applicant_data.get('Name of Applicant', ''):
-                    checkbox.select()
+        selected_count = self.applicants.select_first(len(self.applicants))
+        self.applicant_list.refresh()
         self._update_selection_summary()
         self.app.log_message(self.log_display, f"Selected all {selected_count} valid applicants.")
 
@@ -396,7 +398,7 @@ class DemandTab(BaseAutomationTab):
         """
         Selects a custom number of applicants from the top of the list.
         """
-        if not self.all_applicants_data:
+        if not len(self.applicants):
             messagebox.showwarning("No Data", "Please load a CSV file first.")
             return
 
@@ -410,31 +412,15 @@ class DemandTab(BaseAutomationTab):
             messagebox.showwarning("Invalid Input", "Number must be greater than zero.")
             return
             
-        if num_to_select > len(self.all_applicants_data):
-            num_to_select = len(self.all_applicants_data)
+        if num_to_select > len(self.applicants):
+            num_to_select = len(self.applicants)
             messagebox.showinfo("Adjustment", f"Selecting maximum available applicants: {num_to_select}.")
 
         self._clear_selection() # Clear any existing selection first
 
-        selected_count = 0
-        
-        # Iterate through the master list and select the first 'num_to_select' valid entries
-        for i, applicant_data in enumerate(self.all_applicants_data):
-            if selected_count >= num_to_select:
-                break
-            
-            # Check if the applicant is valid (no '*')
-            if "*" not in applicant_data.get('Name of Applicant', ''):
-                applicant_data['_selected'] = True
-                selected_count += 1
-            
-        # Update the visible checkboxes
-        for checkbox in self.displayed_checkboxes:
-             if isinstance(checkbox, ctk.CTkCheckBox):
-                if checkbox.applicant_data.get('_selected', False):
-                    checkbox.select()
-                else:
-                    checkbox.deselect()
+        # Select the first 'num_to_select' valid entries (no '*') from the master list
+        selected_count = self.applicants.select_first(num_to_select)
+        self.applicant_list.refresh()
 
         self._update_selection_summary()
         self.app.log_message(self.log_display, f"Selected first {selected_count} valid applicants.")
@@ -445,10 +431,7 @@ class DemandTab(BaseAutomationTab):
         This is called after a successful automation run.
         """
         self.app.log_message(self.log_display, "Clearing processed selection...", "info")
-        for app_data in self.all_applicants_data: app_data['_selected'] = False
-        for widget in self.displayed_checkboxes:
-            if isinstance(widget, ctk.CTkCheckBox) and widget.get() == "on":
-                widget.deselect()
+        self.applicants.clear_selection(); self.applicant_list.refresh()
         self._update_selection_summary()
 
     def _select_csv_from_computer(self):
@@ -470,11 +453,11 @@ class DemandTab(BaseAutomationTab):
     def _process_csv_data(self, path):
         """
         Reads a CSV file (from a local or temp path) and populates
-        the self.all_applicants_data list.
+        the applicant model.
         """
         self.csv_path = path 
         self.file_label.configure(text=os.path.basename(path))
-        self.all_applicants_data = []
+        records = []
 
         try:
             with open(path, mode='r', encoding='utf-8-sig') as csvfile:
@@ -497,9 +480,9 @@ class DemandTab(BaseAutomationTab):
                          continue
                      name, job_card = row[name_idx].strip(), row[jc_idx].strip()
                      if name and job_card:
-                        self.all_applicants_data.append({'original_index': row_num, 'Name of Applicant': name, 'Job card number': job_card, '_selected': False})
+                        records.append({'original_index': row_num, 'Name of Applicant': name, 'Job card number': job_card, '_selected': False})
 
-            loaded_count = len(self.all_applicants_data)
+            self.applicants.load(records); loaded_count = len(self.applicants)
             self.app.log_message(self.log_display, f"Loaded {loaded_count} applicants from '{os.path.basename(path)}'.")
             
             # UPDATED: Call display update to handle button visibility
@@ -508,7 +491,7 @@ class DemandTab(BaseAutomationTab):
         except Exception as e:
             messagebox.showerror("Error Reading CSV", f"Could not read CSV.\nError: {e}")
             self.csv_path = None
-            self.all_applicants_data = []
+            self.applicants.load([])
             self.file_label.configure(text="No file")
             self._update_applicant_display() # Ensure UI resets even on error
             self._update_selection_summary()
@@ -717,16 +700,11 @@ class DemandTab(BaseAutomationTab):
 
     def _update_applicant_display(self, event=None):
         """
-        Updates the applicant checkbox list based on the search query or
-        shows the first 50 if no search.
+        Updates the applicant list based on the search query (or shows all if no search).
+        Only the rows that fit on screen are drawn, so the full list is cheap to show.
         """
-        # 1. Clear existing widgets
-        for widget in self.displayed_checkboxes: widget.destroy()
-        if self.next_jc_separator: self.next_jc_separator.destroy(); self.next_jc_separator = None
-        self.displayed_checkboxes.clear(); self.next_jc_separator_shown = False
-
-        # 2. Handle Button Visibility FIRST (So they always appear)
-        loaded_count = len(self.all_applicants_data)
+        # 1. Handle Button Visibility FIRST (So they always appear)
+        loaded_count = len(self.applicants)
         
         # Handle Select All Button (Limit 400)
         if 0 < loaded_count <= 400: 
@@ -741,93 +719,40 @@ class DemandTab(BaseAutomationTab):
         else:
             self.clear_selection_button.pack_forget()
 
-        # 3. Logic for Displaying the List
-        if not self.all_applicants_data: return
-
-        search = self.search_entry.get().lower().strip()
-        
-        # If search is short, don't filter, just stop rendering list (but buttons are already shown!)
-        if search and len(search) < 3: 
-            return 
-
-        # Determine matches
-        if search:
-             matches = [row for row in self.all_applicants_data if
-                   (search in row.get('Job card number','').lower() or
-                    search in row.get('Name of Applicant','').lower())]
-        else:
-             # If no search, take the first 50 rows (Deleted the 'return' line that caused the bug)
-             matches = self.all_applicants_data[:50]
-
-        limit = 50
-        for row in matches[:limit]: self._create_applicant_checkbox(row)
-        
-        # Add "..." label if there are more items
-        if len(matches) > limit or (not search and len(self.all_applicants_data) > limit):
-             label = ctk.CTkLabel(self.applicant_scroll_frame, text=f"... (showing first {limit} items)", text_color="gray")
-             label.pack(anchor="w", padx=10, pady=2); self.displayed_checkboxes.append(label)
-
-        # Scroll to top
-        try: self.applicant_scroll_frame._parent_canvas.yview_moveto(0)
-        except Exception: pass
+        # 2. Search through the model's indexes and show the matches (scrolls to top)
+        village_logic = config.STATE_DEMAND_CONFIG.get(self.state_combobox.get(), {}).get("village_code_logic")
+        matches = self.applicants.search(self.search_entry.get(), village_logic)
+        self.displayed_positions = matches if isinstance(matches, range) else set(matches)
+        self.next_jc_separator_shown = False
+        self.applicant_list.set_rows([("applicant", i, False) for i in matches])
 
-    def _create_applicant_checkbox(self, row_data, is_next_jc=False):
-        """
-        Creates a single checkbox widget for an applicant.
-        """
-        text = f"{row_data['Job card number']}  -  {row_data['Name of Applicant']}"
-        var = ctk.StringVar(value="on" if row_data['_selected'] else "off")
-        cmd = lambda data=row_data, state=var: self._on_applicant_select(data, state.get())
-        cb = ctk.CTkCheckBox(self.applicant_scroll_frame, text=text, variable=var, onvalue="on", offvalue="off", command=cmd)
-        cb.applicant_data = row_data
-
-        # Disable checkbox if applicant name has a '*' (e.g., marked as ineligible)
-        if "*" in row_data.get('Name of Applicant', ''): cb.configure(text_color="gray50", state="disabled")
-        # Highlight if it's from a 'next' job card
-        elif is_next_jc: cb.configure(text_color="#a0a0ff")
-
-        cb.pack(anchor="w", padx=10, pady=2, fill="x"); self.displayed_checkboxes.append(cb)
-
-    def _on_applicant_select(self, applicant_data, new_state):
+    def _on_applicant_select(self, position, selected):
         """
         Handles the event when an applicant's checkbox is clicked.
         Updates the master data and the selection summary.
         """
-        applicant_data['_selected'] = (new_state == "on")
+        self.applicants.set_selected(position, selected)
         self._update_selection_summary()
-        if new_state == "on": self._add_next_jobcards_to_display(applicant_data)
+        if selected: self._add_next_jobcards_to_display(position)
 
-    def _add_next_jobcards_to_display(self, selected_applicant_data):
+    def _add_next_jobcards_to_display(self, position):
         """
         Intelligently displays applicants from the next few job cards
         when one is selected, to make selecting families easier.
         """
         try:
-            sel_idx = next((i for i, d in enumerate(self.all_applicants_data) if d['original_index'] == selected_applicant_data['original_index']), -1)
-            if sel_idx == -1: return
-
-            sel_jc = selected_applicant_data['Job card number']; next_jcs = set(); apps_to_add = []
             max_next = 5 # Show applicants from the next 5 job cards
-
-            for i in range(sel_idx + 1, len(self.all_applicants_data)):
-                curr_app = self.all_applicants_data[i]; curr_jc = curr_app['Job card number']
-                if curr_jc == sel_jc: continue # Skip applicants from the *same* JC
-                if curr_jc not in next_jcs:
-                    if len(next_jcs) >= max_next: break
-                    next_jcs.add(curr_jc)
-                if curr_jc in next_jcs: apps_to_add.append(curr_app)
-
+            apps_to_add = [i for i in self.applicants.next_jobcard_positions(position, max_next) if i not in self.displayed_positions]
             if not apps_to_add: return
 
-            # Add a separator label if it's not already there
+            if isinstance(self.displayed_positions, range): self.displayed_positions = set(self.displayed_positions)
+            self.displayed_positions.update(apps_to_add)
+            rows = list(self.applicant_list.rows())
+            # Add a separator row if it's not already there
             if not self.next_jc_separator_shown:
-                self.next_jc_separator = ctk.CTkLabel(self.applicant_scroll_frame, text=f"--- Applicants from Next {max_next} Job Card(s) ---", text_color="gray")
-                self.next_jc_separator.pack(anchor="w", padx=10, pady=(10, 2)); self.displayed_checkboxes.append(self.next_jc_separator); self.next_jc_separator_shown = True
-
-            # Add checkboxes for the newly found applicants
-            displayed_indices = {cb.applicant_data['original_index'] for cb in self.displayed_checkboxes if hasattr(cb, 'applicant_data')}
-            for app_data in apps_to_add:
-                if app_data['original_index'] not in displayed_indices: self._create_applicant_checkbox(app_data, is_next_jc=True)
+                rows.append(("separator", f"--- Applicants from Next {max_next} Job Card(s) ---")); self.next_jc_separator_shown = True
+            rows.extend(("applicant", i, True) for i in apps_to_add)
+            self.applicant_list.set_rows(rows, keep_offset=True)
 
         except Exception as e: self.app.log_message(self.log_display, f"Error adding next JCs: {e}", "warning")
 
@@ -835,9 +760,8 @@ class DemandTab(BaseAutomationTab):
         """
         Updates the label showing the count of selected applicants and unique job cards.
         """
-        selected = [r for r in self.all_applicants_data if r.get('_selected', False)]
-        unique_jcs = len(set(r.get('Job card number') for r in selected))
-        self.selection_summary_label.configure(text=f"{len(selected)} applicants / {unique_jcs} unique job cards")
+        selected, unique_jcs = self.applicants.selection_summary()
+        self.selection_summary_label.configure(text=f"{selected} applicants / {unique_jcs} unique job cards")
 
     def set_ui_state(self, running: bool):
         """
@@ -855,9 +779,7 @@ class DemandTab(BaseAutomationTab):
         self.load_work_key_button.configure(state=state)
         # Also disable/enable the retry button
         self.retry_failed_button.configure(state=state)
-        for widget in self.displayed_checkboxes:
-             if isinstance(widget, ctk.CTkCheckBox) and "*" not in widget.cget("text"):
-                 widget.configure(state=state)
+        self.applicant_list.set_state(state) # '*' wale applicants disabled hi rehte hain
 
     def _get_village_code(self, job_card, state_logic_key):
         """
@@ -881,7 +803,7 @@ class DemandTab(BaseAutomationTab):
         try: cfg = config.STATE_DEMAND_CONFIG[state]; logic_key = cfg["village_code_logic"]; url = cfg["base_url"]
         except KeyError: messagebox.showerror("Config Error", f"Demand config missing for: {state}"); return
 
-        selected = [r for r in self.all_applicants_data if r.get('_selected', False)]
+        selected = self.applicants.selected_records()
         panchayat = self.panchayat_entry.get().strip(); days_str = self.days_entry.get().strip()
         work_key_for_allocation = self.allocation_work_key_entry.get().strip()
         
@@ -967,7 +889,7 @@ class DemandTab(BaseAutomationTab):
         self.state_combobox.set(""); self.panchayat_entry.delete(0, 'end'); self.days_entry.delete(0, 'end'); self.search_entry.delete(0, 'end')
         self.allocation_work_key_entry.delete(0, 'end')
         self.demand_date_entry.clear(); self.demand_to_date_entry.clear(); 
-        self.csv_path = None; self.all_applicants_data.clear()
+        self.csv_path = None; self.applicants.load([])
         self.file_label.configure(text="No file loaded.", text_color="gray")
         self.select_all_button.pack_forget(); self.clear_selection_button.pack_forget()
         # Clear work key list
@@ -998,10 +920,11 @@ class DemandTab(BaseAutomationTab):
         It loops through villages and job cards.
         """
         driver = None
+        self.trace_begin()
         try:
             driver = self.app.get_driver();
             if not driver: self.app.after(0, self.app.log_message, self.log_display, "ERROR: WebDriver unavailable."); return
-            driver.get(base_url)
+            with self.trace_step("navigate"): driver.get(base_url)
             wait, short_wait = WebDriverWait(driver, 20), WebDriverWait(driver, 5)
 
             # Define potential element IDs for different state portals
@@ -1038,10 +961,11 @@ class DemandTab(BaseAutomationTab):
                 try:
                     self.app.after(0, self.app.set_status, f"Selecting Panchayat: {panchayat}") # <-- STATUS UPDATE
                     self.app.after(0, self.app.log_message, self.log_display, f"Selecting Panchayat: {panchayat}")
-                    panchayat_dropdown = driver.find_element(By.CSS_SELECTOR, panchayat_selector)
-                    Select(panchayat_dropdown).select_by_visible_text(panchayat)
-                    self.app.after(0, self.app.log_message, self.log_display, "Waiting for villages to load after P selection...")
-                    wait.until(EC.any_of(EC.presence_of_element_located((By.XPATH, f"//select[@id='{v_ids[0]}']/option[position()>1]")), EC.presence_of_element_located((By.XPATH, f"//select[@id='{v_ids[1]}']/option[position()>1]"))))
+                    with self.trace_step("select panchayat"):
+                        panchayat_dropdown = driver.find_element(By.CSS_SELECTOR, panchayat_selector)
+                        Select(panchayat_dropdown).select_by_visible_text(panchayat)
+                        self.app.after(0, self.app.log_message, self.log_display, "Waiting for villages to load after P selection...")
+                        wait.until(EC.any_of(EC.presence_of_element_located((By.XPATH, f"//select[@id='{v_ids[0]}']/option[position()>1]")), EC.presence_of_element_located((By.XPATH, f"//select[@id='{v_ids[1]}']/option[position()>1]"))))
                 except NoSuchElementException as e_select:
                     self.app.after(0, self.app.log_message, self.log_display, f"ERROR: Panchayat '{panchayat}' not found in dropdown. Stopping.", "error")
                     raise e_select
@@ -1059,14 +983,16 @@ class DemandTab(BaseAutomationTab):
                 try:
                     self.app.after(0, self.app.set_status, f"V {proc_v}/{total_v}: Selecting Village {vc}...") # <-- STATUS UPDATE
                     self.app.after(0, self.app.log_message, self.log_display, f"--- Village {proc_v}/{total_v} (Code: {vc}) ---")
+                    village_done = self.trace_mark("select village")
                     v_el = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"#{v_ids[0]}, #{v_ids[1]}"))); v_sel = Select(v_el); found_v = False
                     for opt in v_sel.options:
                         if opt.get_attribute('value').endswith(vc): v_sel.select_by_value(opt.get_attribute('value')); self.app.after(0, self.app.log_message, self.log_display, f"Selected Village '{opt.text}' (...{vc})."); found_v = True; break
                     if not found_v: raise NoSuchElementException(f"Village code {vc} not found.")
 
                     self.app.after(0, self.app.set_status, f"V {proc_v}/{total_v}: Loading job cards...") # <-- STATUS UPDATE
-                    self.app.after(0, self.app.log_message, self.log_display, "Waiting for job cards..."); time.sleep(0.5)
+                    self.app.after(0, self.app.log_message, self.log_display, "Waiting for job cards..."); wait_for_postback(driver, v_el)
                     wait.until(EC.any_of(EC.presence_of_element_located((By.XPATH, f"//select[@id='{j_ids[0]}']/option[position()>1]")), EC.presence_of_element_located((By.XPATH, f"//select[@id='{j_ids[1]}']/option[position()>1]"))))
+                    village_done()
 
                     # --- Loop Through Job Cards in Village ---
                     total_jc, proc_jc = len(jcs_in_v), 0
@@ -1079,7 +1005,8 @@ class DemandTab(BaseAutomationTab):
                         # This updates the *main app* status
                         self.app.after(0, self.app.set_status, f"V {proc_v}/{total_v}, JC {proc_jc}/{total_jc}: {jc.split('/')[-1]}") # <-- STATUS UPDATE
                         
-                        self._process_single_job_card(driver, wait, short_wait, jc, apps, user_days, demand_from, work_start, days_worked_ids, j_ids, grid_ids, btn_ids, err_msg_ids, base_url, state, demand_to_override)
+                        with self.trace_item(jc):
+                            self._process_single_job_card(driver, wait, short_wait, jc, apps, user_days, demand_from, work_start, days_worked_ids, j_ids, grid_ids, btn_ids, err_msg_ids, base_url, state, demand_to_override)
 
                 except Exception as e: 
                     self.app.after(0, self.app.log_message, self.log_display, f"ERROR Village {vc}: {type(e).__name__} - {e}. Skipping.", "error")
@@ -1095,6 +1022,7 @@ class DemandTab(BaseAutomationTab):
             self.app.after(0, self.update_status, f"Error: {type(e).__name__}", 0.0) 
             self.app.after(0, lambda: messagebox.showerror("Error", f"Automation stopped: {e}"))
         finally:
+            self.trace_finish()
             final_status_text = "Finished"
             final_tab_status = "Finished" # For internal tab status
             final_progress = 1.0
@@ -1144,7 +1072,7 @@ class DemandTab(BaseAutomationTab):
             Tries to read the 'Total Days worked' label.
             Returns -1 on timeout or error.
             """
-            time.sleep(0.3)
+            wait_for_page_ready(driver, timeout=5)
             try:
                 days_el = short_wait.until(EC.visibility_of_element_located((By.ID, days_worked_ids[0])))
                 worked_str = days_el.text.strip(); worked = int(worked_str) if worked_str and worked_str.isdigit() else 0
@@ -1211,8 +1139,8 @@ class DemandTab(BaseAutomationTab):
                                 self.app.after(0, self.app.log_message, self.log_display, f"   -> Updating: '{name_web}' ({days_to_fill}d)...")
                                 if from_in.get_attribute('value') != demand_from: from_in.clear(); from_in.send_keys(demand_from + Keys.TAB); time.sleep(0.1)
                                 start_in = wait.until(EC.element_to_be_clickable((By.ID, ids['start']))) 
-                                if start_in.get_attribute('value') != work_start: start_in.clear(); start_in.send_keys(work_start + Keys.TAB); time.sleep(1.0) 
-                                else: start_in.send_keys(Keys.TAB); time.sleep(1.0) 
+                                if start_in.get_attribute('value') != work_start: start_in.clear(); start_in.send_keys(work_start + Keys.TAB); wait_for_postback(driver, start_in)
+                                else: start_in.send_keys(Keys.TAB); wait_for_postback(driver, start_in)
 
                                 days_in = wait.until(EC.element_to_be_clickable((By.ID, ids['days']))) 
                                 days_after = days_in.get_attribute('value')
@@ -1224,7 +1152,7 @@ class DemandTab(BaseAutomationTab):
                                 else:
                                     # Even if days match, hit tab to ensure calculation triggers if needed
                                     days_in.send_keys(Keys.TAB)
-                                    time.sleep(0.5)
+                                    wait_for_postback(driver, days_in)
 
                                 # --- OVERRIDE TO DATE LOGIC ---
                                 if demand_to_override:
@@ -1243,7 +1171,7 @@ class DemandTab(BaseAutomationTab):
                                                 time.sleep(0.02)
                                             
                                             till_in.send_keys(demand_to_override + Keys.TAB)
-                                            time.sleep(0.5)
+                                            wait_for_postback(driver, till_in)
                                     except Exception as e_override:
                                         self.app.after(0, self.app.log_message, self.log_display, f"      -> Error overriding date: {e_override}", "error")
                                 # ------------------------------
@@ -1269,7 +1197,7 @@ class DemandTab(BaseAutomationTab):
                     except StaleElementReferenceException: self.app.after(0, self.app.log_message, self.log_display, f"   Warn: Stale fill '{target_name}', retry find...", "warning"); found = False; break
                     except Exception as e_fill: self.app.after(0, self.app.log_message, self.log_display, f"   Warn: Error fill '{target_name}': {type(e_fill).__name__}"); continue
 
-                if not found and (StaleElementReferenceException or UnexpectedAlertPresentException): self.app.after(0, self.app.log_message, self.log_display, f"   -> Retrying search '{target_name}'..."); time.sleep(0.5); continue
+                if not found and (StaleElementReferenceException or UnexpectedAlertPresentException): self.app.after(0, self.app.log_message, self.log_display, f"   -> Retrying search '{target_name}'..."); wait_for_page_ready(driver); continue
 
             for nf in applicants_not_found: self.app.after(0, self.app.log_message, self.log_display, f"   ERROR: Not found: '{nf}'.", "error"); self.app.after(0, self._update_results_tree, (jc, nf, "Failed (Not found)"))
             return fill_success
@@ -1278,6 +1206,7 @@ class DemandTab(BaseAutomationTab):
         try:
             # 1. Select the Job Card
             jc_suffix = jc.split('/')[-1]; self.app.after(0, self.app.log_message, self.log_display, f"Processing JC Suffix: {jc_suffix}")
+            select_jc_done = self.trace_mark("select job card")
             try:
                 jc_el = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"#{jc_ids[0]}, #{jc_ids[1]}"))); jc_val = jc.split('/')[0]
                 
@@ -1316,6 +1245,7 @@ class DemandTab(BaseAutomationTab):
             except NoSuchElementException as e_jc_select:
                 self.app.after(0, self.app.log_message, self.log_display, f"   ERROR: Job Card '{jc}' not found. Skipping.", "error"); [self.app.after(0, self._update_results_tree, (jc, a.get('Name of Applicant'), "FAIL: JC Not Found")) for a in apps_in_jc]; return
 
+            select_jc_done()
             targets = [a.get('Name of Applicant', '').strip() for a in apps_in_jc]
             num_selected = len(targets)
             if num_selected == 0:
@@ -1324,7 +1254,7 @@ class DemandTab(BaseAutomationTab):
 
             # 2. Get Worked Days and Check for early exit
             self.app.after(0, self.app.set_status, f"JC {jc_suffix}: Reading worked days...") # <-- STATUS UPDATE
-            worked = get_worked_days_robustly() # Can return number, 0, or -1
+            with self.trace_step("read worked days"): worked = get_worked_days_robustly() # Can return number, 0, or -1
             
             # Handle "worked == -1" (timeout) case
             if worked == -1: 
@@ -1406,7 +1336,7 @@ class DemandTab(BaseAutomationTab):
                 grid_el = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f"#{grid_ids[0]}, #{grid_ids[1]}"))); 
                 grid_id = grid_el.get_attribute("id"); 
                 wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, f"table[id='{grid_id}'] > tbody > tr"))); 
-                time.sleep(0.5)
+                wait_for_page_ready(driver)
             except TimeoutException:
                 msg = "Skipped (Table fail)"; err_found = False
                 try:
@@ -1447,21 +1377,23 @@ class DemandTab(BaseAutomationTab):
             
             # 6. Fill Data for Target Applicants
             self.app.after(0, self.app.set_status, f"JC {jc_suffix}: Filling data...") # <-- STATUS UPDATE
-            filled = fill_demand_data(days_distribution) 
+            with self.trace_step("fill demand"): filled = fill_demand_data(days_distribution) 
 
             # 7. Submit and Handle Response
             if filled:
                 self.app.after(0, self.app.set_status, f"JC {jc_suffix}: Submitting...") # <-- STATUS UPDATE
                 total_days_attempt = sum(days_distribution.values())
                 self.app.after(0, self.app.log_message, self.log_display, f"Submitting (Attempt 1) JC {jc_suffix} with {total_days_attempt} total days...")
+                submit_done = self.trace_mark("submit")
                 btn = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, f"#{btn_ids[0]}, #{btn_ids[1]}"))); body = driver.find_element(By.TAG_NAME, 'body'); btn.click()
                 res = ""; alert_ok = False; is_100_day_error = False; actual_worked_from_error = -1; remaining_days_calc = -1; is_aadhaar_error = False; reason = "" 
 
                 try: 
                     # Try to get an alert
                     alert = short_wait.until(EC.alert_is_present()); res = alert.text.strip(); self.app.after(0, self.app.log_message, self.log_display, f"   RESULT (Alert): {res}"); alert.accept(); alert_ok = True
-                    try: wait.until(EC.staleness_of(body)); time.sleep(0.5)
-                    except TimeoutException: time.sleep(1.5)
+                    try: wait.until(EC.staleness_of(body))
+                    except TimeoutException: pass
+                    wait_for_page_ready(driver)
                 except TimeoutException: 
                     self.app.after(0, self.app.log_message, self.log_display, "   -> No alert...")
                     try:
@@ -1486,8 +1418,9 @@ class DemandTab(BaseAutomationTab):
 
                     except TimeoutException: 
                         res = "Unknown (No message)"; self.app.after(0, self.app.log_message, self.log_display, f"   RESULT: {res}", "warning")
-                    time.sleep(1.0)
+                    wait_for_page_ready(driver)
                 except Exception as alert_e: self.app.after(0, self.app.log_message, self.log_display, f"   Alert Error: {alert_e}")
+                submit_done()
 
                 # 8. Handle 100-Day Error Retry Logic
                 retry_days_distribution = {} 
@@ -1520,8 +1453,9 @@ class DemandTab(BaseAutomationTab):
                             alert_ok = False 
                             try:
                                 alert_retry = short_wait.until(EC.alert_is_present()); res = alert_retry.text.strip(); self.app.after(0, self.app.log_message, self.log_display, f"   RESULT (Retry Alert): {res}"); alert_retry.accept(); alert_ok = True
-                                try: wait.until(EC.staleness_of(body_retry)); time.sleep(0.5)
-                                except TimeoutException: time.sleep(1.5)
+                                try: wait.until(EC.staleness_of(body_retry))
+                                except TimeoutException: pass
+                                wait_for_page_ready(driver)
                             except TimeoutException:
                                 self.app.after(0, self.app.log_message, self.log_display, "   -> No alert on retry.", "warning")
                                 xpaths_retry = ["//font[contains(text(), 'Record NOT Saved')]", "//font[@color='red']", "//span[contains(@id, '_lblmsg') and normalize-space(text())]"]
@@ -1529,7 +1463,7 @@ class DemandTab(BaseAutomationTab):
                                     try: msg_r = short_wait.until(EC.visibility_of_element_located((By.XPATH, xp_r))); res = msg_r.text.strip(); level = "error"; self.app.after(0, self.app.log_message, self.log_display, f"   RESULT (Retry Fail): {res}", level); break
                                     except TimeoutException: continue
                                 else: res = "Retry Failed (Unknown)"; self.app.after(0, self.app.log_message, self.log_display, f"   RESULT: {res}", "error")
-                                time.sleep(1.0)
+                                wait_for_page_ready(driver)
                             except Exception as retry_alert_e: self.app.after(0, self.app.log_message, self.log_display, f"   Retry Alert Error: {retry_alert_e}")
                         else: res = "Retry Failed (Re-fill error)"; self.app.after(0, self.app.log_message, self.log_display, f"   ERROR: {res}", "error"); alert_ok = False
                     else: # 100d error, but 0 or fewer days left
@@ -1586,13 +1520,13 @@ class DemandTab(BaseAutomationTab):
 
         except StaleElementReferenceException:
             # Handle page refresh by retrying the same function
-            self.app.after(0, self.app.log_message, self.log_display, f"   INFO: Stale element {jc}, retrying...", "warning"); time.sleep(1.0)
+            self.app.after(0, self.app.log_message, self.log_display, f"   INFO: Stale element {jc}, retrying...", "warning"); wait_for_page_ready(driver)
             self._process_single_job_card(driver, wait, short_wait, jc, apps_in_jc, user_days, demand_from, work_start, days_worked_ids, jc_ids, grid_ids, btn_ids, err_msg_ids, base_url, state, demand_to_override)
         except Exception as e:
             # Catch any other critical error, log it, and try to recover
             self.app.after(0, self.app.log_message, self.log_display, f"CRITICAL ERROR processing {jc}: {type(e).__name__} - {e}", "error")
             [self.app.after(0, self._update_results_tree, (jc, a.get('Name of Applicant'), f"FAIL: {type(e).__name__}")) for a in apps_in_jc]
-            try: driver.get(base_url); self.app.after(0, self.app.log_message, self.log_display, f"   Recovering: Navigating start...", "warning"); time.sleep(1)
+            try: driver.get(base_url); self.app.after(0, self.app.log_message, self.log_display, f"   Recovering: Navigating start...", "warning"); wait_for_page_ready(driver)
             except Exception as nav_e: self.app.after(0, self.app.log_message, self.log_display, f"   Recovery failed: {nav_e}", "error")
 
 
@@ -1625,8 +1559,7 @@ class DemandTab(BaseAutomationTab):
         re_selected_count = 0
         
         # Clear current selection in the main data
-        for app_data in self.all_applicants_data:
-            app_data['_selected'] = False
+        self.applicants.clear_selection()
 
         # Iterate through failed items in the tree
         for item_id in failed_items:
@@ -1638,27 +1571,18 @@ class DemandTab(BaseAutomationTab):
                 name = values[2]
 
                 # Find this applicant in the master data list and mark for re-selection
-                found = False
-                for app_data in self.all_applicants_data:
-                    if app_data['Job card number'] == jc_no and app_data['Name of Applicant'] == name:
-                        app_data['_selected'] = True
-                        re_selected_count += 1
-                        found = True
-                        break
-                
-                if not found:
+                position = self.applicants.find(jc_no, name)
+                if position != -1:
+                    self.applicants.set_selected(position)
+                    re_selected_count += 1
+                else:
                     self.app.log_message(self.log_display, f"Could not find {name} ({jc_no}) in original CSV.", "warning")
                         
             except Exception as e:
                 self.app.log_message(self.log_display, f"Error processing item {item_id}: {e}", "error")
 
-        # Update all visible checkboxes to reflect the new selection
-        for widget in self.displayed_checkboxes:
-            if isinstance(widget, ctk.CTkCheckBox):
-                if widget.applicant_data.get('_selected', False):
-                    widget.select()
-                else:
-                    widget.deselect()
+        # Update the visible checkboxes to reflect the new selection
+        self.applicant_list.refresh()
 
         self._update_selection_summary()
         self.app.log_message(self.log_display, f"Re-selected {re_selected_count} failed applicants.")
@@ -1675,24 +1599,24 @@ class DemandTab(BaseAutomationTab):
 
     def save_inputs(self, inputs):
         """
-        Saves the current UI inputs (state, panchayat, etc.) to a JSON file.
+        Saves the current UI inputs (state, panchayat, etc.) to the app's state store.
         """
         try:
-            with open(self.config_file, 'w') as f: json.dump(inputs, f, indent=4)
+            self.app.state_store.set("demand_inputs", inputs)
         except Exception as e: print(f"Err saving demand inputs: {e}")
 
     def load_inputs(self):
         """
-        Loads the last saved inputs from the JSON file on tab startup.
+        Loads the last saved inputs from the state store on tab startup.
         """
         today = datetime.now().strftime('%d/%m/%Y'); date_to_set = today
         days_to_set = self.app.history_manager.get_suggestions("demand_days")[0] if self.app.history_manager.get_suggestions("demand_days") else "14"
         work_key_to_set = ""
         demand_to_date_set = ""
         
-        if os.path.exists(self.config_file):
+        data = self.app.state_store.get("demand_inputs")
+        if data is not None:
             try:
-                with open(self.config_file, 'r') as f: data = json.load(f)
                 self.state_combobox.set(data.get('state', '')); self.panchayat_entry.insert(0, data.get('panchayat', ''))
                 days_to_set = data.get('days', days_to_set)
                 work_key_to_set = data.get('work_key_for_allocation', '')
@@ -1721,12 +1645,9 @@ class DemandTab(BaseAutomationTab):
         """
         Clears the current selection of all applicants.
         """
-        if not any(a.get('_selected', False) for a in self.all_applicants_data): self.app.log_message(self.log_display, "No selection.", "info"); return
-        # Update master data
-        for a in self.all_applicants_data: a['_selected'] = False
-        # Update visible checkboxes
-        for w in self.displayed_checkboxes:
-             if isinstance(w, ctk.CTkCheckBox) and w.get() == "on": w.deselect()
+        if not self.applicants.selection_summary()[0]: self.app.log_message(self.log_display, "No selection.", "info"); return
+        # Update master data (visible rows are redrawn below)
+        self.applicants.clear_selection()
         self._update_selection_summary(); self.app.log_message(self.log_display, "Selection cleared.")
         
         # Force re-evaluation of button visibility using the main update function
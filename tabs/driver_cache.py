@@ -0,0 +1,93 @@
+# tabs/driver_cache.py
+"""
+Cached chromedriver / geckodriver resolution.
+webdriver-manager ka install() har call par version metadata ke liye network hit kar sakta hai.
+Yahan resolved driver path aur us waqt ka installed browser version app data dir mein save hota hai;
+jab tak browser version same hai (aur file maujood hai) cached path hi use hota hai, bina network ke.
+"""
+import os, json, time, logging, threading
+from utils import get_data_path
+
+CACHE_FILE = "driver_cache.json"
+
+_lock = threading.Lock()
+
+
+def _load():
+    try:
+        with open(get_data_path(CACHE_FILE), "r") as f: return json.load(f)
+    except (IOError, ValueError): return {}
+
+
+def _save(data):
+    path = get_data_path(CACHE_FILE); tmp = path + ".tmp"
+    try:
+        with open(tmp, "w") as f: json.dump(data, f, indent=4)
+        os.replace(tmp, path)
+    except OSError as e: logging.warning(f"Driver cache not saved: {e}")
+
+
+def browser_version(browser):
+    """Installed browser version, read locally (registry / --version). None if it can't be detected."""
+    try:
+        try:
+            from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+            detect = OperationSystemManager().get_browser_version_from_os
+        except ImportError: # webdriver-manager 3.x
+            from webdriver_manager.core.utils import get_browser_version_from_os as detect, ChromeType
+        return detect(ChromeType.GOOGLE if browser == "chrome" else "firefox") or None
+    except Exception as e:
+        logging.debug(f"Could not read {browser} version: {e}")
+        return None
+
+
+def _install(browser):
+    if browser == "chrome":
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    from webdriver_manager.firefox import GeckoDriverManager
+    return GeckoDriverManager().install()
+
+
+def driver_path(browser, refresh=False):
+    """
+    Path of the driver binary for "chrome" or "firefox".
+    Network (webdriver-manager) is used only when there is no cached path, the file is gone,
+    or the installed browser version changed. Offline, a stale cached path is better than nothing;
+    returns None when nothing is known (Selenium then falls back to its own driver lookup).
+    """
+    version = browser_version(browser)
+    with _lock:
+        cache = _load(); entry = cache.get(browser) or {}
+        cached_path = entry.get("path") if entry.get("path") and os.path.isfile(entry["path"]) else None
+        if cached_path and not refresh and (version is None or entry.get("browser_version") == version):
+            return cached_path
+        try:
+            started = time.perf_counter()
+            path = _install(browser)
+            logging.info(f"Driver cache: resolved {browser} driver for browser {version} in {(time.perf_counter() - started) * 1000:.0f} ms")
+        except Exception as e:
+            logging.warning(f"Driver cache: could not resolve {browser} driver ({e}); using {cached_path or 'Selenium default'}")
+            return cached_path
+        cache[browser] = {"path": path, "browser_version": version, "resolved_at": time.time()}
+        _save(cache)
+        return path
+
+
+def chrome_service():
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    path = driver_path("chrome")
+    return ChromeService(path) if path else ChromeService()
+
+
+def firefox_service():
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    path = driver_path("firefox")
+    return FirefoxService(path) if path else FirefoxService()
+
+
+def warm_up():
+    """Startup hook (background thread): makes sure both cache entries match the installed browsers."""
+    for browser in ("chrome", "firefox"):
+        try: driver_path(browser)
+        except Exception as e: logging.debug(f"Driver cache warm-up for {browser} failed: {e}")
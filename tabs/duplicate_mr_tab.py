@@ -19,11 +19,14 @@ from selenium.common.exceptions import TimeoutException, StaleElementReferenceEx
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback
 
 class DuplicateMrTab(BaseAutomationTab):
     """
     A tab for automating the process of re-printing Muster Rolls (MRs) for multiple work codes.
     """
+    lean_mode_allow = ("images", "fonts") # Printed/saved MR PDFs need logos and fonts
+
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="duplicate_mr")
         
@@ -76,7 +79,7 @@ class DuplicateMrTab(BaseAutomationTab):
         # --- NEW INFO LABEL ---
         ctk.CTkLabel(input_frame, text="ℹ️ Generated PDFs are saved in 'Downloads/NregaBot/Duplicate_MR_Output'.", text_color="gray50").grid(row=4, column=1, sticky='w', padx=15, pady=(0,5))
         
-        action_frame = self._create_action_buttons(input_frame)
+        action_frame = self._create_action_buttons(input_frame, parallel_workers=True)
         action_frame.grid(row=5, column=0, columnspan=2, sticky="ew", padx=15, pady=(10, 15)) # <-- Row changed to 5
 
         notebook = ctk.CTkTabview(main_container)
@@ -126,6 +129,7 @@ class DuplicateMrTab(BaseAutomationTab):
         self.results_tree.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
         scrollbar = ctk.CTkScrollbar(results_tab, command=self.results_tree.yview)
         self.results_tree.configure(yscroll=scrollbar.set)
+        self.attach_results_model(self.results_tree, scrollbar)
         scrollbar.grid(row=1, column=1, sticky='ns')
         
     def _update_scale_label(self, value):
@@ -139,8 +143,9 @@ class DuplicateMrTab(BaseAutomationTab):
 
 
     def _log_result(self, work_code, msr_no, status):
+        self._record_result(status, work_code, msr_no)
         timestamp = time.strftime("%H:%M:%S")
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=(timestamp, work_code, msr_no, status)))
+        self._add_result_row((timestamp, work_code, msr_no, status))
 
     def start_automation(self):
         panchayat = self.panchayat_entry.get().strip()
@@ -213,7 +218,7 @@ class DuplicateMrTab(BaseAutomationTab):
     def run_automation_logic(self, panchayat, work_codes, action, orientation, scale):
         self.app.after(0, self.set_ui_state, True)
         self.app.clear_log(self.log_display)
-        for item in self.results_tree.get_children(): self.results_tree.delete(item)
+        self._clear_results()
 
         self.app.log_message(self.log_display, "--- Starting Duplicate MR Printing ---")
         self.app.after(0, self.app.set_status, "Running Duplicate MR Print...")
@@ -238,11 +243,11 @@ class DuplicateMrTab(BaseAutomationTab):
             return
 
         try:
-            for work_code in work_codes:
-                if self.app.stop_events[self.automation_key].is_set():
-                    break
+            def process_item(worker_driver, _context, work_code):
                 self.app.log_message(self.log_display, f"\n--- Processing Work Code: {work_code} ---")
-                self._process_single_work_code(driver, work_code, action, panchayat, orientation, scale)
+                self._process_single_work_code(worker_driver, work_code, action, panchayat, orientation, scale)
+
+            self.run_work_items(driver, work_codes, process_item)
         except Exception as e:
             self.app.log_message(self.log_display, f"A critical error occurred: {str(e).splitlines()[0]}", "error")
         finally:
@@ -282,8 +287,8 @@ class DuplicateMrTab(BaseAutomationTab):
                 
                 wc_input.clear()
                 wc_input.send_keys(work_code)
-                driver.find_element(By.ID, "imgButtonSearch").click()
-                time.sleep(2)
+                search_button = driver.find_element(By.ID, "imgButtonSearch")
+                search_button.click(); wait_for_postback(driver, search_button)
 
                 wait.until(lambda d: len(Select(d.find_element(By.ID, "ddlworkcode")).options) > 1)
                 Select(driver.find_element(By.ID, "ddlworkcode")).select_by_index(1)
@@ -328,6 +333,14 @@ class DuplicateMrTab(BaseAutomationTab):
             self._log_result(work_code, "N/A", "Unexpected Error")
 
     def _get_msr_list(self, driver, wait, work_code, panchayat, url):
+        known = self.app.work_index.msrs("duplicate_mr", panchayat, work_code)
+        if known is not None: # Saved list se, ek page load kam
+            if not known:
+                self.app.log_message(self.log_display, "No MSR numbers found (saved list).", "warning")
+                self._log_result(work_code, "N/A", "No MSRs found")
+            else: self.app.log_message(self.log_display, f"Found {len(known)} MSRs (saved list): {', '.join(known)}")
+            return known
+
         self.app.log_message(self.log_display, f"Getting MSR list for Work Code: {work_code}")
         driver.get(url)
         
@@ -336,8 +349,8 @@ class DuplicateMrTab(BaseAutomationTab):
         
         wc_input = wait.until(EC.element_to_be_clickable((By.ID, "txtWork")))
         wc_input.clear(); wc_input.send_keys(work_code)
-        driver.find_element(By.ID, "imgButtonSearch").click()
-        time.sleep(2)
+        search_button = driver.find_element(By.ID, "imgButtonSearch")
+        search_button.click(); wait_for_postback(driver, search_button)
         
         wait.until(lambda d: len(Select(d.find_element(By.ID, "ddlworkcode")).options) > 1)
         Select(driver.find_element(By.ID, "ddlworkcode")).select_by_index(1)
@@ -345,6 +358,7 @@ class DuplicateMrTab(BaseAutomationTab):
         wait.until(lambda d: len(Select(d.find_element(By.ID, "ddlmsrno")).options) > 1)
         msr_dd_element = driver.find_element(By.ID, "ddlmsrno")
         msr_options = [opt.get_attribute('value') for opt in Select(msr_dd_element).options if '--' not in opt.text]
+        self.app.work_index.record_msrs("duplicate_mr", panchayat, work_code, msr_options)
         
         if not msr_options:
             self.app.log_message(self.log_display, "No MSR numbers found.", "warning")
@@ -422,8 +436,7 @@ class DuplicateMrTab(BaseAutomationTab):
             self.work_codes_textbox.delete("1.0", "end")
             self.app.clear_log(self.log_display)
             self.update_status("Ready", 0)
-            for item in self.results_tree.get_children():
-                self.results_tree.delete(item)
+            self._clear_results()
             self.orientation_var.set("Landscape")
             self.scale_slider.set(75)
             self.scale_label.configure(text="75%")
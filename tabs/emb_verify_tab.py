@@ -4,7 +4,6 @@ import sys
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -13,6 +12,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback, wait_for_options
 
 class EmbVerifyTab(BaseAutomationTab):
     """
@@ -43,7 +43,7 @@ class EmbVerifyTab(BaseAutomationTab):
         self.verify_amount_entry.grid(row=1, column=1, sticky='ew', padx=15, pady=(0, 15))
 
         # Action buttons
-        action_frame = self._create_action_buttons(parent_frame=self)
+        action_frame = self._create_action_buttons(parent_frame=self, parallel_workers=True)
         action_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(0, 10))
         
         # --- Bottom Frame for Data Tabs ---
@@ -100,6 +100,7 @@ class EmbVerifyTab(BaseAutomationTab):
         
         scrollbar = ctk.CTkScrollbar(results_tab, command=self.results_tree.yview)
         self.results_tree.configure(yscroll=scrollbar.set); scrollbar.grid(row=1, column=1, sticky='ns')
+        self.attach_results_model(self.results_tree, scrollbar)
         self.style_treeview(self.results_tree)
         self._setup_treeview_sorting(self.results_tree)
 
@@ -126,8 +127,7 @@ class EmbVerifyTab(BaseAutomationTab):
             self.verify_amount_entry.delete(0, tkinter.END)
             self.verify_amount_entry.insert(0, "282")
             self.work_codes_text.delete("1.0", tkinter.END)
-            for item in self.results_tree.get_children():
-                self.results_tree.delete(item)
+            self._clear_results()
             self.app.clear_log(self.log_display)
             self.update_status("Ready", 0.0)
             self.app.log_message(self.log_display, "Form has been reset.")
@@ -148,19 +148,21 @@ class EmbVerifyTab(BaseAutomationTab):
         for wc in work_codes:
             self.app.update_history("work_code", wc)
 
-        self.app.start_automation_thread(self.automation_key, self.run_automation_logic, args=(panchayat, verify_amount, work_codes))
+        self.app.start_automation_thread(self.automation_key, self.run_automation_logic, args=(panchayat, verify_amount, work_codes),
+                                         job_params={"panchayat": panchayat, "work_codes": work_codes})
 
     def _log_result(self, work_code, status, details):
         """Logs a result to the treeview."""
+        self._record_result(status, work_code, details=details)
         timestamp = datetime.now().strftime("%H:%M:%S")
         tags = ('failed',) if 'success' not in status.lower() and 'verified' not in status.lower() else ()
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=(work_code, status, details, timestamp), tags=tags))
+        self._add_result_row((work_code, status, details, timestamp), tags)
 
     def run_automation_logic(self, panchayat, verify_amount, work_codes_from_ui):
         """The main logic for the eMB verification automation."""
         self.app.after(0, self.set_ui_state, True)
         self.app.clear_log(self.log_display)
-        self.app.after(0, lambda: [self.results_tree.delete(item) for item in self.results_tree.get_children()])
+        self._clear_results()
         self.app.log_message(self.log_display, f"Starting eMB Verification for Panchayat: {panchayat}")
         self.app.after(0, self.app.set_status, "Running eMB Verification...")
 
@@ -168,17 +170,8 @@ class EmbVerifyTab(BaseAutomationTab):
             driver = self.app.get_driver()
             if not driver: return
 
-            driver.get(config.EMB_VERIFY_CONFIG["url"])
-            wait = WebDriverWait(driver, 20) 
-
-            self.app.log_message(self.log_display, f"Selecting Panchayat: {panchayat}")
-            panchayat_select = Select(wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_panch"))))
-            panchayat_select.select_by_visible_text(panchayat)
-            
-            self.app.log_message(self.log_display, "Waiting for page to reload...")
-            wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_work")))
-            time.sleep(1) 
-            self.app.log_message(self.log_display, "Page reloaded successfully.")
+            wait = WebDriverWait(driver, 20)
+            self._open_panchayat(driver, wait, panchayat, log_progress=True)
             
             work_codes_to_process = []
             use_search = bool(work_codes_from_ui)
@@ -193,23 +186,20 @@ class EmbVerifyTab(BaseAutomationTab):
                 if not work_codes_to_process:
                     self.app.log_message(self.log_display, "No work codes found for this Panchayat.", "warning")
                     self._log_result("N/A", "Skipped", "No work codes found.")
-            
-            total = len(work_codes_to_process)
-            for i, current_wc in enumerate(work_codes_to_process):
-                if self.app.stop_events[self.automation_key].is_set():
-                    self.app.log_message(self.log_display, "Automation stopped by user.", "warning")
-                    break
-                
-                self.app.after(0, self.update_status, f"Processing {i+1}/{total}: {current_wc}", (i+1)/total)
-                self._process_single_work_code(driver, wait, current_wc, use_search, verify_amount)
 
-                if use_search and i < total - 1:
+            def setup_worker(worker_driver):
+                worker_wait = wait if worker_driver is driver else WebDriverWait(worker_driver, 20)
+                if worker_driver is not driver: self._open_panchayat(worker_driver, worker_wait, panchayat)
+                return {"wait": worker_wait, "page_fresh": True}
+
+            def process_item(worker_driver, context, current_wc):
+                if use_search and not context["page_fresh"]:
                     self.app.log_message(self.log_display, "Navigating back for next work code...")
-                    driver.get(config.EMB_VERIFY_CONFIG["url"])
-                    panchayat_select = Select(wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_panch"))))
-                    panchayat_select.select_by_visible_text(panchayat)
-                    wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_work")))
-                    time.sleep(1)
+                    self._open_panchayat(worker_driver, context["wait"], panchayat)
+                context["page_fresh"] = False
+                self._process_single_work_code(worker_driver, context["wait"], current_wc, use_search, verify_amount)
+
+            self.run_work_items(driver, work_codes_to_process, process_item, setup_worker=setup_worker)
 
             final_msg = "Automation finished." if not self.app.stop_events[self.automation_key].is_set() else "Stopped."
             self.app.after(0, self.update_status, final_msg, 1.0)
@@ -223,11 +213,23 @@ class EmbVerifyTab(BaseAutomationTab):
             self.app.after(0, self.set_ui_state, False)
             self.app.after(0, self.app.set_status, "Automation Finished")
 
+    def _open_panchayat(self, driver, wait, panchayat, log_progress=False):
+        """Opens the eMB verify page and selects the Panchayat, waiting for the work list to reload."""
+        driver.get(config.EMB_VERIFY_CONFIG["url"])
+        if log_progress: self.app.log_message(self.log_display, f"Selecting Panchayat: {panchayat}")
+        panchayat_element = wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_panch")))
+        Select(panchayat_element).select_by_visible_text(panchayat)
+        if log_progress: self.app.log_message(self.log_display, "Waiting for page to reload...")
+        wait_for_postback(driver, panchayat_element)
+        wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_work")))
+        if log_progress: self.app.log_message(self.log_display, "Page reloaded successfully.")
+
     def _process_single_work_code(self, driver, wait, work_code, use_search, verify_amount):
         """Handles the logic for a single work code verification."""
         try:
             self.app.log_message(self.log_display, f"Selecting work code: {work_code}")
-            work_select = Select(wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_work"))))
+            work_element = wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_ddl_work")))
+            work_select = Select(work_element)
             
             found = False
             for option in work_select.options:
@@ -239,16 +241,17 @@ class EmbVerifyTab(BaseAutomationTab):
             if not found:
                 raise NoSuchElementException(f"Work code containing '{work_code}' not found in dropdown.")
             
-            self.app.log_message(self.log_display, "Work selected. Pausing for page to update...")
-            time.sleep(2) 
+            self.app.log_message(self.log_display, "Work selected. Waiting for page to update...")
+            wait_for_postback(driver, work_element)
 
             self.app.log_message(self.log_display, "Selecting 'Musterroll Period Wise'.")
             period_radio_btn = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_rbl_mustrolltype_0")))
             driver.execute_script("arguments[0].click();", period_radio_btn)
+            wait_for_postback(driver, period_radio_btn)
             
             self.app.log_message(self.log_display, "Waiting for measurement periods to load...")
+            wait_for_options(driver, (By.ID, "ctl00_ContentPlaceHolder1_ddl_mperiod"))
             period_dropdown_element = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_ddl_mperiod")))
-            time.sleep(2) 
 
             period_select = Select(period_dropdown_element)
             if len(period_select.options) <= 1:
@@ -265,7 +268,6 @@ class EmbVerifyTab(BaseAutomationTab):
             self.app.log_message(self.log_display, f"Found Unit Cost: {unit_cost}, Wage Per Day: {wage_per_day} for {work_code}")
 
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(0.5)
 
             if unit_cost == verify_amount and wage_per_day == verify_amount:
                 driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_btn_verify").click()
@@ -312,14 +314,14 @@ class EmbVerifyTab(BaseAutomationTab):
             self._handle_pdf_export(data, headers, col_widths, file_path)
 
     def _get_filtered_data_and_filepath(self, export_format):
-        if not self.results_tree.get_children(): messagebox.showinfo("No Data", "No results to export."); return None, None
+        all_items = self.get_result_rows(self.results_tree)
+        if not all_items: messagebox.showinfo("No Data", "No results to export."); return None, None
         panchayat_name = self.panchayat_entry.get().strip()
         if not panchayat_name: messagebox.showwarning("Input Needed", "Panchayat Name is required for report title."); return None, None
         
         filter_option = self.export_filter_menu.get()
         data_to_export = []
-        for item_id in self.results_tree.get_children():
-            row_values = self.results_tree.item(item_id)['values']
+        for row_values in all_items:
             status = row_values[1].upper() # Status is at index 1
             if filter_option == "Export All": data_to_export.append(row_values)
             elif filter_option == "Success Only" and ("SUCCESS" in status or "VERIFIED" in status): data_to_export.append(row_values)
@@ -80,6 +80,7 @@ class FtoGenerationTab(BaseAutomationTab):
         self.app.start_automation_thread(self.automation_key, self.run_automation_logic)
         
     def _log_result(self, page_name, fto_number):
+        self._record_result("Success" if fto_number != "Not Found" else "Failed", details=f"{page_name}: FTO {fto_number}")
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=(page_name, fto_number, datetime.now().strftime("%H:%M:%S"))))
 
     def _process_verification_page(self, driver, wait, verification_url, page_identifier):
@@ -1,82 +1,166 @@
 # tabs/history_manager.py
+"""
+Autocomplete history + automation usage counts.
+Data memory mein sorted lists ke roop mein rehta hai (bisect se insert, poora sort kabhi nahi) aur disk par
+SQLite (history.db) mein. Writes turant disk par nahi jaate: changes jama hote hain aur `flush_delay` ke baad
+ek hi transaction mein likhe jaate hain, isliye loop mein save_entry bhi sasta hai aur crash par file kharab nahi hoti.
+Purani autocomplete_history.json pehli baar khulne par import ho jaati hai.
+"""
 import json
 import os
+import bisect
+import sqlite3
 import threading
+from .suggestion_index import SuggestionIndex
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    field_key TEXT NOT NULL,
+    value     TEXT NOT NULL,
+    PRIMARY KEY (field_key, value)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS usage (
+    automation_key TEXT PRIMARY KEY,
+    count          INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name  TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class HistoryList(list):
+    """The values of one history key, plus a search index built on first use and kept in sync by HistoryManager."""
+    _search_index = None
+
+    def search_index(self):
+        if self._search_index is None: self._search_index = SuggestionIndex(self)
+        return self._search_index
+
+
+def _contains(values, value):
+    i = bisect.bisect_left(values, value)
+    return i < len(values) and values[i] == value
+
 
 class HistoryManager:
-    def __init__(self, data_path_func):
-        self.history_file = data_path_func('autocomplete_history.json')
-        self.history_data = self._load_history()
+    def __init__(self, data_path_func, flush_delay=2.0):
+        self.db_path = data_path_func('history.db')
+        self.history_file = data_path_func('autocomplete_history.json') # Sirf migration ke liye
+        self.flush_delay = flush_delay
         self.lock = threading.Lock()
+        self._conn = None
+        self._pending = [] # (sql, params) waiting for the next flush
+        self._timer = None
+        self.history_data = self._load_history()
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
 
     def _load_history(self):
-        """Loads history from the JSON file."""
-        if os.path.exists(self.history_file):
-            try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {} # Return empty dict on error
-        return {}
+        """Loads history from the database (importing the old JSON file the first time)."""
+        data = {}
+        try:
+            with self.lock:
+                self._migrate_json_locked()
+                for field_key, value in self.conn.execute("SELECT field_key, value FROM history ORDER BY field_key, value"):
+                    data.setdefault(field_key, HistoryList()).append(value) # BINARY order == Python str order
+                data["_usage_stats"] = dict(self.conn.execute("SELECT automation_key, count FROM usage"))
+        except sqlite3.Error as e:
+            print(f"Error loading history: {e}")
+        return data
+
+    def _migrate_json_locked(self):
+        if self.conn.execute("SELECT 1 FROM meta WHERE name='json_imported'").fetchone(): return
+        try:
+            with open(self.history_file, 'r') as f: old = json.load(f)
+        except (OSError, json.JSONDecodeError): old = {}
+        with self.conn: # Ek transaction: ya poora import ya kuch nahi
+            for key, values in old.items():
+                if key == "_usage_stats" and isinstance(values, dict):
+                    self.conn.executemany("INSERT OR REPLACE INTO usage VALUES (?, ?)", [(k, int(v)) for k, v in values.items()])
+                elif isinstance(values, list):
+                    self.conn.executemany("INSERT OR IGNORE INTO history VALUES (?, ?)", [(key, str(v)) for v in values if v])
+            self.conn.execute("INSERT INTO meta VALUES ('json_imported', ?)", (str(os.path.exists(self.history_file)),))
 
     def get_suggestions(self, field_key: str) -> list:
         """Gets a list of suggestions for a given field key."""
         return self.history_data.get(field_key, [])
 
     def save_entry(self, field_key: str, value: str):
-        """Saves a new, unique entry for a field key to the history file."""
+        """Saves a new, unique entry for a field key (written to disk by the next background flush)."""
         if not value: return # Don't save empty values
-        
+
         with self.lock:
             if field_key not in self.history_data:
-                self.history_data[field_key] = []
-            
-            if value not in self.history_data[field_key]:
-                self.history_data[field_key].append(value)
-                self.history_data[field_key].sort()
-                
-                self._save_data_locked()
-
-    # --- NEW METHOD TO REMOVE AN ENTRY ---
+                self.history_data[field_key] = HistoryList()
+
+            values = self.history_data[field_key]
+            if not _contains(values, value):
+                bisect.insort(values, value)
+                if values._search_index is not None: values._search_index.add(value)
+                self._queue_locked("INSERT OR IGNORE INTO history VALUES (?, ?)", (field_key, value))
+
     def remove_entry(self, field_key: str, value: str):
         """Removes a specific value from a history key."""
         if not value or not field_key:
             return
-            
-        with self.lock:
-            if field_key in self.history_data and value in self.history_data[field_key]:
-                self.history_data[field_key].remove(value)
-                self._save_data_locked()
 
-    def _save_data_locked(self):
-        """Internal method to save data while lock is acquired."""
-        try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history_data, f, indent=4)
-        except IOError as e:
-            print(f"Error saving history: {e}")
-    # --- END OF NEW METHOD ---
+        with self.lock:
+            values = self.history_data.get(field_key)
+            if values is not None and _contains(values, value):
+                del values[bisect.bisect_left(values, value)]
+                index = getattr(values, "_search_index", None)
+                if index is not None: index.remove(value)
+                self._queue_locked("DELETE FROM history WHERE field_key=? AND value=?", (field_key, value))
 
-    # --- NEW: Methods for tracking usage ---
+    # --- Methods for tracking usage ---
     def increment_usage(self, automation_key: str):
         """Increments the usage count for a given automation key."""
         with self.lock:
-            if "_usage_stats" not in self.history_data:
-                self.history_data["_usage_stats"] = {}
-            
-            stats = self.history_data["_usage_stats"]
+            stats = self.history_data.setdefault("_usage_stats", {})
             stats[automation_key] = stats.get(automation_key, 0) + 1
-            
-            self._save_data_locked()
+            self._queue_locked("INSERT OR REPLACE INTO usage VALUES (?, ?)", (automation_key, stats[automation_key]))
 
     def get_most_used_keys(self, count: int = 5) -> list:
         """Gets a sorted list of the most used automation keys."""
         stats = self.history_data.get("_usage_stats", {})
         if not stats:
             return []
-        
+
         # Sort items by count (value) in descending order
         sorted_stats = sorted(stats.items(), key=lambda item: item[1], reverse=True)
-        
+
         # Return only the keys of the top items
-        return [item[0] for item in sorted_stats[:count]]
\ No newline at end of file
+        return [item[0] for item in sorted_stats[:count]]
+
+    # --- Write-behind ---
+    def _queue_locked(self, sql, params):
+        self._pending.append((sql, params))
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_delay, self.flush)
+            self._timer.daemon = True; self._timer.start()
+
+    def flush(self):
+        """Writes all queued changes in one transaction."""
+        with self.lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None: self._timer.cancel(); self._timer = None
+            if not pending: return
+            try:
+                with self.conn:
+                    for sql, params in pending: self.conn.execute(sql, params)
+            except sqlite3.Error as e:
+                print(f"Error saving history: {e}")
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            if self._conn is not None: self._conn.close(); self._conn = None
@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import os, csv, time, pyperclip, json
+import os, csv, pyperclip
 from datetime import datetime
 from collections import defaultdict
 from selenium.webdriver.common.by import By
@@ -12,6 +12,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
 import config
 from .base_tab import BaseAutomationTab
+from .page_wait import wait_for_postback, wait_for_page_ready
 
 class IfEditTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -21,7 +22,6 @@ class IfEditTab(BaseAutomationTab):
         self.column_map = {}
         self.ui_fields = {}
         self.profiles = {}
-        self.profile_file = self.app.get_data_path("if_edit_profiles.json")
         self.saved_config = {}
         self.data_from_wc_gen = None # NEW: To hold data from WC Gen tab
 
@@ -218,12 +218,12 @@ class IfEditTab(BaseAutomationTab):
         self._toggle_page_settings()
 
     def _load_profiles_from_file(self):
-        if not os.path.exists(self.profile_file):
+        self.profiles = self.app.state_store.get("if_edit_profiles")
+        if self.profiles is None:
             self.profiles = {}
             self._populate_defaults()
             return
         try:
-            with open(self.profile_file, 'r') as f: self.profiles = json.load(f)
             profile_names = list(self.profiles.keys())
             self.profile_combobox.configure(values=profile_names)
             last_used = "Last Used Config"
@@ -242,15 +242,10 @@ class IfEditTab(BaseAutomationTab):
             if not profile_name: messagebox.showwarning("Input Error", "Please enter a name for the profile."); return
         if not profile_name: return
 
-        config_data = {}
-        for key, field in self.ui_fields.items():
-            if isinstance(field, ctk.CTkTextbox):
-                config_data[key] = field.get("1.0", tkinter.END).strip()
-            else: config_data[key] = field.get()
-        self.profiles[profile_name] = config_data
+        self.profiles[profile_name] = self._get_field_values()
 
         try:
-            with open(self.profile_file, 'w') as f: json.dump(self.profiles, f, indent=4)
+            self.app.state_store.set("if_edit_profiles", self.profiles)
             profile_names = list(self.profiles.keys())
             if "Last Used Config" not in profile_names: profile_names.insert(0, "Last Used Config")
             self.profile_combobox.configure(values=profile_names)
@@ -265,10 +260,22 @@ class IfEditTab(BaseAutomationTab):
         if not profile_name or not self.profiles: return
         self.saved_config = self.profiles.get(profile_name, {})
         if not self.saved_config: self._populate_defaults(); return
+        self._set_field_values(self.saved_config)
+        self.app.log_message(self.log_display, f"Profile '{profile_name}' loaded.")
 
-        for key, value in self.saved_config.items():
+    def _get_field_values(self):
+        values = {}
+        for key, field in self.ui_fields.items():
+            if isinstance(field, ctk.CTkTextbox):
+                values[key] = field.get("1.0", tkinter.END).strip()
+            else: values[key] = field.get()
+        return values
+
+    def _set_field_values(self, values):
+        for key, value in values.items():
             if key in self.ui_fields:
                 field = self.ui_fields[key]
+                if field.cget("state") == "disabled": field.configure(state="normal") # Disabled entry mein insert nahi hota; _toggle_page_settings state wapas lagata hai
                 if isinstance(field, ctk.CTkEntry):
                     field.delete(0, tkinter.END); field.insert(0, value)
                 elif isinstance(field, ctk.CTkComboBox):
@@ -280,7 +287,20 @@ class IfEditTab(BaseAutomationTab):
                     field.delete("1.0", tkinter.END)
                     if value: field.insert("1.0", value)
         self._toggle_page_settings()
-        self.app.log_message(self.log_display, f"Profile '{profile_name}' loaded.")
+
+    def snapshot_state(self):
+        """Data source (CSV or WC Gen handoff) and the settings fields, which live in `ui_fields` rather than attributes."""
+        return {"csv_path": self.csv_path, "csv_headers": self.csv_headers, "column_map": self.column_map,
+                "data_from_wc_gen": self.data_from_wc_gen, "fields": self._get_field_values()}
+
+    def restore_state(self, state):
+        if state.get("fields"): self._set_field_values(state["fields"])
+        if state.get("data_from_wc_gen"):
+            self.data_from_wc_gen = state["data_from_wc_gen"]; self.select_button.configure(state="disabled")
+            self.file_label.configure(text=f"{len(self.data_from_wc_gen)} work codes loaded from WC Gen tab.")
+        elif state.get("csv_path"):
+            self.csv_path, self.csv_headers, self.column_map = state["csv_path"], state.get("csv_headers", []), state.get("column_map", {})
+            self.file_label.configure(text=os.path.basename(self.csv_path))
 
     def _delete_profile(self):
         profile_name = self.profile_combobox.get()
@@ -289,7 +309,7 @@ class IfEditTab(BaseAutomationTab):
         if not messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the profile '{profile_name}'?"): return
         del self.profiles[profile_name]
         try:
-            with open(self.profile_file, 'w') as f: json.dump(self.profiles, f, indent=4)
+            self.app.state_store.set("if_edit_profiles", self.profiles)
             profile_names = list(self.profiles.keys())
             self.profile_combobox.configure(values=profile_names)
             if profile_names:
@@ -411,14 +431,14 @@ class IfEditTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Automation Finished")
 
     def _log_result(self, work_code, job_card, status, details):
+        self._record_result(status, work_code, details=f"{job_card}: {details}")
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=(work_code, job_card, status, details)))
         level = "success" if status.lower() == "success" else "error" if status.lower() == "failed" else "info"
         self.app.log_message(self.log_display, f"'{work_code}' - {status}: {details}", level)
         
     def _scroll_to(self, driver, element):
         """Helper to scroll an element into view."""
-        driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'smooth'});", element)
-        time.sleep(0.3) # Wait for scroll
+        driver.execute_script("arguments[0].scrollIntoView({block: 'center', behavior: 'instant'});", element) # Instant scroll, no wait needed
 
     def _process_single_work_code(self, driver, row, cfg):
         work_code, beneficiary_type, job_card = row[self.column_map['work_code']], row[self.column_map['beneficiary_type']], row[self.column_map['job_card']]
@@ -426,11 +446,11 @@ class IfEditTab(BaseAutomationTab):
             current_year, wait = datetime.now().year, WebDriverWait(driver, 20)
             mode = cfg.get('automation_mode')
             driver.get(config.IF_EDIT_CONFIG["url"])
-            time.sleep(1)
+            wait_for_page_ready(driver)
 
             work_code_input = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_txtwrksearchkey")))
             self._scroll_to(driver, work_code_input)
-            work_code_input.send_keys(work_code); work_code_input.send_keys(Keys.TAB); time.sleep(3)
+            work_code_input.send_keys(work_code); work_code_input.send_keys(Keys.TAB); wait_for_postback(driver, work_code_input)
 
             try:
                 work_name_ddl = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_ddlworkName")))
@@ -440,7 +460,7 @@ class IfEditTab(BaseAutomationTab):
                 self._log_result(work_code, job_card, "Skipped", "Job card not found, skipped")
                 return
 
-            time.sleep(2)
+            wait_for_postback(driver, work_name_ddl)
 
             # --- Page 1 ---
             if mode == "Full Process (All Pages)":
@@ -455,7 +475,7 @@ class IfEditTab(BaseAutomationTab):
                 self._scroll_to(driver, beneficiaries_input)
                 beneficiaries_input.send_keys(cfg.get("beneficiaries_count", "0"))
                 beneficiaries_input.send_keys(Keys.TAB)
-                time.sleep(2)
+                wait_for_postback(driver, beneficiaries_input)
 
                 try:
                     job_card_ddl = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_grdData_ctl02_ddljobcard")))
@@ -464,7 +484,7 @@ class IfEditTab(BaseAutomationTab):
                 except Exception:
                     self._log_result(work_code, job_card, "Skipped", "Job card not found, skipped")
                     return
-                time.sleep(2)
+                wait_for_postback(driver, job_card_ddl)
 
                 benef_type_ddl = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_ddlTypeBenif")
                 self._scroll_to(driver, benef_type_ddl)
@@ -477,11 +497,11 @@ class IfEditTab(BaseAutomationTab):
                 if cfg['run_convergence'] == 1:
                     radio_yes = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_UCconverg_rblConverg_0")
                     self._scroll_to(driver, radio_yes)
-                    radio_yes.click(); time.sleep(1)
+                    radio_yes.click(); wait_for_postback(driver, radio_yes)
 
                     scheme_type_ddl = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_UCconverg_ddlSchemeType1")
                     self._scroll_to(driver, scheme_type_ddl)
-                    Select(scheme_type_ddl).select_by_visible_text(cfg['convergence_scheme_type']); time.sleep(1)
+                    Select(scheme_type_ddl).select_by_visible_text(cfg['convergence_scheme_type']); wait_for_postback(driver, scheme_type_ddl)
                     
                     scheme_name_ddl = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_UCconverg_ddlScheme1")
                     self._scroll_to(driver, scheme_name_ddl)
@@ -530,7 +550,7 @@ class IfEditTab(BaseAutomationTab):
                 fin_scheme_input.clear()
                 fin_scheme_input.send_keys(cfg.get("fin_scheme_input", "0"))
                 fin_scheme_input.send_keys(Keys.TAB)
-                time.sleep(1)
+                wait_for_postback(driver, fin_scheme_input)
 
             try:
                 update_btn_p2 = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_btUpdate")
@@ -656,9 +676,9 @@ class IfEditTab(BaseAutomationTab):
                         else:
                             # --- EDIT FLOW (User's original logic) ---
                             edit_link = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(@href, \"ctl00$ContentPlaceHolder1$grdDisplayMat','Edit$0\")]")))
-                            self._scroll_to(driver, edit_link); edit_link.click(); time.sleep(1)
+                            self._scroll_to(driver, edit_link); edit_link.click(); wait_for_postback(driver, edit_link)
                             
-                            driver.find_element(By.TAG_NAME, "body").click(); time.sleep(0.5)
+                            driver.find_element(By.TAG_NAME, "body").click(); wait_for_postback(driver)
 
                             mat_dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_ddlMatname")))
                             self._scroll_to(driver, mat_dropdown)
@@ -2,29 +2,21 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, os, re, json
+import os, re
 from datetime import datetime
 import pandas as pd
 from openpyxl.styles import Font, Alignment, PatternFill
 from openpyxl.utils import get_column_letter
 
-# --- Imports jo add kiye gaye hain ---
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-# --- End Imports ---
-
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 from fpdf import FPDF
-from PIL import Image, ImageDraw, ImageFont # <-- Added PIL imports
-from utils import resource_path
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback
 import config
 
 class IssuedMrReportTab(BaseAutomationTab):
@@ -159,34 +151,16 @@ class IssuedMrReportTab(BaseAutomationTab):
         self.app.log_message(self.log_display, "Form has been reset.")
         self.update_status("Ready", 0.0)
         
-    # --- Naya Function: Naya browser instance banane ke liye (HEADLESS) ---
+    # --- Headless browser ab app ke shared report pool se aata hai ---
     def _get_new_driver(self):
         """
-        Ek naya, alag HEADLESS Chrome browser instance banata hai.
+        Shared pool se ek warm HEADLESS Chrome browser leta hai (zaroorat ho to naya start hota hai).
         """
-        self.app.log_message(self.log_display, "Naya Headless Chrome browser shuru kar raha hoon...", "info")
-        try:
-            chrome_options = ChromeOptions()
-            
-            # --- YEH LINE HEADLESS MODE ENABLE KARTI HAI ---
-            chrome_options.add_argument("--headless")
-            # --- END HEADLESS ---
-
-            # Headless browser ko ek size dena zaroori hai
-            chrome_options.add_argument("--window-size=1920,1080") 
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"]) # "Chrome is being controlled" banner hatane ke liye
-            
-            # webdriver-manager ka istemaal karke driver manage karein
-            service = ChromeService(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            self.app.log_message(self.log_display, "Headless browser safaltapoorvak shuru ho gaya.", "info")
-            return driver
-        except Exception as e:
-            self.app.log_message(self.log_display, f"Headless browser shuru karne mein BADI GADBAD: {e}", "error")
-            messagebox.showerror("Browser Error", f"Naya Headless Chrome browser shuru nahi ho saka.\n\nError: {e}\n\nKya Chrome installed hai?")
-            return None
+        self.app.log_message(self.log_display, "Headless Chrome browser le raha hoon (report pool)...", "info")
+        driver = self.app.get_report_driver()
+        if driver: self.app.log_message(self.log_display, "Headless browser taiyaar hai.", "info")
+        else: self.app.log_message(self.log_display, "Headless browser shuru karne mein BADI GADBAD.", "error")
+        return driver
 
     # --- Badlaav: `start_automation` ab naya driver banayega ---
     def start_automation(self):
@@ -244,8 +218,9 @@ class IssuedMrReportTab(BaseAutomationTab):
             elif operator == '*': result = num1 * num2
             self.app.log_message(self.log_display, f"Solved: {captcha_text.strip()} = {result}")
             driver.find_element(By.ID, captcha_textbox_id).send_keys(str(result))
-            driver.find_element(By.ID, verify_button_id).click()
-            time.sleep(1)
+            verify_button = driver.find_element(By.ID, verify_button_id)
+            verify_button.click()
+            wait_for_postback(driver, verify_button, timeout=10)
             if "Invalid Captcha Code" in driver.page_source:
                 raise ValueError("CAPTCHA verification failed.")
             return True
@@ -295,7 +270,7 @@ class IssuedMrReportTab(BaseAutomationTab):
             report_link_text = "MGNREGS daily status as per e-muster issued"
             report_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, report_link_text)))
             driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", report_link)
-            time.sleep(1); report_link.click()
+            report_link.click()
 
             self.app.after(0, self.app.set_status, f"Selecting District: {inputs['district']}...")
             self.app.after(0, self.update_status, "Selecting District...", 0.25)
@@ -334,7 +309,6 @@ class IssuedMrReportTab(BaseAutomationTab):
                     return
 
                 driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", target_link)
-                time.sleep(0.5)
                 target_link.click()
 
             except NoSuchElementException:
@@ -410,10 +384,7 @@ class IssuedMrReportTab(BaseAutomationTab):
                 self.app.log_message(self.log_display, "Session expired, attempting retry...", "warning")
                 self.app.after(0, self.app.set_status, "Session expired, retrying...")
                 self.app.after(0, self.update_status, "Retrying...", 0.0)
-                try:
-                    self.driver.quit() # Puraane ko band karein
-                except Exception:
-                    pass
+                self.app.report_pool.release(self.driver, broken=True) # Puraane ko recycle karein
                 self.driver = self._get_new_driver() # Naya banayein
                 if self.driver:
                     self.run_automation_logic(inputs, retries - 1)
@@ -437,13 +408,10 @@ class IssuedMrReportTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Unexpected Error")
             self.success_message = None
         finally:
-            # --- NAYA BADLAAV: Driver ko yahan quit karein ---
-            if self.driver: # self.driver ko check karein
-                try:
-                    self.driver.quit()
-                    self.app.after(0, self.app.log_message, self.log_display, "Automation ne browser ko band kar diya hai.", "info")
-                except Exception as e:
-                    self.app.after(0, self.app.log_message, self.log_display, f"Browser band karne mein error: {e}", "warning")
+            # --- Driver ko yahan pool mein wapas karein ---
+            if self.driver: # Browser band nahi hota, agle run ke liye pool mein wapas jaata hai
+                self.app.report_pool.release(self.driver)
+                self.app.after(0, self.app.log_message, self.log_display, "Headless browser report pool mein wapas diya.", "info")
             
             self.driver = None # Tab ka driver state reset karein
             # --- End Badlaav ---
@@ -567,9 +535,7 @@ class IssuedMrReportTab(BaseAutomationTab):
                 messagebox.showinfo("Success", f"PDF report saved successfully to:\n{file_path}")
 
         elif "PNG" in export_format: 
-            success = self._save_to_png(data, headers, pdf_title, date_str_header, file_path)
-            if success:
-                messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}")
+            self._save_to_png(data, headers, pdf_title, date_str_header, file_path)
 
 
     def _save_to_excel(self, data, headers, title, file_path):
@@ -610,147 +576,23 @@ class IssuedMrReportTab(BaseAutomationTab):
         return super().generate_report_pdf(data, headers, col_widths, title, date_str, file_path)
 
     def _save_to_png(self, data, headers, title, date_str, file_path):
-        # (Is function mein koi badlaav nahi hai)
-        base_col_widths = [0.05, 0.10, 0.20, 0.30, 0.15, 0.15, 0.05]
-        
-        try:
-            font_path_regular = resource_path("assets/fonts/NotoSansDevanagari-Regular.ttf")
-            font_path_bold = resource_path("assets/fonts/NotoSansDevanagari-Bold.ttf")
-            font_title = ImageFont.truetype(font_path_bold, 28)
-            font_date = ImageFont.truetype(font_path_regular, 18)
-            font_header = ImageFont.truetype(font_path_bold, 16)
-            font_body = ImageFont.truetype(font_path_regular, 14)
-        except IOError:
-            font_title = ImageFont.load_default(size=28)
-            font_date = ImageFont.load_default(size=18)
-            font_header = ImageFont.load_default(size=16)
-            font_body = ImageFont.load_default(size=14)
-        
-        img_width = 2400; margin_x = 80; margin_y = 60
-        header_bg_color = (220, 235, 255); row_even_bg_color = (255, 255, 255); row_odd_bg_color = (245, 245, 245); text_color = (0, 0, 0); border_color = (180, 180, 180)
-
-        available_width = img_width - (2 * margin_x)
-        col_widths_pixels = [w * available_width for w in base_col_widths]
+        """Saves the report as a PNG in a worker process (base_tab.render_report_image) without blocking the UI."""
+        self.generate_report_image(data, headers, title, date_str, file_path, col_ratios=[0.05, 0.10, 0.20, 0.30, 0.15, 0.15, 0.05],
+                                   on_done=lambda: messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}"))
 
-        for i, header in enumerate(headers):
-            header_width = font_header.getlength(header) + 40
-            if col_widths_pixels[i] < header_width:
-                diff = header_width - col_widths_pixels[i]
-                col_widths_pixels[i] = header_width
-                col_widths_pixels[3] -= diff # Steal from Work Name (index 3)
-
-        if col_widths_pixels[3] < 100: col_widths_pixels[3] = 100
-        
-        current_total_width = sum(col_widths_pixels)
-        scale_factor = available_width / current_total_width
-        col_widths_pixels = [w * scale_factor for w in col_widths_pixels]
-
-        initial_height = 1600
-        img = Image.new("RGB", (img_width, initial_height), (255, 255, 255))
-        draw = ImageDraw.Draw(img)
-        current_y = margin_y
-        
-        title_bbox = font_title.getbbox(title); title_height = title_bbox[3] - title_bbox[1]
-        title_text_width = font_title.getlength(title); title_x = (img_width - title_text_width) / 2
-        draw.text((title_x, current_y), title, font=font_title, fill=text_color)
-        current_y += title_height + 5
-
-        date_bbox = font_date.getbbox(date_str); date_height = date_bbox[3] - date_bbox[1]
-        date_text_width = font_date.getlength(date_str); date_x = img_width - margin_x - date_text_width
-        draw.text((date_x, current_y), date_str, font=font_date, fill=text_color)
-        current_y += date_height + 20
-
-        header_y_start = current_y; header_height = 0
-        for i, header in enumerate(headers):
-            wrapped_header = self._wrap_text(header, font_header, col_widths_pixels[i] - 10)
-            line_height = (font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]) * 1.2
-            header_height = max(header_height, len(wrapped_header) * line_height + 10)
-        
-        current_x = margin_x
-        for i, header in enumerate(headers):
-            draw.rectangle([current_x, header_y_start, current_x + col_widths_pixels[i], header_y_start + header_height], fill=header_bg_color, outline=border_color, width=1)
-            wrapped_header = self._wrap_text(header, font_header, col_widths_pixels[i] - 20)
-            line_height = (font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1]) * 1.2
-            total_text_height = len(wrapped_header) * line_height
-            text_y = header_y_start + (header_height - total_text_height) / 2
-            
-            for line in wrapped_header:
-                line_width = font_header.getlength(line)
-                draw.text((current_x + (col_widths_pixels[i] - line_width) / 2, text_y), line, font=font_header, fill=text_color)
-                text_y += line_height
-            current_x += col_widths_pixels[i]
-        current_y += header_height
-
-        line_height = (font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1]) * 1.2
-        for row_idx, row_data in enumerate(data):
-            row_bg_color = row_even_bg_color if row_idx % 2 == 0 else row_odd_bg_color
-            max_row_text_height = 0
-            temp_wrapped_cells = []
-            for i, cell_text in enumerate(row_data):
-                wrapped_lines = self._wrap_text(str(cell_text), font_body, col_widths_pixels[i] - 20)
-                temp_wrapped_cells.append(wrapped_lines)
-                max_row_text_height = max(max_row_text_height, len(wrapped_lines) * line_height)
-
-            row_data_height = max_row_text_height + 10
-            if current_y + row_data_height + margin_y > img.height:
-                new_height = int(img.height + (row_data_height + margin_y) * 10)
-                new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-                new_img.paste(img, (0, 0))
-                img = new_img
-                draw = ImageDraw.Draw(img)
-
-            current_x = margin_x
-            for i, cell_text in enumerate(row_data):
-                draw.rectangle([current_x, current_y, current_x + col_widths_pixels[i], current_y + row_data_height], fill=row_bg_color, outline=border_color, width=1)
-                wrapped_lines = temp_wrapped_cells[i]
-                text_y = current_y + 5
-                for line in wrapped_lines:
-                    draw.text((current_x + 10, text_y), line, font=font_body, fill=text_color)
-                    text_y += line_height
-                current_x += col_widths_pixels[i]
-            current_y += row_data_height
-
-        current_y += 15
-        footer_text = "Report Generated by NregaBot.com"; footer_font = font_body
-        footer_bbox = footer_font.getbbox(footer_text); footer_height = footer_bbox[3] - footer_bbox[1]
-        footer_y_pos = current_y + 10
-
-        if footer_y_pos + footer_height + margin_y > img.height:
-            new_height = int(footer_y_pos + footer_height + margin_y)
-            new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-            new_img.paste(img, (0, 0))
-            img = new_img
-            draw = ImageDraw.Draw(img)
-        
-        draw.text((margin_x, footer_y_pos), footer_text, font=footer_font, fill=text_color)
-        current_y = footer_y_pos + footer_height
-
-        final_img = img.crop((0, 0, img_width, current_y + margin_y))
-        final_img.save(file_path, "PNG", dpi=(300, 300))
-        return True
-
-    def _wrap_text(self, text, font, max_width):
-        # (Is function mein koi badlaav nahi hai)
-        return super()._wrap_text(text, font, max_width)
-
-        
     def save_inputs(self, inputs):
         # (Is function mein koi badlaav nahi hai)
         save_data = {k: inputs.get(k) for k in ('state', 'district', 'block', 'panchayat')}
         try:
-            config_file = self.app.get_data_path("issued_mr_report_inputs.json")
-            with open(config_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
+            self.app.state_store.set("issued_mr_report_inputs", save_data)
         except Exception as e:
             print(f"Error saving Issued MR Report inputs: {e}")
 
     def load_inputs(self):
         # (Is function mein koi badlaav nahi hai)
         try:
-            config_file = self.app.get_data_path("issued_mr_report_inputs.json")
-            if not os.path.exists(config_file): return
-            
-            with open(config_file, 'r') as f: data = json.load(f)
+            data = self.app.state_store.get("issued_mr_report_inputs")
+            if data is None: return
             
             self.state_entry.delete(0, 'end')
             self.state_entry.insert(0, data.get('state', ''))
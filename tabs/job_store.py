@@ -0,0 +1,172 @@
+# tabs/job_store.py
+"""
+Crash-safe job store for batch automations (SQLite, app data dir).
+Har run ek row hai aur har work code ek item row (status, attempts, timings, result rows).
+Har item ke baad commit hota hai, isliye app ya browser crash hone par bhi agla run
+wahin se resume ho sakta hai jahan pichla ruka tha.
+"""
+import json, time, hashlib, sqlite3, threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id      INTEGER PRIMARY KEY AUTOINCREMENT,
+    key         TEXT NOT NULL,
+    params_hash TEXT NOT NULL,
+    params      TEXT,
+    status      TEXT NOT NULL,            -- running / finished / stopped
+    created_at  REAL NOT NULL,
+    updated_at  REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    run_id      INTEGER NOT NULL,
+    item        TEXT NOT NULL,
+    position    INTEGER NOT NULL,
+    status      TEXT NOT NULL,            -- pending / running / done / failed / dropped
+    outcome     TEXT,                     -- tab-level status, e.g. "Success" / "Skipped"
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    started_at  REAL,
+    finished_at REAL,
+    duration_ms REAL,
+    results     TEXT,                     -- JSON list of [values, tags] result rows
+    PRIMARY KEY (run_id, item)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_key ON runs (key, status);
+"""
+
+KEEP_RUNS_PER_KEY = 20
+
+
+def params_hash(params):
+    return hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """One SQLite connection shared by all automation threads (guarded by a lock)."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._conn = None
+        self._active = {}  # automation key -> JobRun
+
+    @property
+    def conn(self):
+        # Lazy connect taaki app startup par disk I/O na ho
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def find_unfinished(self, key, params):
+        """Latest run of `key` with the same inputs that did not finish, as a dict with done/total counts, or None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT run_id, created_at FROM runs WHERE key=? AND params_hash=? AND status!='finished' ORDER BY run_id DESC LIMIT 1",
+                (key, params_hash(params))).fetchone()
+            if not row: return None
+            done, total = self.conn.execute(
+                "SELECT SUM(status='done'), SUM(status!='dropped') FROM items WHERE run_id=?", (row[0],)).fetchone()
+        if not total or done == total: return None
+        return {"run_id": row[0], "created_at": row[1], "done": done or 0, "total": total}
+
+    def begin(self, key, params, resume_run_id=None):
+        """Starts (or resumes) a run and makes it the active job for `key`."""
+        now = time.time()
+        with self._lock:
+            if resume_run_id:
+                self.conn.execute("UPDATE runs SET status='running', updated_at=? WHERE run_id=?", (now, resume_run_id))
+                self.conn.execute("UPDATE items SET status='pending' WHERE run_id=? AND status IN ('running', 'failed')", (resume_run_id,))
+                run_id = resume_run_id
+            else:
+                # Purane unfinished runs (same inputs) ab resume nahi honge
+                self.conn.execute("UPDATE runs SET status='stopped' WHERE key=? AND params_hash=? AND status='running'", (key, params_hash(params)))
+                run_id = self.conn.execute(
+                    "INSERT INTO runs (key, params_hash, params, status, created_at, updated_at) VALUES (?, ?, ?, 'running', ?, ?)",
+                    (key, params_hash(params), json.dumps(params, default=str), now, now)).lastrowid
+            self.conn.commit()
+            self._prune(key)
+            run = self._active[key] = JobRun(self, run_id, key, resumed=bool(resume_run_id))
+        return run
+
+    def active(self, key):
+        return self._active.get(key)
+
+    def end(self, key, stopped=False):
+        """Closes the active run; it only counts as finished when every item is done."""
+        run = self._active.pop(key, None)
+        if not run: return
+        with self._lock:
+            pending = self.conn.execute("SELECT COUNT(*) FROM items WHERE run_id=? AND status NOT IN ('done', 'dropped')", (run.run_id,)).fetchone()[0]
+            status = "stopped" if stopped or pending or not run.bound else "finished"
+            self.conn.execute("UPDATE runs SET status=?, updated_at=? WHERE run_id=?", (status, time.time(), run.run_id))
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None: self._conn.close(); self._conn = None
+
+    def _prune(self, key):
+        old = [r[0] for r in self.conn.execute(
+            "SELECT run_id FROM runs WHERE key=? ORDER BY run_id DESC LIMIT -1 OFFSET ?", (key, KEEP_RUNS_PER_KEY))]
+        if old:
+            marks = ",".join("?" * len(old))
+            self.conn.execute(f"DELETE FROM items WHERE run_id IN ({marks})", old)
+            self.conn.execute(f"DELETE FROM runs WHERE run_id IN ({marks})", old)
+            self.conn.commit()
+
+
+class JobRun:
+    """Per-item checkpoints of one run. Items are identified by their text (the work code)."""
+
+    def __init__(self, store, run_id, key, resumed=False):
+        self.store, self.run_id, self.key, self.resumed = store, run_id, key, resumed
+        self.bound = False
+        self._started = {}
+
+    def bind(self, items):
+        """
+        Registers the run's items and returns the ones already done in an earlier attempt of this run,
+        as {item: {"outcome", "results"}}. Callers skip those items and restore their result rows.
+        """
+        with self.store._lock:
+            conn = self.store.conn
+            conn.executemany("INSERT OR IGNORE INTO items (run_id, item, position, status) VALUES (?, ?, ?, 'pending')",
+                             [(self.run_id, str(item), i) for i, item in enumerate(items)])
+            rows = conn.execute("SELECT item, status, outcome, results FROM items WHERE run_id=? ORDER BY position", (self.run_id,)).fetchall()
+            # Jo items ab list mein nahi hain (e.g. auto mode dropdown badal gaya) unka intezaar nahi karna
+            current = {str(item) for item in items}
+            dropped = [(self.run_id, item) for item, status, _, _ in rows if status != "done" and item not in current]
+            conn.executemany("UPDATE items SET status='dropped' WHERE run_id=? AND item=?", dropped)
+            conn.commit()
+        self.bound = True
+        return {item: {"outcome": outcome, "results": json.loads(results) if results else []}
+                for item, status, outcome, results in rows if status == "done"}
+
+    def start_item(self, item):
+        now = time.time(); self._started[str(item)] = time.perf_counter()
+        self._execute("UPDATE items SET status='running', attempts=attempts+1, started_at=?, finished_at=NULL, results=NULL WHERE run_id=? AND item=?",
+                      (now, self.run_id, str(item)))
+
+    def finish_item(self, item, ok=True, outcome=None):
+        started = self._started.pop(str(item), None)
+        duration_ms = (time.perf_counter() - started) * 1000 if started else None
+        self._execute("UPDATE items SET status=?, outcome=COALESCE(?, outcome), finished_at=?, duration_ms=? WHERE run_id=? AND item=?",
+                      ("done" if ok else "failed", outcome, time.time(), duration_ms, self.run_id, str(item)))
+
+    def add_result(self, item, values, tags=()):
+        """Keeps the result row(s) of an item so a resumed run can show them again."""
+        with self.store._lock:
+            row = self.store.conn.execute("SELECT results FROM items WHERE run_id=? AND item=?", (self.run_id, str(item))).fetchone()
+            if row is None: return
+            results = json.loads(row[0]) if row[0] else []
+            results.append([list(values), list(tags)])
+            self.store.conn.execute("UPDATE items SET results=? WHERE run_id=? AND item=?",
+                                    (json.dumps(results, default=str), self.run_id, str(item)))
+            self.store.conn.commit()
+
+    def _execute(self, sql, args):
+        with self.store._lock:
+            self.store.conn.execute(sql, args)
+            self.store.conn.commit()
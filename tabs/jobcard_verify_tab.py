@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
-import time, os, sys
+import os, sys
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -11,6 +11,7 @@ from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_page_ready
 
 def resource_path(relative_path):
     try: base_path = sys._MEIPASS
@@ -18,6 +19,8 @@ def resource_path(relative_path):
     return os.path.join(base_path, relative_path)
 
 class JobcardVerifyTab(BaseAutomationTab):
+    lean_mode_allow = ("images",) # Photo upload popup needs the page images
+
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="jc_verify")
         self.photo_folder_path = ""
@@ -215,8 +218,8 @@ class JobcardVerifyTab(BaseAutomationTab):
                         wait.until(EC.number_of_windows_to_be(2))
                         popup_handle = [h for h in driver.window_handles if h != main_window_handle][0]
                         
-                        time.sleep(1) # Crucial pause before switching
                         driver.switch_to.window(popup_handle)
+                        wait_for_page_ready(driver) # Popup load hone tak ruko
                         
                         # Wait for the pop-up to finish loading its URL
                         WebDriverWait(driver, 10).until(lambda d: "UploadPhoto_Verified" in d.current_url)
@@ -251,5 +254,5 @@ class JobcardVerifyTab(BaseAutomationTab):
             final_alert = wait.until(EC.alert_is_present())
             self.app.log_message(self.log_display, f"     - Saved successfully: {final_alert.text}", "success"); final_alert.accept()
             jobcard_count += 1
-            time.sleep(2)
+            wait_for_page_ready(driver)
             wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_UC_panch_vill_reg1_ddlpnch")))
\ No newline at end of file
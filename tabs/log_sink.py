@@ -0,0 +1,128 @@
+# tabs/log_sink.py
+"""
+Batched, thread-safe log sink for a tab's log textbox.
+Worker threads sirf queue mein line daalte hain; Tk thread har `drain_ms` par saari pending lines
+ek hi insert mein likhta hai. Textbox mein sirf aakhri `visible_lines` rehti hain (ring buffer),
+purani lines memory mein "Show Older" ke liye rakhi jaati hain aur poora log ek rotating file
+mein bhi jaata hai (file I/O alag listener thread par).
+"""
+import os, time, queue, logging, tkinter, threading, collections
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+LEVELS = {"warning": logging.WARNING, "error": logging.ERROR, "critical": logging.CRITICAL, "debug": logging.DEBUG}
+
+
+class LogSink:
+    """One per log textbox. `write` and `clear` may be called from any thread; the rest runs on the Tk thread."""
+
+    def __init__(self, widget, name, log_path, settings):
+        self.widget, self.name, self.log_path = widget, name, log_path
+        self.visible_lines = settings["visible_lines"]
+        self.batch_lines = settings["batch_lines"]
+        self.drain_ms = settings["drain_ms"]
+        self._pending = collections.deque()
+        self._visible = collections.deque() # entries currently in the textbox (Tk thread only)
+        self._older = collections.deque(maxlen=settings["older_lines"]) # trimmed entries (Tk thread only)
+        self._extra = 0 # "Show Older" se wapas laayi gayi lines ke liye cap itna badh jaata hai
+        self._lock = threading.Lock()
+        self._scheduled = self._clear_requested = False
+        self._file_logger, self._listener = self._open_file(settings)
+
+    def _open_file(self, settings):
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            handler = RotatingFileHandler(self.log_path, maxBytes=settings["file_max_mb"] * 1024 * 1024,
+                                          backupCount=settings["file_backups"], encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+            records = queue.SimpleQueue()
+            listener = QueueListener(records, handler); listener.start()
+            logger = logging.getLogger(f"nregabot.tablog.{self.name}")
+            logger.handlers[:] = [QueueHandler(records)]
+            logger.setLevel(logging.DEBUG); logger.propagate = False
+            return logger, listener
+        except Exception as e:
+            logging.warning(f"Log file {self.log_path} not available: {e}")
+            return None, None
+
+    def write(self, msg, level="info"):
+        entry = f"[{time.strftime('%H:%M:%S')}] {msg}"
+        with self._lock:
+            self._pending.append(entry)
+            schedule, self._scheduled = not self._scheduled, True
+        if self._file_logger: self._file_logger.log(LEVELS.get(level, logging.INFO), msg)
+        if schedule: self._schedule(self.drain_ms)
+
+    def preload(self, entries):
+        """Queues already formatted entries (e.g. a restored tab's old log) without writing them to the log file again."""
+        if not entries: return
+        with self._lock:
+            self._pending.extend(entries)
+            schedule, self._scheduled = not self._scheduled, True
+        if schedule: self._schedule(0)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear(); self._clear_requested = True
+            schedule, self._scheduled = not self._scheduled, True
+        if schedule: self._schedule(0)
+
+    def _schedule(self, delay):
+        try: self.widget.after(delay, self._drain)
+        except (RuntimeError, tkinter.TclError): # mainloop abhi nahi chala ya widget destroy ho gaya
+            with self._lock: self._scheduled = False
+
+    def _drain(self):
+        with self._lock:
+            clear, self._clear_requested = self._clear_requested, False
+            batch = [self._pending.popleft() for _ in range(min(len(self._pending), self.batch_lines))]
+            more = bool(self._pending)
+            if not more: self._scheduled = False
+        try:
+            self.widget.configure(state="normal")
+            if clear:
+                self.widget.delete("1.0", tkinter.END)
+                self._visible.clear(); self._older.clear(); self._extra = 0
+            if batch:
+                self.widget.insert(tkinter.END, "\n".join(batch) + "\n")
+                self._visible.extend(batch)
+                self._trim()
+            self.widget.configure(state="disabled")
+            if batch: self.widget.see(tkinter.END)
+        except tkinter.TclError: # Tab band ho gaya
+            return
+        if more: self._schedule(1) # Backlog hai, UI ko ek event dene ke baad agla batch
+
+    def _trim(self):
+        overflow = len(self._visible) - (self.visible_lines + self._extra)
+        if overflow <= 0: return
+        text_lines = 0
+        for _ in range(overflow):
+            entry = self._visible.popleft()
+            text_lines += entry.count("\n") + 1
+            self._older.append(entry)
+        self.widget.delete("1.0", f"{text_lines + 1}.0")
+
+    def show_older(self, count=500):
+        """Puts up to `count` trimmed entries back at the top of the textbox; returns how many."""
+        restored = [self._older.pop() for _ in range(min(count, len(self._older)))][::-1]
+        if not restored: return 0
+        self._extra += len(restored)
+        self.widget.configure(state="normal")
+        self.widget.insert("1.0", "\n".join(restored) + "\n")
+        self.widget.configure(state="disabled")
+        self._visible.extendleft(reversed(restored))
+        self.widget.see("1.0")
+        return len(restored)
+
+    def text(self):
+        """Everything still in memory (trimmed + visible + not yet drawn), e.g. for Copy Logs."""
+        with self._lock:
+            pending, cleared = list(self._pending), self._clear_requested
+        entries = pending if cleared else list(self._older) + list(self._visible) + pending
+        return "\n".join(entries) + "\n" if entries else ""
+
+    def close(self):
+        if self._listener:
+            try: self._listener.stop()
+            except Exception: pass
+            self._listener = None
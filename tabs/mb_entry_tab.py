@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, os, json, sys, subprocess, random
+import os, sys, subprocess, random
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -11,16 +11,13 @@ from selenium.common.exceptions import UnexpectedAlertPresentException, NoSuchEl
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback, wait_for_page_ready
 
 class MbEntryTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
         """Initializes the eMB Entry tab."""
         super().__init__(parent, app_instance, automation_key="mb_entry")
         
-        # Path to save/load form inputs
-        self.config_file = self.app.get_data_path("mb_entry_inputs.json")
-
-        self.mapping_file = self.app.get_data_path("mb_panchayat_mate_map.json")
         self.mapping_data = {}
         self._load_mapping_data()
         
@@ -94,7 +91,7 @@ class MbEntryTab(BaseAutomationTab):
         # --- Action Buttons (Start, Stop, Reset) ---
         action_frame_container = ctk.CTkFrame(top_frame)
         action_frame_container.pack(pady=10, fill='x')
-        action_frame = self._create_action_buttons(parent_frame=action_frame_container)
+        action_frame = self._create_action_buttons(parent_frame=action_frame_container, parallel_workers=True)
         action_frame.pack(expand=True, fill='x')
         
         # --- Tab View for Work Codes, Results, Logs ---
@@ -142,6 +139,7 @@ class MbEntryTab(BaseAutomationTab):
         self.results_tree.grid(row=1, column=0, sticky='nsew')
         scrollbar = ctk.CTkScrollbar(results_frame, command=self.results_tree.yview)
         self.results_tree.configure(yscroll=scrollbar.set); scrollbar.grid(row=1, column=1, sticky='ns')
+        self.attach_results_model(self.results_tree, scrollbar)
         self.style_treeview(self.results_tree); self._setup_treeview_sorting(self.results_tree)
 
     def _toggle_mb_no_entry(self):
@@ -153,11 +151,7 @@ class MbEntryTab(BaseAutomationTab):
         else:
             # Auto is unchecked: Enable entry and load saved value
             self.mb_no_entry.configure(state="normal")
-            saved_data = {}
-            if os.path.exists(self.config_file):
-                try:
-                    with open(self.config_file, 'r') as f: saved_data = json.load(f)
-                except (json.JSONDecodeError, IOError): pass
+            saved_data = self.app.state_store.get("mb_entry_inputs", {})
             self.config_vars["measurement_book_no"].set(saved_data.get("measurement_book_no", ""))
 
     def _on_format_change(self, selected_format):
@@ -222,21 +216,13 @@ class MbEntryTab(BaseAutomationTab):
 
     # --- NEW HELPER METHODS ---
     def _load_mapping_data(self):
-        if os.path.exists(self.mapping_file):
-            try:
-                with open(self.mapping_file, 'r') as f:
-                    self.mapping_data = json.load(f)
-            except Exception:
-                self.mapping_data = {}
+        self.mapping_data = self.app.state_store.get("mb_panchayat_mate_map", {})
 
     def _save_mapping_pair(self, panchayat, mate_names):
         if not panchayat or not mate_names: return
         key = panchayat.strip().lower()
         self.mapping_data[key] = mate_names.strip()
-        try:
-            with open(self.mapping_file, 'w') as f:
-                json.dump(self.mapping_data, f, indent=4)
-        except Exception: pass
+        self.app.state_store.set("mb_panchayat_mate_map", self.mapping_data)
     # --------------------------
 
     def _on_panchayat_change(self):
@@ -299,7 +285,7 @@ class MbEntryTab(BaseAutomationTab):
             self.work_codes_text.configure(state="normal")
             self.work_codes_text.delete("1.0", tkinter.END)
             self.work_codes_text.configure(state="disabled")
-            for item in self.results_tree.get_children(): self.results_tree.delete(item)
+            self._clear_results()
             self.app.clear_log(self.log_display)
             self.update_status("Ready", 0.0)
             self.app.log_message(self.log_display, "Form has been reset.")
@@ -335,24 +321,17 @@ class MbEntryTab(BaseAutomationTab):
         self.app.start_automation_thread(
             self.automation_key, 
             self.run_automation_logic, 
-            args=(cfg, work_codes_raw)
+            args=(cfg, work_codes_raw),
+            job_params={"panchayat": cfg["panchayat_name"], "work_codes": work_codes_raw}
         )
     
     def _save_inputs(self, cfg):
-        """Saves configuration to a JSON file."""
-        try:
-            with open(self.config_file, 'w') as f: json.dump(cfg, f, indent=4)
-        except Exception as e: 
-            self.app.log_message(self.log_display, f"Could not save inputs: {e}", "warning")
+        """Saves configuration to the app's state store."""
+        self.app.state_store.set("mb_entry_inputs", cfg)
 
     def _load_inputs(self):
-        """Loads configuration from a JSON file."""
-        saved_data = {}
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f: saved_data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e: 
-                self.app.log_message(self.log_display, f"Could not load inputs: {e}", "warning")
+        """Loads configuration from the app's state store."""
+        saved_data = self.app.state_store.get("mb_entry_inputs", {})
         
         # Set values, falling back to defaults if not found
         for key, var in self.config_vars.items():
@@ -368,7 +347,7 @@ class MbEntryTab(BaseAutomationTab):
         # --- UI Setup ---
         self.app.after(0, self.set_ui_state, True) # Disable UI
         self.app.clear_log(self.log_display) # Clear log
-        self.app.after(0, lambda: [self.results_tree.delete(item) for item in self.results_tree.get_children()]) # Clear tree
+        self._clear_results() # Clear tree
         self.app.log_message(self.log_display, "Starting eMB Entry automation...")
         self.app.after(0, self.app.set_status, "Running eMB Entry...") # App-level status
         
@@ -395,20 +374,14 @@ class MbEntryTab(BaseAutomationTab):
             total = len(work_codes_raw)
             self.app.after(0, self.app.set_status, f"Starting eMB Entry for {total} workcodes...")
 
-            # --- Main Loop ---
-            for i, work_code in enumerate(work_codes_raw):
-                if self.app.stop_events[self.automation_key].is_set():
-                    self.app.log_message(self.log_display, "Automation stopped.", "warning"); break
-                
-                # Update per-workcode status
-                self.app.after(0, self.update_status, f"Processing {i+1}/{total}: {work_code}", (i+1) / total)
-                
+            def process_item(worker_driver, _context, work_code):
                 if work_code in processed_codes:
-                    self._log_result(work_code, "Skipped", "Duplicate entry."); continue
-                
-                # Process the work code
-                self._process_single_work_code(driver, work_code, cfg, mate_names_list)
-                processed_codes.add(work_code) # Mark as processed
+                    self._log_result(work_code, "Skipped", "Duplicate entry."); return
+                processed_codes.add(work_code) # Mark before processing so parallel workers don't pick it twice
+                self._process_single_work_code(worker_driver, work_code, cfg, mate_names_list)
+
+            # --- Main Loop ---
+            self.run_work_items(driver, work_codes_raw, process_item)
 
             # --- Completion ---
             final_msg = "Automation finished." if not self.app.stop_events[self.automation_key].is_set() else "Stopped."
@@ -428,9 +401,10 @@ class MbEntryTab(BaseAutomationTab):
 
     def _log_result(self, work_code, status, details):
         """Helper to add a row to the results treeview on the main thread."""
+        self._record_result(status, work_code, details=details)
         timestamp = datetime.now().strftime("%H:%M:%S")
         tags = ('failed',) if 'success' not in status.lower() else ()
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=(work_code, status, details, timestamp), tags=tags))
+        self._add_result_row((work_code, status, details, timestamp), tags)
 
     def _process_single_work_code(self, driver, work_code, cfg, mate_names_list):
         """Performs the browser automation for a single work code."""
@@ -464,17 +438,19 @@ class MbEntryTab(BaseAutomationTab):
             wait.until(EC.presence_of_element_located((By.ID, 'ctl00_ContentPlaceHolder1_txtMBNo'))).send_keys(mb_no_to_use)
             driver.find_element(By.ID, 'ctl00_ContentPlaceHolder1_txtpageno').send_keys(cfg["page_no"])
             driver.find_element(By.ID, 'ctl00_ContentPlaceHolder1_txtWrkCode').send_keys(work_code)
-            driver.find_element(By.ID, 'ctl00_ContentPlaceHolder1_imgButtonSearch').click()
+            search_button = driver.find_element(By.ID, 'ctl00_ContentPlaceHolder1_imgButtonSearch')
+            search_button.click(); wait_for_postback(driver, search_button)
             
             # --- 4. Select Work and Period ---
             self.app.after(0, self.app.set_status, f"Selecting work details for {work_code}...")
-            wait.until(EC.presence_of_element_located((By.ID, 'ctl00_ContentPlaceHolder1_ddlSelWrk'))); time.sleep(1) # Wait for JS
+            wait.until(EC.presence_of_element_located((By.ID, 'ctl00_ContentPlaceHolder1_ddlSelWrk'))); wait_for_page_ready(driver) # Wait for JS
             select_work = Select(driver.find_element(By.ID, 'ctl00_ContentPlaceHolder1_ddlSelWrk'))
             if len(select_work.options) <= 1: raise ValueError("Work code not found/processed.")
             select_work.select_by_index(1) # Select first work in list
             
-            driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_rddist_0").click() # Click 'Distinct' radio
-            time.sleep(2) # Wait for period to load
+            distinct_radio = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_rddist_0")
+            distinct_radio.click() # Click 'Distinct' radio
+            wait_for_postback(driver, distinct_radio) # Wait for period to load
             
             period_dropdown = Select(driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_ddlSelMPeriod"))
             if len(period_dropdown.options) <= 1: raise ValueError("No measurement period found.")
@@ -504,7 +480,7 @@ class MbEntryTab(BaseAutomationTab):
             mate_name_field.send_keys(random_mate)
 
             self.app.after(0, self.app.set_status, f"Saving eMB for {work_code}...")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);"); time.sleep(0.5)
+            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
             driver.find_element(By.XPATH, '//input[@value="Save"]').click()
             
             # --- 8. Handle Confirmation Alert ---
@@ -560,7 +536,7 @@ class MbEntryTab(BaseAutomationTab):
 
     def _get_filtered_data_and_filepath(self, export_format):
         """Filters treeview data and gets a save file path from the user."""
-        all_items = self.results_tree.get_children()
+        all_items = self.get_result_rows(self.results_tree)
         if not all_items: 
             messagebox.showinfo("No Data", "There are no results to export."); return None, None
             
@@ -571,8 +547,7 @@ class MbEntryTab(BaseAutomationTab):
         # Filter data based on dropdown
         filter_option = self.export_filter_menu.get()
         data_to_export = []
-        for item_id in all_items:
-            row_values = self.results_tree.item(item_id)['values']
+        for row_values in all_items:
             status = row_values[1].upper() # Status is the second column
             if filter_option == "Export All": data_to_export.append(row_values)
             elif filter_option == "Success Only" and "SUCCESS" in status: data_to_export.append(row_values)
@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, os, json
+import os
 from datetime import datetime
 import pandas as pd
 import re
@@ -20,12 +20,27 @@ from openpyxl.worksheet.page import PageMargins
 
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_page_ready
+from .process_worker import WorkerStopped
 import config
 
+
+def parse_report_table(channel, html):
+    """Last table of a MIS report page as a DataFrame (two-row header if present). Runs in a worker process."""
+    try:
+        report_df = pd.read_html(StringIO(html), header=[0, 1])[-1]
+        report_df.columns = [col[1] for col in report_df.columns]
+        if not report_df.empty and str(report_df.iloc[0, 0]).strip() == '1' and str(report_df.iloc[0, 1]).strip().startswith('2'):
+            channel.log("Detected and removed junk numeric header row from data.", "warning")
+            report_df = report_df.iloc[1:].reset_index(drop=True)
+    except ValueError:
+        channel.log("Could not parse multi-level header. Trying single header.", "warning")
+        report_df = pd.read_html(StringIO(html), header=0)[-1]
+    return report_df
+
 class MisReportsTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="mis_reports")
-        self.config_file = self.app.get_data_path("mis_reports_inputs.json")
         self.report_checkboxes = {}
         
         self.grid_columnconfigure(0, weight=1)
@@ -198,8 +213,9 @@ class MisReportsTab(BaseAutomationTab):
 
     def run_automation_logic(self, inputs, save_path):
         self.app.after(0, self.set_ui_state, True); self.app.clear_log(self.log_display); self.app.log_message(self.log_display, "Starting MIS Report generation...")
+        driver = None
         try:
-            driver = self.app.get_driver();
+            driver = self.app.get_report_driver() # Shared headless report pool se
             if not driver: return
             wait = WebDriverWait(driver, 20)
             
@@ -208,12 +224,7 @@ class MisReportsTab(BaseAutomationTab):
                 for i, report_name in enumerate(inputs['reports']):
                     if self.app.stop_events[self.automation_key].is_set(): self.app.log_message(self.log_display, "Stop signal received.", "warning"); break
                     
-                    # --- NEW: Update App Status ---
-                    status_msg = f"Processing report {i+1}/{total_reports}..."
-                    self.app.after(0, self.app.set_status, status_msg)
-                    # ---
-                    
-                    self.app.after(0, self.update_status, f"Processing {report_name}", (i+1)/total_reports)
+                    self.progress.update(f"Processing {report_name}", (i+1)/total_reports, app_message=f"Processing report {i+1}/{total_reports}...")
                     self.app.log_message(self.log_display, f"--- Processing report {i+1}/{total_reports}: {report_name} ---")
                     
                     report_df = pd.DataFrame() # Initialize empty dataframe
@@ -231,7 +242,7 @@ class MisReportsTab(BaseAutomationTab):
                         self.app.log_message(self.log_display, f"Finding and scrolling to '{report_name}'...")
                         report_link = wait.until(EC.presence_of_element_located((By.LINK_TEXT, report_name.strip())))
                         driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", report_link)
-                        time.sleep(1); report_link.click()
+                        report_link.click()
                         if "Aadhaar Status" in report_name:
                             self.app.log_message(self.log_display, "Handling special case, selecting State again...")
                             wait.until(EC.element_to_be_clickable((By.PARTIAL_LINK_TEXT, inputs['state'].upper()))).click()
@@ -246,19 +257,10 @@ class MisReportsTab(BaseAutomationTab):
                             wait.until(EC.element_to_be_clickable((By.PARTIAL_LINK_TEXT, inputs['block'].upper()))).click()
                         
                         self.app.log_message(self.log_display, "Final page reached. Reading table...")
-                        time.sleep(2)
+                        wait_for_page_ready(driver)
                         
-                        try:
-                            df_list = pd.read_html(StringIO(driver.page_source), header=[0, 1])
-                            report_df = df_list[-1]
-                            report_df.columns = [col[1] for col in report_df.columns]
-                            if not report_df.empty and str(report_df.iloc[0, 0]).strip() == '1' and str(report_df.iloc[0, 1]).strip().startswith('2'):
-                                self.app.log_message(self.log_display, "Detected and removed junk numeric header row from data.", "warning")
-                                report_df = report_df.iloc[1:].reset_index(drop=True)
-                        except ValueError:
-                            self.app.log_message(self.log_display, "Could not parse multi-level header. Trying single header.", "warning")
-                            df_list = pd.read_html(StringIO(driver.page_source), header=0)
-                            report_df = df_list[-1]
+                        # read_html GIL pakad ke rakhta hai, isliye parsing worker process mein
+                        report_df = self.app.process_workers.run(self, parse_report_table, driver.page_source)
 
                         sheet_name = re.sub(r'[\\/*?:\[\]]', '', report_name)[:30]
                         report_df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=1)
@@ -337,6 +339,8 @@ class MisReportsTab(BaseAutomationTab):
                         
                         self.app.after(0, lambda r=report_name, d=details: self.results_tree.insert("", "end", values=(r, "Success", d)))
 
+                    except WorkerStopped:
+                        self.app.log_message(self.log_display, f"Stopped while reading '{report_name}'.", "warning"); break
                     except Exception as e:
                         error_msg = str(e).split('\n')[0]
                         self.app.log_message(self.log_display, f"Failed to process '{report_name}': {error_msg}", "error")
@@ -347,9 +351,9 @@ class MisReportsTab(BaseAutomationTab):
         except Exception as e:
             error_msg = str(e).split('\n')[0]; self.app.log_message(self.log_display, f"A critical error occurred: {error_msg}", "error"); messagebox.showerror("Critical Error", error_msg)
         finally:
+            self.app.report_pool.release(driver)
             self.app.after(0, self.set_ui_state, False); 
-            self.app.after(0, self.update_status, "Automation Finished", 1.0); 
-            self.app.after(0, self.app.set_status, "Automation Finished")
+            self.progress.update("Automation Finished", 1.0, immediate=True)
             
             if not self.app.stop_events[self.automation_key].is_set():
                 self.app.after(100, lambda: messagebox.showinfo("Complete", f"MIS Report generation has finished.\nFile(s) saved near: {save_path}"))
@@ -359,16 +363,14 @@ class MisReportsTab(BaseAutomationTab):
 
     def save_inputs(self, inputs):
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(inputs, f, indent=4)
+            self.app.state_store.set("mis_reports_inputs", inputs)
         except Exception as e:
             print(f"Error saving MIS inputs: {e}")
 
     def load_inputs(self):
-        if not os.path.exists(self.config_file): return
+        data = self.app.state_store.get("mis_reports_inputs")
+        if data is None: return
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
             self.state_entry.delete(0, tkinter.END)
             self.state_entry.insert(0, data.get('state', ''))
             self.district_entry.delete(0, tkinter.END)
@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import os, random, time, sys, subprocess, re, json
+import os, random, time, sys, subprocess, re
 from datetime import datetime
 from fpdf import FPDF
 from selenium.webdriver.common.by import By
@@ -12,6 +12,7 @@ from selenium.common.exceptions import StaleElementReferenceException, NoSuchEle
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback, wait_for_page_ready
 
 class MrFillTab(BaseAutomationTab):
     """
@@ -23,8 +24,6 @@ class MrFillTab(BaseAutomationTab):
         super().__init__(parent, app_instance, automation_key="mr_fill")
         self.grid_columnconfigure(0, weight=1); self.grid_rowconfigure(1, weight=1)
         
-        # --- Config file for saving inputs ---
-        self.config_file = self.app.get_data_path("mr_fill_inputs.json")
         self.config_vars = {} # Dictionary to hold UI variables
 
         # --- UI Variables ---
@@ -149,22 +148,12 @@ class MrFillTab(BaseAutomationTab):
     
     # --- Save and Load Inputs ---
     def _save_inputs(self, cfg):
-        """Saves the current UI inputs to a JSON file."""
-        try:
-            with open(self.config_file, 'w') as f: 
-                json.dump(cfg, f, indent=4)
-        except Exception as e: 
-            self.app.log_message(self.log_display, f"Could not save inputs: {e}", "warning")
+        """Saves the current UI inputs to the app's state store."""
+        self.app.state_store.set("mr_fill_inputs", cfg)
 
     def _load_inputs(self):
-        """Loads inputs from the JSON file on startup."""
-        saved_data = {}
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f: 
-                    saved_data = json.load(f)
-            except (json.JSONDecodeError, IOError) as e: 
-                self.app.log_message(self.log_display, f"Could not load inputs: {e}", "warning")
+        """Loads inputs from the state store on startup."""
+        saved_data = self.app.state_store.get("mr_fill_inputs", {})
         
         # Set values from saved_data, falling back to defaults
         self.panchayat_var.set(saved_data.get("panchayat_name", ""))
@@ -269,13 +258,13 @@ class MrFillTab(BaseAutomationTab):
                     panchayat_select.select_by_visible_text(match)
                     self.app.update_history("panchayat_name", panchayat_name) # Save to autocomplete history
                     self.app.log_message(self.log_display, f"Successfully selected Panchayat: {match}", "success")
-                    time.sleep(2) # Wait for page to reload
+                    wait_for_postback(driver, panchayat_select_element) # Wait for page to reload
                     panchayat_selected = True
                     break # Exit loop on success
                 
                 except TimeoutException:
                     self.app.log_message(self.log_display, f"Panchayat dropdown not found (Attempt {attempt + 1}/2).", "info")
-                    time.sleep(1) # Wait before retrying
+                    wait_for_page_ready(driver, timeout=5) # Wait before retrying
                 
             if not panchayat_selected and not self.app.stop_events[self.automation_key].is_set():
                 self.app.log_message(self.log_display, "Panchayat selection not found/required (GP Login). Proceeding...", "info")
@@ -319,8 +308,9 @@ class MrFillTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, f"Searching for Work Key: {work_key}")
             wait.until(EC.presence_of_element_located((By.ID, "txtSearch"))).clear()
             driver.find_element(By.ID, "txtSearch").send_keys(work_key)
-            wait.until(EC.element_to_be_clickable((By.ID, "ImgbtnSearch"))).click()
-            time.sleep(1) # Wait for search
+            search_button = wait.until(EC.element_to_be_clickable((By.ID, "ImgbtnSearch")))
+            search_button.click()
+            wait_for_postback(driver, search_button) # Wait for search
 
             # Check for 'lblmsg' error (like Geotag)
             error_span = driver.find_element(By.ID, "lblmsg")
@@ -330,11 +320,12 @@ class MrFillTab(BaseAutomationTab):
 
             # --- 2. Work Code Select ---
             self.app.after(0, self.app.set_status, f"Selecting Work Code...")
-            work_code_select = Select(wait.until(EC.presence_of_element_located((By.ID, "ddlWorkCode"))))
+            work_code_element = wait.until(EC.presence_of_element_located((By.ID, "ddlWorkCode")))
+            work_code_select = Select(work_code_element)
             if len(work_code_select.options) <= 1: 
                 raise IndexError("Work code not found after search.")
             work_code_select.select_by_index(1) # Select the first work code
-            time.sleep(1.5) # Wait for MR list to load
+            wait_for_postback(driver, work_code_element) # Wait for MR list to load
 
             # --- 3. MR No. Select ---
             self.app.after(0, self.app.set_status, f"Selecting MR No...")
@@ -348,7 +339,7 @@ class MrFillTab(BaseAutomationTab):
             
             # Wait for table to load by checking for the 'Save' button
             wait.until(EC.presence_of_element_located((By.ID, "btnsave")))
-            time.sleep(1) # Allow table to render
+            wait_for_page_ready(driver) # Allow table to render
 
             # --- 4. Mark Holidays ---
             if holiday_cols:
@@ -436,6 +427,8 @@ class MrFillTab(BaseAutomationTab):
         level = "success" if status.lower() == "success" else "error"
         timestamp = datetime.now().strftime("%H:%M:%S")
         details = msg.replace("\n", " ").replace("\r", " ")
+        self._record_result(status, work_key, mr_no, details)
+        if status.lower() == "success": self.app.work_index.forget_msrs(self.result_panchayat) # MR bhara, MSR payment list badal gayi
         
         self.app.log_message(self.log_display, f"'{work_key}' (MR: {mr_no}) - {status.upper()}: {details}", level=level)
         tags = ('failed',) if 'success' not in status.lower() else ()
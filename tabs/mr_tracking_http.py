@@ -0,0 +1,167 @@
+# tabs/mr_tracking_http.py
+"""
+Browser-free engine for the MR Tracking report (dynamic_muster_track.aspx).
+Form ko plain HTTP postbacks se replay karta hai (__VIEWSTATE / __EVENTVALIDATION ke saath),
+aur result table ko lxml se parse karta hai. Koi bhi gadbad ho to MrTrackingHttpError
+raise hota hai taaki tab browser engine par fall back kar sake.
+"""
+import re, time, queue, threading
+import requests
+from lxml import etree, html
+
+STATE_FIELD = "ctl00$ContentPlaceHolder1$ddl_state"
+DISTRICT_FIELD = "ctl00$ContentPlaceHolder1$ddl_dist"
+BLOCK_FIELD = "ctl00$ContentPlaceHolder1$ddl_blk"
+PANCHAYAT_FIELD = "ctl00$ContentPlaceHolder1$ddl_pan"
+PAYMENT_RADIO_FIELD = "ctl00$ContentPlaceHolder1$Rbtn_pay"
+SUBMIT_BUTTON_ID = "ctl00_ContentPlaceHolder1_Button1"
+TABLE_XPATH = "//table[@bordercolor='#EBEBEB' and .//b[text()='SNo.']]"
+
+_POSTBACK_TARGET_RE = re.compile(r"__doPostBack\(\\?'([^'\\]+)")
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+
+
+class MrTrackingHttpError(Exception):
+    """The form could not be replayed or the report could not be parsed over HTTP."""
+
+
+def _clean(text):
+    return " ".join((text or "").replace("\xa0", " ").split())
+
+
+class MrTrackingHttpEngine:
+    """Replays the MR Tracking cascading-dropdown form with pooled requests.Session objects."""
+
+    FORM_TTL = 600 # Block-level form state (viewstate) ko itni der reuse karte hain
+
+    def __init__(self, url, timeout=30, pool_size=2):
+        self.url, self.timeout = url, timeout
+        self._sessions = queue.LifoQueue(maxsize=pool_size)
+        self._form_cache, self._cache_lock = {}, threading.Lock()
+
+    # --- Session pool ---
+    def _acquire_session(self):
+        try: return self._sessions.get_nowait()
+        except queue.Empty:
+            session = requests.Session()
+            session.headers.update({"User-Agent": _USER_AGENT})
+            return session
+
+    def _release_session(self, session):
+        try: self._sessions.put_nowait(session)
+        except queue.Full: session.close()
+
+    def close(self):
+        while not self._sessions.empty(): self._sessions.get_nowait().close()
+
+    # --- Form helpers ---
+    def _load(self, response):
+        try: response.raise_for_status()
+        except requests.HTTPError as e: # Purane __VIEWSTATE par server aksar 500 deta hai; fresh form se retry ho sake
+            raise MrTrackingHttpError(f"HTTP {response.status_code} from MR Tracking page.") from e
+        tree = html.fromstring(response.content, base_url=response.url)
+        forms = tree.forms
+        if not forms: raise MrTrackingHttpError("No form found on MR Tracking page.")
+        return tree, forms[0]
+
+    def _postback(self, session, form, fields, event_target=""):
+        data = dict(fields, __EVENTTARGET=event_target, __EVENTARGUMENT="")
+        return self._load(session.post(form.action or self.url, data=data, timeout=self.timeout))
+
+    @staticmethod
+    def _fields(form):
+        return dict(form.form_values())
+
+    @staticmethod
+    def _select_value(form, field, visible_text):
+        """Returns the option value for `visible_text` (exact first, then case-insensitive). MrTrackingHttpError if absent."""
+        selects = form.xpath(f".//select[@name='{field}']")
+        if not selects: raise MrTrackingHttpError(f"Dropdown '{field}' not found.")
+        options = [(_clean(opt.text_content()), opt.get("value", _clean(opt.text_content()))) for opt in selects[0].xpath(".//option")]
+        target = _clean(visible_text)
+        for text, value in options:
+            if text == target: return value
+        for text, value in options:
+            if text.lower() == target.lower(): return value
+        raise MrTrackingHttpError(f"'{visible_text}' not found in {field.rsplit('$', 1)[-1]} dropdown.")
+
+    @staticmethod
+    def _postback_target(element, default):
+        script = (element.get("onchange") or "") + (element.get("onclick") or "")
+        match = _POSTBACK_TARGET_RE.search(script)
+        return match.group(1) if match else (default if script else None)
+
+    def _choose(self, session, form, field, visible_text):
+        """Selects an option; posts back if the dropdown has AutoPostBack."""
+        fields = self._fields(form)
+        fields[field] = self._select_value(form, field, visible_text)
+        target = self._postback_target(form.xpath(f".//select[@name='{field}']")[0], field)
+        if target is None: form.fields[field] = fields[field]; return form # No postback, just remember the value
+        return self._postback(session, form, fields, target)[1]
+
+    # --- Public API ---
+    def fetch_rows(self, state, district, block, panchayat, radio_id):
+        """
+        Runs the report and returns data rows (header skipped) as lists of cell texts,
+        same shape as table_extractor.extract_table().
+        """
+        session = self._acquire_session()
+        try:
+            key = (state.upper(), district.upper(), block)
+            with self._cache_lock: had_cache = key in self._form_cache
+            try: return self._run_report(session, state, district, block, panchayat, radio_id, use_cache=True)
+            except MrTrackingHttpError:
+                # Cached viewstate purana ho sakta hai, ek baar fresh form se try karo
+                if not had_cache: raise
+                with self._cache_lock: self._form_cache.pop(key, None)
+                return self._run_report(session, state, district, block, panchayat, radio_id, use_cache=False)
+        except requests.RequestException as e:
+            raise MrTrackingHttpError(f"Network error: {e}") from e
+        finally:
+            self._release_session(session)
+
+    def _run_report(self, session, state, district, block, panchayat, radio_id, use_cache):
+        try: return self._replay_report(session, state, district, block, panchayat, radio_id, use_cache)
+        except (etree.ParserError, IndexError, KeyError) as e: # Khaali / badla hua page
+            raise MrTrackingHttpError(f"Unexpected response: {e!r}") from e
+
+    def _replay_report(self, session, state, district, block, panchayat, radio_id, use_cache):
+        form = self._block_form(session, state, district, block, use_cache)
+        form = self._choose(session, form, PANCHAYAT_FIELD, panchayat)
+
+        fields = self._fields(form)
+        radio = form.xpath(f".//input[@id='{radio_id}']")
+        if not radio: raise MrTrackingHttpError(f"Filter option '{radio_id}' not found.")
+        radio_name = radio[0].get("name", PAYMENT_RADIO_FIELD)
+        fields[radio_name] = radio[0].get("value")
+        target = self._postback_target(radio[0], radio_name)
+        if target is not None:
+            form = self._postback(session, form, fields, target)[1]
+            fields = self._fields(form); fields[radio_name] = radio[0].get("value")
+
+        button = form.xpath(f".//input[@id='{SUBMIT_BUTTON_ID}']")
+        if not button: raise MrTrackingHttpError("Submit button not found.")
+        fields[button[0].get("name")] = button[0].get("value", "")
+        tree, _ = self._postback(session, form, fields)
+        return self._parse_rows(tree)
+
+    def _block_form(self, session, state, district, block, use_cache=True):
+        """State -> District -> Block postbacks, cached per block so back-to-back panchayats skip them."""
+        key = (state.upper(), district.upper(), block)
+        with self._cache_lock: cached = self._form_cache.get(key)
+        if use_cache and cached and time.monotonic() - cached[0] < self.FORM_TTL:
+            return html.fromstring(cached[1], base_url=cached[2]).forms[0]
+
+        _, form = self._load(session.get(self.url, timeout=self.timeout))
+        form = self._choose(session, form, STATE_FIELD, state.upper())
+        form = self._choose(session, form, DISTRICT_FIELD, district.upper())
+        form = self._choose(session, form, BLOCK_FIELD, block)
+        with self._cache_lock: self._form_cache[key] = (time.monotonic(), html.tostring(form.getroottree().getroot()), form.base_url)
+        return form
+
+    @staticmethod
+    def _parse_rows(tree):
+        tables = tree.xpath(TABLE_XPATH)
+        if not tables: raise MrTrackingHttpError("Report table not found in response.")
+        rows = tables[0].xpath(".//tr")[1:] # Skip header row
+        return [[_clean(td.text_content()) for td in row.xpath(".//td")] for row in rows]
@@ -1,34 +1,31 @@
 # tabs/mr_tracking_tab.py
-import json
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, os, re
+import os, re
 from datetime import datetime
 import pandas as pd
 from openpyxl.styles import Font, Alignment, PatternFill
 from openpyxl.utils import get_column_letter
 
-# --- Imports jo add kiye gaye hain ---
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
-# --- End Imports ---
-
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 
 from fpdf import FPDF
-from PIL import Image, ImageDraw, ImageFont # Import Pillow
 from utils import resource_path
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback, wait_for_page_ready
+from .table_extractor import extract_table
+from .mr_tracking_http import MrTrackingHttpEngine, MrTrackingHttpError
 import config  # <-- Make sure config is imported
 
 class MrTrackingTab(BaseAutomationTab):
+    RADIO_PAYMENT_PENDING_ID = "ctl00_ContentPlaceHolder1_Rbtn_pay_1"
+    RADIO_T8_T15_ID = "ctl00_ContentPlaceHolder1_Rbtn_pay_2"
+
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="mr_tracking")
         
@@ -49,6 +46,7 @@ class MrTrackingTab(BaseAutomationTab):
         
         # --- Naya Badlaav: Is tab ka apna driver hoga ---
         self.driver = None
+        self.http_engine = MrTrackingHttpEngine(config.MR_TRACKING_CONFIG["url"]) # Fast mode: bina browser ke report
         
         self._create_widgets()
         self.load_inputs()
@@ -170,6 +168,9 @@ class MrTrackingTab(BaseAutomationTab):
         self.export_button.pack(side="left")
         self.export_format_menu = ctk.CTkOptionMenu(export_frame, values=["Excel (.xlsx)", "PDF (.pdf)", "PNG (.png)"])
         self.export_format_menu.pack(side="left", padx=5)
+        self.results_filter_entry = ctk.CTkEntry(export_frame, width=200, placeholder_text="Filter rows...")
+        self.results_filter_entry.pack(side="left", padx=5)
+        self.results_filter_entry.bind("<KeyRelease>", lambda e: self.results_model.set_filter(self.results_filter_entry.get()))
 
         self.results_tree = ttk.Treeview(results_tab, columns=self.report_headers, show='headings')
         for col in self.report_headers: self.results_tree.heading(col, text=col)
@@ -183,6 +184,8 @@ class MrTrackingTab(BaseAutomationTab):
         scrollbar = ctk.CTkScrollbar(results_tab, command=self.results_tree.yview)
         self.results_tree.configure(yscroll=scrollbar.set); scrollbar.grid(row=1, column=1, sticky='ns')
         self.style_treeview(self.results_tree)
+        self.results_model = self.attach_results_model(self.results_tree, scrollbar)
+        self._setup_treeview_sorting(self.results_tree)
         
         # 3. --- NEW: ABPS Pendency Results Tab ---
         abps_results_tab.grid_columnconfigure(0, weight=1)
@@ -208,6 +211,7 @@ class MrTrackingTab(BaseAutomationTab):
         abps_scrollbar = ctk.CTkScrollbar(abps_results_tab, command=self.abps_results_tree.yview)
         self.abps_results_tree.configure(yscroll=abps_scrollbar.set); abps_scrollbar.grid(row=1, column=1, sticky='ns')
         self.style_treeview(self.abps_results_tree)
+        self.abps_results_model = self.attach_results_model(self.abps_results_tree, abps_scrollbar)
         # --- END NEW TAB ---
 
     def _on_filter_check_changed(self):
@@ -296,41 +300,23 @@ class MrTrackingTab(BaseAutomationTab):
             self._on_filter_check_changed() # Update UI state (enables all)
         
         # Clear all results
-        for item in self.results_tree.get_children(): self.results_tree.delete(item)
-        for item in self.abps_results_tree.get_children(): self.abps_results_tree.delete(item)
+        self.results_model.clear(); self.abps_results_model.clear()
+        self.results_filter_entry.delete(0, "end"); self.results_model.set_filter("")
         self._update_workcode_textbox("")
         
         self.app.log_message(self.log_display, "Form has been reset.")
         self.update_status("Ready", 0.0)
         
-    # --- Naya Function: Naya browser instance banane ke liye (HEADLESS) ---
+    # --- Headless browser ab app ke shared report pool se aata hai ---
     def _get_new_driver(self):
         """
-        Ek naya, alag HEADLESS Chrome browser instance banata hai.
+        Shared pool se ek warm HEADLESS Chrome browser leta hai (zaroorat ho to naya start hota hai).
         """
-        self.app.log_message(self.log_display, "Naya Headless Chrome browser shuru kar raha hoon...", "info")
-        try:
-            chrome_options = ChromeOptions()
-            
-            # --- YEH LINE HEADLESS MODE ENABLE KARTI HAI ---
-            chrome_options.add_argument("--headless")
-            # --- END HEADLESS ---
-
-            # Headless browser ko ek size dena zaroori hai
-            chrome_options.add_argument("--window-size=1920,1080") 
-            chrome_options.add_argument("--disable-gpu")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"]) # "Chrome is being controlled" banner hatane ke liye
-            
-            # webdriver-manager ka istemaal karke driver manage karein
-            service = ChromeService(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            self.app.log_message(self.log_display, "Headless browser safaltapoorvak shuru ho gaya.", "info")
-            return driver
-        except Exception as e:
-            self.app.log_message(self.log_display, f"Headless browser shuru karne mein BADI GADBAD: {e}", "error")
-            messagebox.showerror("Browser Error", f"Naya Headless Chrome browser shuru nahi ho saka.\n\nError: {e}\n\nKya Chrome installed hai?")
-            return None
+        self.app.log_message(self.log_display, "Headless Chrome browser le raha hoon (report pool)...", "info")
+        driver = self.app.get_report_driver()
+        if driver: self.app.log_message(self.log_display, "Headless browser taiyaar hai.", "info")
+        else: self.app.log_message(self.log_display, "Headless browser shuru karne mein BADI GADBAD.", "error")
+        return driver
 
     # --- Badlaav: `start_automation` ab naya driver banayega ---
     def start_automation(self):
@@ -338,8 +324,7 @@ class MrTrackingTab(BaseAutomationTab):
         self.run_emb_entry_button.pack_forget() # Hide button on new run
         self.run_zero_mr_button.pack_forget() # <-- New: Hide button
         
-        for item in self.results_tree.get_children(): self.results_tree.delete(item)
-        for item in self.abps_results_tree.get_children(): self.abps_results_tree.delete(item) # --- NEW ---
+        self.results_model.clear(); self.abps_results_model.clear()
         self._update_workcode_textbox("") # Clear workcode list
         
         inputs = {
@@ -367,10 +352,12 @@ class MrTrackingTab(BaseAutomationTab):
             messagebox.showwarning("Automation Jaari Hai", "Report generation pehle se chal raha hai.")
             return
         
-        self.driver = self._get_new_driver() # Naya driver banayein
-        if not self.driver:
-            self.app.log_message(self.log_display, "ERROR: WebDriver nahi mila. Automation ruka.", "error")
-            return # Driver nahi mila toh kuch mat karo
+        # Fast mode (HTTP) mein browser tabhi banta hai jab zaroorat ho (fallback / ABPS drill-down)
+        if not config.MR_TRACKING_CONFIG.get("http_engine", True):
+            self.driver = self._get_new_driver() # Naya driver banayein
+            if not self.driver:
+                self.app.log_message(self.log_display, "ERROR: WebDriver nahi mila. Automation ruka.", "error")
+                return # Driver nahi mila toh kuch mat karo
         
         # UI ko lock karein
         self.app.after(0, self.set_ui_state, True) 
@@ -388,91 +375,23 @@ class MrTrackingTab(BaseAutomationTab):
         self.app.log_message(self.log_display, "Starting MR Tracking automation...")
         
         self.zero_mr_data = [] # <-- NEW: Initialize list for Zero MR data
+        self.trace_begin()
         
         try:
-            # driver = self.app.get_driver() # <-- YEH LINE HATA DI GAYI
-            driver = self.driver # <-- NAYA: self.driver ka istemaal karein
-            if not driver:
-                self.app.log_message(self.log_display, "ERROR: Browser driver not found.", "error")
-                return # Exit early
-                
-            wait = WebDriverWait(driver, 20)
-            
-            url = config.MR_TRACKING_CONFIG["url"]
-            self.app.after(0, self.app.set_status, "Navigating to MR Tracking...")
-            self.app.after(0, self.update_status, "Navigating...", 0.1)
-            self.app.log_message(self.log_display, f"Navigating to MR Tracking page...")
-            driver.get(url)
-            
-            main_window_handle = driver.current_window_handle # Store main window
-            
-            # --- Define element IDs from the HTML ---
-            STATE_ID = "ctl00_ContentPlaceHolder1_ddl_state"
-            DIST_ID = "ctl00_ContentPlaceHolder1_ddl_dist"
-            BLOCK_ID = "ctl00_ContentPlaceHolder1_ddl_blk"
-            PANCH_ID = "ctl00_ContentPlaceHolder1_ddl_pan"
-            RADIO_PAYMENT_PENDING_ID = "ctl00_ContentPlaceHolder1_Rbtn_pay_1" # <-- Renamed
-            RADIO_T8_T15_ID = "ctl00_ContentPlaceHolder1_Rbtn_pay_2" # <-- NEW
-            SUBMIT_BTN_ID = "ctl00_ContentPlaceHolder1_Button1"
-            TABLE_XPATH = "//table[@bordercolor='#EBEBEB' and .//b[text()='SNo.']]"
-
-            def wait_for_dropdown(dropdown_id, step_name, progress):
-                self.app.after(0, self.app.set_status, f"Waiting for {step_name}...")
-                self.app.after(0, self.update_status, f"Waiting for {step_name}...", progress)
-                self.app.log_message(self.log_display, f"Waiting for dropdown {dropdown_id} to populate...")
-                wait.until(
-                    EC.presence_of_element_located((By.XPATH, f"//select[@id='{dropdown_id}']/option[position()>1]"))
-                )
-                self.app.log_message(self.log_display, "Dropdown populated.")
-                time.sleep(0.5) # Add a small buffer for the UI to settle
-
-            self.app.after(0, self.app.set_status, f"Selecting State: {inputs['state']}")
-            self.app.after(0, self.update_status, "Selecting State...", 0.15)
-            self.app.log_message(self.log_display, f"Selecting State: {inputs['state']}")
-            state_select = Select(wait.until(EC.element_to_be_clickable((By.ID, STATE_ID))))
-            state_select.select_by_visible_text(inputs['state'].upper())
-            wait_for_dropdown(DIST_ID, "Districts", 0.2)
-
-            self.app.after(0, self.app.set_status, f"Selecting District: {inputs['district']}")
-            self.app.after(0, self.update_status, "Selecting District...", 0.25)
-            self.app.log_message(self.log_display, f"Selecting District: {inputs['district']}")
-            dist_select = Select(wait.until(EC.element_to_be_clickable((By.ID, DIST_ID))))
-            dist_select.select_by_visible_text(inputs['district'].upper())
-            wait_for_dropdown(BLOCK_ID, "Blocks", 0.3)
-
-            self.app.after(0, self.app.set_status, f"Selecting Block: {inputs['block']}")
-            self.app.after(0, self.update_status, "Selecting Block...", 0.35)
-            self.app.log_message(self.log_display, f"Selecting Block: {inputs['block']}")
-            Select(wait.until(EC.element_to_be_clickable((By.ID, BLOCK_ID)))).select_by_visible_text(inputs['block'])
-            
-            self.app.after(0, self.app.set_status, f"Selecting Panchayat: {inputs['panchayat']}")
-            self.app.after(0, self.update_status, "Selecting Panchayat...", 0.45)
-            self.app.log_message(self.log_display, f"Selecting Panchayat: {inputs['panchayat']}")
-            Select(wait.until(EC.element_to_be_clickable((By.ID, PANCH_ID)))).select_by_visible_text(inputs['panchayat'])
-            
-            self.app.after(0, self.app.set_status, "Setting filter...")
-            self.app.after(0, self.update_status, "Setting filter...", 0.5)
-            
-            # --- NEW: Radio button selection logic ---
-            if inputs['zero_mr_filter']:
-                self.app.log_message(self.log_display, "Selecting '...T+8 and T+15'")
-                wait.until(EC.element_to_be_clickable((By.ID, RADIO_T8_T15_ID))).click()
-            else:
-                # Both 'Pending for filling' and 'Pending for ABPS' use this same base report
-                self.app.log_message(self.log_display, "Selecting 'Where payment is pending'")
-                wait.until(EC.element_to_be_clickable((By.ID, RADIO_PAYMENT_PENDING_ID))).click()
-            # --- END NEW logic ---
-            
-            self.app.after(0, self.app.set_status, "Submitting form...")
-            self.app.after(0, self.update_status, "Submitting form...", 0.55)
-            self.app.log_message(self.log_display, "Submitting form...")
-            wait.until(EC.element_to_be_clickable((By.ID, SUBMIT_BTN_ID))).click()
-            
-            self.app.after(0, self.app.set_status, "Waiting for report...")
-            self.app.after(0, self.update_status, "Waiting for report...", 0.6)
-            self.app.log_message(self.log_display, "Waiting for report table...")
-            table = wait.until(EC.presence_of_element_located((By.XPATH, TABLE_XPATH)))
-            rows = table.find_elements(By.XPATH, ".//tr[position()>1]") # Skip header row
+            driver, wait, main_window_handle = None, None, None
+            radio_id = self.RADIO_T8_T15_ID if inputs['zero_mr_filter'] else self.RADIO_PAYMENT_PENDING_ID
+            rows = None
+            if config.MR_TRACKING_CONFIG.get("http_engine", True):
+                with self.trace_step("report (http)"): rows = self._fetch_rows_http(inputs, radio_id)
+            if rows is None:
+                # --- Browser engine (fallback) ---
+                with self.trace_step("start browser"): driver = self._ensure_driver()
+                if not driver:
+                    self.app.log_message(self.log_display, "ERROR: Browser driver not found.", "error")
+                    return # Exit early
+                wait = WebDriverWait(driver, 20)
+                main_window_handle = driver.current_window_handle # Store main window
+                with self.trace_step("report (browser)"): rows = self._fetch_rows_browser(driver, wait, inputs)
             
             total_rows = len(rows)
             if total_rows == 0:
@@ -489,22 +408,18 @@ class MrTrackingTab(BaseAutomationTab):
             pending_filling_count = 0
             abps_pending_mrs = [] # --- To store data for drill-down ---
             
-            for i, row in enumerate(rows):
+            rows_done = self.trace_mark("process rows", rows=total_rows)
+            for i, row_data in enumerate(rows):
                 if self.app.stop_events[self.automation_key].is_set():
                     self.app.log_message(self.log_display, "Stop signal received.", "warning")
                     break
                 
                 # Progress from 0.6 to 0.8
                 progress = 0.6 + ( (i + 1) / total_rows ) * 0.2
-                status_msg = f"Processing row {i+1}/{total_rows}"
-                self.app.after(0, self.app.set_status, status_msg)
-                self.app.after(0, self.update_status, status_msg, progress)
+                self.progress.update(f"Processing row {i+1}/{total_rows}", progress)
                 
-                cells = row.find_elements(By.TAG_NAME, "td")
-                if not cells or len(cells) < len(self.report_headers):
+                if not row_data or len(row_data) < len(self.report_headers):
                     continue
-                    
-                row_data = [cell.text.strip() for cell in cells]
                 
                 panchayat_name = row_data[1] # <-- For Zero MR
                 muster_roll_no = row_data[2] # <-- For Zero MR
@@ -540,7 +455,7 @@ class MrTrackingTab(BaseAutomationTab):
                     })
                 
                 # Row passes filters
-                self.app.after(0, lambda data=tuple(row_data): self.results_tree.insert("", "end", values=data))
+                self.results_model.add(row_data)
                 displayed_rows += 1
                 
                 if work_code:
@@ -558,6 +473,7 @@ class MrTrackingTab(BaseAutomationTab):
                 if is_pending_filling:
                     pending_filling_count += 1
 
+            rows_done()
             if self.app.stop_events[self.automation_key].is_set():
                  self.app.log_message(self.log_display, "Automation stopped by user.", "warning")
                  self.success_message = None 
@@ -584,17 +500,22 @@ class MrTrackingTab(BaseAutomationTab):
                 
                 self.app.log_message(self.log_display, f"Found {len(wagelists_to_search)} unique wagelists to scan.")
                 
+                if not driver: # Fast mode mein report bina browser ke aayi thi, drill-down ke liye browser chahiye
+                    with self.trace_step("start browser"): driver = self._ensure_driver()
+                    if not driver: raise RuntimeError("Headless browser could not be started for the ABPS drill-down.")
+                    wait = WebDriverWait(driver, 20)
+                    main_window_handle = driver.current_window_handle
+                
                 total_wl = len(wagelists_to_search)
                 for i, (wagelist_no, mr_list) in enumerate(wagelists_to_search.items()):
                     if self.app.stop_events[self.automation_key].is_set(): break
                     
                     # Progress from 0.8 to 1.0
                     progress = 0.8 + ( (i + 1) / total_wl ) * 0.2
-                    status_msg = f"Scanning Wagelist {i+1}/{total_wl} ({wagelist_no})"
-                    self.app.after(0, self.app.set_status, status_msg)
-                    self.app.after(0, self.update_status, status_msg, progress)
+                    self.progress.update(f"Scanning Wagelist {i+1}/{total_wl} ({wagelist_no})", progress)
                     
-                    self._search_wagelist_for_pending_abps(driver, wait, inputs, wagelist_no, mr_list, main_window_handle)
+                    with self.trace_item(wagelist_no):
+                        self._search_wagelist_for_pending_abps(driver, wait, inputs, wagelist_no, mr_list, main_window_handle)
 
                 # Switch back to main window just in case
                 if driver.current_window_handle != main_window_handle:
@@ -635,13 +556,11 @@ class MrTrackingTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Unexpected Error")
             self.success_message = None
         finally:
-            # --- NAYA BADLAAV: Driver ko yahan quit karein ---
-            if self.driver: # self.driver ko check karein
-                try:
-                    self.driver.quit()
-                    self.app.after(0, self.app.log_message, self.log_display, "Automation ne browser ko band kar diya hai.", "info")
-                except Exception as e:
-                    self.app.after(0, self.app.log_message, self.log_display, f"Browser band karne mein error: {e}", "warning")
+            self.trace_finish()
+            # --- Driver ko yahan pool mein wapas karein ---
+            if self.driver: # Browser band nahi hota, agle run ke liye pool mein wapas jaata hai
+                self.app.report_pool.release(self.driver)
+                self.app.after(0, self.app.log_message, self.log_display, "Headless browser report pool mein wapas diya.", "info")
             
             self.driver = None # Tab ka driver state reset karein
             # --- End Badlaav ---
@@ -653,8 +572,7 @@ class MrTrackingTab(BaseAutomationTab):
             final_tab_status = "Stopped" if self.app.stop_events[self.automation_key].is_set() else \
                               ("Finished" if hasattr(self, 'success_message') and self.success_message else "Failed")
 
-            self.app.after(0, self.app.set_status, final_app_status)
-            self.app.after(0, self.update_status, final_tab_status, 1.0)
+            self.progress.update(final_tab_status, 1.0, app_message=final_app_status, immediate=True)
 
             if not self.app.stop_events[self.automation_key].is_set():
                  self.app.after(5000, lambda: self.app.set_status("Ready")) # Reset app status
@@ -672,14 +590,108 @@ class MrTrackingTab(BaseAutomationTab):
                     self.app.after(0, lambda: self.run_emb_entry_button.pack(side="left", padx=(10, 0)))
             # --- END NEW logic ---
 
+    def _ensure_driver(self):
+        """Starts this tab's headless browser on first use (HTTP engine ko browser nahi chahiye)."""
+        if not self.driver: self.driver = self._get_new_driver()
+        return self.driver
+
+    def _fetch_rows_http(self, inputs, radio_id):
+        """Runs the report over plain HTTP. Returns None if the browser engine should be used instead."""
+        self.app.after(0, self.app.set_status, "Fetching MR Tracking report...")
+        self.app.after(0, self.update_status, "Fetching report (fast mode)...", 0.3)
+        self.app.log_message(self.log_display, "Fetching report without browser (fast mode)...")
+        try:
+            rows = self.http_engine.fetch_rows(inputs['state'], inputs['district'], inputs['block'], inputs['panchayat'], radio_id)
+            self.app.after(0, self.update_status, "Report received.", 0.6)
+            return rows
+        except MrTrackingHttpError as e:
+            self.app.log_message(self.log_display, f"Fast mode failed ({e}). Switching to browser...", "warning")
+            return None
+
+    def _fetch_rows_browser(self, driver, wait, inputs):
+        """Drives the report form in the headless browser and returns the table rows."""
+        url = config.MR_TRACKING_CONFIG["url"]
+        self.app.after(0, self.app.set_status, "Navigating to MR Tracking...")
+        self.app.after(0, self.update_status, "Navigating...", 0.1)
+        self.app.log_message(self.log_display, f"Navigating to MR Tracking page...")
+        driver.get(url)
+        
+        # --- Define element IDs from the HTML ---
+        STATE_ID = "ctl00_ContentPlaceHolder1_ddl_state"
+        DIST_ID = "ctl00_ContentPlaceHolder1_ddl_dist"
+        BLOCK_ID = "ctl00_ContentPlaceHolder1_ddl_blk"
+        PANCH_ID = "ctl00_ContentPlaceHolder1_ddl_pan"
+        RADIO_PAYMENT_PENDING_ID, RADIO_T8_T15_ID = self.RADIO_PAYMENT_PENDING_ID, self.RADIO_T8_T15_ID
+        SUBMIT_BTN_ID = "ctl00_ContentPlaceHolder1_Button1"
+        TABLE_XPATH = "//table[@bordercolor='#EBEBEB' and .//b[text()='SNo.']]"
+
+        def wait_for_dropdown(dropdown_id, step_name, progress):
+            self.app.after(0, self.app.set_status, f"Waiting for {step_name}...")
+            self.app.after(0, self.update_status, f"Waiting for {step_name}...", progress)
+            self.app.log_message(self.log_display, f"Waiting for dropdown {dropdown_id} to populate...")
+            wait.until(
+                EC.presence_of_element_located((By.XPATH, f"//select[@id='{dropdown_id}']/option[position()>1]"))
+            )
+            self.app.log_message(self.log_display, "Dropdown populated.")
+            wait_for_page_ready(driver) # Let the UI settle
+
+        self.app.after(0, self.app.set_status, f"Selecting State: {inputs['state']}")
+        self.app.after(0, self.update_status, "Selecting State...", 0.15)
+        self.app.log_message(self.log_display, f"Selecting State: {inputs['state']}")
+        state_select = Select(wait.until(EC.element_to_be_clickable((By.ID, STATE_ID))))
+        state_select.select_by_visible_text(inputs['state'].upper())
+        wait_for_dropdown(DIST_ID, "Districts", 0.2)
+
+        self.app.after(0, self.app.set_status, f"Selecting District: {inputs['district']}")
+        self.app.after(0, self.update_status, "Selecting District...", 0.25)
+        self.app.log_message(self.log_display, f"Selecting District: {inputs['district']}")
+        dist_select = Select(wait.until(EC.element_to_be_clickable((By.ID, DIST_ID))))
+        dist_select.select_by_visible_text(inputs['district'].upper())
+        wait_for_dropdown(BLOCK_ID, "Blocks", 0.3)
+
+        self.app.after(0, self.app.set_status, f"Selecting Block: {inputs['block']}")
+        self.app.after(0, self.update_status, "Selecting Block...", 0.35)
+        self.app.log_message(self.log_display, f"Selecting Block: {inputs['block']}")
+        Select(wait.until(EC.element_to_be_clickable((By.ID, BLOCK_ID)))).select_by_visible_text(inputs['block'])
+        
+        self.app.after(0, self.app.set_status, f"Selecting Panchayat: {inputs['panchayat']}")
+        self.app.after(0, self.update_status, "Selecting Panchayat...", 0.45)
+        self.app.log_message(self.log_display, f"Selecting Panchayat: {inputs['panchayat']}")
+        Select(wait.until(EC.element_to_be_clickable((By.ID, PANCH_ID)))).select_by_visible_text(inputs['panchayat'])
+        
+        self.app.after(0, self.app.set_status, "Setting filter...")
+        self.app.after(0, self.update_status, "Setting filter...", 0.5)
+        
+        # --- NEW: Radio button selection logic ---
+        if inputs['zero_mr_filter']:
+            self.app.log_message(self.log_display, "Selecting '...T+8 and T+15'")
+            wait.until(EC.element_to_be_clickable((By.ID, RADIO_T8_T15_ID))).click()
+        else:
+            # Both 'Pending for filling' and 'Pending for ABPS' use this same base report
+            self.app.log_message(self.log_display, "Selecting 'Where payment is pending'")
+            wait.until(EC.element_to_be_clickable((By.ID, RADIO_PAYMENT_PENDING_ID))).click()
+        # --- END NEW logic ---
+        
+        self.app.after(0, self.app.set_status, "Submitting form...")
+        self.app.after(0, self.update_status, "Submitting form...", 0.55)
+        self.app.log_message(self.log_display, "Submitting form...")
+        wait.until(EC.element_to_be_clickable((By.ID, SUBMIT_BTN_ID))).click()
+        
+        self.app.after(0, self.app.set_status, "Waiting for report...")
+        self.app.after(0, self.update_status, "Waiting for report...", 0.6)
+        self.app.log_message(self.log_display, "Waiting for report table...")
+        table = wait.until(EC.presence_of_element_located((By.XPATH, TABLE_XPATH)))
+        return extract_table(driver, table) # Skip header row, whole table in one call
+
     # --- NEW METHOD to search wagelist ---
     def _search_wagelist_for_pending_abps(self, driver, wait, inputs, wagelist_no, mr_list, main_window_handle):
         # (Is function mein koi badlaav nahi hai)
         try:
             # Open homesearch in a new tab to avoid issues
             self.app.log_message(self.log_display, f"   Opening homesearch tab for {wagelist_no}...")
+            handles_before = len(driver.window_handles)
             driver.execute_script("window.open(arguments[0], '_blank');", "https://mnregaweb4.nic.in/netnrega/homesearch.htm")
-            time.sleep(1) # Give tab time to open
+            wait.until(EC.number_of_windows_to_be(handles_before + 1)) # Wait for the tab to open
             
             popup_handle = [handle for handle in driver.window_handles if handle != main_window_handle][-1]
             driver.switch_to.window(popup_handle)
@@ -711,12 +723,12 @@ class MrTrackingTab(BaseAutomationTab):
             
             # Action 3: Select District (This causes Postback 3)
             self.app.log_message(self.log_display, f"   Selecting District: {inputs['district'].upper()}...")
-            dist_select = Select(driver.find_element(By.ID, "ddl_district"))
-            dist_select.select_by_visible_text(inputs['district'].upper()) # Use text
+            dist_element = driver.find_element(By.ID, "ddl_district")
+            Select(dist_element).select_by_visible_text(inputs['district'].upper()) # Use text
             
-            # Add the simple time.sleep(2) to wait for Postback 3
-            self.app.log_message(self.log_display, "   Waiting for final postback (2 sec)...")
-            time.sleep(2)
+            # Wait for Postback 3
+            self.app.log_message(self.log_display, "   Waiting for final postback...")
+            wait_for_postback(driver, dist_element)
             self.app.log_message(self.log_display, "   ...Wait complete.")
 
             # Action 4: Enter Wagelist (using your corrected ID)
@@ -752,12 +764,11 @@ class MrTrackingTab(BaseAutomationTab):
             self.app.log_message(self.log_display, f"   Scanning {wagelist_no} for pending workers...")
             # Use the 'lb_main' span to find the table, as it's a sibling/parent
             details_table = wait.until(EC.presence_of_element_located((By.XPATH, "//span[@id='lb_main']/ancestor::center/table[1]")))
-            worker_rows = details_table.find_elements(By.XPATH, ".//tr[position() > 1]") # Skip header
+            worker_rows = extract_table(driver, details_table) # Skip header
             
             found_workers = set() # De-duplicate workers *within* this wagelist
             
-            for row in worker_rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
+            for cells in worker_rows:
                 
                 # --- FIX: Check cell count based on the provided HTML (15 columns) ---
                 if len(cells) < 15: continue 
@@ -766,9 +777,9 @@ class MrTrackingTab(BaseAutomationTab):
                 # 8 = Reg No. (JH-22-003...)
                 # 9 = Applicant Name
                 # 12 = FTO No.
-                jobcard_no = cells[8].text.strip()
-                applicant_name = cells[9].text.strip()
-                fto_no = cells[12].text.strip()
+                jobcard_no = cells[8]
+                applicant_name = cells[9]
+                fto_no = cells[12]
                 
                 if not fto_no and (jobcard_no, applicant_name) not in found_workers:
                     found_workers.add((jobcard_no, applicant_name))
@@ -776,7 +787,7 @@ class MrTrackingTab(BaseAutomationTab):
                     # Log this worker for *each* MR that uses this wagelist
                     for mr in mr_list:
                         result_data = (mr["panchayat"], mr["mr_no"], mr["work_code"], wagelist_no, applicant_name, jobcard_no)
-                        self.app.after(0, lambda data=result_data: self.abps_results_tree.insert("", "end", values=data))
+                        self.abps_results_model.add(result_data)
             
             if not found_workers:
                  self.app.log_message(self.log_display, f"   No pending workers found in {wagelist_no}.")
@@ -792,7 +803,6 @@ class MrTrackingTab(BaseAutomationTab):
                     driver.close()
             driver.switch_to.window(main_window_handle)
             self.app.log_message(self.log_display, "   ...Finished wagelist scan.")
-            time.sleep(0.5) # Small pause
 
     def _run_mr_payment(self):
         # (Is function mein koi badlaav nahi hai)
@@ -864,7 +874,7 @@ class MrTrackingTab(BaseAutomationTab):
 
     def export_report(self):
         # (Is function mein koi badlaav nahi hai)
-        if not self.results_tree.get_children():
+        if not self.results_model.rows():
             messagebox.showinfo("No Data", "There are no results to export.")
             return
             
@@ -877,7 +887,7 @@ class MrTrackingTab(BaseAutomationTab):
         
         # --- Prepare data from Treeview ---
         headers = self.results_tree['columns']
-        data = [self.results_tree.item(item, 'values') for item in self.results_tree.get_children()]
+        data = self.results_model.rows()
         
         # --- Prepare Title ---
         title = f"MR Tracking Report Panchayat - {panchayat}"
@@ -950,14 +960,12 @@ class MrTrackingTab(BaseAutomationTab):
                 title="Save Report As"
             )
             if not file_path: return
-            success = self._save_to_png(data, headers, title, date_str, file_path)
-            if success:
-                messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}")
+            self._save_to_png(data, headers, title, date_str, file_path)
 
     # --- NEW: Export for ABPS Tab ---
     def _export_abps_report(self):
         # (Is function mein koi badlaav nahi hai)
-        if not self.abps_results_tree.get_children():
+        if not self.abps_results_model.rows():
             messagebox.showinfo("No Data", "There are no ABPS results to export.")
             return
             
@@ -968,7 +976,7 @@ class MrTrackingTab(BaseAutomationTab):
         current_date_str = datetime.now().strftime("%d-%b-%Y")
         
         headers = self.abps_report_headers
-        data = [self.abps_results_tree.item(item, 'values') for item in self.abps_results_tree.get_children()]
+        data = self.abps_results_model.rows()
         
         title = f"ABPS Pendency Report - {panchayat}"
         date_str = f"Date - {datetime.now().strftime('%d-%m-%Y')}"
@@ -1136,180 +1144,10 @@ class MrTrackingTab(BaseAutomationTab):
             return False
 
     def _save_to_png(self, data, headers, title, date_str, file_path):
-        # (Is function mein koi badlaav nahi hai)
-        """Generates a professional-looking report as a PNG image."""
-        try:
-            # --- Font setup ---
-            try:
-                font_path_regular = resource_path("assets/fonts/NotoSansDevanagari-Regular.ttf")
-                font_path_bold = resource_path("assets/fonts/NotoSansDevanagari-Bold.ttf")
-                font_title = ImageFont.truetype(font_path_bold, 28)
-                font_date = ImageFont.truetype(font_path_regular, 18)
-                font_header = ImageFont.truetype(font_path_bold, 16)
-                font_body = ImageFont.truetype(font_path_regular, 14)
-            except IOError:
-                self.app.log_message(self.log_display, "Warning: NotoSansDevanagari fonts not found. Using default PIL fonts. Ensure 'assets/fonts' exist.", "warning")
-                font_title = ImageFont.load_default(size=28)
-                font_date = ImageFont.load_default(size=18)
-                font_header = ImageFont.load_default(size=16)
-                font_body = ImageFont.load_default(size=14)
-
-            # --- Image dimensions and colors ---
-            img_width = 2400  # High resolution for readability
-            margin_x = 80
-            margin_y = 60
-            
-            header_bg_color = (220, 235, 255) # Light blue
-            row_even_bg_color = (255, 255, 255) # White
-            row_odd_bg_color = (245, 245, 245)  # Light grey
-            text_color = (0, 0, 0) # Black
-            border_color = (180, 180, 180) # Grey
-
-            draw_start_y = margin_y # Y position to start drawing content
-
-            # --- Calculate column widths (heuristic approach) ---
-            # Max width for each column based on content and header
-            col_widths_pixels = []
-            min_col_width = 100 # Minimum width for a column
-            
-            # Calculate initial widths based on header text
-            for i, header in enumerate(headers):
-                text_width = font_header.getlength(header)
-                col_widths_pixels.append(max(min_col_width, text_width + 40)) # Add padding
-
-            # Adjust for body content
-            for row_data in data:
-                for i, cell_text in enumerate(row_data):
-                    lines = self._wrap_text(str(cell_text), font_body, col_widths_pixels[i] - 20) # Simulate wrap for width calc
-                    max_text_width = 0
-                    for line in lines:
-                        max_text_width = max(max_text_width, font_body.getlength(line))
-                    col_widths_pixels[i] = max(col_widths_pixels[i], max_text_width + 40) # Add padding
-
-            # Distribute remaining space if total width is less than img_width - 2*margin_x
-            current_total_width = sum(col_widths_pixels)
-            available_width = img_width - 2 * margin_x
-            if current_total_width < available_width:
-                extra_space_per_col = (available_width - current_total_width) / len(col_widths_pixels)
-                col_widths_pixels = [w + extra_space_per_col for w in col_widths_pixels]
-
-            current_total_width = sum(col_widths_pixels) # Re-calculate after distribution
-            
-            # Estimate total height required
-            estimated_row_height = font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1] + 20 # Base height + padding
-            estimated_header_height = font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1] + 20 # Base height + padding
-
-            # Title and date height
-            title_bbox = font_title.getbbox(title)
-            date_bbox = font_date.getbbox(date_str)
-            title_height = title_bbox[3] - title_bbox[1]
-            date_height = date_bbox[3] - date_bbox[1]
-
-            total_estimated_height = margin_y * 2 + title_height + date_height + 20 + estimated_header_height + (len(data) * estimated_row_height)
-            
-            # Start with a base image, will expand if needed
-            img = Image.new("RGB", (img_width, int(total_estimated_height)), (255, 255, 255))
-            draw = ImageDraw.Draw(img)
-
-            current_y = margin_y
-            
-            # --- Draw Title ---
-            title_text_width = font_title.getlength(title)
-            title_x = (img_width - title_text_width) / 2
-            draw.text((title_x, current_y), title, font=font_title, fill=text_color)
-            current_y += title_height + 5
-
-            # --- Draw Date ---
-            date_text_width = font_date.getlength(date_str)
-            date_x = img_width - margin_x - date_text_width
-            draw.text((date_x, current_y), date_str, font=font_date, fill=text_color)
-            current_y += date_height + 20 # Space after date and before table
-
-            # --- Draw Headers ---
-            header_y_start = current_y
-            header_height = 0
-            # Calculate max header height considering wrapping
-            for i, header in enumerate(headers):
-                wrapped_header = self._wrap_text(header, font_header, col_widths_pixels[i] - 10)
-                line_height = font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1] # Basic line height
-                header_height = max(header_height, len(wrapped_header) * line_height + 10) # Add padding
-            
-            # Draw header cells
-            current_x = margin_x
-            for i, header in enumerate(headers):
-                draw.rectangle([current_x, header_y_start, current_x + col_widths_pixels[i], header_y_start + header_height], fill=header_bg_color, outline=border_color, width=1)
-                
-                wrapped_header = self._wrap_text(header, font_header, col_widths_pixels[i] - 20)
-                text_y = header_y_start + (header_height - len(wrapped_header) * font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1] ) / 2 # Center vertically
-                
-                for line in wrapped_header:
-                    line_width = font_header.getlength(line)
-                    draw.text((current_x + (col_widths_pixels[i] - line_width) / 2, text_y), line, font=font_header, fill=text_color)
-                    text_y += font_header.getbbox("Tg")[3] - font_header.getbbox("Tg")[1] # Move to next line
-                current_x += col_widths_pixels[i]
-            current_y += header_height
-
-            # --- Draw Data Rows ---
-            for row_idx, row_data in enumerate(data):
-                row_bg_color = row_even_bg_color if row_idx % 2 == 0 else row_odd_bg_color
-
-                # Calculate row height dynamically based on content wrapping
-                max_row_text_height = 0
-                temp_wrapped_cells = []
-                for i, cell_text in enumerate(row_data):
-                    wrapped_lines = self._wrap_text(str(cell_text), font_body, col_widths_pixels[i] - 20) # 20 for internal padding
-                    temp_wrapped_cells.append(wrapped_lines)
-                    line_height = font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1] # Basic line height
-                    max_row_text_height = max(max_row_text_height, len(wrapped_lines) * line_height)
-
-                row_data_height = max_row_text_height + 10 # Add vertical padding
-
-                # If current_y plus next row height exceeds image height, expand image
-                if current_y + row_data_height + margin_y > img.height:
-                    new_height = int(img.height + (row_data_height + margin_y) * 1.5) # Expand by 1.5 rows
-                    new_img = Image.new("RGB", (img_width, new_height), (255, 255, 255))
-                    new_img.paste(img, (0, 0))
-                    img = new_img
-                    draw = ImageDraw.Draw(img) # Update draw object for new image
-
-                current_x = margin_x
-                for i, cell_text in enumerate(row_data):
-                    # Draw cell background
-                    draw.rectangle([current_x, current_y, current_x + col_widths_pixels[i], current_y + row_data_height], fill=row_bg_color, outline=border_color, width=1)
-                    
-                    # Draw wrapped text
-                    wrapped_lines = temp_wrapped_cells[i]
-                    text_y = current_y + 5 # Small top padding
-                    for line in wrapped_lines:
-                        draw.text((current_x + 10, text_y), line, font=font_body, fill=text_color) # 10 for left padding
-                        text_y += font_body.getbbox("Tg")[3] - font_body.getbbox("Tg")[1] # Move to next line
-                    current_x += col_widths_pixels[i]
-                current_y += row_data_height
-
-            # Crop image to actual content if it expanded too much
-            final_img = img.crop((0, 0, img_width, current_y + margin_y))
-            final_img.save(file_path, "PNG", dpi=(300, 300)) # Save at 300 DPI for quality
-            return True
-        except Exception as e:
-            messagebox.showerror("PNG Export Error", f"Could not generate PNG report.\nError: {e}", parent=self)
-            return False
-
-    def _wrap_text(self, text, font, max_width):
-        # (Is function mein koi badlaav nahi hai)
-        """Helper to wrap text for Pillow."""
-        if not text:
-            return [""]
-        words = text.split(' ')
-        lines = []
-        current_line = []
-        for word in words:
-            if font.getlength(' '.join(current_line + [word])) <= max_width:
-                current_line.append(word)
-            else:
-                lines.append(' '.join(current_line))
-                current_line = [word]
-        lines.append(' '.join(current_line))
-        return lines
+        """Saves the report as a PNG in a worker process (base_tab.render_report_image) without blocking the UI."""
+        # Column proportions same as the PDF export
+        self.generate_report_image(data, headers, title, date_str, file_path, col_ratios=[10, 20, 25, 30, 15, 45, 20, 45, 20, 25, 25, 20, 20, 20],
+                                   on_done=lambda: messagebox.showinfo("Success", f"PNG report saved successfully to:\n{file_path}"))
 
     def save_inputs(self, inputs):
         # (Is function mein koi badlaav nahi hai)
@@ -1321,9 +1159,7 @@ class MrTrackingTab(BaseAutomationTab):
             'panchayat': inputs.get('panchayat')
         }
         try:
-            config_file = self.app.get_data_path("mr_tracking_inputs.json")
-            with open(config_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
+            self.app.state_store.set("mr_tracking_inputs", save_data)
         except Exception as e:
             print(f"Error saving MR Tracking inputs: {e}")
 
@@ -1331,11 +1167,8 @@ class MrTrackingTab(BaseAutomationTab):
         # (Is function mein koi badlaav nahi hai)
         """Loads saved inputs for this tab."""
         try:
-            config_file = self.app.get_data_path("mr_tracking_inputs.json")
-            if not os.path.exists(config_file): return
-            
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            data = self.app.state_store.get("mr_tracking_inputs")
+            if data is None: return
             
             self.state_entry.delete(0, tkinter.END)
             self.state_entry.insert(0, data.get('state', ''))
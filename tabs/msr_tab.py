@@ -12,6 +12,7 @@ from selenium.common.exceptions import StaleElementReferenceException, NoSuchEle
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback
 
 class MsrTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -46,7 +47,7 @@ class MsrTab(BaseAutomationTab):
 
         ctk.CTkLabel(controls_frame, text="ℹ️ Note: If using GP Login, Panchayat selection is not required and will be skipped.", text_color="gray50").grid(row=1, column=0, columnspan=2, sticky='w', padx=15, pady=(10,0))
 
-        action_frame = self._create_action_buttons(parent_frame=controls_frame)
+        action_frame = self._create_action_buttons(parent_frame=controls_frame, parallel_workers=True)
         action_frame.grid(row=2, column=0, columnspan=2, sticky='ew', pady=(15, 15))
 
         data_notebook = ctk.CTkTabview(self)
@@ -92,6 +93,7 @@ class MsrTab(BaseAutomationTab):
         self.results_tree.grid(row=1, column=0, sticky='nsew')
         scrollbar = ctk.CTkScrollbar(results_frame, command=self.results_tree.yview)
         self.results_tree.configure(yscroll=scrollbar.set); scrollbar.grid(row=1, column=1, sticky='ns')
+        self.attach_results_model(self.results_tree, scrollbar)
         self.style_treeview(self.results_tree); self._setup_treeview_sorting(self.results_tree)
     
     def load_data_from_mr_tracking(self, workcodes: str, panchayat_name: str):
@@ -136,7 +138,7 @@ class MsrTab(BaseAutomationTab):
             self.panchayat_entry.delete(0, tkinter.END)
             self.verify_amount_entry.delete(0, tkinter.END); self.verify_amount_entry.insert(0, "282")
             self.work_key_text.configure(state="normal"); self.work_key_text.delete("1.0", tkinter.END); self.work_key_text.configure(state="disabled")
-            for item in self.results_tree.get_children(): self.results_tree.delete(item)
+            self._clear_results()
             self.app.clear_log(self.log_display)
             self.update_status("Ready", 0)
             self.app.log_message(self.log_display, "Form has been reset.")
@@ -144,7 +146,7 @@ class MsrTab(BaseAutomationTab):
             
     def run_automation_logic(self):
         self.app.after(0, self.set_ui_state, True)
-        self.app.after(0, lambda: [self.results_tree.delete(item) for item in self.results_tree.get_children()])
+        self.app.after(0, self._clear_results)
         self.app.clear_log(self.log_display)
         self.app.log_message(self.log_display, "Starting MSR processing...")
         self.app.after(0, self.app.set_status, "Running MSR Payment...")
@@ -160,104 +162,119 @@ class MsrTab(BaseAutomationTab):
         try: verify_amount = float(verify_amount_str)
         except ValueError: messagebox.showerror("Input Error", "Verify Amount must be a valid number."); self.app.after(0, self.set_ui_state, False); return
 
+        self.trace_begin()
         try:
             driver = self.app.get_driver()
             if not driver: return
-            
-            wait = WebDriverWait(driver, 15)
-            if driver.current_url != config.MSR_CONFIG["url"]: driver.get(config.MSR_CONFIG["url"])
-            
-            try:
-                panchayat_select_element = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.NAME, "ddlPanchayat")))
-                if not panchayat_name: messagebox.showerror("Input Error", "Panchayat name is required for Block Login."); self.app.after(0, self.set_ui_state, False); return
-                panchayat_select = Select(panchayat_select_element)
-                match = next((opt.text for opt in panchayat_select.options if panchayat_name.strip().lower() in opt.text.lower()), None)
-                if not match: raise ValueError(f"Panchayat '{panchayat_name}' not found.")
-                panchayat_select.select_by_visible_text(match)
-                self.app.update_history("panchayat_name", panchayat_name)
-                self.app.log_message(self.log_display, f"Successfully selected Panchayat: {match}", "success"); time.sleep(2)
-            except TimeoutException: self.app.log_message(self.log_display, "Panchayat selection not found/required (GP Login). Proceeding...", "info")
 
-            total = len(work_keys)
-            for i, work_key in enumerate(work_keys, 1):
-                if self.app.stop_events[self.automation_key].is_set(): self.app.log_message(self.log_display, "Automation stopped by user.", "warning"); break
-                # --- MODIFICATION ---
-                status_msg = f"Processing {i}/{total}: {work_key}"
-                progress = (i / total)
-                self.app.after(0, self.app.set_status, status_msg) # मुख्य (main) स्टेटस बार को अपडेट करें
-                self.app.after(0, self.update_status, status_msg, progress) # टैब के स्टेटस बार को अपडेट करें
-                # --- END MODIFICATION ---
-                self._process_single_work_code(driver, wait, work_key, verify_amount)
+            with self.trace_step("open msr page"): page_ok = self._open_msr_page(driver, panchayat_name, log_selection=True)
+            if not page_ok: self.app.after(0, self.set_ui_state, False); return
+            self.app.update_history("panchayat_name", panchayat_name)
+
+            def setup_worker(worker_driver):
+                if worker_driver is not driver: self._open_msr_page(worker_driver, panchayat_name)
+                return WebDriverWait(worker_driver, 15)
+
+            self.run_work_items(driver, work_keys, lambda d, wait, work_key: self._process_single_work_code(d, wait, work_key, verify_amount, panchayat_name), setup_worker=setup_worker)
                 
             if not self.app.stop_events[self.automation_key].is_set(): messagebox.showinfo("Completed", "Automation finished! Check the 'Results' tab for details.")
         except Exception as e:
             self.app.log_message(self.log_display, f"A critical error occurred: {e}", "error")
             messagebox.showerror("MSR Error", f"An error occurred: {e}")
         finally:
+            self.trace_finish()
             self.app.after(0, self.set_ui_state, False)
             self.app.after(0, self.update_status, "Automation Finished.", 1.0)
             self.app.after(0, self.app.set_status, "Automation Finished")
             
-    def _process_single_work_code(self, driver, wait, work_key, verify_amount):
+    def _open_msr_page(self, driver, panchayat_name, log_selection=False):
+        """Opens the MSR payment page and selects the Panchayat (Block Login). Returns False on missing input."""
+        if driver.current_url != config.MSR_CONFIG["url"]: driver.get(config.MSR_CONFIG["url"])
+        try:
+            panchayat_select_element = WebDriverWait(driver, 3).until(EC.presence_of_element_located((By.NAME, "ddlPanchayat")))
+            if not panchayat_name: messagebox.showerror("Input Error", "Panchayat name is required for Block Login."); return False
+            panchayat_select = Select(panchayat_select_element)
+            match = next((opt.text for opt in panchayat_select.options if panchayat_name.strip().lower() in opt.text.lower()), None)
+            if not match: raise ValueError(f"Panchayat '{panchayat_name}' not found.")
+            panchayat_select.select_by_visible_text(match)
+            if log_selection: self.app.log_message(self.log_display, f"Successfully selected Panchayat: {match}", "success")
+            wait_for_postback(driver, panchayat_select_element)
+        except TimeoutException:
+            if log_selection: self.app.log_message(self.log_display, "Panchayat selection not found/required (GP Login). Proceeding...", "info")
+        return True
+
+    def _process_single_work_code(self, driver, wait, work_key, verify_amount, panchayat_name=""):
+        if self.app.work_index.msrs("msr", panchayat_name, work_key) == []: # Saved list: is work ka koi MSR pending nahi
+            self._log_result("Failed", work_key, "Muster Roll (MSR) not found (saved list)."); return
+        msr_no = "" # Selected MSR, recorded with the result
         try:
             try: driver.switch_to.alert.accept()
             except NoAlertPresentException: pass
-            wait.until(EC.presence_of_element_located((By.ID, "txtSearch"))).clear()
-            driver.find_element(By.ID, "txtSearch").send_keys(work_key)
-            wait.until(EC.element_to_be_clickable((By.ID, "ImgbtnSearch"))).click(); time.sleep(1)
+            with self.trace_step("search work code"):
+                wait.until(EC.presence_of_element_located((By.ID, "txtSearch"))).clear()
+                driver.find_element(By.ID, "txtSearch").send_keys(work_key)
+                search_button = wait.until(EC.element_to_be_clickable((By.ID, "ImgbtnSearch")))
+                search_button.click(); wait_for_postback(driver, search_button)
             error_span = driver.find_element(By.ID, "lblError")
             if error_span and error_span.text.strip(): raise ValueError(f"Site error: '{error_span.text.strip()}'")
-            work_code_select = Select(wait.until(EC.presence_of_element_located((By.ID, "ddlWorkCode"))))
-            if len(work_code_select.options) <= config.MSR_CONFIG["work_code_index"]: raise IndexError("Work code not found.")
-            work_code_select.select_by_index(config.MSR_CONFIG["work_code_index"]); time.sleep(1.5)
-            msr_select = Select(wait.until(EC.presence_of_element_located((By.ID, "ddlMsrNo"))))
-            if len(msr_select.options) <= config.MSR_CONFIG["muster_roll_index"]: raise IndexError("Muster Roll (MSR) not found.")
-            msr_select.select_by_index(config.MSR_CONFIG["muster_roll_index"]); time.sleep(1.5)
+            with self.trace_step("select work code"):
+                work_code_element = wait.until(EC.presence_of_element_located((By.ID, "ddlWorkCode"))); work_code_select = Select(work_code_element)
+                if len(work_code_select.options) <= config.MSR_CONFIG["work_code_index"]: raise IndexError("Work code not found.")
+                work_code_select.select_by_index(config.MSR_CONFIG["work_code_index"]); wait_for_postback(driver, work_code_element)
+            with self.trace_step("select msr"):
+                msr_element = wait.until(EC.presence_of_element_located((By.ID, "ddlMsrNo"))); msr_select = Select(msr_element)
+                msr_texts = [o.text.strip() for o in msr_select.options[config.MSR_CONFIG["muster_roll_index"]:]]
+                self.app.work_index.record_msrs("msr", panchayat_name, work_key, msr_texts)
+                if not msr_texts: raise IndexError("Muster Roll (MSR) not found.")
+                msr_no = msr_texts[0]
+                msr_select.select_by_index(config.MSR_CONFIG["muster_roll_index"]); wait_for_postback(driver, msr_element)
 
             wage_inputs = driver.find_elements(By.XPATH, "//input[starts-with(@name, 'wage_per_day')]")
             filled_wages = [float(inp.get_attribute('value')) for inp in wage_inputs if inp.get_attribute('value') and float(inp.get_attribute('value')) > 0]
             
             if not filled_wages:
-                self._log_result("Skipped", work_key, "Pending for JE or AE Approval")
+                self._log_result("Skipped", work_key, "Pending for JE or AE Approval", msr_no)
                 return
             
             for wage in filled_wages:
                 if wage != verify_amount:
-                    self._log_result("Rejected", work_key, f"Verify amount not matched ({wage} != {verify_amount})")
+                    self._log_result("Rejected", work_key, f"Verify amount not matched ({wage} != {verify_amount})", msr_no)
                     return
 
-            wait.until(EC.element_to_be_clickable((By.ID, "btnSave"))).click()
-            WebDriverWait(driver, 10).until(EC.alert_is_present()).accept()
-            outcome_found = False
-            for _ in range(3):
-                try:
-                    final_alert = driver.switch_to.alert; final_alert_text = final_alert.text.strip(); final_alert.accept()
-                    if "Muster Roll Payment has been saved" in final_alert_text: self._log_result("Success", work_key, final_alert_text)
-                    elif "and hence it is not saved" in final_alert_text: self._log_result("Success", work_key, "Saved (ignorable attendance error)")
-                    else: self._log_result("Failed", work_key, f"Unknown Alert: {final_alert_text}")
-                    outcome_found = True; break
-                except NoAlertPresentException:
-                    if "Expenditure on unskilled labours exceeds sanction amount" in driver.page_source: self._log_result("Failed", work_key, "Exceeds Labour Payment"); outcome_found = True; break
-                    time.sleep(1)
-            if not outcome_found: self._log_result("Failed", work_key, "No final confirmation found (Timeout).")
+            with self.trace_step("save"):
+                wait.until(EC.element_to_be_clickable((By.ID, "btnSave"))).click()
+                WebDriverWait(driver, 10).until(EC.alert_is_present()).accept()
+                outcome_found = False
+                for _ in range(3):
+                    try:
+                        final_alert = driver.switch_to.alert; final_alert_text = final_alert.text.strip(); final_alert.accept()
+                        if "Muster Roll Payment has been saved" in final_alert_text: self._log_result("Success", work_key, final_alert_text, msr_no)
+                        elif "and hence it is not saved" in final_alert_text: self._log_result("Success", work_key, "Saved (ignorable attendance error)", msr_no)
+                        else: self._log_result("Failed", work_key, f"Unknown Alert: {final_alert_text}", msr_no)
+                        outcome_found = True; break
+                    except NoAlertPresentException:
+                        if "Expenditure on unskilled labours exceeds sanction amount" in driver.page_source: self._log_result("Failed", work_key, "Exceeds Labour Payment", msr_no); outcome_found = True; break
+                        time.sleep(1)
+            if not outcome_found: self._log_result("Failed", work_key, "No final confirmation found (Timeout).", msr_no)
             delay = random.uniform(config.MSR_CONFIG["min_delay"], config.MSR_CONFIG["max_delay"])
             self.app.after(0, self.update_status, f"Waiting {delay:.1f}s...")
-            time.sleep(delay)
+            with self.trace_step("random delay"): time.sleep(delay)
         except (ValueError, IndexError, NoSuchElementException, TimeoutException) as e:
             display_msg = "MR not Filled yet." if isinstance(e, IndexError) else "Page timed out or element not found." if isinstance(e, TimeoutException) else str(e)
-            self._log_result("Failed", work_key, display_msg)
-        except Exception as e: self._log_result("Failed", work_key, f"CRITICAL ERROR: {type(e).__name__}")
+            self._log_result("Failed", work_key, display_msg, msr_no)
+        except Exception as e: self._log_result("Failed", work_key, f"CRITICAL ERROR: {type(e).__name__}", msr_no)
         
-    def _log_result(self, status, work_key, msg):
+    def _log_result(self, status, work_key, msg, msr_no=""):
         level = "success" if status.lower() == "success" else "error"
         timestamp = datetime.now().strftime("%H:%M:%S")
         details = msg.replace("\n", " ").replace("\r", " ")
         if "No final confirmation found" in msg: details = "Pending for JE & AE Approval"
         elif "Muster Roll (MSR) not found" in msg: details = "MR not Filled yet."
         elif "Work code not found" in msg: details = "Work Code not found."
+        self._record_result(status, work_key, msr_no, details)
         self.app.log_message(self.log_display, f"'{work_key}' - {status.upper()}: {details}", level=level)
         tags = ('failed',) if 'success' not in status.lower() else ()
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=(work_key, status.upper(), details, timestamp), tags=tags))
+        self._add_result_row((work_key, status.upper(), details, timestamp), tags)
 
     # --- NEW: Central Export Function ---
     def export_report(self):
@@ -283,15 +300,14 @@ class MsrTab(BaseAutomationTab):
             self._handle_pdf_export(data, file_path)
 
     def _get_filtered_data_and_filepath(self, export_format):
-        all_items = self.results_tree.get_children()
+        all_items = self.get_result_rows(self.results_tree)
         if not all_items: messagebox.showinfo("No Data", "There are no results to export."); return None, None
         panchayat_name = self.panchayat_entry.get().strip()
         if not panchayat_name: messagebox.showwarning("Input Needed", "Please enter a Panchayat Name for the report title."); return None, None
 
         filter_option = self.export_filter_menu.get()
         data_to_export = []
-        for item_id in all_items:
-            row_values = self.results_tree.item(item_id)['values']
+        for row_values in all_items:
             status = row_values[1].upper()
             if filter_option == "Export All": data_to_export.append(row_values)
             elif filter_option == "Success Only" and "SUCCESS" in status: data_to_export.append(row_values)
@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import os, json, time, base64, sys, subprocess, requests, re, threading
+import os, time, base64, sys, subprocess, requests, re, threading
 from datetime import datetime
 from pypdf import PdfWriter # <-- IMPORT ADD KIYA GAYA
 from selenium.webdriver.common.by import By
@@ -13,18 +13,20 @@ import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
 from .date_entry_widget import DateEntry
+from .page_wait import wait_for_postback, wait_for_page_ready
 
 class MusterrollGenTab(BaseAutomationTab):
+    lean_mode_allow = ("images", "fonts") # Generated MR PDFs need logos and fonts
+
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="muster")
-        self.config_file = self.app.get_data_path("muster_roll_inputs.json")
         
-        # --- NEW: Mapping file path and data holder ---
-        self.mapping_file = self.app.get_data_path("mr_panchayat_staff_map.json")
+        # --- NEW: Mapping data holder (saved in the state store) ---
         self.mapping_data = {} 
         
         self.success_count = 0
         self.skipped_count = 0
+        self._count_lock = threading.Lock() # Parallel workers share the counters
         self.output_dir = ""
         self.current_session_files = []
         
@@ -101,7 +103,7 @@ class MusterrollGenTab(BaseAutomationTab):
         
         action_frame_container = ctk.CTkFrame(self)
         action_frame_container.grid(row=1, column=0, sticky="ew", padx=10, pady=10)
-        action_frame = self._create_action_buttons(parent_frame=action_frame_container)
+        action_frame = self._create_action_buttons(parent_frame=action_frame_container, parallel_workers=True)
         action_frame.pack(expand=True, fill='x')
 
         data_notebook = ctk.CTkTabview(self)
@@ -154,6 +156,7 @@ class MusterrollGenTab(BaseAutomationTab):
         self.results_tree.column("Timestamp", width=80, anchor='center'); self.results_tree.column("Work Code/Key", width=250); self.results_tree.column("Status", width=100, anchor='center'); self.results_tree.column("Details", width=400)
         self.results_tree.grid(row=2, column=0, sticky='nsew')
         scrollbar = ctk.CTkScrollbar(results_tab, command=self.results_tree.yview); self.results_tree.configure(yscroll=scrollbar.set); scrollbar.grid(row=2, column=1, sticky='ns')
+        self.attach_results_model(self.results_tree, scrollbar)
         self.style_treeview(self.results_tree)
         self._setup_treeview_sorting(self.results_tree)
 
@@ -185,13 +188,8 @@ class MusterrollGenTab(BaseAutomationTab):
         if state == "normal": self._on_format_change(self.export_format_menu.get())
 
     def _load_mapping_data(self):
-        """Loads the Panchayat-Staff mapping from JSON."""
-        if os.path.exists(self.mapping_file):
-            try:
-                with open(self.mapping_file, 'r') as f:
-                    self.mapping_data = json.load(f)
-            except Exception:
-                self.mapping_data = {}
+        """Loads the Panchayat-Staff mapping from the state store."""
+        self.mapping_data = self.app.state_store.get("mr_panchayat_staff_map", {})
 
     def _save_mapping_pair(self, panchayat, staff):
         """Saves a new Panchayat-Staff link."""
@@ -201,11 +199,7 @@ class MusterrollGenTab(BaseAutomationTab):
         key = panchayat.strip().lower()
         self.mapping_data[key] = staff.strip()
         
-        try:
-            with open(self.mapping_file, 'w') as f:
-                json.dump(self.mapping_data, f, indent=4)
-        except Exception as e:
-            print(f"Error saving mapping: {e}")
+        self.app.state_store.set("mr_panchayat_staff_map", self.mapping_data)
 
     def _on_panchayat_change_debounced(self, event=None):
         """Waits for user to stop typing then updates Staff field."""
@@ -228,7 +222,7 @@ class MusterrollGenTab(BaseAutomationTab):
                 self.staff_entry.insert(0, saved_staff)
         
     def start_automation(self):
-        for item in self.results_tree.get_children(): self.results_tree.delete(item)
+        self._clear_results()
         self.success_count, self.skipped_count = 0, 0
         self.current_session_files = [] # <-- RESET LIST HERE
         self.success_label.configure(text="Success: 0")
@@ -254,7 +248,8 @@ class MusterrollGenTab(BaseAutomationTab):
         inputs['work_codes'] = [line.strip() for line in inputs['work_codes_raw'].split('\n') if line.strip()]
         inputs['auto_mode'] = not bool(inputs['work_codes'])
         self.save_inputs(inputs)
-        self.app.start_automation_thread(self.automation_key, self.run_automation_logic, args=(inputs,))
+        job_params = {k: inputs[k] for k in ('panchayat', 'start_date', 'end_date', 'designation', 'staff', 'work_codes')}
+        self.app.start_automation_thread(self.automation_key, self.run_automation_logic, args=(inputs,), job_params=job_params)
 
     
         
@@ -268,7 +263,7 @@ class MusterrollGenTab(BaseAutomationTab):
             self.scale_slider.set(75); self.scale_label.configure(text="75%")
             self.output_action_combobox.set('Save as PDF')
             self.work_codes_text.delete('1.0', tkinter.END)
-            for item in self.results_tree.get_children(): self.results_tree.delete(item)
+            self._clear_results()
             self.app.clear_log(self.log_display)
             self.update_status("Ready", 0.0)
             self.success_label.configure(text="Success: 0"); self.skipped_label.configure(text="Skipped/Failed: 0")
@@ -281,14 +276,13 @@ class MusterrollGenTab(BaseAutomationTab):
             inputs_to_save.pop('work_codes_raw', None)
             inputs_to_save.pop('work_codes', None)
             inputs_to_save.pop('auto_mode', None)
-            with open(self.config_file, 'w') as f:
-                json.dump(inputs_to_save, f, indent=4)
+            self.app.state_store.set("muster_roll_inputs", inputs_to_save)
         except Exception as e: print(f"Error saving inputs: {e}")
         
     def load_inputs(self):
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f: data = json.load(f)
+            data = self.app.state_store.get("muster_roll_inputs")
+            if data is not None:
                 self.panchayat_entry.insert(0, data.get('panchayat', ''))
                 self.start_date_entry.set_date(data.get('start_date', ''))
                 self.end_date_entry.set_date(data.get('end_date', ''))
@@ -347,6 +341,7 @@ class MusterrollGenTab(BaseAutomationTab):
         self.app.clear_log(self.log_display)
         self.app.log_message(self.log_display, f"Starting MR generation for: {inputs['panchayat']}")
         self.app.after(0, self.app.set_status, "Running MR Generation...")
+        self.trace_begin()
         
         # --- PATH LOGIC UPDATED ---
         self.output_dir = self._get_output_dir(inputs['panchayat'])
@@ -365,25 +360,25 @@ class MusterrollGenTab(BaseAutomationTab):
             
             self.app.log_message(self.log_display, f"Output will be in: {self.output_dir}", "info")
             
-            if not self._validate_panchayat(driver, wait, inputs['panchayat']):
+            with self.trace_step("validate panchayat"): panchayat_ok = self._validate_panchayat(driver, wait, inputs['panchayat'])
+            if not panchayat_ok:
                 self.app.after(0, self.set_ui_state, False)
                 return
             
             self.app.update_history("panchayat_name", inputs['panchayat'])
             self.app.update_history("staff_name", inputs['staff'])
 
-            items_to_process = self._get_items_to_process(driver, wait, inputs)
+            with self.trace_step("fetch work codes"): items_to_process = self._get_items_to_process(driver, wait, inputs)
             session_skip_list = set()
-            total_items = len(items_to_process)
 
-            for index, item in enumerate(items_to_process):
-                if self.app.stop_events[self.automation_key].is_set(): 
-                    self.app.log_message(self.log_display, "Stop signal received.", "warning")
-                    break
-                self.app.log_message(self.log_display, f"\n--- Processing item ({index+1}/{total_items}): {item} ---", "info")
-                self.app.after(0, self.update_status, f"Processing {item}", (index+1)/total_items)
-                # --- PASSING self.output_dir ---
-                self._process_single_item(driver, wait, inputs, item, self.output_dir, session_skip_list)
+            def setup_worker(worker_driver):
+                return wait if worker_driver is driver else WebDriverWait(worker_driver, 20)
+
+            def process_item(worker_driver, worker_wait, item):
+                self.app.log_message(self.log_display, f"\n--- Processing item: {item} ---", "info")
+                self._process_single_item(worker_driver, worker_wait, inputs, item, self.output_dir, session_skip_list)
+
+            self.run_work_items(driver, items_to_process, process_item, setup_worker=setup_worker)
         
         except Exception as e:
             self.app.log_message(self.log_display, f"A critical error occurred: {e}", "error")
@@ -391,6 +386,7 @@ class MusterrollGenTab(BaseAutomationTab):
                 messagebox.showerror("Critical Error", f"An unexpected error stopped the automation. Please check the logs for details.\n\nError: {e}")
         
         finally:
+            self.trace_finish(self.output_dir)
             self.app.after(0, self.set_ui_state, False)
             self.app.after(0, self.update_status, "Automation Finished.", 1.0)
             # --- Uses self.output_dir now ---
@@ -406,12 +402,18 @@ class MusterrollGenTab(BaseAutomationTab):
             messagebox.showinfo("Task Finished", summary)
 
     def _validate_panchayat(self, driver, wait, panchayat_name):
+        target_panchayat = config.AGENCY_PREFIX + panchayat_name
+        known = self.app.work_index.panchayats("mr_gen")
+        if known is not None and target_panchayat in known: # Saved list mein hai to page load ki jarurat nahi
+            self.app.log_message(self.log_display, "Panchayat name is valid (saved list).", "success")
+            return True
         try:
             self.app.log_message(self.log_display, "Validating Panchayat name...")
             driver.get(config.MUSTER_ROLL_CONFIG["base_url"])
             panchayat_dropdown = Select(wait.until(EC.presence_of_element_located((By.ID, "exe_agency"))))
-            target_panchayat = config.AGENCY_PREFIX + panchayat_name
-            if target_panchayat not in [opt.text for opt in panchayat_dropdown.options]:
+            panchayat_names = [opt.text for opt in panchayat_dropdown.options]
+            self.app.work_index.record_panchayats("mr_gen", panchayat_names)
+            if target_panchayat not in panchayat_names:
                 messagebox.showerror("Validation Error", f"Panchayat name '{panchayat_name}' not found on the website. Please check for spelling mistakes.")
                 return False
             self.app.log_message(self.log_display, "Panchayat name is valid.", "success")
@@ -422,11 +424,17 @@ class MusterrollGenTab(BaseAutomationTab):
 
     def _get_items_to_process(self, driver, wait, inputs):
         if inputs['auto_mode']:
+            known = self.app.work_index.work_codes("mr_gen", inputs['panchayat'])
+            if known is not None:
+                self.app.log_message(self.log_display, f"Auto Mode: {len(known)} available work codes from the saved list.")
+                return known
             self.app.log_message(self.log_display, "Auto Mode: Fetching available work codes...")
             try:
-                Select(driver.find_element(By.ID, "exe_agency")).select_by_visible_text(config.AGENCY_PREFIX + inputs['panchayat'])
+                if not driver.find_elements(By.ID, "exe_agency"): driver.get(config.MUSTER_ROLL_CONFIG["base_url"])
+                Select(wait.until(EC.presence_of_element_located((By.ID, "exe_agency")))).select_by_visible_text(config.AGENCY_PREFIX + inputs['panchayat'])
                 wait.until(lambda d: len(Select(d.find_element(By.ID, "ddlWorkCode")).options) > 1)
                 items = [opt.text for opt in Select(driver.find_element(By.ID, "ddlWorkCode")).options if opt.get_attribute("value")]
+                self.app.work_index.record_work_codes("mr_gen", inputs['panchayat'], items)
                 self.app.log_message(self.log_display, f"Found {len(items)} available work codes.")
                 return items
             except Exception as e:
@@ -440,35 +448,38 @@ class MusterrollGenTab(BaseAutomationTab):
         full_work_code_text = ""
         try:
             self.app.log_message(self.log_display, "   - Navigating to MR page...")
-            driver.get(config.MUSTER_ROLL_CONFIG["base_url"])
+            with self.trace_step("navigate"): driver.get(config.MUSTER_ROLL_CONFIG["base_url"])
             
             # --- FIX 1: Re-finding Panchayat Dropdown every time ---
             self.app.log_message(self.log_display, "   - Selecting Panchayat...")
-            panchayat_dropdown = wait.until(EC.presence_of_element_located((By.ID, "exe_agency")))
-            Select(panchayat_dropdown).select_by_visible_text(config.AGENCY_PREFIX + inputs['panchayat'])
+            with self.trace_step("select panchayat"):
+                panchayat_dropdown = wait.until(EC.presence_of_element_located((By.ID, "exe_agency")))
+                Select(panchayat_dropdown).select_by_visible_text(config.AGENCY_PREFIX + inputs['panchayat'])
             # --- END FIX 1 ---
             
             self.app.log_message(self.log_display, f"   - Selecting work code for '{item}'...")
             # _select_work_code will handle re-finding the ddlWorkCode element
-            full_work_code_text = self._select_work_code(driver, wait, item, inputs['auto_mode'])
+            with self.trace_step("select work code"): full_work_code_text = self._select_work_code(driver, wait, item, inputs['auto_mode'])
             
             if full_work_code_text in session_skip_list:
                 self._log_result(item, "Skipped", "Already processed in this session.")
                 return
 
             self.app.log_message(self.log_display, "   - Entering dates and staff details...")
-            driver.find_element(By.ID, "txtDateFrom").send_keys(inputs['start_date'])
-            driver.find_element(By.ID, "txtDateTo").send_keys(inputs['end_date'])
-            
-            # --- FIX 2: Re-finding Designation Dropdown after date entry/DOM update ---
-            designation_dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ddldesg")))
-            Select(designation_dropdown).select_by_visible_text(inputs['designation'])
+            with self.trace_step("fill dates & designation"):
+                driver.find_element(By.ID, "txtDateFrom").send_keys(inputs['start_date'])
+                driver.find_element(By.ID, "txtDateTo").send_keys(inputs['end_date'])
+                
+                # --- FIX 2: Re-finding Designation Dropdown after date entry/DOM update ---
+                designation_dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ddldesg")))
+                Select(designation_dropdown).select_by_visible_text(inputs['designation'])
 
             self.app.log_message(self.log_display, "   - Waiting for Technical Staff list to populate...")
             long_wait = WebDriverWait(driver, 30)
             
             # Wait for options to populate in the staff dropdown
-            long_wait.until(EC.presence_of_element_located((By.XPATH, "//select[@id='ddlstaff']/option[position()>1]")))
+            with self.trace_step("staff list postback"):
+                long_wait.until(EC.presence_of_element_located((By.XPATH, "//select[@id='ddlstaff']/option[position()>1]")))
             
             # --- FIX 3: Re-finding Staff Dropdown after population ---
             staff_dropdown_element = driver.find_element(By.ID, "ddlstaff")
@@ -480,11 +491,12 @@ class MusterrollGenTab(BaseAutomationTab):
             # --- END FIX 3 ---
             
             self.app.log_message(self.log_display, "   - Submitting form...")
-            body_element = driver.find_element(By.TAG_NAME, 'body')
-            driver.find_element(By.ID, "btnProceed").click()
-            
-            wait.until(EC.staleness_of(body_element))
-            time.sleep(2)
+            with self.trace_step("submit"):
+                body_element = driver.find_element(By.TAG_NAME, 'body')
+                driver.find_element(By.ID, "btnProceed").click()
+                
+                wait.until(EC.staleness_of(body_element))
+                wait_for_page_ready(driver)
             
             error_reason = self._check_for_page_errors(driver)
             if error_reason:
@@ -493,7 +505,9 @@ class MusterrollGenTab(BaseAutomationTab):
                 return
             
             self.app.log_message(self.log_display, "   - Muster Roll is valid. Generating output...")
-            pdf_path = self._save_mr_as_pdf(driver, full_work_code_text, output_dir, inputs['orientation'], inputs['scale'])
+            self.app.work_index.forget_msrs(inputs['panchayat']) # Naya MR bana, saved MSR lists ab purani hain
+            self.app.work_index.forget_work_codes("mr_gen", inputs['panchayat'])
+            with self.trace_step("pdf render"): pdf_path = self._save_mr_as_pdf(driver, full_work_code_text, output_dir, inputs['orientation'], inputs['scale'])
             
             log_detail = f"Saved as {os.path.basename(pdf_path)}" if pdf_path else "PDF Save Failed"
             
@@ -502,7 +516,7 @@ class MusterrollGenTab(BaseAutomationTab):
                 
                 if inputs.get('save_to_cloud'):
                     self.app.log_message(self.log_display, "   - Uploading to cloud storage...")
-                    upload_success = self._upload_to_cloud(pdf_path, inputs['panchayat'])
+                    with self.trace_step("cloud upload"): upload_success = self._upload_to_cloud(pdf_path, inputs['panchayat'])
                     if upload_success:
                         log_detail += " & Uploaded to Cloud"
                         self.app.log_message(self.log_display, "   - Successfully uploaded to cloud.", "success")
@@ -511,7 +525,7 @@ class MusterrollGenTab(BaseAutomationTab):
                         self.app.log_message(self.log_display, "   - Failed to upload to cloud.", "error")
 
             if inputs['output_action'] == "Print" and pdf_path:
-                self._print_file(pdf_path)
+                with self.trace_step("print"): self._print_file(pdf_path)
                 log_detail = f"Printed and Saved as {os.path.basename(pdf_path)}"
 
             self._log_result(item, "Success" if pdf_path else "Failed", log_detail)
@@ -621,8 +635,9 @@ class MusterrollGenTab(BaseAutomationTab):
                 search_box.send_keys(search_key)
                 
                 # Search button click karne se DOM phir se badal sakta hai
-                driver.find_element(By.ID, "imgButtonSearch").click()
-                time.sleep(2) # Thoda extra wait dete hain
+                search_button = driver.find_element(By.ID, "imgButtonSearch")
+                search_button.click()
+                wait_for_postback(driver, search_button) # Postback khatam hone tak wait
 
                 # Work Code dropdown ko load hone ka wait karein
                 wait.until(lambda d: len(Select(d.find_element(*work_code_dropdown_locator)).options) > 1)
@@ -658,19 +673,21 @@ class MusterrollGenTab(BaseAutomationTab):
         return None
 
     def _log_result(self, item_key, status, details):
+        self._record_result(status, item_key, details=details)
         timestamp = datetime.now().strftime("%H:%M:%S")
         values = (timestamp, item_key, status, details)
         
         tags = ('failed',) if 'success' not in status.lower() else ()
 
-        if status == "Success":
-            self.success_count += 1
-            self.app.after(0, lambda: self.success_label.configure(text=f"Success: {self.success_count}"))
-        else:
-            self.skipped_count += 1
-            self.app.after(0, lambda: self.skipped_label.configure(text=f"Skipped/Failed: {self.skipped_count}"))
+        with self._count_lock:
+            if status == "Success":
+                self.success_count += 1
+                self.app.after(0, lambda: self.success_label.configure(text=f"Success: {self.success_count}"))
+            else:
+                self.skipped_count += 1
+                self.app.after(0, lambda: self.skipped_label.configure(text=f"Skipped/Failed: {self.skipped_count}"))
         
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=values, tags=tags))
+        self._add_result_row(values, tags)
 
     def _upload_to_cloud(self, file_path, panchayat_name):
         """Uploads a given file to the user's cloud storage via the API."""
@@ -727,14 +744,14 @@ class MusterrollGenTab(BaseAutomationTab):
             self._handle_pdf_export(report_data, report_headers, col_widths, file_path)
 
     def _get_filtered_data_and_filepath(self, export_format):
-        if not self.results_tree.get_children(): messagebox.showinfo("No Data", "No results to export."); return None, None
+        all_items = self.get_result_rows(self.results_tree)
+        if not all_items: messagebox.showinfo("No Data", "No results to export."); return None, None
         panchayat_name = self.panchayat_entry.get().strip()
         if not panchayat_name: messagebox.showwarning("Input Needed", "Panchayat Name is required for report title."); return None, None
         
         filter_option = self.export_filter_menu.get()
         data_to_export = []
-        for item_id in self.results_tree.get_children():
-            row_values = self.results_tree.item(item_id)['values']
+        for row_values in all_items:
             status = row_values[2].upper() 
             if filter_option == "Export All": data_to_export.append(row_values)
             elif filter_option == "Success Only" and "SUCCESS" in status: data_to_export.append(row_values)
@@ -0,0 +1,118 @@
+# tabs/page_wait.py
+"""
+Adaptive waits for the NREGA portal's ASP.NET WebForms postbacks.
+Fixed time.sleep() ki jagah yeh check karta hai ki UpdatePanel / full postback
+sach mein khatam hua ya nahi, taaki fast connection par time waste na ho aur
+slow connection par step fail na ho.
+"""
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+# Navigation marker: `beforeunload` par flag lagta hai, to full postback ka response aane tak (jab tak purana
+# document 'complete' dikhta hai) bhi pata rehta hai ki navigation chal raha hai. Naye document mein flag nahi hota.
+# 10 s baad bhi wahi document ho to navigation cancel maana jaata hai (jaise file download wala postback).
+_ARM_JS = ("if (!window.__nbArmed) { window.__nbArmed = true;"
+           " window.addEventListener('beforeunload', function () { window.__nbUnloading = Date.now(); }); }")
+_UNLOADING_JS = "window.__nbUnloading && Date.now() - window.__nbUnloading < 10000"
+
+# Returns true only when the document is loaded and no async (UpdatePanel) postback is running.
+# A ready page is armed with the navigation marker for the next action.
+_PAGE_READY_JS = """
+try {
+    if (document.readyState !== 'complete') { return false; }
+    if (%s) { return false; }
+""" % _UNLOADING_JS + """    if (window.jQuery && window.jQuery.active > 0) { return false; }
+    if (window.Sys && Sys.WebForms && Sys.WebForms.PageRequestManager) {
+        var prm = Sys.WebForms.PageRequestManager.getInstance();
+        if (prm && prm.get_isInAsyncPostBack()) { return false; }
+    }
+    """ + _ARM_JS + """
+    return true;
+} catch (e) { return true; }
+"""
+
+_ASYNC_POSTBACK_JS = """
+try {
+    if (document.readyState !== 'complete') { return true; }
+    if (%s) { return true; }
+""" % _UNLOADING_JS + """    if (window.Sys && Sys.WebForms && Sys.WebForms.PageRequestManager) {
+        var prm = Sys.WebForms.PageRequestManager.getInstance();
+        return !!(prm && prm.get_isInAsyncPostBack());
+    }
+} catch (e) {}
+return false;
+"""
+
+POLL_INTERVAL = 0.1
+
+
+def _alert_open(driver):
+    # Script chalane se pehle alert check karna zaroori hai, warna Chrome alert ko dismiss kar deta hai.
+    try: return bool(EC.alert_is_present()(driver))
+    except WebDriverException: return False
+
+
+def is_stale(element):
+    """True if the element was detached from the DOM (i.e. a full postback replaced the page)."""
+    try: element.is_enabled(); return False
+    except StaleElementReferenceException: return True
+    except WebDriverException: return False
+
+
+def is_page_ready(driver):
+    """True when the page has loaded and no WebForms async postback is in flight."""
+    if _alert_open(driver): return True # Let the caller handle the alert
+    try: return bool(driver.execute_script(_PAGE_READY_JS))
+    except WebDriverException: return False # Page is mid-navigation
+
+
+def arm_postback(driver):
+    """Arms the navigation marker on the current page; call it before an action when the page was not awaited yet."""
+    try: driver.execute_script(_ARM_JS)
+    except WebDriverException: pass
+
+
+def _postback_started(driver, trigger):
+    if trigger is not None and is_stale(trigger): return True
+    if _alert_open(driver): return True
+    try: return bool(driver.execute_script(_ASYNC_POSTBACK_JS))
+    except WebDriverException: return True # Navigation in progress
+
+
+def wait_for_postback(driver, trigger=None, timeout=20, start_timeout=1.5):
+    """
+    Waits for the postback caused by the last select/click to finish.
+    `trigger` is the element that was acted on; a full postback is detected by it going stale, or earlier,
+    while the server is still answering, by the navigation marker (armed by wait_for_page_ready / arm_postback).
+    If no postback starts within `start_timeout`, the action is assumed not to post back.
+    Returns True once the page is ready, False on timeout (callers continue as before).
+    """
+    start = time.monotonic()
+    if trigger is None: start_timeout = min(start_timeout, 0.3) # Without a trigger only async postbacks can be seen early
+    while time.monotonic() - start < start_timeout:
+        if _postback_started(driver, trigger): break
+        time.sleep(POLL_INTERVAL)
+    return wait_for_page_ready(driver, timeout=max(0.0, timeout - (time.monotonic() - start)))
+
+
+def wait_for_page_ready(driver, timeout=20):
+    """Polls until the page is loaded and idle. Returns False on timeout."""
+    end = time.monotonic() + timeout
+    while True:
+        if is_page_ready(driver): return True
+        if time.monotonic() >= end: return False
+        time.sleep(POLL_INTERVAL)
+
+
+
+def wait_for_options(driver, locator, min_options=2, timeout=10):
+    """Waits until a (dependent) dropdown has been populated. Returns False on timeout."""
+    end = time.monotonic() + timeout
+    while True:
+        try:
+            if len(driver.find_element(*locator).find_elements(By.TAG_NAME, "option")) >= min_options: return True
+        except WebDriverException: pass
+        if time.monotonic() >= end: return False
+        time.sleep(POLL_INTERVAL)
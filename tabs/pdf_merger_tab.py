@@ -7,6 +7,26 @@ from pypdf import PdfWriter
 from datetime import datetime  # <-- ADD THIS IMPORT
 
 from .base_tab import BaseAutomationTab
+from .process_worker import WorkerStopped
+
+
+def merge_pdfs(channel, file_list, output_path):
+    """Worker-process side of the merge: appends every file, writes the output and returns its page count."""
+    merger = PdfWriter()
+    try:
+        for i, pdf_path in enumerate(file_list):
+            channel.check_stop()
+            channel.log(f"Adding file {i+1}/{len(file_list)}: {os.path.basename(pdf_path)}")
+            channel.progress(f"Adding file {i+1}/{len(file_list)}", (i + 1) / len(file_list))
+            merger.append(pdf_path)
+        channel.check_stop()
+        channel.log(f"Writing to output file: {output_path}")
+        with open(output_path, "wb") as f_out:
+            merger.write(f_out)
+        return len(merger.pages)
+    finally:
+        merger.close()
+
 
 class PdfMergerTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -130,6 +150,13 @@ class PdfMergerTab(BaseAutomationTab):
             self.update_listbox()
             self.app.log_message(self.log_display, f"Added {new_files_count} new PDF file(s). Total: {len(self.selected_files)}")
     
+    def snapshot_state(self):
+        """The merge list (kept outside widgets) so an unloaded tab comes back with the same files in order."""
+        return {"selected_files": self.selected_files}
+
+    def restore_state(self, state):
+        self.selected_files = list(state.get("selected_files", [])); self.update_listbox()
+
     def update_listbox(self):
         self.file_listbox.delete(0, tkinter.END)
         for i, f in enumerate(self.selected_files):
@@ -236,32 +263,17 @@ class PdfMergerTab(BaseAutomationTab):
         self.app.after(0, self.app.set_status, "Merging PDFs...")
 
         try:
-            merger = PdfWriter()
-            
-            for i, pdf_path in enumerate(file_list):
-                if self.app.stop_events[self.automation_key].is_set():
-                    self.app.log_message(self.log_display, "Merge cancelled.", "warning")
-                    merger.close()
-                    return
-
-                self.app.log_message(self.log_display, f"Adding file {i+1}/{len(file_list)}: {os.path.basename(pdf_path)}")
-                self.app.after(0, self.update_status, f"Adding file {i+1}/{len(file_list)}")
-                merger.append(pdf_path)
-            
-            if self.app.stop_events[self.automation_key].is_set(): return
+            # Merge worker process mein hota hai, taaki bade PDFs par UI na atke
+            self.app.process_workers.run(self, merge_pdfs, file_list, output_path)
 
-            self.app.log_message(self.log_display, f"Writing to output file: {output_path}")
-            with open(output_path, "wb") as f_out:
-                merger.write(f_out)
-            
-            merger.close()
-            
             self.app.log_message(self.log_display, "Merge complete!", "success")
             messagebox.showinfo("Success", f"Successfully merged {len(file_list)} files into:\n{output_path}", parent=self)
             
             if messagebox.askyesno("Open Location?", "Do you want to open the folder containing the merged file?", parent=self):
                 self.app.open_folder(os.path.dirname(output_path))
 
+        except WorkerStopped:
+            self.app.log_message(self.log_display, "Merge cancelled.", "warning")
         except Exception as e:
             self.app.log_message(self.log_display, f"A critical error occurred: {e}", "error")
             messagebox.showerror("Merge Error", f"An error occurred during merging:\n\n{e}", parent=self)
@@ -0,0 +1,180 @@
+# tabs/process_worker.py
+"""
+Worker processes for CPU-heavy automation steps (PDF merge, HTML table parsing, PNG rendering).
+Automation thread `run()` call karta hai aur kaam ek alag process mein hota hai, isliye GIL UI thread
+ke paas hi rehta hai. Worker ke log, progress aur result rows ek multiprocessing queue se wapas aate hain
+aur tab ke normal log sink / progress reporter / results table tak pahunchte hain. Tab ka Stop button
+process ke multiprocessing.Event tak jaata hai; worker `grace` ke andar na ruke to process band kar diya jaata hai.
+"""
+import time, queue, logging, threading, traceback, multiprocessing
+
+
+class WorkerStopped(Exception):
+    """The user pressed Stop while a worker step was running."""
+
+
+class WorkerProcessError(RuntimeError):
+    """The worker function raised; the message carries the original error."""
+
+
+class WorkerChannel:
+    """First argument of every worker function: `log`, `progress`, `row` stream back to the tab."""
+
+    def __init__(self, events, stop_event):
+        self._events, self._stop = events, stop_event
+
+    def log(self, message, level="info"):
+        self._events.put(("log", message, level))
+
+    def progress(self, message, fraction=None):
+        self._events.put(("progress", message, fraction))
+
+    def row(self, values, tags=()):
+        self._events.put(("row", list(values), list(tags)))
+
+    def stopped(self):
+        return self._stop.is_set()
+
+    def check_stop(self):
+        if self._stop.is_set(): raise WorkerStopped()
+
+
+class _Direct:
+    """Inline mode: events go straight to the tab instead of through a queue."""
+    def __init__(self, dispatch): self.put = dispatch
+
+
+def _worker_main(tasks, events, stop):
+    while True:
+        task = tasks.get()
+        if task is None: return
+        func, args, kwargs = task
+        try: events.put(("done", func(WorkerChannel(events, stop), *args, **kwargs)))
+        except WorkerStopped: events.put(("stopped",))
+        except BaseException as e: events.put(("error", f"{type(e).__name__}: {e}", traceback.format_exc()))
+
+
+class _Worker:
+    def __init__(self, ctx):
+        self.tasks, self.events, self.stop = ctx.Queue(), ctx.Queue(), ctx.Event()
+        self.process = ctx.Process(target=_worker_main, args=(self.tasks, self.events, self.stop), daemon=True, name="NregaBotWorker")
+        self.process.start()
+
+    def close(self, kill=False):
+        try:
+            if kill or not self.process.is_alive(): self.process.terminate()
+            else: self.tasks.put(None)
+            self.process.join(timeout=2)
+            if self.process.is_alive(): self.process.kill()
+        except Exception as e: logging.debug(f"Worker process close: {e}")
+
+
+class ProcessWorkerPool:
+    """
+    Long-lived "spawn" worker processes (at most `pool_size`), started on first use and reused.
+    `enabled=False` runs the same functions inline in the calling thread.
+    """
+
+    def __init__(self, settings):
+        self.settings = settings
+        self._ctx = multiprocessing.get_context("spawn") # Windows/macOS default; Tk process fork nahi hona chahiye
+        self._idle, self._all = [], []
+        self._cond = threading.Condition()
+        self._closed = False
+
+    @property
+    def enabled(self): return self.settings.get("enabled", True)
+
+    def run(self, tab, func, *args, **kwargs):
+        """
+        Runs module-level `func(channel, *args, **kwargs)` in a worker process and returns its result.
+        Call it from the automation thread; on the Tk thread it runs inline (use `submit` there instead).
+        Raises WorkerStopped when the tab's stop event ends the step, WorkerProcessError when `func` fails.
+        """
+        stop_event = tab.app.stop_events.get(getattr(tab, "automation_key", None))
+        if threading.current_thread() is threading.main_thread():
+            return func(WorkerChannel(_Direct(lambda event: self._dispatch(tab, event)), stop_event or threading.Event()), *args, **kwargs)
+        return self._call(tab, func, args, kwargs, stop_event)
+
+    def submit(self, tab, func, *args, on_done=None, on_error=None, **kwargs):
+        """
+        Non-blocking `run` for the Tk thread (e.g. export buttons): returns at once, then calls
+        on_done(result) or on_error(exception) on the Tk thread. Tab ka Stop button ise nahi rokta.
+        """
+        def job():
+            try: result = self._call(tab, func, args, kwargs, None)
+            except Exception as e:
+                if on_error: tab.app.after(0, on_error, e)
+                else: logging.error(f"Background {getattr(func, '__name__', func)} failed: {e}")
+                return
+            if on_done: tab.app.after(0, on_done, result)
+        threading.Thread(target=job, daemon=True, name="NregaBotSubmit").start()
+
+    def _call(self, tab, func, args, kwargs, stop_event):
+        dispatch = lambda event: self._dispatch(tab, event)
+        if not self.enabled or self._closed:
+            return func(WorkerChannel(_Direct(dispatch), stop_event or threading.Event()), *args, **kwargs)
+
+        worker, broken = self._acquire(), False
+        try:
+            worker.stop.clear()
+            worker.tasks.put((func, args, kwargs))
+            stop_sent_at = None
+            while True:
+                try: event = worker.events.get(timeout=0.1)
+                except queue.Empty:
+                    if not worker.process.is_alive():
+                        broken = True; raise WorkerProcessError("Worker process exited unexpectedly.")
+                    if stop_event is not None and stop_event.is_set():
+                        if stop_sent_at is None: worker.stop.set(); stop_sent_at = time.monotonic()
+                        elif time.monotonic() - stop_sent_at > self.settings.get("stop_grace_s", 5):
+                            broken = True; raise WorkerStopped() # Worker ne stop nahi suna, process hi band karo
+                    continue
+                kind = event[0]
+                if kind == "done": return event[1]
+                if kind == "stopped": raise WorkerStopped()
+                if kind == "error":
+                    logging.error(f"Worker process error in {getattr(func, '__name__', func)}:\n{event[2]}")
+                    raise WorkerProcessError(event[1])
+                dispatch(event)
+        except BaseException:
+            if not broken and not worker.process.is_alive(): broken = True
+            raise
+        finally: self._release(worker, broken)
+
+    @staticmethod
+    def _dispatch(tab, event):
+        kind = event[0]
+        if kind == "log": tab.app.log_message(tab.log_display, event[1], event[2])
+        elif kind == "progress": tab.progress.update(event[1], event[2], app_message=None)
+        elif kind == "row": tab._add_result_row(event[1], tuple(event[2]))
+
+    def _acquire(self):
+        with self._cond:
+            while True:
+                if self._closed: raise RuntimeError("Worker processes are shut down.")
+                if self._idle: return self._idle.pop()
+                if len(self._all) < max(1, int(self.settings.get("pool_size", 1))): break
+                self._cond.wait()
+            placeholder = object(); self._all.append(placeholder) # Slot reserve, process bahar start hoga
+        try: worker = _Worker(self._ctx)
+        except BaseException:
+            with self._cond: self._all.remove(placeholder); self._cond.notify()
+            raise
+        with self._cond: self._all[self._all.index(placeholder)] = worker
+        return worker
+
+    def _release(self, worker, broken=False):
+        with self._cond:
+            if broken or self._closed:
+                if worker in self._all: self._all.remove(worker)
+            else: self._idle.append(worker)
+            self._cond.notify()
+        if broken or self._closed: worker.close(kill=True)
+
+    def close_all(self):
+        with self._cond:
+            self._closed = True
+            workers, self._idle, self._all = [w for w in self._all if isinstance(w, _Worker)], [], []
+            self._cond.notify_all()
+        for worker in workers: worker.close(kill=True)
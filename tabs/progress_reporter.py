@@ -0,0 +1,46 @@
+# tabs/progress_reporter.py
+"""
+Coalesced status / progress updates for a tab.
+Worker har row par `update()` kar sakta hai; UI (app.set_status + tab.update_status) ko
+sirf latest value milti hai, aur wo bhi second mein zyada se zyada `max_per_second` baar,
+taaki bade reports Tk event queue ko hazaaron bekaar callbacks se na bhar dein.
+"""
+import time, tkinter, threading
+
+
+class ProgressReporter:
+    """Latest-value-wins reporter; `update` is cheap and safe to call from any thread."""
+
+    def __init__(self, app, tab, max_per_second=5):
+        self.app, self.tab = app, tab
+        self.interval = 1.0 / max(1, max_per_second)
+        self._lock = threading.Lock()
+        self._pending = None # (message, progress, app_message)
+        self._scheduled = False
+        self._last_flush = 0.0
+
+    def update(self, message, progress=None, app_message=True, immediate=False):
+        """
+        Queues a tab status (and progress 0..1). `app_message=True` mirrors the message to the app-wide
+        status, a string sets a different app status and None leaves it alone. `immediate` is for final
+        states (finished / stopped) so they are shown right away and never overwritten by an older row.
+        """
+        if app_message is True: app_message = message
+        with self._lock:
+            previous = self._pending or (None, None, None)
+            # Beech ki updates drop hoti hain, par unka progress / app status kho na jaye
+            self._pending = (message, previous[1] if progress is None else progress, app_message or previous[2])
+            schedule, self._scheduled = immediate or not self._scheduled, True
+            delay = 0 if immediate else max(0, int((self._last_flush + self.interval - time.monotonic()) * 1000))
+        if schedule: self.app.after(delay, self._flush)
+
+    def _flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._scheduled, self._last_flush = False, time.monotonic()
+        if not pending: return
+        message, progress, app_message = pending
+        try:
+            if app_message: self.app.set_status(app_message)
+            self.tab.update_status(message, progress)
+        except tkinter.TclError: pass # Tab band ho chuka hai
@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -12,6 +11,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_page_ready
 
 class ResendRejectedWgTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -196,7 +196,7 @@ class ResendRejectedWgTab(BaseAutomationTab):
                 return
 
             # --- KEY CHANGE: Use a precise XPath to find the "No Records Found" message in the table ---
-            time.sleep(0.5) # Brief pause for content to render
+            wait_for_page_ready(driver) # Let the content render
             no_records_elements = driver.find_elements(By.XPATH, "//td[contains(text(), 'No Records Found')]")
 
             if no_records_elements:
@@ -220,7 +220,7 @@ class ResendRejectedWgTab(BaseAutomationTab):
             self.app.log_message(self.log_display, f"   - Result: {result_text}", "success" if status == "Success" else "info")
             self._log_result(panchayat_name, status, result_text)
             
-            time.sleep(1)
+            wait_for_page_ready(driver, timeout=5)
 
         except Exception as e:
             error_msg = f"An unexpected error occurred: {str(e).splitlines()[0]}"
@@ -228,6 +228,7 @@ class ResendRejectedWgTab(BaseAutomationTab):
             self._log_result(panchayat_name, "Failed", error_msg)
 
     def _log_result(self, panchayat, status, details):
+        self._record_result(status, details=details, panchayat=panchayat)
         timestamp = datetime.now().strftime("%H:%M:%S")
         values = (timestamp, panchayat, status, details)
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=values))
\ No newline at end of file
@@ -0,0 +1,158 @@
+# tabs/results_model.py
+"""
+Results model for a ttk.Treeview.
+Saari rows ek Python list mein rehti hain; workers kisi bhi thread se `add()` karte hain aur Tk thread
+unhe chunks mein model mein daalta hai. Sort aur filter model par hote hain, aur Treeview mein sirf
+utni rows render hoti hain jitni screen par dikh sakti hain (scrollbar model ka offset chalata hai).
+Isliye 5,000+ rows par bhi UI atakta nahi.
+"""
+import bisect, itertools, threading, tkinter
+from tkinter import ttk
+
+MODEL_ATTR = "_results_model"
+
+
+def _sort_key(value):
+    text = str(value)
+    try: return (0, float(text.replace(",", "")), "")
+    except ValueError: return (1, 0.0, text.lower())
+
+
+class ResultsModel:
+    """Rows as (order_key, seq, values, tags). `add` / `clear` are thread-safe; everything else runs on the Tk thread."""
+
+    def __init__(self, tree, scrollbar=None, flush_ms=50, chunk_rows=500, overscan=2):
+        self.tree, self.scrollbar = tree, scrollbar
+        self.flush_ms, self.chunk_rows, self.overscan = flush_ms, chunk_rows, overscan
+        self.columns = list(tree["columns"])
+        self._rows = [] # base order: (order_key, seq)
+        self._keys = []
+        self._view = [] # rows after filter + sort, as shown
+        self._pending = []
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._scheduled = self._clear_requested = False
+        self._sort = None # (column index, reverse)
+        self._filter = ""
+        self._offset = 0
+        setattr(tree, MODEL_ATTR, self)
+
+        tree.configure(yscrollcommand="")
+        if scrollbar is not None: scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", lambda e: self._render(), add="+")
+        tree.bind("<MouseWheel>", self._on_wheel, add="+")
+        tree.bind("<Button-4>", lambda e: self._scroll(-3), add="+") # Linux
+        tree.bind("<Button-5>", lambda e: self._scroll(3), add="+")
+
+    @staticmethod
+    def of(tree):
+        return getattr(tree, MODEL_ATTR, None)
+
+    # --- Data (any thread) ---
+    def add(self, values, tags=(), order_key=None):
+        """Queues a row. Rows with a smaller `order_key` are kept ahead (None = append)."""
+        row = (float("inf") if order_key is None else order_key, next(self._seq), tuple(values), tuple(tags))
+        with self._lock:
+            self._pending.append(row)
+            schedule, self._scheduled = not self._scheduled, True
+        if schedule: self._schedule(self.flush_ms)
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear(); self._clear_requested = True
+            schedule, self._scheduled = not self._scheduled, True
+        if schedule: self._schedule(0)
+
+    def _schedule(self, delay):
+        try: self.tree.after(delay, self._flush)
+        except (RuntimeError, tkinter.TclError):
+            with self._lock: self._scheduled = False
+
+    def _flush(self):
+        with self._lock:
+            clear, self._clear_requested = self._clear_requested, False
+            chunk, self._pending = self._pending[:self.chunk_rows], self._pending[self.chunk_rows:]
+            more = bool(self._pending)
+            if not more: self._scheduled = False
+        if clear: self._rows, self._keys, self._offset = [], [], 0
+        for row in chunk:
+            position = bisect.bisect_right(self._keys, row[:2])
+            self._keys.insert(position, row[:2]); self._rows.insert(position, row)
+        if clear or chunk: self._rebuild_view()
+        if more: self._schedule(1)
+
+    # --- Reading (Tk thread) ---
+    def __len__(self):
+        return len(self._rows)
+
+    def rows(self, visible_only=True):
+        """Row values as lists, in display order. `visible_only=False` ignores the filter."""
+        if visible_only: return [list(r[2]) for r in self._view]
+        return [list(r[2]) for r in self._rows]
+
+    def entries(self):
+        """(values, tags) of every row in base order, including rows not flushed yet (e.g. for tab snapshots)."""
+        with self._lock:
+            pending, cleared = list(self._pending), self._clear_requested
+        rows = pending if cleared else self._rows + sorted(pending, key=lambda r: r[:2])
+        return [(list(r[2]), list(r[3])) for r in rows]
+
+    # --- Sort / filter ---
+    def sort(self, column, reverse=False):
+        self._sort = (self.columns.index(column), reverse)
+        self._rebuild_view()
+
+    def set_filter(self, text):
+        self._filter = (text or "").strip().lower(); self._offset = 0
+        self._rebuild_view()
+
+    def _rebuild_view(self):
+        view = self._rows
+        if self._filter:
+            view = [r for r in view if any(self._filter in str(v).lower() for v in r[2])]
+        if self._sort:
+            index, reverse = self._sort
+            view = sorted(view, key=lambda r: _sort_key(r[2][index] if index < len(r[2]) else ""), reverse=reverse)
+        self._view = list(view)
+        self._render()
+
+    # --- Virtual scrolling ---
+    def _page_size(self):
+        try:
+            height = self.tree.winfo_height()
+            row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        except (tkinter.TclError, ValueError): return 30
+        if height <= 1: return 30 # Abhi map nahi hua
+        return max(1, height // row_height)
+
+    def _render(self):
+        try:
+            page = self._page_size()
+            self._offset = max(0, min(self._offset, len(self._view) - page))
+            window = self._view[self._offset:self._offset + page + self.overscan]
+            selected = set(self.tree.selection())
+            self.tree.delete(*self.tree.get_children())
+            for order_key, seq, values, tags in window:
+                self.tree.insert("", "end", iid=str(seq), values=values, tags=tags)
+            keep = [iid for iid in selected if self.tree.exists(iid)]
+            if keep: self.tree.selection_set(keep)
+            if self.scrollbar is not None:
+                total = max(1, len(self._view))
+                self.scrollbar.set(self._offset / total, min(1.0, (self._offset + page) / total))
+        except tkinter.TclError: pass # Tree destroy ho gaya
+
+    def yview(self, *args):
+        """Scrollbar command: ("moveto", fraction) or ("scroll", n, "units"/"pages")."""
+        page = self._page_size()
+        if args and args[0] == "moveto": self._offset = int(float(args[1]) * len(self._view))
+        elif args and args[0] == "scroll":
+            step = int(args[1]) * (page if len(args) > 2 and args[2] == "pages" else 1)
+            self._offset += step
+        self._render()
+
+    def _scroll(self, units):
+        self.yview("scroll", units, "units")
+        return "break" # Tree ka apna scroll nahi chalna chahiye
+
+    def _on_wheel(self, event):
+        return self._scroll(-3 if event.delta > 0 else 3)
@@ -0,0 +1,102 @@
+# tabs/results_store.py
+"""
+Cross-run results database (SQLite, app data dir). Har tab ka `_log_result` yahan bhi ek row likhta hai:
+automation key, panchayat, work code, MSR no, status, details aur time. Writes jama hokar `flush_delay`
+ke baad ek transaction mein jaate hain. Indexed queries se "is fortnight mein kya ho chuka hai" turant
+pata chal jaata hai, taaki batch tabs browser kholne se pehle hi done items skip kar sakein.
+"""
+import time, sqlite3, threading
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    automation_key TEXT NOT NULL,
+    panchayat      TEXT NOT NULL DEFAULT '',  -- lowercase, for matching
+    work_code      TEXT NOT NULL DEFAULT '',
+    msr_no         TEXT NOT NULL DEFAULT '',
+    status         TEXT NOT NULL,
+    details        TEXT,
+    created_at     REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_key ON results (automation_key, panchayat, created_at);
+CREATE INDEX IF NOT EXISTS idx_results_work ON results (work_code, msr_no, created_at);
+"""
+
+
+def fortnight_start(now=None):
+    """Timestamp of the start of the current fortnight (1st or 16th of the month, 00:00 local time)."""
+    now = now or datetime.now()
+    return now.replace(day=1 if now.day < 16 else 16, hour=0, minute=0, second=0, microsecond=0).timestamp()
+
+
+class ResultsStore:
+    """One SQLite connection shared by all automation threads; `record` only queues, `flush` writes."""
+
+    def __init__(self, db_path, flush_delay=2.0, keep_days=400, done_statuses=("success",)):
+        self.db_path, self.flush_delay, self.keep_days = db_path, flush_delay, keep_days
+        self.done_statuses = tuple(s.lower() for s in done_statuses)
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pending = []
+        self._timer = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+            if self.keep_days: # Purani rows hatao taaki DB chhota rahe
+                with self._conn: self._conn.execute("DELETE FROM results WHERE created_at < ?", (time.time() - self.keep_days * 86400,))
+        return self._conn
+
+    def record(self, automation_key, status, work_code="", msr_no="", panchayat="", details=""):
+        """Queues one outcome row (written by the next batched flush)."""
+        row = (automation_key, (panchayat or "").strip().lower(), str(work_code or "").strip(), str(msr_no or "").strip(),
+               str(status), str(details or ""), time.time())
+        with self._lock:
+            self._pending.append(row)
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True; self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None: self._timer.cancel(); self._timer = None
+            if not pending: return
+            try:
+                with self.conn:
+                    self.conn.executemany("INSERT INTO results (automation_key, panchayat, work_code, msr_no, status, details, created_at) "
+                                          "VALUES (?, ?, ?, ?, ?, ?, ?)", pending)
+            except sqlite3.Error as e:
+                print(f"Error saving results: {e}")
+
+    def done_items(self, automation_key, since=None, panchayat=None, with_msr=False):
+        """
+        Work codes (or (work_code, msr_no) pairs with `with_msr`) of `automation_key` that finished with a
+        done status since `since` (default: start of this fortnight), optionally for one panchayat.
+        """
+        sql = f"SELECT DISTINCT work_code, msr_no FROM results WHERE automation_key=? AND created_at>=? AND lower(status) IN ({','.join('?' * len(self.done_statuses))})"
+        params = [automation_key, fortnight_start() if since is None else since, *self.done_statuses]
+        if panchayat: sql += " AND panchayat=?"; params.append(panchayat.strip().lower())
+        self.flush() # Abhi queue mein pade results bhi gine jaayein
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return {(code, msr) for code, msr in rows} if with_msr else {code for code, _ in rows}
+
+    def history(self, work_code, limit=50):
+        """Latest rows for `work_code` across all automations, newest first, as dicts."""
+        self.flush()
+        with self._lock:
+            rows = self.conn.execute("SELECT automation_key, panchayat, work_code, msr_no, status, details, created_at FROM results "
+                                     "WHERE work_code=? ORDER BY created_at DESC LIMIT ?", (str(work_code).strip(), limit)).fetchall()
+        keys = ("automation_key", "panchayat", "work_code", "msr_no", "status", "details", "created_at")
+        return [dict(zip(keys, row)) for row in rows]
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._conn is not None: self._conn.close(); self._conn = None
@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
-import json
 import os, time, csv
 import threading
 from selenium.webdriver.common.by import By
@@ -14,7 +13,6 @@ from .base_tab import BaseAutomationTab
 class SADUpdateStatusTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="sad_update_status")
-        self.config_file = self.app.get_data_path("sad_update_inputs.json")
         
         # Flags
         self.is_running = False
@@ -103,7 +101,7 @@ class SADUpdateStatusTab(BaseAutomationTab):
 
     def copy_logs(self):
         try:
-            log_content = self.log_display.get("1.0", "end")
+            log_content = self.app.get_log_text(self.log_display)
             self.app.clipboard_clear()
             self.app.clipboard_append(log_content)
             self.app.update()
@@ -119,16 +117,15 @@ class SADUpdateStatusTab(BaseAutomationTab):
 
     def save_inputs(self, inputs):
         try:
-            with open(self.config_file, 'w') as f: json.dump(inputs, f, indent=4)
+            self.app.state_store.set("sad_update_inputs", inputs)
         except: pass
 
     def load_inputs(self):
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    self.csv_entry.insert(0, data.get('csv_file', ''))
-                    self.prefix_entry.insert(0, data.get('block_prefix', '3/28/')) # Default suggested
+            data = self.app.state_store.get("sad_update_inputs")
+            if data is not None:
+                self.csv_entry.insert(0, data.get('csv_file', ''))
+                self.prefix_entry.insert(0, data.get('block_prefix', '3/28/')) # Default suggested
         except: pass
 
     # --- File Reading Helper ---
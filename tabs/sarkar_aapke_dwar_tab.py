@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
-import json
 import os, time, csv
 from datetime import datetime
 from selenium.webdriver.common.by import By
@@ -11,11 +10,11 @@ from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, ElementClickInterceptedException
 from .base_tab import BaseAutomationTab
+from .page_wait import wait_for_page_ready, wait_for_options
 
 class SarkarAapkeDwarTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="sad_auto")
-        self.config_file = self.app.get_data_path("sad_inputs.json")
         
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(2, weight=1)
@@ -214,7 +213,7 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
             try:
                 if "application/create" not in driver.current_url:
                     driver.get("https://sarkaraapkedwar.jharkhand.gov.in/#/application/create")
-                    time.sleep(2)
+                    wait_for_page_ready(driver)
 
                 # Wait for form to be ready
                 wait.until(EC.presence_of_element_located((By.NAME, "applicantName")))
@@ -238,13 +237,13 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
                     try:
                         village_input = driver.find_element(By.ID, "react-select-2-input")
                         village_input.send_keys(village)
-                        time.sleep(1)
+                        self._wait_for_select_menu(driver)
                         village_input.send_keys(Keys.ENTER)
                     except NoSuchElementException:
                         try:
                             village_input = driver.find_element(By.CSS_SELECTOR, ".css-13cymwt-control input")
                             village_input.send_keys(village)
-                            time.sleep(1)
+                            self._wait_for_select_menu(driver)
                             village_input.send_keys(Keys.ENTER)
                         except:
                             self.app.log_message(self.log_display, f"Warning: Could not select Village '{village}'.", "warning")
@@ -261,7 +260,7 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
                 # Scheme Type
                 try:
                     Select(driver.find_element(By.NAME, "schemeId")).select_by_visible_text(inputs['scheme_type'])
-                    time.sleep(1) # Wait for services
+                    wait_for_options(driver, (By.NAME, "schemeService")) # Wait for services
                 except NoSuchElementException:
                     self.app.log_message(self.log_display, f"Error: Scheme Type '{inputs['scheme_type']}' not found.", "error")
                     continue
@@ -290,7 +289,7 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
                 # --- 4. Submit ---
                 try:
                     driver.find_element(By.XPATH, "//button[contains(., 'Add Service')]").click()
-                    time.sleep(1)
+                    self._wait_for_service_row(driver)
                     wait.until(EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Create Application')]"))).click()
                     
                     # Success Wait
@@ -302,7 +301,7 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
                         time.sleep(1)
                     except:
                         driver.refresh()
-                        time.sleep(2)
+                        wait_for_page_ready(driver)
 
                     self.app.log_message(self.log_display, f"Success: {applicant_name}", "success")
                 except Exception as e:
@@ -311,7 +310,7 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
             except Exception as e:
                 self.app.log_message(self.log_display, f"Failed {applicant_name}: {e}", "error")
                 driver.refresh()
-                time.sleep(3)
+                wait_for_page_ready(driver)
 
     def _run_monitor_mode(self, driver, wait, inputs):
         while not self.app.stop_events[self.automation_key].is_set():
@@ -332,12 +331,8 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
                     if inputs['app_remarks']: self._safe_send_keys(driver, "remarks", inputs['app_remarks'])
                     
                     Select(scheme_dd).select_by_visible_text(inputs['scheme_type'])
-                    time.sleep(1)
-                    
+                    wait_for_options(driver, (By.NAME, "schemeService"), timeout=6)
                     svc_select = Select(driver.find_element(By.NAME, "schemeService"))
-                    for _ in range(5):
-                        if len(svc_select.options) > 1: break
-                        time.sleep(1)
                     
                     try:
                         svc_select.select_by_visible_text(inputs['service'])
@@ -349,12 +344,22 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
                     
                     driver.find_element(By.XPATH, "//button[contains(., 'Add Service')]").click()
                     self.app.log_message(self.log_display, "Service Added.")
-                    time.sleep(3)
+                    self._wait_for_service_row(driver)
                 else:
                     time.sleep(1)
             except Exception:
                 time.sleep(1)
 
+    def _wait_for_select_menu(self, driver):
+        """Waits for the react-select dropdown to show its filtered options."""
+        try: WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[id*='-option-']")))
+        except TimeoutException: pass
+
+    def _wait_for_service_row(self, driver):
+        """Waits until 'Add Service' has put a row in the services table."""
+        try: WebDriverWait(driver, 5).until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tbody tr")))
+        except TimeoutException: pass
+
     def _safe_send_keys(self, driver, element_name, value):
         if not value: return
         try:
@@ -374,17 +379,16 @@ class SarkarAapkeDwarTab(BaseAutomationTab):
 
     def save_inputs(self, inputs):
         try:
-            with open(self.config_file, 'w') as f: json.dump(inputs, f, indent=4)
+            self.app.state_store.set("sad_inputs", inputs)
         except Exception as e: print(f"Error saving SAD inputs: {e}")
 
     def load_inputs(self):
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    data = json.load(f)
-                    self.csv_path_entry.insert(0, data.get('csv_file', ''))
-                    self.app_remarks_entry.insert(0, data.get('app_remarks', ''))
-                    self.scheme_type_combobox.set(data.get('scheme_type', 'Service Focus Area'))
-                    self.service_combobox.set(data.get('service', ''))
-                    self.scheme_remarks_entry.insert(0, data.get('scheme_remarks', ''))
+            data = self.app.state_store.get("sad_inputs")
+            if data is not None:
+                self.csv_path_entry.insert(0, data.get('csv_file', ''))
+                self.app_remarks_entry.insert(0, data.get('app_remarks', ''))
+                self.scheme_type_combobox.set(data.get('scheme_type', 'Service Focus Area'))
+                self.service_combobox.set(data.get('service', ''))
+                self.scheme_remarks_entry.insert(0, data.get('scheme_remarks', ''))
         except Exception as e: print(f"Error loading SAD inputs: {e}")
\ No newline at end of file
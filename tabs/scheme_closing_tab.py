@@ -5,7 +5,6 @@ import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
 import os
-import json
 import time
 import re
 from datetime import datetime
@@ -19,6 +18,7 @@ import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
 from .date_entry_widget import DateEntry
+from .page_wait import wait_for_page_ready
 
 class SchemeClosingTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -210,15 +210,15 @@ class SchemeClosingTab(BaseAutomationTab):
     def _save_inputs(self, inputs):
         save_data = {k: v for k, v in inputs.items() if k not in ["work_codes_raw", "work_codes"]}
         try:
-            with open(self.app.get_data_path("scheme_closing_inputs.json"), 'w') as f:
-                json.dump(save_data, f, indent=4)
+            self.app.state_store.set("scheme_closing_inputs", save_data)
         except Exception as e:
             print(f"Error saving inputs: {e}")
 
     def _load_saved_inputs(self):
         try:
-            with open(self.app.get_data_path("scheme_closing_inputs.json"), 'r') as f:
-                data = json.load(f)
+            data = self.app.state_store.get("scheme_closing_inputs")
+            if data is None:
+                self.completion_date_entry.set_date(datetime.now().strftime("%d/%m/%Y")); return
             self.panchayat_entry.insert(0, data.get("panchayat", ""))
             self.work_category_var.set(data.get("work_category", "Provision of Irrigation facility to Land Owned by SC/ST/LR or IAY Beneficiaries/Small or Marginal Farmers"))
             self.area_entry.insert(0, data.get("area", ""))
@@ -226,8 +226,6 @@ class SchemeClosingTab(BaseAutomationTab):
             self.measured_name_entry.insert(0, data.get("measured_name", ""))
             self.cert_no_entry.insert(0, data.get("cert_no_start", ""))
             self.completion_date_entry.set_date(data.get("completion_date", ""))
-        except FileNotFoundError:
-            self.completion_date_entry.set_date(datetime.now().strftime("%d/%m/%Y"))
         except Exception as e:
             print(f"Error loading inputs: {e}")
 
@@ -252,7 +250,8 @@ class SchemeClosingTab(BaseAutomationTab):
         self.app.update_history("staff_name", inputs["measured_name"])
         # ---
         
-        self.app.start_automation_thread(self.automation_key, self.run_automation_logic, args=(inputs,))
+        job_params = {k: inputs[k] for k in ("panchayat", "cert_no_start", "work_codes")}
+        self.app.start_automation_thread(self.automation_key, self.run_automation_logic, args=(inputs,), job_params=job_params)
 
     def run_automation_logic(self, inputs):
         self.app.after(0, self.set_ui_state, True)
@@ -270,12 +269,26 @@ class SchemeClosingTab(BaseAutomationTab):
             return
 
         try:
-            total_codes = len(inputs["work_codes"])
+            work_codes = inputs["work_codes"]
             current_cert_no = inputs["cert_no_start"]
             success_count = 0
             fail_count = 0
 
-            for i, work_code in enumerate(inputs["work_codes"]):
+            # Resumed run: jo work codes pehle ho chuke unhe skip karein, certificate no. wahin se aage badhe
+            job = self.app.job_store.active(self.automation_key)
+            if job:
+                done = job.bind(work_codes)
+                for record in done.values():
+                    for values, tags in record["results"]: # Sirf table mein, results DB mein yeh pehle hi likhe ja chuke hain
+                        self._add_result_row(values, tags or (('failed',) if 'success' not in values[2].lower() else ()), order_key=float("-inf"))
+                    if record["outcome"] == "Success": current_cert_no += 1; success_count += 1
+                    else: fail_count += 1
+                if done:
+                    work_codes = [wc for wc in work_codes if wc not in done]
+                    self.app.log_message(self.log_display, f"Resuming previous run: {len(done)} work code(s) already done, {len(work_codes)} left.", "info")
+            total_codes = len(work_codes)
+
+            for i, work_code in enumerate(work_codes):
                 if self.app.stop_events[self.automation_key].is_set():
                     self.app.log_message(self.log_display, "Automation stopped by user.", "warning")
                     break
@@ -289,8 +302,10 @@ class SchemeClosingTab(BaseAutomationTab):
                 
                 self.app.log_message(self.log_display, f"\n--- Processing Work Code: {work_code} ---")
                 
+                if job: job.start_item(work_code)
                 status, details = self._process_single_work_code(driver, inputs, work_code, current_cert_no)
-                self._log_result(work_code, status, details)
+                values = self._log_result(work_code, status, details)
+                if job: job.add_result(work_code, values); job.finish_item(work_code, outcome=status)
                 
                 if status == "Success":
                     current_cert_no += 1
@@ -311,9 +326,12 @@ class SchemeClosingTab(BaseAutomationTab):
             self.app.after(0, self.app.set_status, "Automation Finished")
 
     def _log_result(self, work_code, status, details):
+        self._record_result(status, work_code, details=details)
         timestamp = time.strftime("%H:%M:%S")
         tags = ('failed',) if 'success' not in status.lower() else ()
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=(timestamp, work_code, status, details), tags=tags))
+        values = (timestamp, work_code, status, details)
+        self.app.after(0, lambda: self.results_tree.insert("", "end", values=values, tags=tags))
+        return values
 
     def _process_single_work_code(self, driver, inputs, work_code, cert_no):
         wait = WebDriverWait(driver, 20)
@@ -335,7 +353,7 @@ class SchemeClosingTab(BaseAutomationTab):
             self.app.log_message(self.log_display, "   - Page 1: Searching for Work Code...")
             wc_input = wait.until(EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_txt_search_wrk")))
 
-            time.sleep(1)
+            wait_for_page_ready(driver)
 
             wc_input.send_keys(work_code)
             wc_input.send_keys(Keys.TAB)
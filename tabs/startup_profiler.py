@@ -0,0 +1,135 @@
+# tabs/startup_profiler.py
+"""
+Cold-start benchmark mode (`--benchmark-startup` ya env NREGABOT_STARTUP_BENCHMARK=1).
+Startup ke har phase (imports, splash, pygame, sentry, icons, layout, license check,
+pehla tab) ka wall time aur har module ka import time record hota hai; pehla tab dikhte hi
+ek JSON report data dir ke "startup_benchmarks" folder mein likhi jaati hai taaki alag-alag
+versions ke numbers compare ho sakein. Normal mode mein sab kuch no-op hai.
+Sirf stdlib use karta hai kyunki ye baaki saare imports se pehle load hota hai.
+"""
+import os, sys, json, time, builtins, platform, threading
+from contextlib import contextmanager
+
+FLAG = "--benchmark-startup"
+ENV_VAR = "NREGABOT_STARTUP_BENCHMARK"
+REPORT_DIR = "startup_benchmarks"
+TOP_MODULES = 40
+
+ENABLED = FLAG in sys.argv or os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes")
+
+_t0 = time.perf_counter()
+_lock = threading.Lock()
+_phases = {}    # name -> (start_ms, duration_ms, thread name)
+_imports = {}   # module -> [inclusive_ms, self_ms]
+_import_stack = threading.local()
+_original_import = None
+_report_path = None
+
+
+def _now_ms():
+    return (time.perf_counter() - _t0) * 1000
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # Sirf pehli baar load hone wale modules time hote hain; baaki imports sys.modules lookup hain
+    full_name = name
+    if level:
+        package = (globals or {}).get("__package__") or ""
+        base = package.rsplit(".", level - 1)[0] if level > 1 else package
+        full_name = f"{base}.{name}" if name else base
+    if not full_name or full_name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    stack = getattr(_import_stack, "frames", None)
+    if stack is None: stack = _import_stack.frames = []
+    stack.append(0.0) # nested imports ka time yahan jama hota hai
+    started = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        inclusive = (time.perf_counter() - started) * 1000
+        nested = stack.pop()
+        if stack: stack[-1] += inclusive
+        with _lock:
+            entry = _imports.setdefault(full_name, [0.0, 0.0])
+            entry[0] += inclusive; entry[1] += inclusive - nested
+
+
+def install():
+    """Hooks `__import__` when benchmark mode is on. Call before the heavy imports."""
+    global _original_import
+    if not ENABLED or _original_import is not None: return
+    _original_import = builtins.__import__
+    builtins.__import__ = _timed_import
+
+
+def _uninstall():
+    global _original_import
+    if _original_import is not None and builtins.__import__ is _timed_import:
+        builtins.__import__ = _original_import
+    _original_import = None
+
+
+def record(name, start_ms, duration_ms):
+    with _lock: _phases[name] = (start_ms, duration_ms, threading.current_thread().name)
+
+
+@contextmanager
+def phase(name):
+    """Times the wrapped startup phase (no-op unless benchmark mode is on)."""
+    if not ENABLED:
+        yield; return
+    start = _now_ms()
+    try: yield
+    finally: record(name, start, _now_ms() - start)
+
+
+def mark(name):
+    """Records a point in time (ms since the profiler was loaded) as a zero-length phase."""
+    if ENABLED: record(name, _now_ms(), 0.0)
+
+
+def report(app_name, app_version):
+    with _lock:
+        phases = sorted(_phases.items(), key=lambda kv: kv[1][0])
+        imports = sorted(_imports.items(), key=lambda kv: -kv[1][0])
+    top_level = [ms[0] for mod, ms in imports if "." not in mod]
+    return {
+        "app": app_name, "app_version": app_version,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(), "platform": platform.platform(),
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "phases": [{"name": name, "start_ms": round(start, 1), "duration_ms": round(dur, 1), "thread": thread}
+                   for name, (start, dur, thread) in phases],
+        "imports": {
+            "modules": len(imports),
+            "self_total_ms": round(sum(ms[1] for _, ms in imports), 1),
+            "top_level_total_ms": round(sum(top_level), 1),
+            "slowest": [{"module": mod, "inclusive_ms": round(ms[0], 1), "self_ms": round(ms[1], 1)}
+                        for mod, ms in imports[:TOP_MODULES]],
+        },
+    }
+
+
+def finish(app_name, app_version, get_data_path):
+    """Writes the JSON report once (first call wins) and returns it with its "path", or None."""
+    global _report_path
+    if not ENABLED: return None
+    with _lock:
+        if _report_path: return None
+        _report_path = "pending"
+    _uninstall()
+    data = report(app_name, app_version)
+    folder = get_data_path(REPORT_DIR); os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"startup_{app_version}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    with open(path, "w") as f: json.dump(data, f, indent=2)
+    _report_path = data["path"] = path
+    return data
+
+
+def format_summary(data):
+    lines = [f"{p['name']:<28} {p['duration_ms']:>9.1f} ms   (at {p['start_ms']:.0f} ms)" for p in data["phases"]]
+    lines.append(f"{'imports (self total)':<28} {data['imports']['self_total_ms']:>9.1f} ms   ({data['imports']['modules']} modules)")
+    for m in data["imports"]["slowest"][:10]:
+        lines.append(f"  {m['module']:<26} {m['inclusive_ms']:>9.1f} ms")
+    return "\n".join(lines)
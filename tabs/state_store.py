@@ -0,0 +1,110 @@
+# tabs/state_store.py
+"""
+Tabs ke saved inputs, mappings aur profiles ke liye ek hi namespaced store (state.db, app data dir).
+Startup par background mein saari rows ek baar padhi jaati hain (sirf raw JSON text); kisi namespace
+ka JSON tabhi parse hota hai jab koi tab use pehli baar maange. Writes jama hokar `flush_delay` ke
+baad ek transaction mein jaate hain. Purani `<namespace>.json` files pehli load par import ho jaati hain.
+"""
+import os, copy, glob, json, time, sqlite3, threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS state (
+    namespace  TEXT PRIMARY KEY,
+    value      TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+# Legacy per-tab files that are imported into the store (namespace = file name without .json)
+LEGACY_PATTERNS = ("*_inputs.json", "*_map.json", "*_profiles.json")
+
+
+class StateStore:
+    """`get(namespace)` / `set(namespace, value)` for small JSON-safe values; safe from any thread."""
+
+    def __init__(self, db_path, legacy_dir=None, flush_delay=1.0):
+        self.db_path, self.legacy_dir, self.flush_delay = db_path, legacy_dir, flush_delay
+        self._lock = threading.RLock()
+        self._loaded = threading.Event()
+        self._conn = None
+        self._raw = {} # namespace -> JSON text (not parsed yet)
+        self._values = {} # namespace -> parsed value
+        self._pending = set()
+        self._timer = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    # --- Loading ---
+    def preload(self):
+        """Reads every namespace (and imports legacy files) in one go; call it early in a background thread."""
+        with self._lock:
+            if self._loaded.is_set(): return
+            try:
+                self._raw.update(self.conn.execute("SELECT namespace, value FROM state"))
+                self._import_legacy_locked()
+            except sqlite3.Error as e: print(f"Error loading saved inputs: {e}")
+            self._loaded.set()
+
+    def preload_async(self):
+        threading.Thread(target=self.preload, daemon=True, name="StateStorePreload").start()
+
+    def _import_legacy_locked(self):
+        if not self.legacy_dir: return
+        rows = []
+        for pattern in LEGACY_PATTERNS:
+            for path in glob.glob(os.path.join(self.legacy_dir, pattern)):
+                namespace = os.path.splitext(os.path.basename(path))[0]
+                if namespace in self._raw: continue
+                try:
+                    with open(path, 'r', encoding='utf-8') as f: text = json.dumps(json.load(f))
+                except (OSError, ValueError): continue # Kharab file import nahi hogi
+                self._raw[namespace] = text; rows.append((namespace, text, time.time()))
+        if rows:
+            with self.conn: self.conn.executemany("INSERT OR IGNORE INTO state VALUES (?, ?, ?)", rows)
+
+    # --- Access ---
+    def get(self, namespace, default=None):
+        """Saved value of `namespace` (a copy), or `default` if nothing was saved."""
+        if not self._loaded.is_set(): self.preload()
+        with self._lock:
+            if namespace not in self._values:
+                raw = self._raw.pop(namespace, None)
+                if raw is None: return default
+                try: self._values[namespace] = json.loads(raw)
+                except ValueError: return default
+            return copy.deepcopy(self._values[namespace])
+
+    def set(self, namespace, value):
+        """Saves `value` for `namespace`; written to disk by the next batched flush."""
+        if not self._loaded.is_set(): self.preload()
+        with self._lock:
+            self._values[namespace] = copy.deepcopy(value); self._raw.pop(namespace, None)
+            self._pending.add(namespace)
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True; self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            if self._timer is not None: self._timer.cancel(); self._timer = None
+            names, self._pending = self._pending, set()
+            if not names: return
+            now = time.time()
+            try:
+                with self.conn:
+                    self.conn.executemany("INSERT OR REPLACE INTO state VALUES (?, ?, ?)",
+                                          [(name, json.dumps(self._values[name]), now) for name in names])
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                print(f"Error saving inputs: {e}")
+
+    def close(self):
+        self.flush()
+        with self._lock:
+            if self._conn is not None: self._conn.close(); self._conn = None
@@ -0,0 +1,55 @@
+# tabs/suggestion_index.py
+"""
+Substring search index for autocomplete suggestions.
+Har value ka lowercase roop ek baar banta hai aur uske trigrams ka posting set. Query ke saare trigrams
+ka intersection lekar sirf un candidates par `in` check hota hai; 1-2 letter ki query pehle se bani
+lowercase values par scan hoti hai. Isliye hazaaron history entries par bhi search kuch hi ms leta hai.
+"""
+import heapq, threading
+
+GRAM = 3
+
+
+def _grams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class SuggestionIndex:
+    """Case-insensitive "contains" matching, same results as `query in value.lower()` over the list."""
+
+    def __init__(self, values=()):
+        self._lock = threading.Lock()
+        self._postings = {} # trigram -> set of values
+        self._lower = {} # value -> lowercase value
+        for value in values: self.add(value)
+
+    def __len__(self):
+        return len(self._lower)
+
+    def add(self, value):
+        if not isinstance(value, str) or value in self._lower: return
+        lower = value.lower()
+        with self._lock:
+            self._lower[value] = lower
+            for gram in _grams(lower): self._postings.setdefault(gram, set()).add(value)
+
+    def remove(self, value):
+        with self._lock:
+            lower = self._lower.pop(value, None)
+            if lower is None: return
+            for gram in _grams(lower):
+                bucket = self._postings.get(gram)
+                if bucket is None: continue
+                bucket.discard(value)
+                if not bucket: del self._postings[gram]
+
+    def search(self, text, limit=5):
+        """First `limit` matching values in sorted order."""
+        query = (text or "").lower()
+        if not query: return []
+        with self._lock:
+            if len(query) < GRAM:
+                return heapq.nsmallest(limit, (v for v, lower in self._lower.items() if query in lower))
+            buckets = sorted((self._postings.get(gram, set()) for gram in _grams(query)), key=len)
+            candidates = buckets[0].intersection(*buckets[1:]) if buckets[0] else set()
+            return heapq.nsmallest(limit, (v for v in candidates if query in self._lower[v]))
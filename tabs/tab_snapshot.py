@@ -0,0 +1,107 @@
+# tabs/tab_snapshot.py
+"""
+Snapshot of a tab's inputs and results, used when an idle tab is unloaded to save memory.
+Tab ke attributes par ek baar nazar daal kar entries, comboboxes, switches, dates aur result Treeviews
+ki values JSON mein likhi jaati hain; tab dobara khulne par nayi widgets mein wahi values bhar di jaati hain.
+Jo data widgets mein nahi hai (jaise Demand ke CSV applicants) wo tab `snapshot_state` / `restore_state` se deta hai.
+"""
+import os, json, logging, tkinter
+from tkinter import ttk
+import customtkinter as ctk
+from .date_entry_widget import DateEntry
+from .results_model import ResultsModel
+
+VERSION = 1
+
+
+def _tree_rows(tree):
+    model = ResultsModel.of(tree)
+    if model is not None: return [[None, values, tags] for values, tags in model.entries()]
+    return [[iid, list(tree.item(iid, "values")), list(tree.item(iid, "tags"))] for iid in tree.get_children()]
+
+
+def capture(tab):
+    """Inputs, results and log text of `tab` as a JSON-safe dict."""
+    inputs, results = {}, {}
+    for attr, widget in vars(tab).items():
+        try:
+            if isinstance(widget, ttk.Treeview): results[attr] = _tree_rows(widget)
+            elif isinstance(widget, DateEntry): inputs[attr] = widget.get()
+            elif isinstance(widget, (ctk.CTkEntry, ctk.CTkComboBox, ctk.CTkOptionMenu, ctk.CTkSegmentedButton, tkinter.Variable)):
+                inputs[attr] = widget.get()
+            elif isinstance(widget, (ctk.CTkSwitch, ctk.CTkCheckBox)): inputs[attr] = widget.get() == widget.cget("onvalue")
+            elif isinstance(widget, ctk.CTkTextbox) and widget.cget("state") != "disabled": # Log jaise read-only box nahi
+                inputs[attr] = widget.get("1.0", "end-1c")
+        except (tkinter.TclError, ValueError) as e: logging.debug(f"Snapshot skipped {attr}: {e}")
+    log = getattr(tab, "log_display", None)
+    return {"version": VERSION, "inputs": inputs, "results": results,
+            "log": tab.app.get_log_text(log) if log is not None else "",
+            "state": tab.snapshot_state() if hasattr(tab, "snapshot_state") else {}}
+
+
+def _set_input(widget, value):
+    if isinstance(widget, DateEntry):
+        if value: widget.set_date(value)
+        else: widget.clear()
+    elif isinstance(widget, (ctk.CTkSwitch, ctk.CTkCheckBox)):
+        if value: widget.select()
+        else: widget.deselect()
+    elif isinstance(widget, ctk.CTkTextbox):
+        widget.delete("1.0", "end"); widget.insert("1.0", value)
+    elif isinstance(widget, ctk.CTkEntry):
+        widget.delete(0, "end")
+        if value: widget.insert(0, value)
+    else: widget.set(value) # ComboBox / OptionMenu / SegmentedButton / tkinter Variable
+
+
+def restore(tab, data):
+    """Puts a `capture` dict back into a freshly built tab."""
+    if data.get("version") != VERSION: return
+    for attr, value in data.get("inputs", {}).items():
+        widget = getattr(tab, attr, None)
+        if widget is None: continue
+        try:
+            state = widget.cget("state") if not isinstance(widget, (tkinter.Variable, DateEntry)) else "normal"
+            if state == "disabled": widget.configure(state="normal")
+            _set_input(widget, value)
+            if state == "disabled": widget.configure(state="disabled")
+        except (tkinter.TclError, ValueError, AttributeError) as e: logging.debug(f"Snapshot restore skipped {attr}: {e}")
+    for attr, rows in data.get("results", {}).items():
+        tree = getattr(tab, attr, None)
+        if not isinstance(tree, ttk.Treeview): continue
+        model = ResultsModel.of(tree)
+        for iid, values, tags in rows:
+            if model is not None: model.add(values, tags)
+            elif iid and not tree.exists(iid): tree.insert("", "end", iid=iid, values=values, tags=tags)
+            else: tree.insert("", "end", values=values, tags=tags)
+    log = getattr(tab, "log_display", None)
+    if log is not None and data.get("log"): tab.app.get_log_sink(log).preload(data["log"].splitlines())
+    if data.get("state") and hasattr(tab, "restore_state"): tab.restore_state(data["state"])
+
+
+def save(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f: json.dump(data, f)
+
+
+def load(path):
+    with open(path, "r", encoding="utf-8") as f: return json.load(f)
+
+
+def widget_count(widget):
+    """Number of Tk widgets under `widget` (itself included)."""
+    count, stack = 0, [widget]
+    while stack:
+        current = stack.pop(); count += 1
+        try: stack.extend(current.winfo_children())
+        except tkinter.TclError: pass
+    return count
+
+
+def result_row_count(tab):
+    total = 0
+    for widget in vars(tab).values():
+        if isinstance(widget, ttk.Treeview):
+            model = ResultsModel.of(widget)
+            total += len(model) if model is not None else len(widget.get_children())
+    return total
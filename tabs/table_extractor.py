@@ -0,0 +1,33 @@
+# tabs/table_extractor.py
+"""
+Reads a whole HTML table in a single execute_script call.
+Har cell ke liye alag WebDriver request (row.find_elements + cell.text) bahut slow hai,
+isliye poori table ek hi baar mein JSON array ki tarah browser se le lete hain.
+"""
+
+# Mirrors the old Selenium pattern: rows = table.find_elements(".//tr"), cells = row.find_elements("td"), cell.text
+_EXTRACT_TABLE_JS = """
+var table = arguments[0], skip = arguments[1], dataOnly = arguments[2];
+var rows = table.querySelectorAll('tr'), out = [];
+for (var i = skip; i < rows.length; i++) {
+    var row = rows[i];
+    if (dataOnly) {
+        var hasTd = false;
+        for (var k = 0; k < row.children.length; k++) { if (row.children[k].tagName === 'TD') { hasTd = true; break; } }
+        if (!hasTd) { continue; }
+    }
+    var tds = row.getElementsByTagName('td'), vals = new Array(tds.length);
+    for (var j = 0; j < tds.length; j++) { vals[j] = (tds[j].innerText || '').replace(/\\u00a0/g, ' ').trim(); }
+    out.push(vals);
+}
+return out;
+"""
+
+
+def extract_table(driver, table, skip_rows=1, data_rows_only=False):
+    """
+    Returns the rows of `table` (a WebElement) as lists of stripped cell texts.
+    `skip_rows` drops leading header rows; `data_rows_only` keeps only rows that have <td> cells
+    (same as the XPath './/tr[td]').
+    """
+    return driver.execute_script(_EXTRACT_TABLE_JS, table, skip_rows, data_rows_only) or []
@@ -0,0 +1,89 @@
+# tabs/tracing.py
+"""
+Lightweight step timing for automation runs.
+Tab apne steps (navigate, select panchayat, postback, save, PDF render...) `trace.step("name")`
+se wrap karta hai; run ke end par har step ka p50/p95 milta hai aur poora run Chrome trace
+(chrome://tracing / ui.perfetto.dev) format mein JSON file ke roop mein export hota hai.
+"""
+import os, json, math, time, threading
+from contextlib import contextmanager
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values: return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class RunTrace:
+    """Collects complete ("X") trace events from any number of worker threads."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self._t0 = time.perf_counter()
+        self._events = []
+        self._lock = threading.Lock()
+
+    def _now_us(self):
+        return (time.perf_counter() - self._t0) * 1_000_000
+
+    @contextmanager
+    def step(self, name, category="step", **args):
+        """Times the wrapped block. Exceptions are recorded in the event args and re-raised."""
+        start = self._now_us()
+        try: yield
+        except BaseException as e:
+            args["error"] = type(e).__name__
+            raise
+        finally:
+            self.add(name, start, self._now_us() - start, category, args)
+
+    def mark(self, name, category="step", **args):
+        """For steps that don't fit a `with` block: returns a function that records the step when called."""
+        start = self._now_us()
+        return lambda: self.add(name, start, self._now_us() - start, category, args)
+
+    def item(self, item, **args):
+        """Wraps one work item; all items are summarised together as the "item" row."""
+        return self.step("item", category="item", item=item, **args)
+
+    def add(self, name, start_us, dur_us, category="step", args=None):
+        event = {"name": name, "cat": category, "ph": "X", "ts": round(start_us, 1), "dur": round(dur_us, 1),
+                 "pid": os.getpid(), "tid": threading.get_ident()}
+        if args: event["args"] = {k: str(v) for k, v in args.items()}
+        with self._lock: self._events.append(event)
+
+    def summary(self):
+        """[(name, category, count, p50_ms, p95_ms, total_ms)] with items first, then steps by total time."""
+        groups = {}
+        with self._lock:
+            for e in self._events: groups.setdefault((e["cat"], e["name"]), []).append(e["dur"] / 1000.0)
+        rows = []
+        for (category, name), durations in groups.items():
+            durations.sort()
+            rows.append((name, category, len(durations), percentile(durations, 50), percentile(durations, 95), sum(durations)))
+        rows.sort(key=lambda r: (r[1] != "item", -r[5]))
+        return rows
+
+    def format_summary(self):
+        rows = self.summary()
+        if not rows: return ""
+        width = max(4, max(len(r[0]) for r in rows))
+        lines = [f"{'Step'.ljust(width)}  {'n':>4}  {'p50 (s)':>8}  {'p95 (s)':>8}  {'total (s)':>9}"]
+        for name, category, count, p50, p95, total in rows:
+            lines.append(f"{name.ljust(width)}  {count:>4}  {p50 / 1000:>8.2f}  {p95 / 1000:>8.2f}  {total / 1000:>9.1f}")
+        return "\n".join(lines)
+
+    def export(self, path):
+        """Writes the Chrome trace JSON and returns the path."""
+        with self._lock: events = list(self._events)
+        thread_ids = sorted({e["tid"] for e in events})
+        meta = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": self.name}}]
+        meta += [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid, "args": {"name": f"worker {n + 1}"}}
+                 for n, tid in enumerate(thread_ids)]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": meta + events, "displayTimeUnit": "ms",
+                       "otherData": {"run": self.name, "started_at": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at))}}, f)
+        return path
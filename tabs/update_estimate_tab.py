@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, csv, sys, os, subprocess, re  # <-- ADD 're'
+import csv, sys, os, subprocess, re  # <-- ADD 're'
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -10,6 +10,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 from datetime import datetime
 import config
 from .base_tab import BaseAutomationTab
+from .page_wait import wait_for_page_ready
 
 class UpdateEstimateTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -165,8 +166,8 @@ class UpdateEstimateTab(BaseAutomationTab):
     def _process_single_task(self, driver, wait, work_code, outcome):
         """Processes a single work code and outcome value."""
         try:
-            # Add a 1-second delay before starting to avoid race conditions
-            time.sleep(1)
+            # Wait for any pending postback before starting to avoid race conditions
+            wait_for_page_ready(driver)
 
             search_box = wait.until(EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_txtwrksearchkey")))
             search_box.clear()
@@ -243,6 +244,7 @@ class UpdateEstimateTab(BaseAutomationTab):
 
     def _log_result(self, work_code, outcome, status, details, is_error=False):
         """Logs the result to the UI."""
+        self._record_result(status, work_code, details=f"{outcome}: {details}")
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_level = "error" if is_error else "success"
         self.app.log_message(self.log_display, f"'{work_code}' - {status.upper()}: {details}", level=log_level)
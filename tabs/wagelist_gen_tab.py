@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import time, os, sys, subprocess
+import os, sys, subprocess
 import re  # <-- IMPORT ADDED
 import base64 # <-- IMPORT ADDED
 from datetime import datetime
@@ -15,8 +15,12 @@ from selenium.webdriver.common.print_page_options import PrintOptions  # <-- IMP
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback
+from .table_extractor import extract_table
 
 class WagelistGenTab(BaseAutomationTab):
+    lean_mode_allow = ("images", "fonts") # Saved wagelist PDFs need logos and fonts
+
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="gen")
         self.grid_columnconfigure(0, weight=1); self.grid_rowconfigure(1, weight=1)
@@ -163,12 +167,13 @@ class WagelistGenTab(BaseAutomationTab):
                     break
                 
                 select.select_by_visible_text(match_text)
-                self.app.log_message(self.log_display, f"Selected agency: {match_text}", "success"); time.sleep(1)
+                self.app.log_message(self.log_display, f"Selected agency: {match_text}", "success"); wait_for_postback(driver, agency_select_element)
                 proceed_button = wait.until(EC.element_to_be_clickable((By.ID, 'ctl00_ContentPlaceHolder1_go')))
                 driver.execute_script("arguments[0].scrollIntoView(true);", proceed_button); proceed_button.click()
                 try:
                     wagelist_table = wait.until(EC.visibility_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_wagelist_msr")))
                     rows = wagelist_table.find_elements(By.XPATH, ".//tr[td]")
+                    row_texts = extract_table(driver, wagelist_table, skip_rows=0, data_rows_only=True)
                     if not rows or total_errors_to_skip >= len(rows): 
                         self.app.log_message(self.log_display, "No more wagelists to process.", "info")
                         break
@@ -178,12 +183,12 @@ class WagelistGenTab(BaseAutomationTab):
                     # --- FIX 1: Check for checkbox and cell count ---
                     try: 
                         checkbox = row_to_process.find_element(By.XPATH, ".//input[@type='checkbox']")
-                        tds = row_to_process.find_elements(By.TAG_NAME, "td")
+                        tds = row_texts[total_errors_to_skip]
                         if len(tds) < 3: # Need at least 3 cells for work code at index 2
                             self.app.log_message(self.log_display, f"Skipping row {total_errors_to_skip + 1}: Unexpected row format.", "warning")
                             total_errors_to_skip += 1
                             continue # Restart the while loop
-                        work_code = tds[2].text.strip()
+                        work_code = tds[2]
                     except NoSuchElementException: 
                         self.app.log_message(self.log_display, "Row without checkbox found, assuming end.", "info")
                         break
@@ -232,12 +237,11 @@ class WagelistGenTab(BaseAutomationTab):
                             try:
                                 job_cards, applicant_names = [], []
                                 unfrozen_table = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_GridView1")
-                                for u_row in unfrozen_table.find_elements(By.XPATH, ".//tr[td]"):
-                                    u_cells = u_row.find_elements(By.TAG_NAME, "td")
+                                for u_cells in extract_table(driver, unfrozen_table, skip_rows=0, data_rows_only=True):
                                     # Check for 4 cells (index 1 and 3)
                                     if len(u_cells) > 3: 
-                                        job_cards.append(u_cells[1].text.strip())
-                                        applicant_names.append(u_cells[3].text.strip())
+                                        job_cards.append(u_cells[1])
+                                        applicant_names.append(u_cells[3])
                                     else:
                                         self.app.log_message(self.log_display, "   - Skipping malformed row in error table.", "warning")
                                 self._log_result(work_code, "Unfrozen Account", "N/A", ", ".join(job_cards), ", ".join(applicant_names))
@@ -286,7 +290,7 @@ class WagelistGenTab(BaseAutomationTab):
                 # We need to get the log content from the main thread
                 # This must be done in the 'after' call to run on the main thread
                 def _send_data():
-                    log_content = self.log_display.get("1.0", "end-1c")
+                    log_content = self.app.get_log_text(self.log_display)
                     
                     # Find all wagelist numbers from successful logs
                     matches = re.findall(r"SUCCESS: Wagelist (\S+) generated", log_content)
@@ -364,6 +368,7 @@ class WagelistGenTab(BaseAutomationTab):
     # --- END NEW METHOD ---
 
     def _log_result(self, work_code, status, wagelist_no, job_card, applicant_name):
+        self._record_result(status, work_code, details=" | ".join(str(v) for v in (wagelist_no, job_card, applicant_name) if v))
         timestamp = datetime.now().strftime("%H:%M:%S")
         tags = ('failed',) if 'success' not in status.lower() else ()
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=(timestamp, work_code, status, wagelist_no, job_card, applicant_name), tags=tags))
@@ -2,7 +2,6 @@
 import tkinter
 from tkinter import ttk, messagebox
 import customtkinter as ctk
-import time
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -10,6 +9,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 import config
 from .base_tab import BaseAutomationTab
+from .page_wait import wait_for_page_ready
 
 class WagelistSendTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -141,7 +141,7 @@ class WagelistSendTab(BaseAutomationTab):
             
             self.app.log_message(self.log_display, "Waiting for wagelists to load...")
             wait.until(EC.element_to_be_clickable((By.XPATH, "//select[@id='ctl00_ContentPlaceHolder1_ddl_sel']/option[position()>1]")))
-            time.sleep(1)
+            wait_for_page_ready(driver)
 
             all_wagelists = [o.get_attribute("value") for o in Select(driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_ddl_sel")).options if o.get_attribute("value") != "select"]
             if not all_wagelists:
@@ -179,7 +179,7 @@ class WagelistSendTab(BaseAutomationTab):
                 
                 success = self._process_single_wagelist(driver, wait, wagelist, fin_year)
                 self.app.after(0, lambda w=wagelist, s="Success" if success else "Failed", t=datetime.now().strftime("%H:%M:%S"): self.results_tree.insert("", tkinter.END, values=(w, s, t)))
-                time.sleep(1)
+                wait_for_page_ready(driver, timeout=5)
 
         except Exception as e:
             automation_failed = True # Track errors
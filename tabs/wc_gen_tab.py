@@ -2,7 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import os, csv, time, pyperclip, sys, threading, json, webbrowser, requests
+import os, csv, time, pyperclip, sys, threading, webbrowser, requests
 from datetime import datetime
 from urllib.parse import urlparse, parse_qs
 from collections import defaultdict
@@ -23,7 +23,6 @@ class WcGenTab(BaseAutomationTab):
         self.csv_path = None
         self.ui_fields = {}
         self.profiles = {}
-        self.profile_file = self.app.get_data_path("wc_gen_profiles.json")
         self.saved_config = {}
         self.successful_wcs_data = [] # --- NEW: To store full data for export ---
 
@@ -216,6 +215,7 @@ class WcGenTab(BaseAutomationTab):
     # --- END NEW METHODS ---
 
     def _log_result(self, result_data):
+        self._record_result("Success", result_data.get('work_code', ''), details=f"{result_data.get('job_card', '')} ({result_data.get('beneficiary_type', '')})")
         self.app.after(0, lambda: self.results_tree.insert("", "end", values=(
             result_data.get('work_code', 'N/A'),
             result_data.get('job_card', 'N/A'),
@@ -269,13 +269,12 @@ class WcGenTab(BaseAutomationTab):
                     field.insert(0, formatted_value)
 
     def _load_profiles_from_file(self):
-        if not os.path.exists(self.profile_file):
+        self.profiles = self.app.state_store.get("wc_gen_profiles")
+        if self.profiles is None:
             self.profiles = {}
             self._populate_defaults()
             return
         try:
-            with open(self.profile_file, 'r') as f:
-                self.profiles = json.load(f)
             profile_names = list(self.profiles.keys())
             self.profile_combobox.configure(values=profile_names)
             last_used = "Last Used Config"
@@ -304,8 +303,7 @@ class WcGenTab(BaseAutomationTab):
         self.profiles[profile_name] = config_data
         
         try:
-            with open(self.profile_file, 'w') as f:
-                json.dump(self.profiles, f, indent=4)
+            self.app.state_store.set("wc_gen_profiles", self.profiles)
             profile_names = list(self.profiles.keys())
             if not "Last Used Config" in profile_names:
                 profile_names.insert(0, "Last Used Config")
@@ -324,7 +322,11 @@ class WcGenTab(BaseAutomationTab):
         self.saved_config = self.profiles.get(profile_name, {})
         if not self.saved_config:
             return
-        
+        self._apply_saved_fields()
+        self.app.log_message(self.log_display, f"Profile '{profile_name}' loaded. Click 'Load Categories' to continue.")
+
+    def _apply_saved_fields(self):
+        """Fills the plain fields from saved_config; dropdowns pick it up after 'Load Categories'."""
         for key in ["proposal_date", "start_date", "est_labour_cost", "est_material_cost"]:
             if key in self.saved_config and key in self.ui_fields:
                 field = self.ui_fields[key]
@@ -334,8 +336,15 @@ class WcGenTab(BaseAutomationTab):
                 elif isinstance(field, ctk.CTkEntry):
                     field.delete(0, tkinter.END)
                     field.insert(0, value)
-        
-        self.app.log_message(self.log_display, f"Profile '{profile_name}' loaded. Click 'Load Categories' to continue.")
+
+    def snapshot_state(self):
+        """Selected CSV and the form fields (in `ui_fields`, not attributes) so an unloaded tab comes back the same."""
+        return {"csv_path": self.csv_path, "fields": {key: field.get() for key, field in self.ui_fields.items()}}
+
+    def restore_state(self, state):
+        if state.get("fields"): # Khaali dropdowns (categories load nahi hue) profile ki values na mitaayein
+            self.saved_config = {**self.saved_config, **{k: v for k, v in state["fields"].items() if v}}; self._apply_saved_fields()
+        if state.get("csv_path"): self.csv_path = state["csv_path"]; self.file_label.configure(text=os.path.basename(self.csv_path))
 
     def _delete_profile(self):
         profile_name = self.profile_combobox.get()
@@ -346,8 +355,7 @@ class WcGenTab(BaseAutomationTab):
             return
         del self.profiles[profile_name]
         try:
-            with open(self.profile_file, 'w') as f:
-                json.dump(self.profiles, f, indent=4)
+            self.app.state_store.set("wc_gen_profiles", self.profiles)
             profile_names = list(self.profiles.keys())
             self.profile_combobox.configure(values=profile_names)
             if profile_names:
@@ -2,8 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import json
-import os, sys, subprocess, time
+import os, sys, subprocess
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -14,6 +13,7 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_page_ready
 
 class WorkAllocationTab(BaseAutomationTab):
     def __init__(self, parent, app_instance):
@@ -222,8 +222,8 @@ class WorkAllocationTab(BaseAutomationTab):
             # This is the normal, fast path. The overlay was not visible (or gone in < 0.5s).
             self.app.log_message(self.log_display, "   - (No overlay) Page is settled.", "info")
         
-        # Add a small fixed delay for extra safety after any postback
-        time.sleep(0.5)
+        # Make sure any remaining postback has finished as well
+        wait_for_page_ready(driver, timeout=5)
 
     # --- FUNCTION MODIFIED ---
     def run_automation_logic(self, inputs):
@@ -453,6 +453,7 @@ class WorkAllocationTab(BaseAutomationTab):
 
     # --- FUNCTION MODIFIED ---
     def _log_result(self, work_key, work_code, status, details):
+        self._record_result(status, work_code or work_key, details=details)
         timestamp = datetime.now().strftime("%H:%M:%S")
         values = (work_key, work_code, status, details, timestamp)
         
@@ -536,21 +537,15 @@ class WorkAllocationTab(BaseAutomationTab):
             'work_category': inputs.get('work_category')
         }
         try:
-            config_file = self.app.get_data_path("work_alloc_inputs.json")
-            with open(config_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
+            self.app.state_store.set("work_alloc_inputs", save_data)
         except Exception as e:
             print(f"Error saving Work Allocation inputs: {e}")
 
     def load_inputs(self):
         """Loads the saved panchayat name and work category."""
         try:
-            config_file = self.app.get_data_path("work_alloc_inputs.json")
-            if not os.path.exists(config_file):
-                return
-            
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            data = self.app.state_store.get("work_alloc_inputs")
+            if data is None: return
             
             self.panchayat_entry.delete(0, tkinter.END)
             self.panchayat_entry.insert(0, data.get('panchayat_name', ''))
@@ -0,0 +1,96 @@
+# tabs/work_index.py
+"""
+Local index of what the NREGA dropdowns last showed: page -> panchayats -> work codes -> MSR numbers
+(SQLite, app data dir). Jab bhi koi tab in dropdowns ko padhta hai, list yahan likh di jaati hai; agla run
+TTL ke andar isi se batch validate / plan kar leta hai, bina page load kiye. Har `page` alag rakha jaata hai,
+kyunki har form apni alag list dikhata hai (jaise Zero MR page par sirf woh MSR jo abhi zero ho sakte hain).
+"""
+import json, time, sqlite3, threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dropdowns (
+    page      TEXT NOT NULL,
+    panchayat TEXT NOT NULL,   -- '' for the panchayat list itself
+    work_code TEXT NOT NULL,   -- '' for the work code list of a panchayat
+    options   TEXT NOT NULL,   -- JSON list of option texts / values
+    seen_at   REAL NOT NULL,
+    PRIMARY KEY (page, panchayat, work_code)
+) WITHOUT ROWID;
+"""
+
+
+def _norm(value):
+    return str(value or "").strip().lower()
+
+
+class WorkIndex:
+    """Getters return None when nothing fresh is known (caller reads the page), else the last seen list."""
+
+    def __init__(self, db_path, settings):
+        self.db_path, self.settings = db_path, settings
+        self._lock = threading.RLock()
+        self._conn = None
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    @property
+    def enabled(self): return self.settings.get("enabled", True)
+
+    def _ttl(self, kind):
+        return self.settings.get("ttl_minutes", {}).get(kind, 60) * 60
+
+    def _get(self, kind, page, panchayat="", work_code=""):
+        if not self.enabled: return None
+        try:
+            with self._lock:
+                row = self.conn.execute("SELECT options, seen_at FROM dropdowns WHERE page=? AND panchayat=? AND work_code=?",
+                                        (page, _norm(panchayat), _norm(work_code))).fetchone()
+        except sqlite3.Error as e:
+            print(f"Work index unavailable: {e}"); return None
+        if not row or time.time() - row[1] > self._ttl(kind): return None
+        return json.loads(row[0])
+
+    def _put(self, page, panchayat, work_code, options):
+        options = [str(o).strip() for o in options if str(o).strip()]
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO dropdowns VALUES (?, ?, ?, ?, ?)",
+                                  (page, _norm(panchayat), _norm(work_code), json.dumps(options), time.time()))
+        except sqlite3.Error as e: print(f"Could not update work index: {e}")
+
+    # --- Panchayats ---
+    def record_panchayats(self, page, names): self._put(page, "", "", names)
+    def panchayats(self, page): return self._get("panchayats", page)
+
+    # --- Work codes of a panchayat (full, unfiltered dropdown only) ---
+    def record_work_codes(self, page, panchayat, labels): self._put(page, panchayat, "", labels)
+    def work_codes(self, page, panchayat): return self._get("work_codes", page, panchayat)
+
+    # --- MSR numbers of a work (`work_code` is the key the user typed) ---
+    def record_msrs(self, page, panchayat, work_code, msrs): self._put(page, panchayat, work_code, msrs)
+    def msrs(self, page, panchayat, work_code): return self._get("msrs", page, panchayat, work_code)
+
+    def forget_work_codes(self, page, panchayat):
+        """Drops the saved work code list of `panchayat` on `page` (its contents changed, e.g. an MR was generated)."""
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM dropdowns WHERE page=? AND panchayat=? AND work_code=''", (page, _norm(panchayat)))
+        except sqlite3.Error as e: print(f"Could not update work index: {e}")
+
+    def forget_msrs(self, panchayat):
+        """Drops every MSR list of `panchayat` (call it after a tab creates or fills a muster roll there)."""
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM dropdowns WHERE panchayat=? AND work_code!=''", (_norm(panchayat),))
+        except sqlite3.Error as e: print(f"Could not update work index: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None: self._conn.close(); self._conn = None
@@ -2,8 +2,7 @@
 import tkinter
 from tkinter import ttk, messagebox, filedialog
 import customtkinter as ctk
-import json
-import os, sys, subprocess, time
+import os, sys, subprocess
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select, WebDriverWait
@@ -12,8 +11,11 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException,
 import config
 from .base_tab import BaseAutomationTab
 from .autocomplete_widget import AutocompleteEntry
+from .page_wait import wait_for_postback, wait_for_page_ready, arm_postback
 
 class ZeroMrTab(BaseAutomationTab):
+    skip_done_results = True # Same work key + MSR already zeroed this fortnight is skipped
+
     def __init__(self, parent, app_instance):
         super().__init__(parent, app_instance, automation_key="zero_mr")
         self.grid_columnconfigure(0, weight=1)
@@ -45,7 +47,7 @@ class ZeroMrTab(BaseAutomationTab):
         ctk.CTkLabel(controls_frame, text="Note: Must exactly match the name on the NREGA website.", text_color="gray50").grid(row=2, column=1, columnspan=3, sticky='w', padx=15, pady=(0,10))
 
         # --- Row 3: Action Buttons ---
-        action_frame = self._create_action_buttons(parent_frame=controls_frame)
+        action_frame = self._create_action_buttons(parent_frame=controls_frame, parallel_workers=True)
         action_frame.grid(row=3, column=0, columnspan=4, sticky='ew', pady=15)
 
         # --- Data Tabs (Work List, Results, Logs) ---
@@ -98,6 +100,7 @@ class ZeroMrTab(BaseAutomationTab):
         self.results_tree.grid(row=1, column=0, sticky='nsew', padx=5, pady=5)
         scrollbar = ctk.CTkScrollbar(results_tab, command=self.results_tree.yview)
         self.results_tree.configure(yscroll=scrollbar.set); scrollbar.grid(row=1, column=1, sticky='ns')
+        self.attach_results_model(self.results_tree, scrollbar)
         self.style_treeview(self.results_tree)
         self._setup_treeview_sorting(self.results_tree)
 
@@ -121,14 +124,14 @@ class ZeroMrTab(BaseAutomationTab):
     def reset_ui(self):
         self.panchayat_entry.delete(0, tkinter.END)
         self.work_list_text.delete("1.0", tkinter.END)
-        for item in self.results_tree.get_children(): self.results_tree.delete(item)
+        self._clear_results()
         self.app.clear_log(self.log_display)
         self.update_status("Ready", 0.0)
         self.app.log_message(self.log_display, "Form has been reset.")
         self.app.after(0, self.app.set_status, "Ready")
 
     def start_automation(self):
-        for item in self.results_tree.get_children(): self.results_tree.delete(item)
+        self._clear_results()
         self.app.clear_log(self.log_display)
 
         inputs = {
@@ -181,58 +184,15 @@ class ZeroMrTab(BaseAutomationTab):
                 self.app.after(0, self.set_ui_state, False)
                 return
                 
-            wait = WebDriverWait(driver, 20)
-            
-            self.app.log_message(self.log_display, f"Navigating to Zero MR page...")
-            driver.get(config.ZERO_MR_CONFIG["url"])
-
-            # --- FIX: Add explicit wait for page to be fully interactive ---
-            self.app.log_message(self.log_display, "Waiting for page elements to load...")
-            try:
-                wait.until(EC.presence_of_element_located((By.ID, "ddlfin")))
-                fin_year_dropdown_element = wait.until(EC.element_to_be_clickable((By.ID, "ddlfin")))
-                self.app.log_message(self.log_display, "Page loaded successfully.")
-            except TimeoutException:
-                self.app.log_message(self.log_display, "Page did not load correctly or Fin Year dropdown not found.", "error")
-                raise Exception("Page load timeout or essential element 'ddlfin' not found.")
-            # --- END FIX ---
-
-            # --- Set Fin Year and Panchayat (only once) ---
-            self.app.after(0, self.app.set_status, "Setting Financial Year...")
-            self.app.log_message(self.log_display, f"Selecting Financial Year: {inputs['fin_year']}")
-            
-            fin_year_select = Select(fin_year_dropdown_element)
-            if fin_year_select.first_selected_option.text != inputs['fin_year']:
-                fin_year_select.select_by_visible_text(inputs['fin_year'])
-                self.app.log_message(self.log_display, "Waiting for Fin Year postback...")
-                time.sleep(2) # Wait for postback
-
-            self.app.after(0, self.app.set_status, "Setting Panchayat...")
-            self.app.log_message(self.log_display, f"Selecting Panchayat: {inputs['panchayat_name']}")
-            panchayat_select = Select(wait.until(EC.element_to_be_clickable((By.ID, "ddlpanch"))))
-            match = next((opt.text for opt in panchayat_select.options if inputs['panchayat_name'].strip().lower() in opt.text.lower()), None)
-            if not match:
-                raise ValueError(f"Panchayat '{inputs['panchayat_name']}' not found in dropdown.")
-            
-            if panchayat_select.first_selected_option.text != match:
-                panchayat_select.select_by_visible_text(match)
-                self.app.log_message(self.log_display, "Waiting for Panchayat postback...")
-                time.sleep(2) # Wait for postback
-            
-            self.app.log_message(self.log_display, "Setup complete. Starting item processing...", "success")
-            
-            # --- Process each item ---
-            total_items = len(inputs['work_items'])
-            for i, (work_key, msr_no) in enumerate(inputs['work_items']):
-                if self.app.stop_events[self.automation_key].is_set():
-                    self.app.log_message(self.log_display, "Stop signal received.", "warning")
-                    break
-                
-                status_msg = f"Processing {i+1}/{total_items}: Key={work_key}, MSR={msr_no}"
-                self.app.after(0, self.app.set_status, status_msg)
-                self.app.after(0, self.update_status, status_msg, (i+1)/total_items)
-                
-                self._process_single_item(driver, wait, work_key, msr_no)
+            def setup_worker(worker_driver):
+                wait = WebDriverWait(worker_driver, 20)
+                self._prepare_page(worker_driver, wait, inputs)
+                return wait
+
+            work_items = self._plan_items(inputs['panchayat_name'], inputs['work_items'])
+            self.run_work_items(driver, work_items, lambda d, wait, item: self._process_single_item(d, wait, *item, panchayat=inputs['panchayat_name']),
+                                setup_worker=setup_worker, describe=lambda item: f"Key={item[0]}, MSR={item[1]}",
+                                result_key=lambda item: (str(item[0]).strip(), str(item[1]).strip()))
 
         except Exception as e:
             error_msg = f"A critical error occurred: {e}"
@@ -248,7 +208,59 @@ class ZeroMrTab(BaseAutomationTab):
             self.app.after(0, self.update_status, final_status, 1.0)
             self.app.after(100, lambda: messagebox.showinfo("Complete", f"{final_status}. Check results."))
 
-    def _process_single_item(self, driver, wait, work_key, msr_no):
+    def _prepare_page(self, driver, wait, inputs):
+        """Opens the Zero MR page and sets the Financial Year and Panchayat once per browser."""
+        self.app.log_message(self.log_display, f"Navigating to Zero MR page...")
+        driver.get(config.ZERO_MR_CONFIG["url"])
+
+        # --- FIX: Add explicit wait for page to be fully interactive ---
+        self.app.log_message(self.log_display, "Waiting for page elements to load...")
+        try:
+            wait.until(EC.presence_of_element_located((By.ID, "ddlfin")))
+            fin_year_dropdown_element = wait.until(EC.element_to_be_clickable((By.ID, "ddlfin")))
+            self.app.log_message(self.log_display, "Page loaded successfully.")
+        except TimeoutException:
+            self.app.log_message(self.log_display, "Page did not load correctly or Fin Year dropdown not found.", "error")
+            raise Exception("Page load timeout or essential element 'ddlfin' not found.")
+        # --- END FIX ---
+
+        # --- Set Fin Year and Panchayat (only once) ---
+        self.app.after(0, self.app.set_status, "Setting Financial Year...")
+        self.app.log_message(self.log_display, f"Selecting Financial Year: {inputs['fin_year']}")
+        
+        fin_year_select = Select(fin_year_dropdown_element)
+        if fin_year_select.first_selected_option.text != inputs['fin_year']:
+            fin_year_select.select_by_visible_text(inputs['fin_year'])
+            self.app.log_message(self.log_display, "Waiting for Fin Year postback...")
+            wait_for_postback(driver, fin_year_dropdown_element)
+
+        self.app.after(0, self.app.set_status, "Setting Panchayat...")
+        self.app.log_message(self.log_display, f"Selecting Panchayat: {inputs['panchayat_name']}")
+        panchayat_dropdown = wait.until(EC.element_to_be_clickable((By.ID, "ddlpanch")))
+        panchayat_select = Select(panchayat_dropdown)
+        match = next((opt.text for opt in panchayat_select.options if inputs['panchayat_name'].strip().lower() in opt.text.lower()), None)
+        if not match:
+            raise ValueError(f"Panchayat '{inputs['panchayat_name']}' not found in dropdown.")
+        
+        if panchayat_select.first_selected_option.text != match:
+            panchayat_select.select_by_visible_text(match)
+            self.app.log_message(self.log_display, "Waiting for Panchayat postback...")
+            wait_for_postback(driver, panchayat_dropdown)
+        
+        self.app.log_message(self.log_display, "Setup complete. Starting item processing...", "success")
+
+    def _plan_items(self, panchayat, work_items):
+        """Fails items whose MSR the saved MSR list of their work does not have, without loading the page."""
+        planned = []
+        for work_key, msr_no in work_items:
+            known = self.app.work_index.msrs("zero_mr", panchayat, work_key)
+            if known is None or any(msr_no.strip() in text for text in known): planned.append((work_key, msr_no)); continue
+            self._log_result(work_key, msr_no, "Failed", f"MSR '{msr_no.strip()}' not in dropdown (saved list: {known[:3]}).")
+        if len(planned) < len(work_items):
+            self.app.log_message(self.log_display, f"{len(work_items) - len(planned)} item(s) skipped using the saved MSR lists.", "warning")
+        return planned
+
+    def _process_single_item(self, driver, wait, work_key, msr_no, panchayat=""):
         try:
             self.app.log_message(self.log_display, f"   - Processing Key: {work_key}, MSR: {msr_no}")
             
@@ -264,15 +276,17 @@ class ZeroMrTab(BaseAutomationTab):
                     if attempt == 2: 
                         raise # Re-raise if failed 3 times
                     self.app.log_message(self.log_display, "   - Page updating, retrying search...", "warning")
-                    time.sleep(2)
+                    wait_for_page_ready(driver)
             
             # 2. Trigger postback (by clicking body) and wait
             driver.find_element(By.TAG_NAME, 'body').click()
+            wait_for_postback(driver, search_box)
             self.app.log_message(self.log_display, "   - Waiting for work code...")
             
             # 3. Select Work Code
             wait.until(EC.presence_of_element_located((By.XPATH, "//select[@id='ddlworkcode']/option[position()>1]")))
-            work_code_select = Select(driver.find_element(By.ID, "ddlworkcode"))
+            work_code_dropdown = driver.find_element(By.ID, "ddlworkcode")
+            work_code_select = Select(work_code_dropdown)
             
             found_option_text = None
             for option in work_code_select.options:
@@ -283,16 +297,18 @@ class ZeroMrTab(BaseAutomationTab):
             if not found_option_text:
                 raise NoSuchElementException(f"Could not find a work code matching '{work_key}' in the dropdown.")
 
+            arm_postback(driver) # Slow full postback mein purane page ki MSR list na padh lein
             work_code_select.select_by_visible_text(found_option_text)
             self.app.log_message(self.log_display, f"   - Selected work code: {found_option_text}")
             
             # --- CRITICAL WAIT: Wait for MSR list update ---
             self.app.log_message(self.log_display, "   - Waiting for MSR list update...")
-            time.sleep(2.5) # Explicit wait for AJAX/Postback
+            wait_for_postback(driver, work_code_dropdown)
 
             # 4. Select MSR No (Modified for Partial Matching)
             wait.until(EC.presence_of_element_located((By.ID, "ddlmustroll")))
             msr_select = Select(driver.find_element(By.ID, "ddlmustroll"))
+            self.app.work_index.record_msrs("zero_mr", panchayat, work_key, [o.text for o in msr_select.options if "Select" not in o.text])
             
             target_msr = msr_no.strip()
             found_msr_text = None
@@ -339,7 +355,7 @@ class ZeroMrTab(BaseAutomationTab):
                 self.app.log_message(self.log_display, f"   - Failed: {message_text}", "error")
                 self._log_result(work_key, msr_no, "Failed", message_text)
             
-            time.sleep(1)
+            wait_for_page_ready(driver, timeout=5)
 
         except (TimeoutException, NoSuchElementException) as e:
             error_msg = f"Element not found/timeout. {str(e).splitlines()[0]}"
@@ -354,10 +370,11 @@ class ZeroMrTab(BaseAutomationTab):
             self._log_result(work_key, msr_no, "Failed", error_msg)
 
     def _log_result(self, work_key, msr_no, status, details):
+        self._record_result(status, work_key, msr_no, details)
         timestamp = datetime.now().strftime("%H:%M:%S")
         values = (work_key, msr_no, status, details, timestamp)
         tags = ('failed',) if 'success' not in status.lower() else ()
-        self.app.after(0, lambda: self.results_tree.insert("", "end", values=values, tags=tags))
+        self._add_result_row(values, tags)
 
     def export_report(self):
         export_format = self.export_format_menu.get()
@@ -381,13 +398,12 @@ class ZeroMrTab(BaseAutomationTab):
             self._handle_pdf_export(data, file_path)
 
     def _get_filtered_data_and_filepath(self, export_format):
-        all_items = self.results_tree.get_children()
+        all_items = self.get_result_rows(self.results_tree)
         if not all_items: messagebox.showinfo("No Data", "There are no results to export."); return None, None
         
         filter_option = self.export_filter_menu.get()
         data_to_export = []
-        for item_id in all_items:
-            row_values = self.results_tree.item(item_id)['values']
+        for row_values in all_items:
             status = row_values[2].upper()
             if filter_option == "Export All": data_to_export.append(row_values)
             elif filter_option == "Success Only" and "SUCCESS" in status: data_to_export.append(row_values)
@@ -438,8 +454,7 @@ class ZeroMrTab(BaseAutomationTab):
         # Clear current form and results
         self.panchayat_entry.delete(0, tkinter.END)
         self.work_list_text.delete("1.0", tkinter.END)
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+        self._clear_results()
 
         # Get the first panchayat from the list
         target_panchayat = data_list[0].get("panchayat")
@@ -496,21 +511,15 @@ class ZeroMrTab(BaseAutomationTab):
             'panchayat_name': inputs.get('panchayat_name')
         }
         try:
-            config_file = self.app.get_data_path("zero_mr_inputs.json")
-            with open(config_file, 'w') as f:
-                json.dump(save_data, f, indent=4)
+            self.app.state_store.set("zero_mr_inputs", save_data)
         except Exception as e:
             print(f"Error saving Zero MR inputs: {e}")
 
     def load_inputs(self):
         """Loads the saved financial year and panchayat name."""
         try:
-            config_file = self.app.get_data_path("zero_mr_inputs.json")
-            if not os.path.exists(config_file):
-                return
-            
-            with open(config_file, 'r') as f:
-                data = json.load(f)
+            data = self.app.state_store.get("zero_mr_inputs")
+            if data is None: return
             
             saved_fin_year = data.get('fin_year')
             if saved_fin_year:
@@ -2,6 +2,9 @@
 import os
 import sys
 import json
+import copy
+import atexit
+import threading
 from pathlib import Path
 from appdirs import user_data_dir
 
@@ -32,30 +35,84 @@ def get_user_downloads_path():
 
 CONFIG_FILE = get_data_path('config.json')
 
+class ConfigStore:
+    """
+    Process-wide config.json cache. File ek hi baar padhi jaati hai; reads memory se hote hain aur
+    writes `flush_delay` seconds tak jama hokar temp file + rename se likhe jaate hain (crash par
+    aadhi likhi / khaali file nahi bachti). `subscribe(callback)` par har change ke baad callback(key, value).
+    """
+
+    def __init__(self, path, flush_delay=0.5):
+        self.path, self.flush_delay = path, flush_delay
+        self._data = None
+        self._dirty = False
+        self._timer = None
+        self._subscribers = []
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
+    def _loaded(self):
+        if self._data is None:
+            try:
+                with open(self.path, 'r') as f: data = json.load(f)
+                self._data = data if isinstance(data, dict) else {}
+            except (FileNotFoundError, json.JSONDecodeError, IOError):
+                self._data = {}
+        return self._data
+
+    def get(self, key=None, default=None):
+        with self._lock:
+            data = self._loaded()
+            value = data if key is None else data.get(key, default)
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value # Caller cache ko badal na sake
+
+    def set(self, key, value):
+        with self._lock:
+            data = self._loaded()
+            if key in data and data[key] == value: return
+            data[key] = value; self._dirty = True
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self.flush)
+                self._timer.daemon = True; self._timer.start()
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try: callback(key, value)
+            except Exception as e: print(f"Config subscriber failed for '{key}': {e}")
+
+    def subscribe(self, callback):
+        """Calls callback(key, value) after every change; returns a function that unsubscribes."""
+        with self._lock: self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback) if callback in self._subscribers else None
+
+    def flush(self):
+        """Writes pending changes now (atomic replace)."""
+        with self._lock:
+            if self._timer is not None: self._timer.cancel(); self._timer = None
+            if not self._dirty: return
+            payload = json.dumps(self._data, indent=4); self._dirty = False
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    f.write(payload); f.flush(); os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except (IOError, OSError) as e:
+                self._dirty = True
+                print(f"Error saving config file: {e}")
+
+    def reload(self):
+        """Drops the cache (pending changes are written first)."""
+        with self._lock: self.flush(); self._data = None
+
+CONFIG = ConfigStore(CONFIG_FILE)
+
 def get_config(key=None, default=None):
     """
-    Loads the configuration from config.json.
-    If a key is provided, it returns the value for that key, otherwise the entire config.
+    Returns the value for `key` from the cached config.json, or the entire config if no key is given.
     """
-    if not os.path.exists(CONFIG_FILE):
-        return {} if key is None else default
-    try:
-        with open(CONFIG_FILE, 'r') as f:
-            config_data = json.load(f)
-        if key is None:
-            return config_data
-        return config_data.get(key, default)
-    except (json.JSONDecodeError, IOError):
-        return {} if key is None else default
+    return CONFIG.get(key, default)
 
 def save_config(key, value):
     """
-    Saves a specific key-value pair to the config.json file.
+    Saves a specific key-value pair to config.json (batched, atomic write).
     """
-    config_data = get_config()  # Load the entire current config
-    config_data[key] = value   # Update or add the new key-value pair
-    try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config_data, f, indent=4)
-    except IOError as e:
-        print(f"Error saving config file: {e}")
\ No newline at end of file
+    CONFIG.set(key, value)